@@ -50,12 +50,14 @@ async def ui_get_spend_by_tags(
         # Get spend for all tags
         sql_query = """
         SELECT
-            individual_request_tag,
-            spend_date,
-            log_count,
-            total_spend
-        FROM DailyTagSpend
-        WHERE spend_date >= $1::date AND spend_date <= $2::date
+            request_tag AS individual_request_tag,
+            DATE(period_start) AS spend_date,
+            SUM(api_requests)::bigint AS log_count,
+            SUM(spend) AS total_spend
+        FROM "LiteLLM_DailySpendRollup"
+        WHERE period_start BETWEEN $1::date AND $2::date
+          AND request_tag <> ''
+        GROUP BY request_tag, period_start
         ORDER BY total_spend DESC;
         """
         response = await prisma_client.db.query_raw(
@@ -67,13 +69,13 @@ async def ui_get_spend_by_tags(
         # filter by tags list
         sql_query = """
         SELECT
-            individual_request_tag,
-            SUM(log_count) AS log_count,
-            SUM(total_spend) AS total_spend
-        FROM DailyTagSpend
-        WHERE spend_date >= $1::date AND spend_date <= $2::date
-          AND individual_request_tag = ANY($3::text[])
-        GROUP BY individual_request_tag
+            request_tag AS individual_request_tag,
+            SUM(api_requests)::bigint AS log_count,
+            SUM(spend) AS total_spend
+        FROM "LiteLLM_DailySpendRollup"
+        WHERE period_start BETWEEN $1::date AND $2::date
+          AND request_tag = ANY($3::text[])
+        GROUP BY request_tag
         ORDER BY total_spend DESC;
         """
         response = await prisma_client.db.query_raw(
@@ -40,6 +40,13 @@ input_callback: List[Union[str, Callable]] = []
 success_callback: List[Union[str, Callable]] = []
 failure_callback: List[Union[str, Callable]] = []
 service_callback: List[Union[str, Callable]] = []
+service_span_sample_rate: float = (
+    1.0  # fraction of redis / db / router calls logged as individual spans on otel / datadog
+)
+service_span_latency_threshold: Optional[float] = (
+    None  # seconds - calls slower than this are always logged as individual spans
+)
+service_metrics_flush_interval: int = 60  # seconds between service latency summaries
 _custom_logger_compatible_callbacks_literal = Literal[
     "lago",
     "openmeter",
@@ -67,6 +74,9 @@ langfuse_default_tags: Optional[List[str]] = None
 langsmith_batch_size: Optional[int] = None
 argilla_batch_size: Optional[int] = None
 argilla_transformation_object: Optional[Dict[str, Any]] = None
+prometheus_label_cardinality_limits: Optional[Dict[str, int]] = (
+    None  # max distinct values per prometheus label, e.g. {"end_user": 1000}
+)
 _async_input_callback: List[Callable] = (
     []
 )  # internal variable - async custom callbacks are routed here.
@@ -131,9 +141,20 @@ common_cloud_provider_auth_params: dict = {
 use_client: bool = False
 ssl_verify: Union[str, bool] = True
 ssl_certificate: Optional[str] = None
+# opt-in HTTP/2 for litellm's async httpx clients. Requires `pip install h2`
+enable_http2: bool = False
+# max concurrent requests per host, for each async httpx client
+max_connections_per_host: Optional[int] = None
 disable_streaming_logging: bool = False
 in_memory_llm_clients_cache: dict = {}
 safe_memory_mode: bool = False
+media_cache_max_bytes: int = (
+    64 * 1024 * 1024
+)  # max size of the in-memory cache of image urls -> base64, for providers that need inline images (anthropic, bedrock, ...)
+# optional on-disk tier for the image cache. Requires `pip install diskcache`
+media_cache_dir: Optional[str] = None
+# seconds an image url -> content mapping is cached for, before the url is re-fetched
+media_cache_url_ttl: float = 600
 enable_azure_ad_token_refresh: Optional[bool] = False
 ### DEFAULT AZURE API VERSION ###
 AZURE_DEFAULT_API_VERSION = "2024-08-01-preview"  # this is updated to the latest
@@ -161,6 +182,10 @@ enable_json_schema_validation: bool = False
 ##################
 logging: bool = True
 enable_loadbalancing_on_batch_endpoints: Optional[bool] = None
+local_batch_storage_dir: str = (
+    ".litellm_batches"  # where batches run by the proxy ('local' provider) keep their files + state
+)
+local_batch_max_concurrency: int = 32
 enable_caching_on_provider_specific_optional_params: bool = (
     False  # feature-flag for caching on optional params - e.g. 'top_k'
 )
@@ -97,9 +97,23 @@ def _enable_debugging():
     verbose_proxy_logger.disabled = False
 
 
-def print_verbose(print_statement):
+def _format_log_message(msg, args: tuple) -> str:
+    """
+    %-style formatting, same as `logging` - only done once the message is going to be emitted
+    """
+    if args:
+        return str(msg) % args
+    return msg
+
+
+def print_verbose(print_statement, *args):
+    """
+    `print_statement` can be a %-style format string, e.g. `print_verbose("response: %s", response)`.
+
+    `args` are only formatted if the message is printed.
+    """
     try:
         if set_verbose:
-            print(print_statement)  # noqa
+            print(_format_log_message(print_statement, args))  # noqa
     except Exception:
         pass
@@ -1,9 +1,14 @@
 import asyncio
+import random
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.asyncify import run_async_function
+from litellm.litellm_core_utils.service_metrics_aggregator import (
+    ServiceMetricsAggregator,
+)
 from litellm.proxy._types import UserAPIKeyAuth
 
 from .integrations.custom_logger import CustomLogger
@@ -27,6 +32,10 @@ class ServiceLogging(CustomLogger):
     Separate class used for monitoring health of litellm-adjacent services (redis/postgres).
     """
 
+    # one per process - every instance (each redis cache, db client, router, ...) records into it, and one task flushes it
+    service_metrics: ClassVar[ServiceMetricsAggregator] = ServiceMetricsAggregator()
+    periodic_flush_task: ClassVar[Optional[asyncio.Task]] = None
+
     def __init__(self, mock_testing: bool = False) -> None:
         self.mock_testing = mock_testing
         self.mock_testing_sync_success_hook = 0
@@ -46,61 +55,260 @@ class ServiceLogging(CustomLogger):
         end_time: Optional[Union[float, datetime]] = None,
     ):
         """
-        Handles both sync and async monitoring by checking for existing event loop.
+        Sync entrypoint - same as `log_service_success`
         """
 
         if self.mock_testing:
             self.mock_testing_sync_success_hook += 1
 
+        self._log_service_success(
+            service=service,
+            duration=duration,
+            call_type=call_type,
+            parent_otel_span=parent_otel_span,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def service_failure_hook(
+        self, service: ServiceTypes, duration: float, error: Exception, call_type: str
+    ):
+        """
+        Sync entrypoint - same as `log_service_failure`
+        """
+        if self.mock_testing:
+            self.mock_testing_sync_failure_hook += 1
+
+        self._log_service_failure(
+            service=service,
+            duration=duration,
+            error=error,
+            call_type=call_type,
+        )
+
+    def log_service_success(
+        self,
+        service: ServiceTypes,
+        duration: float,
+        call_type: str,
+        parent_otel_span: Optional[Span] = None,
+        start_time: Optional[Union[datetime, float]] = None,
+        end_time: Optional[Union[float, datetime]] = None,
+        event_metadata: Optional[dict] = None,
+    ):
+        """
+        Records a successful redis / postgres / router call, without creating a task per call.
+
+        - latency + counts are aggregated in-process, and flushed as summaries every `litellm.service_metrics_flush_interval` seconds
+        - prometheus is updated inline
+        - an individual otel span is only logged if the call is sampled (`litellm.service_span_sample_rate`) or slower than `litellm.service_span_latency_threshold`
+        """
+        if self.mock_testing:
+            self.mock_testing_async_success_hook += 1
+
+        self._log_service_success(
+            service=service,
+            duration=duration,
+            call_type=call_type,
+            parent_otel_span=parent_otel_span,
+            start_time=start_time,
+            end_time=end_time,
+            event_metadata=event_metadata,
+        )
+
+    def _log_service_success(
+        self,
+        service: ServiceTypes,
+        duration: float,
+        call_type: str,
+        parent_otel_span: Optional[Span] = None,
+        start_time: Optional[Union[datetime, float]] = None,
+        end_time: Optional[Union[float, datetime]] = None,
+        event_metadata: Optional[dict] = None,
+    ):
+        self.service_metrics.record(
+            service=service.value, call_type=call_type, duration=duration
+        )
+        if not litellm.service_callback:
+            return
+        self._start_periodic_flush_if_none()
+
         try:
-            # Try to get the current event loop
-            loop = asyncio.get_event_loop()
-            # Check if the loop is running
-            if loop.is_running():
-                # If we're in a running loop, create a task
-                loop.create_task(
-                    self.async_service_success_hook(
-                        service=service,
-                        duration=duration,
-                        call_type=call_type,
-                        parent_otel_span=parent_otel_span,
-                        start_time=start_time,
-                        end_time=end_time,
-                    )
-                )
-            else:
-                # Loop exists but not running, we can use run_until_complete
-                loop.run_until_complete(
-                    self.async_service_success_hook(
-                        service=service,
-                        duration=duration,
-                        call_type=call_type,
-                        parent_otel_span=parent_otel_span,
-                        start_time=start_time,
-                        end_time=end_time,
-                    )
+            payload = ServiceLoggerPayload(
+                is_error=False,
+                error=None,
+                service=service,
+                duration=duration,
+                call_type=call_type,
+            )
+            if "prometheus_system" in litellm.service_callback:
+                self._get_prometheus_services_logger().service_success_hook(
+                    payload=payload
                 )
-        except RuntimeError:
-            # No event loop exists, create a new one and run
-            asyncio.run(
-                self.async_service_success_hook(
-                    service=service,
-                    duration=duration,
-                    call_type=call_type,
+            if self._should_log_service_span(
+                duration=duration, parent_otel_span=parent_otel_span
+            ):
+                self._schedule_service_span(
+                    payload=payload,
                     parent_otel_span=parent_otel_span,
                     start_time=start_time,
                     end_time=end_time,
+                    event_metadata=event_metadata,
                 )
+        except Exception as e:
+            verbose_logger.exception(
+                "ServiceLogging: Exception logging service success - %s", str(e)
             )
 
-    def service_failure_hook(
-        self, service: ServiceTypes, duration: float, error: Exception, call_type: str
+    def log_service_failure(
+        self,
+        service: ServiceTypes,
+        duration: float,
+        error: Union[str, Exception],
+        call_type: str,
+        parent_otel_span: Optional[Span] = None,
+        start_time: Optional[Union[datetime, float]] = None,
+        end_time: Optional[Union[float, datetime]] = None,
+        event_metadata: Optional[dict] = None,
     ):
         """
-        [TODO] Not implemented for sync calls yet. V0 is focused on async monitoring (used by proxy).
+        Records a failed redis / postgres / router call, without creating a task per call.
+
+        Failures are always logged as individual otel / datadog events.
         """
         if self.mock_testing:
-            self.mock_testing_sync_failure_hook += 1
+            self.mock_testing_async_failure_hook += 1
+
+        self._log_service_failure(
+            service=service,
+            duration=duration,
+            error=error,
+            call_type=call_type,
+            parent_otel_span=parent_otel_span,
+            start_time=start_time,
+            end_time=end_time,
+            event_metadata=event_metadata,
+        )
+
+    def _log_service_failure(
+        self,
+        service: ServiceTypes,
+        duration: float,
+        error: Union[str, Exception],
+        call_type: str,
+        parent_otel_span: Optional[Span] = None,
+        start_time: Optional[Union[datetime, float]] = None,
+        end_time: Optional[Union[float, datetime]] = None,
+        event_metadata: Optional[dict] = None,
+    ):
+        self.service_metrics.record(
+            service=service.value, call_type=call_type, duration=duration, is_error=True
+        )
+        if not litellm.service_callback:
+            return
+        self._start_periodic_flush_if_none()
+
+        try:
+            payload = ServiceLoggerPayload(
+                is_error=True,
+                error=str(error),
+                service=service,
+                duration=duration,
+                call_type=call_type,
+            )
+            if "prometheus_system" in litellm.service_callback:
+                self._get_prometheus_services_logger().service_failure_hook(
+                    payload=payload, error=error
+                )
+            if self._should_log_service_span(
+                duration=duration, parent_otel_span=parent_otel_span, is_error=True
+            ):
+                self._schedule_service_span(
+                    payload=payload,
+                    parent_otel_span=parent_otel_span,
+                    start_time=start_time,
+                    end_time=end_time,
+                    event_metadata=event_metadata,
+                )
+        except Exception as e:
+            verbose_logger.exception(
+                "ServiceLogging: Exception logging service failure - %s", str(e)
+            )
+
+    def _should_log_service_span(
+        self,
+        duration: float,
+        parent_otel_span: Optional[Span],
+        is_error: bool = False,
+    ) -> bool:
+        if not any(
+            callback != "prometheus_system" for callback in litellm.service_callback
+        ):
+            return False
+        if is_error:
+            return True
+        if parent_otel_span is None:
+            # success is only logged as an otel span under the request span - datadog only gets the summaries
+            return False
+        if (
+            litellm.service_span_latency_threshold is not None
+            and duration >= litellm.service_span_latency_threshold
+        ):
+            return True
+        return random.random() < litellm.service_span_sample_rate
+
+    def _schedule_service_span(self, **kwargs):
+        try:
+            asyncio.get_running_loop().create_task(
+                self._async_log_service_span(**kwargs)
+            )
+        except RuntimeError:
+            # No running event loop - use the long-lived background loop, instead of creating a new event loop per call
+            run_async_function(self._async_log_service_span, **kwargs)
+
+    def _get_prometheus_services_logger(self) -> PrometheusServicesLogger:
+        if getattr(self, "prometheusServicesLogger", None) is None:
+            self.prometheusServicesLogger = PrometheusServicesLogger()
+        return self.prometheusServicesLogger
+
+    def _start_periodic_flush_if_none(self):
+        """
+        Start the process-wide flush task - again if it stopped, or its event loop was closed
+        """
+        task = ServiceLogging.periodic_flush_task
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            return
+        try:
+            ServiceLogging.periodic_flush_task = asyncio.get_running_loop().create_task(
+                self.periodic_flush()
+            )
+        except RuntimeError:
+            # No running event loop - started by the first call made from one
+            pass
+
+    async def periodic_flush(self):
+        while True:
+            await asyncio.sleep(litellm.service_metrics_flush_interval)
+            try:
+                await self.flush_service_metrics()
+            except Exception as e:
+                verbose_logger.exception(
+                    "ServiceLogging: Exception flushing service metrics - %s", str(e)
+                )
+
+    async def flush_service_metrics(self):
+        """
+        Sends the service latency summaries since the last flush to datadog
+        """
+        summaries = self.service_metrics.flush()
+        if not summaries:
+            return
+        verbose_logger.debug(
+            "ServiceLogging: service metrics summaries - %s", summaries
+        )
+        if "datadog" in litellm.service_callback:
+            await self.init_datadog_logger_if_none()
+            await self.dd_logger.async_service_metrics_summary_hook(summaries=summaries)
 
     async def async_service_success_hook(
         self,
@@ -115,8 +323,6 @@ class ServiceLogging(CustomLogger):
         """
         - For counting if the redis, postgres call is successful
         """
-        from litellm.integrations.opentelemetry import OpenTelemetry
-
         if self.mock_testing:
             self.mock_testing_async_success_hook += 1
 
@@ -128,23 +334,52 @@ class ServiceLogging(CustomLogger):
             call_type=call_type,
         )
 
-        for callback in litellm.service_callback:
-            if callback == "prometheus_system":
-                await self.init_prometheus_services_logger_if_none()
-                await self.prometheusServicesLogger.async_service_success_hook(
-                    payload=payload
-                )
-            elif callback == "datadog":
-                from litellm.integrations.datadog.datadog import DataDogLogger
+        if "prometheus_system" in litellm.service_callback:
+            await self.init_prometheus_services_logger_if_none()
+            await self.prometheusServicesLogger.async_service_success_hook(
+                payload=payload
+            )
+        await self._async_log_service_span(
+            payload=payload,
+            parent_otel_span=parent_otel_span,
+            start_time=start_time,
+            end_time=end_time,
+            event_metadata=event_metadata,
+        )
 
+    async def _async_log_service_span(
+        self,
+        payload: ServiceLoggerPayload,
+        parent_otel_span: Optional[Span] = None,
+        start_time: Optional[Union[datetime, float]] = None,
+        end_time: Optional[Union[datetime, float]] = None,
+        event_metadata: Optional[dict] = None,
+    ):
+        """
+        Logs the individual service call on datadog / otel
+        """
+        from litellm.integrations.opentelemetry import OpenTelemetry
+
+        for callback in litellm.service_callback:
+            if callback == "datadog":
                 await self.init_datadog_logger_if_none()
-                await self.dd_logger.async_service_success_hook(
-                    payload=payload,
-                    parent_otel_span=parent_otel_span,
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata=event_metadata,
-                )
+                if payload.is_error:
+                    await self.dd_logger.async_service_failure_hook(
+                        payload=payload,
+                        error=payload.error,
+                        parent_otel_span=parent_otel_span,
+                        start_time=start_time,
+                        end_time=end_time,
+                        event_metadata=event_metadata,
+                    )
+                else:
+                    await self.dd_logger.async_service_success_hook(
+                        payload=payload,
+                        parent_otel_span=parent_otel_span,
+                        start_time=start_time,
+                        end_time=end_time,
+                        event_metadata=event_metadata,
+                    )
             elif callback == "otel" or isinstance(callback, OpenTelemetry):
                 from litellm.proxy.proxy_server import open_telemetry_logger
 
@@ -219,8 +454,6 @@ class ServiceLogging(CustomLogger):
         """
         - For counting if the redis, postgres call is unsuccessful
         """
-        from litellm.integrations.opentelemetry import OpenTelemetry
-
         if self.mock_testing:
             self.mock_testing_async_failure_hook += 1
 
@@ -237,43 +470,19 @@ class ServiceLogging(CustomLogger):
             duration=duration,
             call_type=call_type,
         )
-        for callback in litellm.service_callback:
-            if callback == "prometheus_system":
-                await self.init_prometheus_services_logger_if_none()
-                await self.prometheusServicesLogger.async_service_failure_hook(
-                    payload=payload,
-                    error=error,
-                )
-            elif callback == "datadog":
-                await self.init_datadog_logger_if_none()
-                await self.dd_logger.async_service_failure_hook(
-                    payload=payload,
-                    error=error_message,
-                    parent_otel_span=parent_otel_span,
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata=event_metadata,
-                )
-            elif callback == "otel" or isinstance(callback, OpenTelemetry):
-                from litellm.proxy.proxy_server import open_telemetry_logger
-
-                await self.init_otel_logger_if_none()
-
-                if not isinstance(error, str):
-                    error = str(error)
-
-                if (
-                    parent_otel_span is not None
-                    and open_telemetry_logger is not None
-                    and isinstance(open_telemetry_logger, OpenTelemetry)
-                ):
-                    await self.otel_logger.async_service_success_hook(
-                        payload=payload,
-                        parent_otel_span=parent_otel_span,
-                        start_time=start_time,
-                        end_time=end_time,
-                        event_metadata=event_metadata,
-                    )
+        if "prometheus_system" in litellm.service_callback:
+            await self.init_prometheus_services_logger_if_none()
+            await self.prometheusServicesLogger.async_service_failure_hook(
+                payload=payload,
+                error=error,
+            )
+        await self._async_log_service_span(
+            payload=payload,
+            parent_otel_span=parent_otel_span,
+            start_time=start_time,
+            end_time=end_time,
+            event_metadata=event_metadata,
+        )
 
     async def async_post_call_failure_hook(
         self,
@@ -0,0 +1,627 @@
+"""
+Local execution of OpenAI-format batches
+
+Runs a `/v1/batches` input file through the Router, instead of a provider's native batch API - works for any deployment (self-hosted, providers without a batch API).
+
+- requests are sent with an adaptive concurrency limit (AIMD): halved on a RateLimitError, +1 after `limit` successes, capped at `max_concurrency`.
+  The Router's own tpm/rpm checks decide when a deployment is at its limit.
+- results are appended to the output / error file as they complete - on restart, `resume()` re-runs unfinished batches and skips the custom_ids already written.
+- output lines use the OpenAI batch result format: `{"id", "custom_id", "response": {"status_code", "request_id", "body"}, "error"}`
+- with several proxy workers sharing `storage_dir`, a batch is only run by the worker holding its lock file (`flock`, released when the process exits).
+  Any worker can cancel it - the running worker checks for the cancel marker every BATCH_STATE_CHECKPOINT_INTERVAL seconds.
+
+Storage layout (`storage_dir`):
+- files/<file_id>.jsonl - uploaded input files + output / error files
+- batches/<batch_id>.json - batch state
+- batches/<batch_id>.lock - held by the worker running the batch
+- batches/<batch_id>.cancel - written when the batch is cancelled
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import fcntl
+except ImportError:  # windows - batches can't be claimed, only run one proxy worker
+    fcntl = None  # type: ignore
+
+from openai.types.batch import Errors
+from openai.types.batch_error import BatchError
+from openai.types.batch_request_counts import BatchRequestCounts
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.types.llms.openai import Batch, FileObject
+
+if TYPE_CHECKING:
+    from litellm.router import Router
+else:
+    Router = Any
+
+LOCAL_BATCH_ENDPOINTS = ("/v1/chat/completions", "/v1/embeddings", "/v1/completions")
+UNFINISHED_BATCH_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+FILE_CHUNK_SIZE = 1024 * 1024
+# seconds between request_counts updates in the batch state file
+BATCH_STATE_CHECKPOINT_INTERVAL = 5
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit - `limit` is halved when a request is rate limited, and grows by 1 for every `limit` successful requests
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit: float = max_concurrency
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, rate_limited: bool = False) -> None:
+        async with self.condition:
+            self.in_flight -= 1
+            if rate_limited:
+                self.limit = max(self.min_concurrency, self.limit / 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+
+def _iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class LocalBatchEngine:
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_rate_limit_retries: int = 8,
+    ):
+        """
+        Args:
+            storage_dir: where files + batch state are kept. Defaults to `litellm.local_batch_storage_dir`
+            max_concurrency: max requests in flight per batch. Defaults to `litellm.local_batch_max_concurrency`
+            max_rate_limit_retries: times a rate limited request is retried (with backoff) before it's written to the error file
+        """
+        self._storage_dir = storage_dir
+        self._max_concurrency = max_concurrency
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.running_batches: Dict[str, asyncio.Task] = {}
+        self.cancel_requested: Set[str] = set()
+        # batch id -> open lock file, held while this process runs the batch
+        self.batch_locks: Dict[str, IO[bytes]] = {}
+
+    @property
+    def storage_dir(self) -> str:
+        return self._storage_dir or litellm.local_batch_storage_dir
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency or litellm.local_batch_max_concurrency
+
+    def _get_file_path(self, file_id: str) -> str:
+        if os.path.basename(file_id) != file_id:
+            raise ValueError(f"Invalid file_id={file_id}")
+        return os.path.join(self.storage_dir, "files", f"{file_id}.jsonl")
+
+    def _get_batch_path(self, batch_id: str) -> str:
+        if os.path.basename(batch_id) != batch_id:
+            raise ValueError(f"Invalid batch_id={batch_id}")
+        return os.path.join(self.storage_dir, "batches", f"{batch_id}.json")
+
+    def _get_cancel_marker_path(self, batch_id: str) -> str:
+        return self._get_batch_path(batch_id)[: -len(".json")] + ".cancel"
+
+    def _claim_batch(self, batch_id: str) -> bool:
+        """
+        Take the batch's lock file, so no other proxy worker runs it. False if another process holds it.
+
+        The lock is released when the batch finishes, or when the process exits.
+        """
+        if batch_id in self.batch_locks:
+            return True
+        lock_path = self._get_batch_path(batch_id)[: -len(".json")] + ".lock"
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        lock_file = open(lock_path, "ab")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+        self.batch_locks[batch_id] = lock_file
+        return True
+
+    def _release_batch(self, batch_id: str) -> None:
+        lock_file = self.batch_locks.pop(batch_id, None)
+        if lock_file is not None:
+            lock_file.close()  # releases the flock
+
+    def _is_cancel_requested(self, batch_id: str) -> bool:
+        return batch_id in self.cancel_requested or os.path.exists(
+            self._get_cancel_marker_path(batch_id)
+        )
+
+    def _read_batch(self, batch_id: str) -> Batch:
+        batch_path = self._get_batch_path(batch_id)
+        if not os.path.exists(batch_path):
+            raise litellm.NotFoundError(
+                message=f"Batch {batch_id} not found",
+                model="",
+                llm_provider="local",
+            )
+        with open(batch_path, "r") as f:
+            return Batch(**json.load(f))
+
+    def _write_batch(self, batch: Batch) -> None:
+        batch_path = self._get_batch_path(batch.id)
+        os.makedirs(os.path.dirname(batch_path), exist_ok=True)
+        # write + rename, so a crash never leaves a partial state file
+        tmp_path = f"{batch_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(batch.model_dump_json())
+        os.replace(tmp_path, batch_path)
+
+    ### FILES ###
+
+    async def acreate_file(
+        self, file: Union[bytes, IO[bytes]], purpose: str = "batch", filename: str = ""
+    ) -> FileObject:
+        """
+        Store an input file. `file` can be bytes or a binary file object - file objects are copied in chunks.
+        """
+        file_id = f"file-local-{uuid.uuid4().hex}"
+        file_size = await asyncio.get_running_loop().run_in_executor(
+            None, self._write_file, self._get_file_path(file_id), file
+        )
+        return FileObject(
+            id=file_id,
+            bytes=file_size,
+            created_at=int(time.time()),
+            filename=filename or f"{file_id}.jsonl",
+            object="file",
+            purpose=purpose,  # type: ignore
+            status="processed",
+        )
+
+    @staticmethod
+    def _write_file(file_path: str, file: Union[bytes, IO[bytes]]) -> int:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as f:
+            if isinstance(file, bytes):
+                f.write(file)
+            else:
+                while True:
+                    chunk = file.read(FILE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+        return os.path.getsize(file_path)
+
+    def get_file_path(self, file_id: str) -> str:
+        """
+        Path to a stored input / output / error file - lets the proxy stream it back, instead of reading it into memory
+        """
+        file_path = self._get_file_path(file_id)
+        if not os.path.exists(file_path):
+            raise litellm.NotFoundError(
+                message=f"File {file_id} not found",
+                model="",
+                llm_provider="local",
+            )
+        return file_path
+
+    def _read_file(self, file_id: str) -> bytes:
+        with open(self.get_file_path(file_id), "rb") as f:
+            return f.read()
+
+    async def afile_content(self, file_id: str) -> bytes:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._read_file, file_id
+        )
+
+    ### BATCHES ###
+
+    async def acreate_batch(
+        self,
+        router: "Router",
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str = "24h",
+        metadata: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Batch:
+        if endpoint not in LOCAL_BATCH_ENDPOINTS:
+            raise ValueError(
+                f"Unsupported endpoint={endpoint} for local batches. Supported: {LOCAL_BATCH_ENDPOINTS}"
+            )
+        self.get_file_path(input_file_id)  # raises if the input file doesn't exist
+        batch_id = f"batch-local-{uuid.uuid4().hex}"
+        batch = Batch(
+            id=batch_id,
+            object="batch",
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            completion_window=completion_window,
+            status="validating",
+            created_at=int(time.time()),
+            metadata=metadata,
+            output_file_id=f"file-{batch_id}-output",
+            error_file_id=f"file-{batch_id}-errors",
+            request_counts=BatchRequestCounts(total=0, completed=0, failed=0),
+        )
+        self._write_batch(batch)
+        self._claim_batch(batch_id)  # new batch - no other worker knows about it yet
+        self._start(batch_id=batch_id, router=router)
+        return batch
+
+    async def aretrieve_batch(self, batch_id: str, **kwargs) -> Batch:
+        return self._read_batch(batch_id)
+
+    async def acancel_batch(self, batch_id: str, **kwargs) -> Batch:
+        """
+        Requests already in flight finish and are written to the output file, no new requests are sent.
+
+        Works from any proxy worker - the worker running the batch stops sending requests at its next checkpoint.
+        """
+        batch = self._read_batch(batch_id)
+        if batch.status not in UNFINISHED_BATCH_STATUSES:
+            return batch
+        # marker first - the running worker may overwrite the state file before it sees the marker
+        with open(self._get_cancel_marker_path(batch_id), "w"):
+            pass
+        batch.status = "cancelling"
+        batch.cancelling_at = batch.cancelling_at or int(time.time())
+        self._write_batch(batch)
+        if batch_id in self.running_batches:
+            self.cancel_requested.add(batch_id)
+        elif self._claim_batch(batch_id):  # not running anywhere - nothing to wait for
+            try:
+                completed, failed = await asyncio.get_running_loop().run_in_executor(
+                    None, self._count_done, batch
+                )
+                batch.request_counts = BatchRequestCounts(
+                    total=batch.request_counts.total,  # type: ignore
+                    completed=completed,
+                    failed=failed,
+                )
+                self._finish_batch(batch)
+            finally:
+                self._release_batch(batch_id)
+        return batch
+
+    def _list_batches(self) -> List[Batch]:
+        batches_dir = os.path.join(self.storage_dir, "batches")
+        if not os.path.isdir(batches_dir):
+            return []
+        batches = [
+            self._read_batch(filename[: -len(".json")])
+            for filename in os.listdir(batches_dir)
+            if filename.endswith(".json")
+        ]
+        batches.sort(key=lambda batch: batch.created_at, reverse=True)
+        return batches
+
+    async def alist_batches(
+        self, after: Optional[str] = None, limit: Optional[int] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Newest first. Returns an OpenAI list object - `{"object": "list", "data", "first_id", "last_id", "has_more"}`
+        """
+        batches = self._list_batches()
+        if after is not None:
+            ids = [batch.id for batch in batches]
+            batches = batches[ids.index(after) + 1 :] if after in ids else []
+        page = batches[: limit or 20]
+        return {
+            "object": "list",
+            "data": page,
+            "first_id": page[0].id if len(page) > 0 else None,
+            "last_id": page[-1].id if len(page) > 0 else None,
+            "has_more": len(batches) > len(page),
+        }
+
+    async def resume(self, router: "Router") -> List[str]:
+        """
+        Restart the batches that were running when the process stopped. Returns their ids.
+
+        Batches another proxy worker has already claimed are skipped - each batch is resumed by one worker.
+        """
+        resumed: List[str] = []
+        for batch in self._list_batches():
+            if (
+                batch.status in UNFINISHED_BATCH_STATUSES
+                and batch.id not in self.running_batches
+                and self._claim_batch(batch.id)
+            ):
+                self._start(batch_id=batch.id, router=router)
+                resumed.append(batch.id)
+        if len(resumed) > 0:
+            verbose_logger.info(
+                "LocalBatchEngine: resumed {} batches - {}".format(
+                    len(resumed), resumed
+                )
+            )
+        return resumed
+
+    def _start(self, batch_id: str, router: "Router") -> None:
+        """
+        Run a batch this process has claimed
+        """
+        task = asyncio.create_task(self._run_batch(batch_id=batch_id, router=router))
+        self.running_batches[batch_id] = task
+
+        def _on_done(_: asyncio.Task) -> None:
+            self.running_batches.pop(batch_id, None)
+            self._release_batch(batch_id)
+
+        task.add_done_callback(_on_done)
+
+    ### EXECUTION ###
+
+    def _validate_input_file(self, batch: Batch) -> int:
+        """
+        Returns the number of requests in the input file. Raises ValueError on the first invalid line.
+        """
+        total = 0
+        custom_ids: Set[str] = set()
+        for line_number, request in enumerate(
+            _iter_jsonl(self.get_file_path(batch.input_file_id)), start=1
+        ):
+            custom_id = request.get("custom_id")
+            if not isinstance(custom_id, str) or custom_id in custom_ids:
+                raise ValueError(
+                    f"line {line_number}: custom_id is missing or not unique"
+                )
+            if request.get("url") != batch.endpoint:
+                raise ValueError(
+                    f"line {line_number}: url={request.get('url')} does not match the batch endpoint={batch.endpoint}"
+                )
+            if (
+                not isinstance(request.get("body"), dict)
+                or "model" not in request["body"]
+            ):
+                raise ValueError(f"line {line_number}: body.model is required")
+            custom_ids.add(custom_id)
+            total += 1
+        return total
+
+    def _get_done_custom_ids(self, file_id: Optional[str]) -> Set[str]:
+        if file_id is None:
+            return set()
+        file_path = self._get_file_path(file_id)
+        if not os.path.exists(file_path):
+            return set()
+        done: Set[str] = set()
+        # drop a partially written last line, left by a crash mid-write
+        with open(file_path, "rb+") as f:
+            valid_size = 0
+            for line in f:
+                try:
+                    done.add(json.loads(line)["custom_id"])
+                except (ValueError, KeyError):
+                    break
+                valid_size += len(line)
+            f.truncate(valid_size)
+        return done
+
+    def _count_done(self, batch: Batch) -> Tuple[int, int]:
+        """
+        (completed, failed) - the results already in the output / error files
+        """
+        return len(self._get_done_custom_ids(batch.output_file_id)), len(
+            self._get_done_custom_ids(batch.error_file_id)
+        )
+
+    async def _run_batch(self, batch_id: str, router: "Router") -> None:
+        batch = self._read_batch(batch_id)
+        loop = asyncio.get_running_loop()
+        try:
+            if batch.status == "validating":
+                try:
+                    # file reads run in the default thread pool, not on the event loop
+                    total = await loop.run_in_executor(
+                        None, self._validate_input_file, batch
+                    )
+                except Exception as e:
+                    batch.status = "failed"
+                    batch.failed_at = int(time.time())
+                    batch.errors = Errors(
+                        object="list",
+                        data=[BatchError(code="invalid_request", message=str(e))],
+                    )
+                    self._write_batch(batch)
+                    return
+                batch.request_counts = BatchRequestCounts(
+                    total=total, completed=0, failed=0
+                )
+                batch.status = "in_progress"
+                batch.in_progress_at = int(time.time())
+                self._write_batch(batch)
+
+            # results already written by a previous run are the checkpoint
+            done_output_ids = await loop.run_in_executor(
+                None, self._get_done_custom_ids, batch.output_file_id
+            )
+            done_error_ids = await loop.run_in_executor(
+                None, self._get_done_custom_ids, batch.error_file_id
+            )
+            # counted in memory from here on - not by re-reading the result files
+            batch.request_counts = BatchRequestCounts(
+                total=batch.request_counts.total,  # type: ignore
+                completed=len(done_output_ids),
+                failed=len(done_error_ids),
+            )
+            if batch.status == "in_progress" and not self._is_cancel_requested(
+                batch.id
+            ):
+                await self._run_requests(
+                    batch=batch,
+                    router=router,
+                    skip_custom_ids=done_output_ids | done_error_ids,
+                )
+            self._finish_batch(batch)
+        except Exception as e:
+            verbose_logger.exception(
+                "LocalBatchEngine: batch {} failed - {}".format(batch_id, str(e))
+            )
+            batch.status = "failed"
+            batch.failed_at = int(time.time())
+            self._write_batch(batch)
+
+    def _finish_batch(self, batch: Batch) -> None:
+        latest = self._read_batch(batch.id)
+        now = int(time.time())
+        if latest.status == "cancelling" or self._is_cancel_requested(batch.id):
+            self.cancel_requested.discard(batch.id)
+            batch.status = "cancelled"
+            batch.cancelling_at = latest.cancelling_at
+            batch.cancelled_at = now
+        else:
+            batch.status = "completed"
+            batch.finalizing_at = now
+            batch.completed_at = now
+        self._write_batch(batch)
+
+    async def _run_requests(
+        self, batch: Batch, router: "Router", skip_custom_ids: Set[str]
+    ) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=self.max_concurrency)
+        tasks: Set[asyncio.Task] = set()
+        last_checkpoint = time.time()
+        with open(self._get_file_path(batch.output_file_id), "ab") as output_file, open(  # type: ignore
+            self._get_file_path(batch.error_file_id), "ab"  # type: ignore
+        ) as error_file:
+            for request in _iter_jsonl(self.get_file_path(batch.input_file_id)):
+                if request["custom_id"] in skip_custom_ids:
+                    continue
+                # input is read as requests complete - only `limit` requests are held in memory
+                await limiter.acquire()
+                if time.time() - last_checkpoint > BATCH_STATE_CHECKPOINT_INTERVAL:
+                    last_checkpoint = time.time()
+                    # cancelled from another proxy worker
+                    if self._is_cancel_requested(batch.id):
+                        self.cancel_requested.add(batch.id)
+                        batch.status = "cancelling"
+                    self._write_batch(batch)
+                if batch.id in self.cancel_requested:
+                    await limiter.release()
+                    break
+                task = asyncio.create_task(
+                    self._run_request(
+                        request=request,
+                        batch=batch,
+                        router=router,
+                        limiter=limiter,
+                        output_file=output_file,
+                        error_file=error_file,
+                    )
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if len(tasks) > 0:
+                await asyncio.gather(*tasks)
+
+    async def _run_request(
+        self,
+        request: Dict[str, Any],
+        batch: Batch,
+        router: "Router",
+        limiter: AdaptiveConcurrencyLimiter,
+        output_file: IO[bytes],
+        error_file: IO[bytes],
+    ) -> None:
+        """
+        Called with a limiter slot already acquired - releases it when done.
+        """
+        custom_id = request["custom_id"]
+        request_counts: BatchRequestCounts = batch.request_counts  # type: ignore
+        attempt = 0
+        while True:
+            try:
+                response = await self._call_router(
+                    router=router, endpoint=batch.endpoint, body=request["body"]
+                )
+                await limiter.release()
+                result = {
+                    "id": f"batch_req_{uuid.uuid4().hex}",
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "request_id": getattr(response, "id", None) or "",
+                        "body": response.model_dump(),
+                    },
+                    "error": None,
+                }
+                output_file.write(json.dumps(result).encode("utf-8") + b"\n")
+                output_file.flush()
+                request_counts.completed += 1
+                return
+            except litellm.RateLimitError as e:
+                await limiter.release(rate_limited=True)
+                if attempt >= self.max_rate_limit_retries:
+                    self._write_error(error_file, custom_id=custom_id, exception=e)
+                    request_counts.failed += 1
+                    return
+                await asyncio.sleep(min(2**attempt, 60))
+                attempt += 1
+                await limiter.acquire()
+            except Exception as e:
+                await limiter.release()
+                self._write_error(error_file, custom_id=custom_id, exception=e)
+                request_counts.failed += 1
+                return
+
+    async def _call_router(
+        self, router: "Router", endpoint: str, body: Dict[str, Any]
+    ) -> Any:
+        body = dict(body)
+        model = body.pop("model")
+        if endpoint == "/v1/chat/completions":
+            return await router.acompletion(model=model, **body)
+        if endpoint == "/v1/embeddings":
+            return await router.aembedding(model=model, **body)
+        return await router.atext_completion(model=model, **body)
+
+    def _write_error(
+        self, error_file: IO[bytes], custom_id: str, exception: Exception
+    ) -> None:
+        result = {
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": custom_id,
+            "response": None,
+            "error": {
+                "code": str(getattr(exception, "status_code", 500)),
+                "message": str(exception),
+            },
+        }
+        error_file.write(json.dumps(result).encode("utf-8") + b"\n")
+        error_file.flush()
+
+
+local_batch_engine = LocalBatchEngine()
@@ -1,7 +1,10 @@
+from .cache_codec import CacheCodec
 from .caching import Cache, LiteLLMCacheType
 from .disk_cache import DiskCache
 from .dual_cache import DualCache
+from .embedding_cache import EmbeddingCache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_semantic_cache import RedisSemanticCache
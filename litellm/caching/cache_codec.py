@@ -0,0 +1,292 @@
+"""
+Binary codec for cached LLM responses (RedisCache / S3Cache / DiskCache)
+
+Encoded entries look like: `MAGIC | version | format | compression | payload`
+- format: msgpack, or json (written with orjson when it's installed)
+- compression: none / zlib / zstd / lz4 - only applied when the payload is larger than `compression_threshold` bytes
+- embedding vectors (`EmbeddingResponse.data[*].embedding`) are packed as float32 arrays, instead of lists of json floats. Other lists of numbers are stored as-is
+
+Entries written before the codec was enabled (plain json / python literal strings) don't start with MAGIC, and are still read with the old logic.
+"""
+
+import base64
+import sys
+import zlib
+from array import array
+from typing import Any, Literal, Optional, Union
+
+from litellm.litellm_core_utils.json_utils import fast_json_dumps, fast_json_loads
+
+CACHE_CODEC_MAGIC = b"\x00LC"
+CACHE_CODEC_VERSION = 1
+HEADER_SIZE = len(CACHE_CODEC_MAGIC) + 3
+
+_FORMAT_JSON = 1
+_FORMAT_MSGPACK = 2
+
+_COMPRESSION_NONE = 0
+_COMPRESSION_ZLIB = 1
+_COMPRESSION_ZSTD = 2
+_COMPRESSION_LZ4 = 3
+
+_FLOAT32_MARKER = "__litellm_f32__"
+MIN_EMBEDDING_LENGTH_TO_PACK = 8
+
+CacheCodecFormat = Literal["auto", "json", "msgpack"]
+CacheCodecCompression = Literal["zlib", "zstd", "lz4"]
+
+
+def _is_msgpack_available() -> bool:
+    try:
+        import msgpack  # type: ignore # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def pack_float32(values: list) -> bytes:
+    """
+    Little-endian float32 bytes for a list of numbers - 4 bytes per value
+    """
+    packed = array("f", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_float32(data: bytes) -> list:
+    unpacked = array("f")
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def _try_pack_float_vector(value: Any) -> Optional[bytes]:
+    """
+    float32 bytes for a list of numbers, None if `value` isn't one
+    """
+    if not isinstance(value, list) or len(value) < MIN_EMBEDDING_LENGTH_TO_PACK:
+        return None
+    try:
+        return pack_float32(value)
+    except TypeError:
+        return None
+
+
+class CacheCodec:
+    def __init__(
+        self,
+        format: CacheCodecFormat = "auto",
+        compression: Optional[CacheCodecCompression] = None,
+        compression_threshold: int = 1024,
+        pack_embeddings_as_float32: bool = True,
+    ):
+        """
+        Args:
+            format: "msgpack" (requires `pip install msgpack`), "json", or "auto" - msgpack if installed, else json
+            compression: "zlib", "zstd" (requires `pip install zstandard`) or "lz4" (requires `pip install lz4`). None = no compression
+            compression_threshold: only compress payloads larger than this many bytes
+            pack_embeddings_as_float32: store `embedding` vectors as float32 arrays (4 bytes per value)
+        """
+        if format == "auto":
+            format = "msgpack" if _is_msgpack_available() else "json"
+        if format == "msgpack" and not _is_msgpack_available():
+            raise ImportError(
+                "msgpack not found. Please install msgpack to use format='msgpack' - `pip install msgpack`"
+            )
+        self.format = format
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.pack_embeddings_as_float32 = pack_embeddings_as_float32
+        self._compression_id = self._get_compression_id(compression)
+
+    @staticmethod
+    def _get_compression_id(compression: Optional[str]) -> int:
+        if compression is None:
+            return _COMPRESSION_NONE
+        if compression == "zlib":
+            return _COMPRESSION_ZLIB
+        if compression == "zstd":
+            try:
+                import zstandard  # type: ignore # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "zstandard not found. Please install zstandard to use compression='zstd' - `pip install zstandard`"
+                )
+            return _COMPRESSION_ZSTD
+        if compression == "lz4":
+            try:
+                import lz4.frame  # type: ignore # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "lz4 not found. Please install lz4 to use compression='lz4' - `pip install lz4`"
+                )
+            return _COMPRESSION_LZ4
+        raise ValueError(
+            f"Unsupported cache compression={compression}. Supported: 'zlib', 'zstd', 'lz4'"
+        )
+
+    def encode(self, value: Any) -> bytes:
+        value = self._prepare(value)
+        if self.format == "msgpack":
+            import msgpack  # type: ignore
+
+            format_id = _FORMAT_MSGPACK
+            payload = msgpack.packb(value, use_bin_type=True)
+        else:
+            format_id = _FORMAT_JSON
+            payload = fast_json_dumps(value)
+
+        compression_id = _COMPRESSION_NONE
+        if (
+            self._compression_id != _COMPRESSION_NONE
+            and len(payload) > self.compression_threshold
+        ):
+            compression_id = self._compression_id
+            payload = _compress(payload, compression_id)
+
+        return (
+            CACHE_CODEC_MAGIC
+            + bytes([CACHE_CODEC_VERSION, format_id, compression_id])
+            + payload
+        )
+
+    def _prepare(self, value: Any) -> Any:
+        # cached responses are stored as {"timestamp": .., "response": <json string>} - encode the response itself, not a json string of it
+        if isinstance(value, dict) and isinstance(value.get("response"), str):
+            response = value["response"]
+            if response.startswith("{") or response.startswith("["):
+                try:
+                    value = {**value, "response": fast_json_loads(response)}
+                except Exception:
+                    pass
+        if (
+            self.pack_embeddings_as_float32
+            and isinstance(value, dict)
+            and isinstance(value.get("response"), dict)
+        ):
+            value = {**value, "response": self._pack_embeddings(value["response"])}
+        return value
+
+    def _pack_embeddings(self, response: dict) -> dict:
+        """
+        Pack the vectors of a cached embedding response - a whole `EmbeddingResponse`, or one of its `data` items (cached per input).
+
+        Nothing else is packed, so other `embedding` fields / lists of numbers keep their exact values.
+        """
+        if response.get("object") == "embedding":
+            return self._pack_embedding_item(response)
+        if response.get("object") == "list" and isinstance(response.get("data"), list):
+            return {
+                **response,
+                "data": [
+                    (
+                        self._pack_embedding_item(item)
+                        if isinstance(item, dict) and item.get("object") == "embedding"
+                        else item
+                    )
+                    for item in response["data"]
+                ],
+            }
+        return response
+
+    def _pack_embedding_item(self, item: dict) -> dict:
+        data = _try_pack_float_vector(item.get("embedding"))
+        if data is None:
+            return item
+        return {
+            **item,
+            "embedding": {
+                _FLOAT32_MARKER: (
+                    data
+                    if self.format == "msgpack"
+                    else base64.b64encode(data).decode("ascii")
+                )
+            },
+        }
+
+
+def is_cache_codec_encoded(data: Any) -> bool:
+    return (
+        isinstance(data, (bytes, bytearray))
+        and bytes(data[: len(CACHE_CODEC_MAGIC)]) == CACHE_CODEC_MAGIC
+    )
+
+
+def decode_cache_value(data: Union[bytes, bytearray]) -> Any:
+    """
+    Decode an entry written by `CacheCodec.encode`. The header says how it was encoded, so this doesn't need the writer's codec settings.
+    """
+    data = bytes(data)
+    version = data[len(CACHE_CODEC_MAGIC)]
+    if version != CACHE_CODEC_VERSION:
+        raise ValueError(f"Unsupported cache entry version={version}")
+    format_id = data[len(CACHE_CODEC_MAGIC) + 1]
+    compression_id = data[len(CACHE_CODEC_MAGIC) + 2]
+    payload = _decompress(data[HEADER_SIZE:], compression_id)
+
+    if format_id == _FORMAT_MSGPACK:
+        import msgpack  # type: ignore
+
+        value = msgpack.unpackb(payload, raw=False)
+    elif format_id == _FORMAT_JSON:
+        value = fast_json_loads(payload)
+    else:
+        raise ValueError(f"Unsupported cache entry format={format_id}")
+    return _unpack_embeddings(value)
+
+
+def _unpack_embeddings(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and _FLOAT32_MARKER in value:
+            data = value[_FLOAT32_MARKER]
+            if isinstance(data, str):
+                data = base64.b64decode(data)
+            return unpack_float32(data)
+        return {k: _unpack_embeddings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_unpack_embeddings(v) for v in value]
+    return value
+
+
+def _compress(payload: bytes, compression_id: int) -> bytes:
+    if compression_id == _COMPRESSION_ZLIB:
+        return zlib.compress(payload)
+    if compression_id == _COMPRESSION_ZSTD:
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdCompressor().compress(payload)
+    if compression_id == _COMPRESSION_LZ4:
+        import lz4.frame  # type: ignore
+
+        return lz4.frame.compress(payload)
+    return payload
+
+
+def _decompress(payload: bytes, compression_id: int) -> bytes:
+    if compression_id == _COMPRESSION_NONE:
+        return payload
+    if compression_id == _COMPRESSION_ZLIB:
+        return zlib.decompress(payload)
+    if compression_id == _COMPRESSION_ZSTD:
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if compression_id == _COMPRESSION_LZ4:
+        import lz4.frame  # type: ignore
+
+        return lz4.frame.decompress(payload)
+    raise ValueError(f"Unsupported cache entry compression={compression_id}")
+
+
+def get_cache_codec(
+    cache_codec: Optional[Union[CacheCodec, dict]]
+) -> Optional[CacheCodec]:
+    """
+    `cache_codec` can be a CacheCodec, or its params as a dict (e.g. from the proxy config.yaml `cache_params`)
+    """
+    if cache_codec is None or isinstance(cache_codec, CacheCodec):
+        return cache_codec
+    return CacheCodec(**cache_codec)
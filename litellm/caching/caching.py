@@ -34,26 +34,29 @@ from openai.types.embedding_create_params import EmbeddingCreateParams
 from pydantic import BaseModel
 
 import litellm
-from litellm._logging import verbose_logger
+from litellm._logging import _format_log_message, verbose_logger
 from litellm.types.caching import *
 from litellm.types.rerank import RerankRequest
 from litellm.types.utils import all_litellm_params
 
 from .base_cache import BaseCache
+from .cache_codec import CacheCodec
 from .disk_cache import DiskCache
 from .dual_cache import DualCache
+from .embedding_cache import EmbeddingCache, get_embedding_cache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_semantic_cache import RedisSemanticCache
 from .s3_cache import S3Cache
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
     try:
-        verbose_logger.debug(print_statement)
+        verbose_logger.debug(print_statement, *args)
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(_format_log_message(print_statement, args))  # noqa
     except Exception:
         pass
 
@@ -108,18 +111,25 @@ class Cache:
         redis_flush_size: Optional[int] = None,
         redis_startup_nodes: Optional[List] = None,
         disk_cache_dir=None,
+        cache_codec: Optional[Union[CacheCodec, dict]] = None,
+        embedding_cache: Optional[Union[EmbeddingCache, dict]] = None,
         qdrant_api_base: Optional[str] = None,
         qdrant_api_key: Optional[str] = None,
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model="text-embedding-ada-002",
+        local_semantic_cache_embedding_model="text-embedding-ada-002",
+        local_semantic_cache_dir: Optional[str] = None,
+        local_semantic_cache_index_type: Literal["flat", "hnsw"] = "flat",
+        local_semantic_cache_max_size: int = 10000,
+        local_semantic_cache_max_embeddings_in_memory: int = 1000,
         **kwargs,
     ):
         """
         Initializes the cache based on the given type.
 
         Args:
-            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3" or "disk". Defaults to "local".
+            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "local-semantic", "s3" or "disk". Defaults to "local".
 
             # Redis Cache Args
             host (str, optional): The host address for the Redis cache. Required if type is "redis".
@@ -134,11 +144,24 @@ class Cache:
             qdrant_api_base (str, optional): The url for your qdrant cluster. Required if type is "qdrant-semantic".
             qdrant_api_key (str, optional): The api_key for the local or cloud qdrant cluster.
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
-            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
+            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic", "qdrant-semantic" or "local-semantic".
+
+            # Local Semantic Cache Args
+            local_semantic_cache_embedding_model (str, optional): The embedding model used to embed prompts. Defaults to "text-embedding-ada-002".
+            local_semantic_cache_dir (str, optional): The directory to persist cached prompt vectors + responses to. Defaults to None (in-memory only).
+            local_semantic_cache_index_type (str, optional): "flat" (exact search) or "hnsw" (approximate search, requires `pip install hnswlib`). Defaults to "flat".
+            local_semantic_cache_max_size (int, optional): Max cached prompts - the oldest is evicted first. Defaults to 10000.
+            local_semantic_cache_max_embeddings_in_memory (int, optional): Number of recent prompt embeddings kept, so a get + set for the same prompt embed it once. Defaults to 1000.
 
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
 
+            # Redis / S3 / Disk Cache Args
+            cache_codec (CacheCodec or dict, optional): Binary encoding (msgpack / json + compression) for cached responses, or the CacheCodec params as a dict. Defaults to None (json).
+
+            # Embedding Cache Args
+            embedding_cache (EmbeddingCache or dict, optional): Per-item float32 vector cache for `aembedding` calls with a list input, or the EmbeddingCache params as a dict (e.g. {"type": "disk", "disk_cache_dir": ...}). A "redis" embedding cache with no connection params reuses the redis cache. Defaults to None (embeddings use the cache above).
+
             # S3 Cache Args
             s3_bucket_name (str, optional): The bucket name for the s3 cache. Defaults to None.
             s3_region_name (str, optional): The region name for the s3 cache. Defaults to None.
@@ -168,6 +191,7 @@ class Cache:
                 password=password,
                 redis_flush_size=redis_flush_size,
                 startup_nodes=redis_startup_nodes,
+                cache_codec=cache_codec,
                 **kwargs,
             )
         elif type == LiteLLMCacheType.REDIS_SEMANTIC:
@@ -189,6 +213,15 @@ class Cache:
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
             )
+        elif type == LiteLLMCacheType.LOCAL_SEMANTIC:
+            self.cache = LocalSemanticCache(
+                similarity_threshold=similarity_threshold,
+                embedding_model=local_semantic_cache_embedding_model,
+                cache_dir=local_semantic_cache_dir,
+                index_type=local_semantic_cache_index_type,
+                max_size=local_semantic_cache_max_size,
+                max_embeddings_in_memory=local_semantic_cache_max_embeddings_in_memory,
+            )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
         elif type == LiteLLMCacheType.S3:
@@ -204,10 +237,13 @@ class Cache:
                 s3_aws_session_token=s3_aws_session_token,
                 s3_config=s3_config,
                 s3_path=s3_path,
+                cache_codec=cache_codec,
                 **kwargs,
             )
         elif type == LiteLLMCacheType.DISK:
-            self.cache = DiskCache(disk_cache_dir=disk_cache_dir)
+            self.cache = DiskCache(
+                disk_cache_dir=disk_cache_dir, cache_codec=cache_codec
+            )
         if "cache" not in litellm.input_callback:
             litellm.input_callback.append("cache")
         if "cache" not in litellm.success_callback:
@@ -233,6 +269,11 @@ class Cache:
         if self.namespace is not None and isinstance(self.cache, RedisCache):
             self.cache.namespace = self.namespace
 
+        self.embedding_cache: Optional[EmbeddingCache] = get_embedding_cache(
+            embedding_cache,
+            redis_cache=self.cache if isinstance(self.cache, RedisCache) else None,
+        )
+
     def get_cache_key(self, **kwargs) -> str:
         """
         Get the cache key for the given arguments.
@@ -549,7 +590,7 @@ class Cache:
                     cached_result=cached_result, max_age=max_age
                 )
         except Exception:
-            print_verbose(f"An exception occurred: {traceback.format_exc()}")
+            print_verbose("An exception occurred: %s", traceback.format_exc())
             return None
 
     async def async_get_cache(self, **kwargs):
@@ -578,7 +619,7 @@ class Cache:
                     cached_result=cached_result, max_age=max_age
                 )
         except Exception:
-            print_verbose(f"An exception occurred: {traceback.format_exc()}")
+            print_verbose("An exception occurred: %s", traceback.format_exc())
             return None
 
     def _add_cache_logic(self, result, **kwargs):
@@ -651,6 +692,28 @@ class Cache:
         except Exception as e:
             verbose_logger.exception(f"LiteLLM Cache: Excepton add_cache: {str(e)}")
 
+    def _should_use_embedding_cache(self, kwargs: dict) -> bool:
+        return (
+            self.embedding_cache is not None
+            and isinstance(kwargs.get("input"), list)
+            and kwargs.get("encoding_format") != "base64"
+        )
+
+    async def async_get_embedding_cache(self, **kwargs) -> List[Optional[dict]]:
+        """
+        Reads the vector for each item in `kwargs["input"]` from the embedding cache - one lookup for the whole list
+
+        Returns a list with `{"embedding": [...]}` for each hit, None for each miss
+        """
+        if self.embedding_cache is None:
+            return [None] * len(kwargs["input"])
+        vectors = await self.embedding_cache.async_get_embeddings(
+            model=self._get_model_param_value(kwargs),
+            dimensions=kwargs.get("dimensions"),
+            inputs=kwargs["input"],
+        )
+        return [None if vector is None else {"embedding": vector} for vector in vectors]
+
     async def async_add_cache_pipeline(self, result, **kwargs):
         """
         Async implementation of add_cache for Embedding calls
@@ -665,6 +728,18 @@ class Cache:
             if self.ttl is not None:
                 kwargs["ttl"] = self.ttl
 
+            if self.embedding_cache is not None and self._should_use_embedding_cache(
+                kwargs
+            ):
+                await self.embedding_cache.async_set_embeddings(
+                    model=self._get_model_param_value(kwargs),
+                    dimensions=kwargs.get("dimensions"),
+                    inputs=kwargs["input"],
+                    embeddings=[item["embedding"] for item in result.data],
+                    ttl=kwargs.get("ttl"),
+                )
+                return
+
             cache_list = []
             for idx, i in enumerate(kwargs["input"]):
                 preset_cache_key = self.get_cache_key(**{**kwargs, "input": i})
@@ -791,8 +866,8 @@ def enable_cache(
             supported_call_types=supported_call_types,
             **kwargs,
         )
-    print_verbose(f"LiteLLM: Cache enabled, litellm.cache={litellm.cache}")
-    print_verbose(f"LiteLLM Cache: {vars(litellm.cache)}")
+    print_verbose("LiteLLM: Cache enabled, litellm.cache=%s", litellm.cache)
+    print_verbose("LiteLLM Cache: %s", vars(litellm.cache))
 
 
 def update_cache(
@@ -839,8 +914,8 @@ def update_cache(
         supported_call_types=supported_call_types,
         **kwargs,
     )
-    print_verbose(f"LiteLLM: Cache Updated, litellm.cache={litellm.cache}")
-    print_verbose(f"LiteLLM Cache: {vars(litellm.cache)}")
+    print_verbose("LiteLLM: Cache Updated, litellm.cache=%s", litellm.cache)
+    print_verbose("LiteLLM Cache: %s", vars(litellm.cache))
 
 
 def disable_cache():
@@ -864,4 +939,4 @@ def disable_cache():
         litellm._async_success_callback.remove("cache")
 
     litellm.cache = None
-    print_verbose(f"LiteLLM: Cache disabled, litellm.cache={litellm.cache}")
+    print_verbose("LiteLLM: Cache disabled, litellm.cache=%s", litellm.cache)
@@ -45,6 +45,9 @@ from litellm.caching.caching import (
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
 )
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingResponseAccumulator,
+)
 from litellm.types.rerank import RerankResponse
 from litellm.types.utils import (
     CallTypes,
@@ -84,8 +87,8 @@ class LLMCachingHandler:
         request_kwargs: Dict[str, Any],
         start_time: datetime.datetime,
     ):
-        self.async_streaming_chunks: List[ModelResponse] = []
-        self.sync_streaming_chunks: List[ModelResponse] = []
+        self.async_streaming_chunks = StreamingResponseAccumulator()
+        self.sync_streaming_chunks = StreamingResponseAccumulator()
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
@@ -196,8 +199,9 @@ class LLMCachingHandler:
                     and cached_result is not None
                     and isinstance(cached_result, list)
                     and litellm.cache is not None
-                    and not isinstance(
-                        litellm.cache.cache, S3Cache
+                    and (
+                        litellm.cache._should_use_embedding_cache(kwargs)
+                        or not isinstance(litellm.cache.cache, S3Cache)
                     )  # s3 doesn't support bulk writing. Exclude.
                 ):
                     (
@@ -215,7 +219,7 @@ class LLMCachingHandler:
                         final_embedding_cached_response=final_embedding_cached_response,
                         embedding_all_elements_cache_hit=embedding_all_elements_cache_hit,
                     )
-        verbose_logger.debug(f"CACHE RESULT: {cached_result}")
+        verbose_logger.debug("CACHE RESULT: %s", cached_result)
         return CachingHandlerResponse(
             cached_result=cached_result,
             final_embedding_cached_response=final_embedding_cached_response,
@@ -341,7 +345,7 @@ class LLMCachingHandler:
         original_kwargs_input = kwargs["input"]
         kwargs["input"] = remaining_list
         if len(non_null_list) > 0:
-            print_verbose(f"EMBEDDING CACHE HIT! - {len(non_null_list)}")
+            print_verbose("EMBEDDING CACHE HIT! - %s", len(non_null_list))
             final_embedding_cached_response = EmbeddingResponse(
                 model=kwargs.get("model"),
                 data=[None] * len(original_kwargs_input),
@@ -491,7 +495,15 @@ class LLMCachingHandler:
             )
         )
         cached_result: Optional[Any] = None
-        if call_type == CallTypes.aembedding.value and isinstance(
+        if (
+            call_type == CallTypes.aembedding.value
+            and litellm.cache._should_use_embedding_cache(new_kwargs)
+        ):
+            cached_result = await litellm.cache.async_get_embedding_cache(**new_kwargs)
+            # set cached_result to None if all elements are None
+            if all(result is None for result in cached_result):
+                cached_result = None
+        elif call_type == CallTypes.aembedding.value and isinstance(
             new_kwargs["input"], list
         ):
             tasks = []
@@ -682,6 +694,8 @@ class LLMCachingHandler:
             None
         """
 
+        if litellm.cache is None:
+            return
         new_kwargs = kwargs.copy()
         new_kwargs.update(
             convert_args_to_kwargs(
@@ -689,8 +703,6 @@ class LLMCachingHandler:
                 args,
             )
         )
-        if litellm.cache is None:
-            return
         # [OPTIONAL] ADD TO CACHE
         if self._should_store_result_in_cache(
             original_function=original_function, kwargs=new_kwargs
@@ -705,8 +717,9 @@ class LLMCachingHandler:
                     isinstance(result, EmbeddingResponse)
                     and isinstance(new_kwargs["input"], list)
                     and litellm.cache is not None
-                    and not isinstance(
-                        litellm.cache.cache, S3Cache
+                    and (
+                        litellm.cache._should_use_embedding_cache(new_kwargs)
+                        or not isinstance(litellm.cache.cache, S3Cache)
                     )  # s3 doesn't support bulk writing. Exclude.
                 ):
                     asyncio.create_task(
@@ -736,6 +749,8 @@ class LLMCachingHandler:
         """
         Sync internal method to add the result to the cache
         """
+        if litellm.cache is None:
+            return
         new_kwargs = kwargs.copy()
         new_kwargs.update(
             convert_args_to_kwargs(
@@ -743,8 +758,6 @@ class LLMCachingHandler:
                 args,
             )
         )
-        if litellm.cache is None:
-            return
 
         if self._should_store_result_in_cache(
             original_function=self.original_function, kwargs=new_kwargs
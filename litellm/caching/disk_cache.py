@@ -1,9 +1,15 @@
 import json
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from litellm._logging import print_verbose
 
 from .base_cache import BaseCache
+from .cache_codec import (
+    CacheCodec,
+    decode_cache_value,
+    get_cache_codec,
+    is_cache_codec_encoded,
+)
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -14,9 +20,16 @@ else:
 
 
 class DiskCache(BaseCache):
-    def __init__(self, disk_cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        disk_cache_dir: Optional[str] = None,
+        cache_codec: Optional[Union[CacheCodec, dict]] = None,
+    ):
         import diskcache as dc
 
+        # binary encoding for cached values. None = store values as-is
+        self.cache_codec = get_cache_codec(cache_codec)
+
         # if users don't provider one, use the default litellm cache
         if disk_cache_dir is None:
             self.disk_cache = dc.Cache(".litellm_cache")
@@ -24,6 +37,8 @@ class DiskCache(BaseCache):
             self.disk_cache = dc.Cache(disk_cache_dir)
 
     def set_cache(self, key, value, **kwargs):
+        if self.cache_codec is not None:
+            value = self.cache_codec.encode(value)
         if "ttl" in kwargs:
             self.disk_cache.set(key, value, expire=kwargs["ttl"])
         else:
@@ -41,6 +56,8 @@ class DiskCache(BaseCache):
 
     def get_cache(self, key, **kwargs):
         original_cached_response = self.disk_cache.get(key)
+        if is_cache_codec_encoded(original_cached_response):
+            return decode_cache_value(original_cached_response)  # type: ignore
         if original_cached_response:
             try:
                 cached_response = json.loads(original_cached_response)  # type: ignore
@@ -8,10 +8,8 @@ Has 4 primary methods:
     - async_get_cache
 """
 
-import asyncio
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import litellm
@@ -151,7 +149,7 @@ class DualCache(BaseCache):
 
                 result = redis_result
 
-            print_verbose(f"get cache: cache result: {result}")
+            print_verbose("get cache: cache result: %s", result)
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
@@ -163,33 +161,53 @@ class DualCache(BaseCache):
         local_only: bool = False,
         **kwargs,
     ):
-        received_args = locals()
-        received_args.pop("self")
-
-        def run_in_new_loop():
-            """Run the coroutine in a new event loop within this thread."""
-            new_loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(new_loop)
-                return new_loop.run_until_complete(
-                    self.async_batch_get_cache(**received_args)
-                )
-            finally:
-                new_loop.close()
-                asyncio.set_event_loop(None)
-
         try:
-            # First, try to get the current event loop
-            _ = asyncio.get_running_loop()
-            # If we're already in an event loop, run in a separate thread
-            # to avoid nested event loop issues
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_in_new_loop)
-                return future.result()
-
-        except RuntimeError:
-            # No running event loop, we can safely run in this thread
-            return run_in_new_loop()
+            result = [None for _ in range(len(keys))]
+            if self.in_memory_cache is not None:
+                in_memory_result = self.in_memory_cache.batch_get_cache(keys, **kwargs)
+
+                if in_memory_result is not None:
+                    result = in_memory_result
+
+            if None in result and self.redis_cache is not None and local_only is False:
+                """
+                - for the none values in the result
+                - check the redis cache
+                """
+                current_time = time.time()
+                sublist_keys = self.get_redis_batch_keys(current_time, keys, result)
+
+                # Only hit Redis if the last access time was more than 5 seconds ago
+                if len(sublist_keys) > 0:
+                    # If not found in in-memory cache, try fetching from Redis
+                    redis_result = self.redis_cache.batch_get_cache(
+                        sublist_keys, parent_otel_span=parent_otel_span
+                    )
+
+                    if redis_result is not None:
+                        # Update in-memory cache with the value from Redis
+                        for key, value in redis_result.items():
+                            if value is not None:
+                                self.in_memory_cache.set_cache(key, value, **kwargs)
+                            # Update the last access time for each key fetched from Redis
+                            self.last_redis_batch_access_time[key] = current_time
+
+                        self._add_redis_batch_result(
+                            keys=keys, result=result, redis_result=redis_result
+                        )
+
+            return result
+        except Exception:
+            verbose_logger.error(traceback.format_exc())
+
+    @staticmethod
+    def _add_redis_batch_result(keys: list, result: list, redis_result: dict) -> None:
+        """
+        Fill the missing values in `result` with the values read from Redis (single pass, no `keys.index()` lookups)
+        """
+        for index, key in enumerate(keys):
+            if result[index] is None and key in redis_result:
+                result[index] = redis_result[key]
 
     async def async_get_cache(
         self,
@@ -201,7 +219,7 @@ class DualCache(BaseCache):
         # Try to fetch from in-memory cache first
         try:
             print_verbose(
-                f"async get cache: cache key: {key}; local_only: {local_only}"
+                "async get cache: cache key: %s; local_only: %s", key, local_only
             )
             result = None
             if self.in_memory_cache is not None:
@@ -209,7 +227,7 @@ class DualCache(BaseCache):
                     key, **kwargs
                 )
 
-                print_verbose(f"in_memory_result: {in_memory_result}")
+                print_verbose("in_memory_result: %s", in_memory_result)
                 if in_memory_result is not None:
                     result = in_memory_result
 
@@ -227,7 +245,7 @@ class DualCache(BaseCache):
 
                 result = redis_result
 
-            print_verbose(f"get cache: cache result: {result}")
+            print_verbose("get cache: cache result: %s", result)
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
@@ -291,9 +309,9 @@ class DualCache(BaseCache):
                             # Update the last access time for each key fetched from Redis
                             self.last_redis_batch_access_time[key] = current_time
 
-                    for key, value in redis_result.items():
-                        index = keys.index(key)
-                        result[index] = value
+                        self._add_redis_batch_result(
+                            keys=keys, result=result, redis_result=redis_result
+                        )
 
             return result
         except Exception:
@@ -301,7 +319,10 @@ class DualCache(BaseCache):
 
     async def async_set_cache(self, key, value, local_only: bool = False, **kwargs):
         print_verbose(
-            f"async set cache: cache key: {key}; local_only: {local_only}; value: {value}"
+            "async set cache: cache key: %s; local_only: %s; value: %s",
+            key,
+            local_only,
+            value,
         )
         try:
             if self.in_memory_cache is not None:
@@ -322,7 +343,9 @@ class DualCache(BaseCache):
         Batch write values to the cache
         """
         print_verbose(
-            f"async batch set cache: cache keys: {cache_list}; local_only: {local_only}"
+            "async batch set cache: cache keys: %s; local_only: %s",
+            cache_list,
+            local_only,
         )
         try:
             if self.in_memory_cache is not None:
@@ -400,6 +423,150 @@ class DualCache(BaseCache):
         except Exception as e:
             raise e  # don't log, if exception is raised
 
+    def push_to_list(
+        self,
+        key,
+        values: List,
+        max_size: int,
+        local_only: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Prepend values to a fixed-size list - newest first, only the first `max_size` items are kept
+
+        Concurrent writers (e.g. proxy workers sharing redis) all append to the same list, nothing is overwritten.
+        """
+        try:
+            if self.in_memory_cache is not None:
+                self.in_memory_cache.push_to_list(
+                    key, values, max_size=max_size, ttl=kwargs.get("ttl", None)
+                )
+
+            if self.redis_cache is not None and local_only is False:
+                self.redis_cache.push_to_list(
+                    key, values, max_size=max_size, ttl=kwargs.get("ttl", None)
+                )
+        except Exception as e:
+            verbose_logger.exception(f"LiteLLM Cache: Excepton push_to_list: {str(e)}")
+
+    async def async_push_to_list(
+        self,
+        key,
+        values: List,
+        max_size: int,
+        parent_otel_span: Optional[Span] = None,
+        local_only: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Prepend values to a fixed-size list - newest first, only the first `max_size` items are kept
+
+        Concurrent writers (e.g. proxy workers sharing redis) all append to the same list, nothing is overwritten.
+        """
+        try:
+            if self.in_memory_cache is not None:
+                self.in_memory_cache.push_to_list(
+                    key, values, max_size=max_size, ttl=kwargs.get("ttl", None)
+                )
+
+            if self.redis_cache is not None and local_only is False:
+                await self.redis_cache.async_push_to_list(
+                    key,
+                    values,
+                    max_size=max_size,
+                    ttl=kwargs.get("ttl", None),
+                    parent_otel_span=parent_otel_span,
+                )
+        except Exception as e:
+            verbose_logger.exception(
+                f"LiteLLM Cache: Excepton async_push_to_list: {str(e)}"
+            )
+
+    def _get_redis_list_keys(self, current_time: float, keys: List[str]) -> List[str]:
+        """
+        Lists not read from redis in the last `redis_batch_cache_expiry` seconds - other writers may have pushed to them
+        """
+        return [
+            key
+            for key in keys
+            if key not in self.last_redis_batch_access_time
+            or current_time - self.last_redis_batch_access_time[key]
+            >= self.redis_batch_cache_expiry
+        ]
+
+    def _add_redis_list_result(
+        self,
+        keys: List[str],
+        result: List[Any],
+        redis_result: dict,
+        current_time: float,
+    ) -> None:
+        for index, key in enumerate(keys):
+            if key not in redis_result:
+                continue
+            self.last_redis_batch_access_time[key] = current_time
+            if len(redis_result[key]) > 0:
+                result[index] = redis_result[key]
+                self.in_memory_cache.set_cache(key, redis_result[key])
+
+    def batch_get_lists(
+        self,
+        keys: List[str],
+        parent_otel_span: Optional[Span] = None,
+        local_only: bool = False,
+    ) -> List[Optional[List]]:
+        """
+        Read lists written by `push_to_list`. None for missing lists
+
+        Redis has every writer's items - each list is re-read from redis at most once every `redis_batch_cache_expiry` seconds, the in-memory copy is used in between.
+        """
+        result: List[Any] = self.in_memory_cache.batch_get_cache(keys)
+        try:
+            if self.redis_cache is not None and local_only is False:
+                current_time = time.time()
+                redis_keys = self._get_redis_list_keys(current_time, keys)
+                if len(redis_keys) > 0:
+                    self._add_redis_list_result(
+                        keys=keys,
+                        result=result,
+                        redis_result=self.redis_cache.batch_get_lists(
+                            redis_keys, parent_otel_span=parent_otel_span
+                        ),
+                        current_time=current_time,
+                    )
+        except Exception:
+            verbose_logger.error(traceback.format_exc())
+        return result
+
+    async def async_batch_get_lists(
+        self,
+        keys: List[str],
+        parent_otel_span: Optional[Span] = None,
+        local_only: bool = False,
+    ) -> List[Optional[List]]:
+        """
+        Read lists written by `push_to_list`. None for missing lists
+
+        Redis has every writer's items - each list is re-read from redis at most once every `redis_batch_cache_expiry` seconds, the in-memory copy is used in between.
+        """
+        result: List[Any] = await self.in_memory_cache.async_batch_get_cache(keys)
+        try:
+            if self.redis_cache is not None and local_only is False:
+                current_time = time.time()
+                redis_keys = self._get_redis_list_keys(current_time, keys)
+                if len(redis_keys) > 0:
+                    self._add_redis_list_result(
+                        keys=keys,
+                        result=result,
+                        redis_result=await self.redis_cache.async_batch_get_lists(
+                            redis_keys, parent_otel_span=parent_otel_span
+                        ),
+                        current_time=current_time,
+                    )
+        except Exception:
+            verbose_logger.error(traceback.format_exc())
+        return result
+
     def flush_cache(self):
         if self.in_memory_cache is not None:
             self.in_memory_cache.flush_cache()
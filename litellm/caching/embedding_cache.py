@@ -0,0 +1,322 @@
+"""
+Exact-match cache for embedding vectors
+
+Each input item is cached on its own, keyed by (model, dimensions, sha256 of the text), and stored as a packed float32 vector.
+- "local": in-memory
+- "redis": one MGET for all the items in a request, one pipelined SET for the misses
+- "disk": append-only float32 vector file + index, read through mmap
+
+Used by `litellm.Cache(embedding_cache=...)` for `aembedding` calls with a list input. Only the items that miss the cache are sent to the provider, in one call.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import mmap
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from litellm._logging import verbose_logger
+
+from .cache_codec import pack_float32, unpack_float32
+from .dual_cache import LimitedSizeOrderedDict
+from .redis_cache import RedisCache
+
+EmbeddingCacheType = Literal["local", "redis", "disk"]
+
+FLOAT32_SIZE = 4
+
+
+class BaseEmbeddingVectorStore(ABC):
+    @abstractmethod
+    async def async_get_vectors(self, keys: List[str]) -> List[Optional[List[float]]]:
+        pass
+
+    @abstractmethod
+    async def async_set_vectors(
+        self, vectors: List[Tuple[str, bytes]], ttl: Optional[float] = None
+    ) -> None:
+        """
+        Args:
+            vectors: (key, float32 packed vector) pairs
+        """
+        pass
+
+
+class InMemoryEmbeddingVectorStore(BaseEmbeddingVectorStore):
+    def __init__(self, max_size_in_memory: int = 10000, default_ttl: float = 600):
+        self.default_ttl = default_ttl
+        # key -> (time the entry expires, float32 packed vector). Oldest entries are dropped first
+        self.vectors = LimitedSizeOrderedDict(max_size=max_size_in_memory)
+
+    async def async_get_vectors(self, keys: List[str]) -> List[Optional[List[float]]]:
+        now = time.time()
+        vectors: List[Optional[List[float]]] = []
+        for key in keys:
+            entry = self.vectors.get(key)
+            if entry is None or now > entry[0]:
+                vectors.append(None)
+            else:
+                vectors.append(unpack_float32(entry[1]))
+        return vectors
+
+    async def async_set_vectors(
+        self, vectors: List[Tuple[str, bytes]], ttl: Optional[float] = None
+    ) -> None:
+        expires_at = time.time() + (ttl or self.default_ttl)
+        for key, data in vectors:
+            self.vectors[key] = (expires_at, data)
+
+
+class RedisEmbeddingVectorStore(BaseEmbeddingVectorStore):
+    def __init__(self, redis_cache: RedisCache):
+        self.redis_cache = redis_cache
+
+    async def async_get_vectors(self, keys: List[str]) -> List[Optional[List[float]]]:
+        keys = [self.redis_cache.check_and_fix_namespace(key=key) for key in keys]
+        async with self.redis_cache.init_async_client() as redis_client:
+            results = await redis_client.mget(keys)
+        return [unpack_float32(data) if data is not None else None for data in results]
+
+    async def async_set_vectors(
+        self, vectors: List[Tuple[str, bytes]], ttl: Optional[float] = None
+    ) -> None:
+        if len(vectors) == 0:
+            return
+        vectors = [
+            (self.redis_cache.check_and_fix_namespace(key=key), data)
+            for key, data in vectors
+        ]
+        async with self.redis_cache.init_async_client() as redis_client:
+            if ttl is None:
+                await redis_client.mset(dict(vectors))
+                return
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, data in vectors:
+                    pipe.set(key, data, px=math.ceil(ttl * 1000))
+                await pipe.execute()
+
+
+class DiskEmbeddingVectorStore(BaseEmbeddingVectorStore):
+    """
+    Vectors are appended to `vectors.f32` (little-endian float32), and `index.txt` has one `<key> <offset> <dimensions>` line per vector.
+
+    Reads are served from a read-only mmap of the vector file. Entries don't expire - the embedding for a (model, dimensions, text) doesn't change.
+    The files are only safe to write from one process.
+    """
+
+    def __init__(self, disk_cache_dir: Optional[str] = None):
+        self.disk_cache_dir = disk_cache_dir or ".litellm_embedding_cache"
+        os.makedirs(self.disk_cache_dir, exist_ok=True)
+        self.vectors_path = os.path.join(self.disk_cache_dir, "vectors.f32")
+        self.index_path = os.path.join(self.disk_cache_dir, "index.txt")
+        self.lock = threading.Lock()
+
+        self.vectors_file = open(self.vectors_path, "ab")
+        self.vectors_size = self.vectors_file.tell()
+        # key -> (offset in the vector file, dimensions)
+        self.index: Dict[str, Tuple[int, int]] = self._load_index()
+        self.index_file = open(self.index_path, "a")
+        self.mmap: Optional[mmap.mmap] = None
+
+    def _load_index(self) -> Dict[str, Tuple[int, int]]:
+        index: Dict[str, Tuple[int, int]] = {}
+        if not os.path.exists(self.index_path):
+            return index
+        with open(self.index_path, "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 3:  # partially written line
+                    continue
+                key, offset, dimensions = parts[0], int(parts[1]), int(parts[2])
+                # skip entries whose vector was not fully written
+                if offset + dimensions * FLOAT32_SIZE <= self.vectors_size:
+                    index[key] = (offset, dimensions)
+        return index
+
+    def _get_mmap(self, min_size: int) -> mmap.mmap:
+        if self.mmap is None or len(self.mmap) < min_size:
+            if self.mmap is not None:
+                self.mmap.close()
+            with open(self.vectors_path, "rb") as f:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mmap
+
+    def get_vectors(self, keys: List[str]) -> List[Optional[List[float]]]:
+        vectors: List[Optional[List[float]]] = []
+        with self.lock:
+            for key in keys:
+                location = self.index.get(key)
+                if location is None:
+                    vectors.append(None)
+                    continue
+                offset, dimensions = location
+                end = offset + dimensions * FLOAT32_SIZE
+                mapped = self._get_mmap(min_size=end)
+                if sys.byteorder == "little":
+                    with memoryview(mapped) as view:
+                        with view[offset:end].cast("f") as vector:
+                            vectors.append(vector.tolist())
+                else:
+                    vectors.append(unpack_float32(mapped[offset:end]))
+        return vectors
+
+    def set_vectors(self, vectors: List[Tuple[str, bytes]]) -> None:
+        with self.lock:
+            index_lines: List[str] = []
+            for key, data in vectors:
+                if key in self.index:
+                    continue
+                self.vectors_file.write(data)
+                self.index[key] = (self.vectors_size, len(data) // FLOAT32_SIZE)
+                index_lines.append(
+                    f"{key} {self.vectors_size} {len(data) // FLOAT32_SIZE}\n"
+                )
+                self.vectors_size += len(data)
+            if len(index_lines) == 0:
+                return
+            # vectors are flushed before the index, so the index never points past the end of the vector file
+            self.vectors_file.flush()
+            self.index_file.write("".join(index_lines))
+            self.index_file.flush()
+
+    # file reads / writes run in the default thread pool, not on the event loop
+    async def async_get_vectors(self, keys: List[str]) -> List[Optional[List[float]]]:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.get_vectors, keys
+        )
+
+    async def async_set_vectors(
+        self, vectors: List[Tuple[str, bytes]], ttl: Optional[float] = None
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.set_vectors, vectors
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            if self.mmap is not None:
+                self.mmap.close()
+                self.mmap = None
+            self.vectors_file.close()
+            self.index_file.close()
+
+
+class EmbeddingCache:
+    def __init__(
+        self,
+        type: EmbeddingCacheType = "local",
+        namespace: Optional[str] = None,
+        ttl: Optional[float] = None,
+        disk_cache_dir: Optional[str] = None,
+        max_size_in_memory: int = 10000,
+        redis_cache: Optional[RedisCache] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            type: "local", "redis" or "disk"
+            namespace: prefix for the cache keys. Defaults to "litellm:embedding"
+            ttl: seconds to keep vectors for ("local" / "redis"). None = the store's default
+            disk_cache_dir: directory for the "disk" vector + index files. Defaults to ".litellm_embedding_cache"
+            max_size_in_memory: max vectors kept by the "local" store
+            redis_cache: RedisCache to use for "redis". If not given, one is created from `**kwargs` (host, port, password, ...)
+        """
+        self.type = type
+        self.namespace = namespace or "litellm:embedding"
+        self.ttl = ttl
+        self.vector_store: BaseEmbeddingVectorStore
+        if type == "redis":
+            self.vector_store = RedisEmbeddingVectorStore(
+                redis_cache=redis_cache or RedisCache(**kwargs)
+            )
+        elif type == "disk":
+            self.vector_store = DiskEmbeddingVectorStore(disk_cache_dir=disk_cache_dir)
+        elif type == "local":
+            self.vector_store = InMemoryEmbeddingVectorStore(
+                max_size_in_memory=max_size_in_memory
+            )
+        else:
+            raise ValueError(
+                f"Unsupported embedding cache type={type}. Supported: 'local', 'redis', 'disk'"
+            )
+
+    def get_cache_key(
+        self, model: str, dimensions: Optional[int], input: Union[str, List[Any]]
+    ) -> str:
+        # inputs can be text, or a list of token ids
+        text = input if isinstance(input, str) else json.dumps(input)
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{model}:{dimensions or 0}:{text_hash}"
+
+    async def async_get_embeddings(
+        self, model: str, dimensions: Optional[int], inputs: List[Any]
+    ) -> List[Optional[List[float]]]:
+        """
+        Returns the cached vector for each input, None for the misses.
+        """
+        keys = [
+            self.get_cache_key(model=model, dimensions=dimensions, input=input)
+            for input in inputs
+        ]
+        try:
+            return await self.vector_store.async_get_vectors(keys)
+        except Exception as e:
+            verbose_logger.exception(
+                "EmbeddingCache: failed to read vectors - {}".format(str(e))
+            )
+            return [None] * len(inputs)
+
+    async def async_set_embeddings(
+        self,
+        model: str,
+        dimensions: Optional[int],
+        inputs: List[Any],
+        embeddings: List[Any],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Cache the vector for each input. Embeddings that aren't lists of floats (e.g. `encoding_format="base64"`) are skipped.
+        """
+        vectors: List[Tuple[str, bytes]] = []
+        for input, embedding in zip(inputs, embeddings):
+            if not isinstance(embedding, list) or len(embedding) == 0:
+                continue
+            vectors.append(
+                (
+                    self.get_cache_key(model=model, dimensions=dimensions, input=input),
+                    pack_float32(embedding),
+                )
+            )
+        try:
+            await self.vector_store.async_set_vectors(vectors, ttl=ttl or self.ttl)
+        except Exception as e:
+            verbose_logger.exception(
+                "EmbeddingCache: failed to write vectors - {}".format(str(e))
+            )
+
+
+def get_embedding_cache(
+    embedding_cache: Optional[Union[EmbeddingCache, dict]],
+    redis_cache: Optional[RedisCache] = None,
+) -> Optional[EmbeddingCache]:
+    """
+    `embedding_cache` can be an EmbeddingCache, or its params as a dict (e.g. from the proxy config.yaml `cache_params`).
+
+    A "redis" embedding cache with no connection params reuses `redis_cache`.
+    """
+    if embedding_cache is None or isinstance(embedding_cache, EmbeddingCache):
+        return embedding_cache
+    params = dict(embedding_cache)
+    if (
+        params.get("type") == "redis"
+        and redis_cache is not None
+        and not any(k in params for k in ("host", "url", "startup_nodes"))
+    ):
+        params.setdefault("redis_cache", redis_cache)
+    return EmbeddingCache(**params)
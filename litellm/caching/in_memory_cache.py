@@ -89,6 +89,15 @@ class InMemoryCache(BaseCache):
         self.set_cache(key, init_value, ttl=ttl)
         return value
 
+    def push_to_list(
+        self, key, values: List, max_size: int, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Prepend values to the list at key (newest first), and keep its first `max_size` items
+        """
+        init_value = self.get_cache(key=key) or []
+        self.set_cache(key, (values[::-1] + list(init_value))[:max_size], ttl=ttl)
+
     def get_cache(self, key, **kwargs):
         if key in self.cache_dict:
             if key in self.ttl_dict:
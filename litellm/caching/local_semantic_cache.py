@@ -0,0 +1,626 @@
+"""
+In-process Semantic Cache implementation - no Redis / Qdrant required
+
+Prompts are embedded with `embedding_model`, and stored as normalized float32 rows of a NumPy matrix.
+A lookup is one matrix-vector product (cosine similarity) over all the cached prompts.
+
+- get / set calls made in the same event-loop tick share one batched embedding call
+- the embedding computed on a cache miss is reused when the response is written to the cache
+- if `cache_dir` is set, vectors are appended to `vectors.f32` (memory-mapped on startup) and the responses to `entries.jsonl`
+- at most `max_size` prompts are kept - the oldest is evicted first. Entries expire after the `ttl` they were set with
+- index_type="hnsw" (requires `pip install hnswlib`) searches an approximate HNSW graph instead of every row - use it for large caches
+
+Has 4 methods:
+    - set_cache
+    - get_cache
+    - async_set_cache
+    - async_get_cache
+"""
+
+import ast
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import litellm
+from litellm._logging import print_verbose, verbose_logger
+
+from .base_cache import BaseCache
+from .dual_cache import LimitedSizeOrderedDict
+
+
+def get_prompt_from_messages(messages: Optional[List[Any]]) -> str:
+    """
+    Text of all the messages - handles `content` as a string, a list of content parts, or None
+    """
+    parts: List[str] = []
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            for content_part in content:
+                if isinstance(content_part, dict) and isinstance(
+                    content_part.get("text"), str
+                ):
+                    parts.append(content_part["text"])
+    return "\n".join(parts)
+
+
+class LocalSemanticCache(BaseCache):
+    def __init__(
+        self,
+        similarity_threshold=None,
+        embedding_model="text-embedding-ada-002",
+        cache_dir: Optional[str] = None,
+        max_embeddings_in_memory: int = 1000,
+        index_type: Literal["flat", "hnsw"] = "flat",
+        max_size: int = 10000,
+    ):
+        """
+        Args:
+            similarity_threshold: min cosine similarity between prompts for a cache hit
+            embedding_model: model used to embed prompts
+            cache_dir: directory to persist the vectors + responses to. None = in-memory only
+            max_embeddings_in_memory: number of recent prompt embeddings kept, so a get followed by a set for the same prompt only embeds it once
+            index_type: "flat" - exact search over all rows, or "hnsw" - approximate search with hnswlib
+            max_size: max cached prompts. The oldest entry is evicted when a new one is added
+        """
+        import numpy as np
+
+        if similarity_threshold is None:
+            raise Exception("similarity_threshold must be provided, passed None")
+        if index_type == "hnsw":
+            try:
+                import hnswlib  # type: ignore # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "hnswlib not found. Please install hnswlib to use index_type='hnsw' - `pip install hnswlib`"
+                )
+        elif index_type != "flat":
+            raise ValueError(
+                f"Unsupported index_type={index_type}. Supported: 'flat', 'hnsw'"
+            )
+        self.index_type = index_type
+        self.hnsw_index: Any = None
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        # serializes appends to the cache_dir files - held without `self.lock`, so lookups don't wait on disk writes
+        self.file_lock = threading.Lock()
+
+        # vectors loaded from disk (read-only memmap) + vectors added since, in a buffer that grows by doubling
+        self.persisted_vectors: Optional[np.ndarray] = None
+        self.vectors: Optional[np.ndarray] = None
+        self.num_vectors = 0
+        self.dimensions: Optional[int] = None
+        # (prompt, cached value) for each row - persisted rows first
+        self.entries: List[Tuple[str, Any]] = []
+        # unix time each row expires at, for every row in self.entries. inf = no ttl, 0 = evicted
+        self.expires_at: np.ndarray = np.empty(0, dtype=np.float64)
+        self.num_live_entries = 0
+        # rows before this one are all evicted - rows are evicted oldest first
+        self.next_eviction = 0
+
+        self.prompt_embeddings = LimitedSizeOrderedDict(
+            max_size=max_embeddings_in_memory
+        )
+        # event loop -> (prompt, future, kwargs) waiting for the next batched embedding call on that loop
+        self.pending_prompts: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Tuple[str, asyncio.Future, dict]]]" = (weakref.WeakKeyDictionary())
+        # keep a reference to scheduled flushes, so they aren't garbage collected mid-flight
+        self.flush_tasks: "set[asyncio.Task]" = set()
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load()
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.cache_dir or "", "vectors.f32")
+
+    @property
+    def entries_path(self) -> str:
+        return os.path.join(self.cache_dir or "", "entries.jsonl")
+
+    def _load(self) -> None:
+        """
+        Load the persisted rows, and rewrite the files without expired / evicted rows and whatever a crash left half-written
+        """
+        import numpy as np
+
+        if not os.path.exists(self.entries_path) or not os.path.exists(
+            self.vectors_path
+        ):
+            return
+        entries: List[Tuple[str, Any, float]] = []
+        dimensions = 0
+        with open(self.entries_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:  # partially written line
+                    break
+                expires_at = entry.get("expires_at")
+                entries.append(
+                    (
+                        entry["prompt"],
+                        entry["value"],
+                        float("inf") if expires_at is None else expires_at,
+                    )
+                )
+                dimensions = entry["dimensions"]
+        if len(entries) == 0 or dimensions == 0:
+            return
+        num_vectors = min(
+            len(entries), os.path.getsize(self.vectors_path) // (4 * dimensions)
+        )
+        persisted_vectors = np.memmap(
+            self.vectors_path,
+            dtype="<f4",
+            mode="r",
+            shape=(num_vectors, dimensions),
+        )
+        now = time.time()
+        # the newest `max_size` rows - like the oldest-first eviction - minus the expired ones
+        rows = [
+            i
+            for i in range(max(0, num_vectors - self.max_size), num_vectors)
+            if entries[i][2] > now
+        ]
+
+        tmp_vectors_path = self.vectors_path + ".tmp"
+        with open(tmp_vectors_path, "wb") as f:
+            for row in rows:
+                f.write(persisted_vectors[row].tobytes())
+        del persisted_vectors
+        os.replace(tmp_vectors_path, self.vectors_path)
+        with open(self.entries_path, "w") as f:
+            for row in rows:
+                f.write(
+                    self._get_entry_line(
+                        prompt=entries[row][0],
+                        value=entries[row][1],
+                        dimensions=dimensions,
+                        expires_at=entries[row][2],
+                    )
+                )
+        if len(rows) == 0:
+            return
+        self.dimensions = dimensions
+        self.persisted_vectors = np.memmap(
+            self.vectors_path,
+            dtype="<f4",
+            mode="r",
+            shape=(len(rows), dimensions),
+        )
+        self.entries = [(entries[row][0], entries[row][1]) for row in rows]
+        self.expires_at = np.array([entries[row][2] for row in rows], dtype=np.float64)
+        self.num_live_entries = len(rows)
+        if self.index_type == "hnsw":
+            self._add_to_hnsw_index(vectors=self.persisted_vectors, first_entry=0)
+        print_verbose(
+            "local semantic-cache loaded %s entries from %s",
+            len(rows),
+            self.cache_dir,
+        )
+
+    @staticmethod
+    def _get_entry_line(
+        prompt: str, value: Any, dimensions: int, expires_at: float
+    ) -> str:
+        return (
+            json.dumps(
+                {
+                    "prompt": prompt,
+                    "value": value,
+                    "dimensions": dimensions,
+                    "expires_at": None if expires_at == float("inf") else expires_at,
+                }
+            )
+            + "\n"
+        )
+
+    def _add(
+        self, prompt: str, embedding: List[float], value: Any, ttl: Optional[float]
+    ) -> Optional[Tuple[bytes, str]]:
+        """
+        Add a row to the index. Returns the (vector bytes, entry line) to append to the cache_dir files - written by `_persist`, outside the lock
+        """
+        import numpy as np
+
+        if self.max_size <= 0:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        vector = vector / norm
+        expires_at = time.time() + ttl if ttl is not None else float("inf")
+        with self.lock:
+            if self.dimensions is None:
+                self.dimensions = vector.shape[0]
+            elif vector.shape[0] != self.dimensions:
+                verbose_logger.debug(
+                    "local semantic-cache: not caching a %s-d embedding, the index has %s-d embeddings",
+                    vector.shape[0],
+                    self.dimensions,
+                )
+                return None
+            while self.num_live_entries >= self.max_size:
+                self._evict_oldest()
+            if len(self.entries) - self.num_live_entries > max(
+                self.num_live_entries, 1024
+            ):
+                self._compact()
+
+            if self.vectors is None:
+                self.vectors = np.empty((16, vector.shape[0]), dtype=np.float32)
+            elif self.num_vectors == self.vectors.shape[0]:
+                grown = np.empty(
+                    (self.vectors.shape[0] * 2, self.vectors.shape[1]),
+                    dtype=np.float32,
+                )
+                grown[: self.num_vectors] = self.vectors
+                self.vectors = grown
+            if len(self.entries) == self.expires_at.shape[0]:
+                self.expires_at = np.concatenate(
+                    [self.expires_at, np.empty(max(16, len(self.entries)))]
+                )
+            self.vectors[self.num_vectors] = vector
+            self.num_vectors += 1
+            self.expires_at[len(self.entries)] = expires_at
+            self.entries.append((prompt, value))
+            self.num_live_entries += 1
+            if self.index_type == "hnsw":
+                self._add_to_hnsw_index(
+                    vectors=vector[None, :], first_entry=len(self.entries) - 1
+                )
+
+        if self.cache_dir is None:
+            return None
+        return vector.astype("<f4").tobytes(), self._get_entry_line(
+            prompt=prompt,
+            value=value,
+            dimensions=vector.shape[0],
+            expires_at=expires_at,
+        )
+
+    def _persist(self, record: Optional[Tuple[bytes, str]]) -> None:
+        if record is None:
+            return
+        vector_bytes, entry_line = record
+        # vector + entry are appended together, so both files keep the same row order
+        with self.file_lock:
+            with open(self.vectors_path, "ab") as f:
+                f.write(vector_bytes)
+            with open(self.entries_path, "a") as f:
+                f.write(entry_line)
+
+    def _evict_oldest(self) -> None:
+        # caller holds self.lock
+        while self.next_eviction < len(self.entries):
+            row = self.next_eviction
+            self.next_eviction += 1
+            if self.expires_at[row] != 0:
+                self._evict(row)
+                return
+
+    def _evict(self, row: int) -> None:
+        # caller holds self.lock
+        self.expires_at[row] = 0
+        self.num_live_entries -= 1
+        if self.hnsw_index is not None:
+            self.hnsw_index.mark_deleted(row)
+
+    def _compact(self) -> None:
+        """
+        Drop the evicted rows from memory - the persisted memmap is replaced by an in-memory copy of its live rows. Caller holds self.lock.
+
+        Evicted rows stay in the cache_dir files until the next `_load`.
+        """
+        import numpy as np
+
+        live_rows = np.nonzero(self.expires_at[: len(self.entries)] != 0)[0]
+        num_persisted = (
+            self.persisted_vectors.shape[0] if self.persisted_vectors is not None else 0
+        )
+        vectors = np.empty(
+            (max(16, len(live_rows) * 2), self.dimensions or 0), dtype=np.float32
+        )
+        for i, row in enumerate(live_rows):
+            if row < num_persisted:
+                vectors[i] = self.persisted_vectors[row]  # type: ignore
+            else:
+                vectors[i] = self.vectors[row - num_persisted]  # type: ignore
+        self.persisted_vectors = None
+        self.vectors = vectors
+        self.num_vectors = len(live_rows)
+        self.entries = [self.entries[row] for row in live_rows]
+        self.expires_at = self.expires_at[live_rows]
+        self.next_eviction = 0
+        if self.index_type == "hnsw":
+            self.hnsw_index = None
+            if self.num_vectors > 0:
+                self._add_to_hnsw_index(
+                    vectors=self.vectors[: self.num_vectors], first_entry=0
+                )
+
+    def _add_to_hnsw_index(self, vectors: Any, first_entry: int) -> None:
+        import hnswlib  # type: ignore
+        import numpy as np
+
+        if self.hnsw_index is None:
+            self.hnsw_index = hnswlib.Index(space="ip", dim=vectors.shape[1])
+            self.hnsw_index.init_index(
+                max_elements=max(1024, vectors.shape[0]), ef_construction=200, M=16
+            )
+            self.hnsw_index.set_ef(64)
+        num_elements = self.hnsw_index.get_current_count() + vectors.shape[0]
+        if num_elements > self.hnsw_index.get_max_elements():
+            self.hnsw_index.resize_index(
+                max(num_elements, self.hnsw_index.get_max_elements() * 2)
+            )
+        self.hnsw_index.add_items(
+            vectors, np.arange(first_entry, first_entry + vectors.shape[0])
+        )
+
+    def _search(
+        self, embedding: List[float]
+    ) -> Tuple[float, Optional[Tuple[str, Any]]]:
+        """
+        Returns the highest cosine similarity, and the (prompt, value) it belongs to. Expired / evicted rows are skipped
+        """
+        import numpy as np
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return 0.0, None
+        query = query / norm
+
+        best_similarity = 0.0
+        best_entry: Optional[Tuple[str, Any]] = None
+        now = time.time()
+        with self.lock:
+            if query.shape[0] != self.dimensions:
+                return best_similarity, best_entry
+            if self.hnsw_index is not None:
+                while self.num_live_entries > 0:
+                    labels, distances = self.hnsw_index.knn_query(query, k=1)
+                    row = int(labels[0][0])
+                    if self.expires_at[row] <= now:
+                        self._evict(row)
+                        continue
+                    # inner product space: distance = 1 - similarity
+                    return 1.0 - float(distances[0][0]), self.entries[row]
+                return best_similarity, best_entry
+            # rows loaded from disk come first in self.entries, then the rows added since
+            segments = [
+                (0, self.persisted_vectors),
+                (
+                    len(self.entries) - self.num_vectors,
+                    (
+                        self.vectors[: self.num_vectors]
+                        if self.vectors is not None
+                        else None
+                    ),
+                ),
+            ]
+            for first_entry, vectors in segments:
+                if vectors is None or vectors.shape[0] == 0:
+                    continue
+                scores = vectors @ query
+                expires_at = self.expires_at[
+                    first_entry : first_entry + vectors.shape[0]
+                ]
+                scores[expires_at <= now] = -np.inf
+                idx = int(np.argmax(scores))
+                if not np.isfinite(scores[idx]):
+                    continue
+                if best_entry is None or float(scores[idx]) > best_similarity:
+                    best_similarity = float(scores[idx])
+                    best_entry = self.entries[first_entry + idx]
+        return best_similarity, best_entry
+
+    def _get_cache_logic(self, cached_response: Any):
+        if cached_response is None:
+            return cached_response
+        if not isinstance(cached_response, str):
+            return cached_response
+        try:
+            cached_response = json.loads(
+                cached_response
+            )  # Convert string to dictionary
+        except Exception:
+            cached_response = ast.literal_eval(cached_response)
+        return cached_response
+
+    def _get_cached_value(self, prompt: str, embedding: List[float], kwargs: dict):
+        similarity, entry = self._search(embedding)
+        # update kwargs["metadata"] with similarity, don't rewrite the original metadata
+        kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+        if entry is None:
+            return None
+
+        cached_prompt, cached_value = entry
+        print_verbose(
+            "semantic cache: similarity threshold: %s, similarity: %s, prompt: %s, closest_cached_prompt: %s",
+            self.similarity_threshold,
+            similarity,
+            prompt,
+            cached_prompt,
+        )
+        if similarity >= self.similarity_threshold:
+            # cache hit !
+            return self._get_cache_logic(cached_response=cached_value)
+        # cache miss !
+        return None
+
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        try:
+            json.dumps(value)
+            return value
+        except (TypeError, ValueError):
+            return str(value)
+
+    def _get_embedding(self, prompt: str) -> List[float]:
+        embedding = self.prompt_embeddings.get(prompt)
+        if embedding is None:
+            embedding_response = litellm.embedding(
+                model=self.embedding_model,
+                input=prompt,
+                cache={"no-store": True, "no-cache": True},
+            )
+            embedding = embedding_response["data"][0]["embedding"]
+            self.prompt_embeddings[prompt] = embedding
+        return embedding
+
+    async def _async_get_embedding(self, prompt: str, kwargs: dict) -> List[float]:
+        embedding = self.prompt_embeddings.get(prompt)
+        if embedding is not None:
+            return embedding
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending_prompts = self.pending_prompts.get(loop)
+        if pending_prompts is None:
+            pending_prompts = []
+            self.pending_prompts[loop] = pending_prompts
+            flush_task = loop.create_task(self._flush_pending_prompts(loop=loop))
+            self.flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self.flush_tasks.discard)
+        pending_prompts.append((prompt, future, kwargs))
+        return await future
+
+    async def _flush_pending_prompts(self, loop: asyncio.AbstractEventLoop) -> None:
+        # sleep(0) yields once, so every prompt queued in this tick is part of the batch
+        await asyncio.sleep(0)
+        pending_prompts = self.pending_prompts.pop(loop, None) or []
+        # one embedding call per api key, so the embedding spend is logged against the key that made each request
+        batches: Dict[str, List[Tuple[str, asyncio.Future, dict]]] = {}
+        for pending_prompt in pending_prompts:
+            user_api_key = (pending_prompt[2].get("metadata") or {}).get(
+                "user_api_key", ""
+            )
+            batches.setdefault(user_api_key, []).append(pending_prompt)
+        await asyncio.gather(
+            *[
+                self._embed_batch(user_api_key=user_api_key, batch=batch)
+                for user_api_key, batch in batches.items()
+            ]
+        )
+
+    async def _embed_batch(
+        self, user_api_key: str, batch: List[Tuple[str, asyncio.Future, dict]]
+    ) -> None:
+        unique_prompts = list(dict.fromkeys(prompt for prompt, _, _ in batch))
+        trace_ids = {
+            (kwargs.get("metadata") or {}).get("trace_id", None)
+            for _, _, kwargs in batch
+        }
+        try:
+            embeddings = await self._async_embed(
+                prompts=unique_prompts,
+                user_api_key=user_api_key,
+                # only set when every prompt in the batch is from the same trace
+                trace_id=trace_ids.pop() if len(trace_ids) == 1 else None,
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "local semantic-cache: embedding call failed - %s", str(e)
+            )
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        prompt_to_embedding = dict(zip(unique_prompts, embeddings))
+        for prompt, embedding in prompt_to_embedding.items():
+            self.prompt_embeddings[prompt] = embedding
+        for prompt, future, _ in batch:
+            if not future.done():
+                future.set_result(prompt_to_embedding[prompt])
+
+    async def _async_embed(
+        self, prompts: List[str], user_api_key: str, trace_id: Optional[str]
+    ) -> List[List[float]]:
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        if llm_router is not None and self.embedding_model in router_model_names:
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=prompts,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": user_api_key,
+                    "semantic-cache-embedding": True,
+                    "trace_id": trace_id,
+                },
+            )
+        else:
+            # convert to embedding
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=prompts,
+                cache={"no-store": True, "no-cache": True},
+            )
+        data = sorted(embedding_response["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
+    def set_cache(self, key, value, **kwargs):
+        print_verbose("local semantic-cache set_cache, kwargs: %s", kwargs)
+        prompt = get_prompt_from_messages(kwargs.get("messages"))
+        record = self._add(
+            prompt=prompt,
+            embedding=self._get_embedding(prompt),
+            value=self._serialize_value(value),
+            ttl=kwargs.get("ttl"),
+        )
+        self._persist(record)
+
+    def get_cache(self, key, **kwargs):
+        print_verbose("sync local semantic-cache get_cache, kwargs: %s", kwargs)
+        prompt = get_prompt_from_messages(kwargs.get("messages"))
+        return self._get_cached_value(
+            prompt=prompt, embedding=self._get_embedding(prompt), kwargs=kwargs
+        )
+
+    async def async_set_cache(self, key, value, **kwargs):
+        print_verbose("async local semantic-cache set_cache, kwargs: %s", kwargs)
+        prompt = get_prompt_from_messages(kwargs.get("messages"))
+        embedding = await self._async_get_embedding(prompt=prompt, kwargs=kwargs)
+        record = self._add(
+            prompt=prompt,
+            embedding=embedding,
+            value=self._serialize_value(value),
+            ttl=kwargs.get("ttl"),
+        )
+        if record is not None:
+            # file appends run in the default thread pool, not on the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._persist, record
+            )
+
+    async def async_get_cache(self, key, **kwargs):
+        print_verbose("async local semantic-cache get_cache, kwargs: %s", kwargs)
+        prompt = get_prompt_from_messages(kwargs.get("messages"))
+        embedding = await self._async_get_embedding(prompt=prompt, kwargs=kwargs)
+        return self._get_cached_value(prompt=prompt, embedding=embedding, kwargs=kwargs)
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        tasks = []
+        for val in cache_list:
+            tasks.append(self.async_set_cache(val[0], val[1], **kwargs))
+        await asyncio.gather(*tasks)
@@ -45,7 +45,7 @@ class QdrantSemanticCache(BaseCache):
 
         self.collection_name = collection_name
         print_verbose(
-            f"qdrant semantic-cache initializing COLLECTION - {self.collection_name}"
+            "qdrant semantic-cache initializing COLLECTION - %s", self.collection_name
         )
 
         if similarity_threshold is None:
@@ -79,7 +79,7 @@ class QdrantSemanticCache(BaseCache):
 
         self.qdrant_api_base = qdrant_api_base
         self.qdrant_api_key = qdrant_api_key
-        print_verbose(f"qdrant semantic-cache qdrant_api_base: {self.qdrant_api_base}")
+        print_verbose("qdrant semantic-cache qdrant_api_base: %s", self.qdrant_api_base)
 
         self.headers = headers
 
@@ -108,7 +108,8 @@ class QdrantSemanticCache(BaseCache):
             )
             self.collection_info = collection_details.json()
             print_verbose(
-                f"Collection already exists.\nCollection details:{self.collection_info}"
+                "Collection already exists.\nCollection details:%s",
+                self.collection_info,
             )
         else:
             if quantization_config is None or quantization_config == "binary":
@@ -145,7 +146,8 @@ class QdrantSemanticCache(BaseCache):
                 )
                 self.collection_info = collection_details.json()
                 print_verbose(
-                    f"New collection created.\nCollection details:{self.collection_info}"
+                    "New collection created.\nCollection details:%s",
+                    self.collection_info,
                 )
             else:
                 raise Exception("Error while creating new collection")
@@ -162,7 +164,7 @@ class QdrantSemanticCache(BaseCache):
         return cached_response
 
     def set_cache(self, key, value, **kwargs):
-        print_verbose(f"qdrant semantic-cache set_cache, kwargs: {kwargs}")
+        print_verbose("qdrant semantic-cache set_cache, kwargs: %s", kwargs)
         import uuid
 
         # get the prompt
@@ -204,7 +206,7 @@ class QdrantSemanticCache(BaseCache):
         return
 
     def get_cache(self, key, **kwargs):
-        print_verbose(f"sync qdrant semantic-cache get_cache, kwargs: {kwargs}")
+        print_verbose("sync qdrant semantic-cache get_cache, kwargs: %s", kwargs)
 
         # get the messages
         messages = kwargs["messages"]
@@ -253,13 +255,20 @@ class QdrantSemanticCache(BaseCache):
 
         # check similarity, if more than self.similarity_threshold, return results
         print_verbose(
-            f"semantic cache: similarity threshold: {self.similarity_threshold}, similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {cached_prompt}"
+            "semantic cache: similarity threshold: %s, similarity: %s, prompt: %s, closest_cached_prompt: %s",
+            self.similarity_threshold,
+            similarity,
+            prompt,
+            cached_prompt,
         )
         if similarity >= self.similarity_threshold:
             # cache hit !
             cached_value = results[0]["payload"]["response"]
             print_verbose(
-                f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
+                "got a cache hit, similarity: %s, Current prompt: %s, cached_prompt: %s",
+                similarity,
+                prompt,
+                cached_prompt,
             )
             return self._get_cache_logic(cached_response=cached_value)
         else:
@@ -272,7 +281,7 @@ class QdrantSemanticCache(BaseCache):
 
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
-        print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
+        print_verbose("async qdrant semantic-cache set_cache, kwargs: %s", kwargs)
 
         # get the prompt
         messages = kwargs["messages"]
@@ -332,7 +341,7 @@ class QdrantSemanticCache(BaseCache):
         return
 
     async def async_get_cache(self, key, **kwargs):
-        print_verbose(f"async qdrant semantic-cache get_cache, kwargs: {kwargs}")
+        print_verbose("async qdrant semantic-cache get_cache, kwargs: %s", kwargs)
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
         # get the messages
@@ -403,7 +412,11 @@ class QdrantSemanticCache(BaseCache):
 
         # check similarity, if more than self.similarity_threshold, return results
         print_verbose(
-            f"semantic cache: similarity threshold: {self.similarity_threshold}, similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {cached_prompt}"
+            "semantic cache: similarity threshold: %s, similarity: %s, prompt: %s, closest_cached_prompt: %s",
+            self.similarity_threshold,
+            similarity,
+            prompt,
+            cached_prompt,
         )
 
         # update kwargs["metadata"] with similarity, don't rewrite the original metadata
@@ -413,7 +426,10 @@ class QdrantSemanticCache(BaseCache):
             # cache hit !
             cached_value = results[0]["payload"]["response"]
             print_verbose(
-                f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
+                "got a cache hit, similarity: %s, Current prompt: %s, cached_prompt: %s",
+                similarity,
+                prompt,
+                cached_prompt,
             )
             return self._get_cache_logic(cached_response=cached_value)
         else:
@@ -0,0 +1,195 @@
+"""
+Auto-pipelining for the async Redis client
+
+Commands issued in the same event-loop tick (or within `flush_interval` seconds) are sent to Redis as one non-transactional pipeline,
+so N concurrent GET / SET / INCR calls cost one round trip instead of N.
+
+Each caller awaits its own future, and gets its own result / exception back.
+"""
+
+import asyncio
+import math
+import weakref
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
+
+from litellm._logging import verbose_logger
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    async_redis_client = Redis
+else:
+    async_redis_client = Any
+
+# INCRBYFLOAT, and set the ttl (in ms) if the key doesn't have one yet - in one step, instead of INCRBYFLOAT + TTL + EXPIRE round trips
+INCREMENT_WITH_TTL_SCRIPT = """
+local result = redis.call('INCRBYFLOAT', KEYS[1], ARGV[1])
+local ttl_ms = tonumber(ARGV[2])
+if ttl_ms > 0 and redis.call('PTTL', KEYS[1]) == -1 then
+    redis.call('PEXPIRE', KEYS[1], ttl_ms)
+end
+return result
+"""
+
+# LPUSH the values, keep the first ARGV[1] items (newest first), and reset the ttl (in ms) - a fixed-size list in one step
+PUSH_WITH_TRIM_SCRIPT = """
+redis.call('LPUSH', KEYS[1], unpack(ARGV, 3))
+redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+local ttl_ms = tonumber(ARGV[2])
+if ttl_ms > 0 then
+    redis.call('PEXPIRE', KEYS[1], ttl_ms)
+end
+return redis.call('LLEN', KEYS[1])
+"""
+
+# (redis-py method name, args, kwargs, future)
+QueuedCommand = Tuple[str, tuple, dict, asyncio.Future]
+
+
+class RedisClientInitError(Exception):
+    """
+    The async redis client could not be created - raised to every caller in the batch.
+
+    Lets callers tell a bad client config apart from a failed redis command.
+    """
+
+    def __init__(self, original_exception: Exception):
+        self.original_exception = original_exception
+        super().__init__(str(original_exception))
+
+
+class RedisAutoPipeline:
+    def __init__(
+        self,
+        get_redis_client: Callable[[], async_redis_client],
+        flush_interval: float = 0.0,
+        max_batch_size: int = 1000,
+    ):
+        """
+        Args:
+            get_redis_client: returns an async redis client (e.g. `RedisCache.init_async_client`)
+            flush_interval: seconds to wait for more commands before flushing. 0 = flush on the next event-loop tick
+            max_batch_size: max commands per pipeline
+        """
+        self.get_redis_client = get_redis_client
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.enabled = True
+        # event loop -> commands waiting to be flushed on that loop
+        self.pending: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[QueuedCommand]]"
+        ) = weakref.WeakKeyDictionary()
+        # keep a reference to scheduled flushes, so they aren't garbage collected mid-flight
+        self.flush_tasks: "set[asyncio.Task]" = set()
+        self.num_round_trips = 0
+        self.num_commands = 0
+
+    async def execute_command(self, command: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Queue a redis-py command (e.g. `execute_command("get", key)`) and wait for its result.
+        """
+        self.num_commands += 1
+        if self.enabled is not True:
+            self.num_round_trips += 1
+            try:
+                _redis_client = self.get_redis_client()
+            except Exception as e:
+                raise RedisClientInitError(original_exception=e) from e
+            async with _redis_client as redis_client:
+                return await getattr(redis_client, command)(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        queued_commands = self.pending.get(loop)
+        if queued_commands is None:
+            queued_commands = []
+            self.pending[loop] = queued_commands
+            flush_task = loop.create_task(self._flush_after_interval(loop=loop))
+            self.flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self.flush_tasks.discard)
+        queued_commands.append((command, args, kwargs, future))
+        return await future
+
+    async def _flush_after_interval(self, loop: asyncio.AbstractEventLoop) -> None:
+        # sleep(0) yields once, so every command queued in this tick is part of the flush
+        await asyncio.sleep(self.flush_interval)
+        queued_commands = self.pending.pop(loop, None) or []
+        batches = [
+            queued_commands[i : i + self.max_batch_size]
+            for i in range(0, len(queued_commands), self.max_batch_size)
+        ]
+        await asyncio.gather(*[self._execute_batch(batch) for batch in batches])
+
+    async def _execute_batch(self, batch: List[QueuedCommand]) -> None:
+        self.num_round_trips += 1
+        try:
+            _redis_client = self.get_redis_client()
+        except Exception as e:
+            self._set_batch_exception(
+                batch=batch, exception=RedisClientInitError(original_exception=e)
+            )
+            return
+        try:
+            async with _redis_client as redis_client:
+                pipe = redis_client.pipeline(transaction=False)
+                for command, args, kwargs, _ in batch:
+                    getattr(pipe, command)(*args, **kwargs)
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            verbose_logger.debug(
+                "RedisAutoPipeline: pipeline of %s commands failed - %s",
+                len(batch),
+                str(e),
+            )
+            self._set_batch_exception(batch=batch, exception=e)
+            return
+
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():  # caller was cancelled
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _set_batch_exception(batch: List[QueuedCommand], exception: Exception) -> None:
+        for _, _, _, future in batch:
+            if not future.done():  # caller was cancelled
+                future.set_exception(exception)
+
+    def get_stats(self) -> dict:
+        return {
+            "num_commands": self.num_commands,
+            "num_round_trips": self.num_round_trips,
+        }
+
+    @staticmethod
+    def get_increment_with_ttl_args(
+        key: str, value: float, ttl: Optional[Union[float, timedelta]]
+    ) -> Tuple[str, int, str, float, int]:
+        """
+        Args for `eval` of INCREMENT_WITH_TTL_SCRIPT. ttl=None -> the key's ttl is not changed
+
+        The ttl is sent in ms (rounded up), so sub-second ttls still expire the key.
+        """
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        ttl_ms = math.ceil(ttl * 1000) if ttl else 0
+        return (INCREMENT_WITH_TTL_SCRIPT, 1, key, value, ttl_ms)
+
+    @staticmethod
+    def get_push_with_trim_args(
+        key: str,
+        values: List[str],
+        max_size: int,
+        ttl: Optional[Union[float, timedelta]],
+    ) -> tuple:
+        """
+        Args for `eval` of PUSH_WITH_TRIM_SCRIPT. ttl=None -> the key's ttl is not changed
+        """
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        ttl_ms = math.ceil(ttl * 1000) if ttl else 0
+        return (PUSH_WITH_TRIM_SCRIPT, 1, key, max_size, ttl_ms, *values)
@@ -15,7 +15,7 @@ import json
 import time
 import traceback
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -24,6 +24,13 @@ from litellm.types.services import ServiceLoggerPayload, ServiceTypes
 from litellm.types.utils import all_litellm_params
 
 from .base_cache import BaseCache
+from .cache_codec import (
+    CacheCodec,
+    decode_cache_value,
+    get_cache_codec,
+    is_cache_codec_encoded,
+)
+from .redis_auto_pipeline import RedisAutoPipeline, RedisClientInitError
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -50,6 +57,7 @@ class RedisCache(BaseCache):
         redis_flush_size: Optional[int] = 100,
         namespace: Optional[str] = None,
         startup_nodes: Optional[List] = None,  # for redis-cluster
+        cache_codec: Optional[Union[CacheCodec, dict]] = None,
         **kwargs,
     ):
         import redis
@@ -79,9 +87,15 @@ class RedisCache(BaseCache):
         self.redis_client = get_redis_client(**redis_kwargs)
         self.redis_kwargs = redis_kwargs
         self.async_redis_conn_pool = get_redis_connection_pool(**redis_kwargs)
+        # async get / set / increment calls made in the same event-loop tick share one round trip
+        self.auto_pipeline = RedisAutoPipeline(
+            get_redis_client=lambda: self.init_async_client()
+        )
 
         # redis namespaces
         self.namespace = namespace
+        # binary encoding for cached values. None = json
+        self.cache_codec = get_cache_codec(cache_codec)
         # for high traffic, we store the redis results in memory and then batch write to redis
         self.redis_batch_writing_buffer: list = []
         if redis_flush_size is None:
@@ -131,6 +145,11 @@ class RedisCache(BaseCache):
             connection_pool=self.async_redis_conn_pool, **self.redis_kwargs
         )
 
+    def _serialize_value(self, value: Any) -> Union[str, bytes]:
+        if self.cache_codec is not None:
+            return self.cache_codec.encode(value)
+        return json.dumps(value)
+
     def check_and_fix_namespace(self, key: str) -> str:
         """
         Make sure each key starts with the given namespace
@@ -143,12 +162,24 @@ class RedisCache(BaseCache):
     def set_cache(self, key, value, **kwargs):
         ttl = self.get_ttl(**kwargs)
         print_verbose(
-            f"Set Redis Cache: key: {key}\nValue {value}\nttl={ttl}, redis_version={self.redis_version}"
+            "Set Redis Cache: key: %s\nValue %s\nttl=%s, redis_version=%s",
+            key,
+            value,
+            ttl,
+            self.redis_version,
         )
         key = self.check_and_fix_namespace(key=key)
         try:
             start_time = time.time()
-            self.redis_client.set(name=key, value=str(value), ex=ttl)
+            self.redis_client.set(
+                name=key,
+                value=(
+                    self.cache_codec.encode(value)
+                    if self.cache_codec is not None
+                    else str(value)
+                ),
+                ex=ttl,
+            )
             end_time = time.time()
             _duration = end_time - start_time
             self.service_logger_obj.service_success_hook(
@@ -161,7 +192,7 @@ class RedisCache(BaseCache):
         except Exception as e:
             # NON blocking - notify users Redis is throwing an exception
             print_verbose(
-                f"litellm.caching.caching: set() - Got exception from REDIS : {str(e)}"
+                "litellm.caching.caching: set() - Got exception from REDIS : %s", str(e)
             )
 
     def increment_cache(
@@ -240,14 +271,12 @@ class RedisCache(BaseCache):
                 ## LOGGING ##
                 end_time = time.time()
                 _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_scan_iter",
-                        start_time=start_time,
-                        end_time=end_time,
-                    )
+                self.service_logger_obj.log_service_success(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type="async_scan_iter",
+                    start_time=start_time,
+                    end_time=end_time,
                 )  # DO NOT SLOW DOWN CALL B/C OF THIS
             return keys
         except Exception as e:
@@ -255,37 +284,56 @@ class RedisCache(BaseCache):
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    call_type="async_scan_iter",
-                    start_time=start_time,
-                    end_time=end_time,
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_scan_iter",
+                start_time=start_time,
+                end_time=end_time,
             )
             raise e
 
     async def async_set_cache(self, key, value, **kwargs):
-        from redis.asyncio import Redis
-
         start_time = time.time()
+        key = self.check_and_fix_namespace(key=key)
+        ttl = self.get_ttl(**kwargs)
+        print_verbose(
+            "Set ASYNC Redis Cache: key: %s\nValue %s\nttl=%s", key, value, ttl
+        )
         try:
-            _redis_client: Redis = self.init_async_client()  # type: ignore
+            await self.auto_pipeline.execute_command(
+                "set", name=key, value=self._serialize_value(value), ex=ttl
+            )
+            print_verbose(
+                "Successfully Set ASYNC Redis Cache: key: %s\nValue %s\nttl=%s",
+                key,
+                value,
+                ttl,
+            )
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_set_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
+                event_metadata={"key": key},
+            )
         except Exception as e:
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                    call_type="async_set_cache",
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_set_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
+                event_metadata={"key": key},
             )
             # NON blocking - notify users Redis is throwing an exception
             verbose_logger.error(
@@ -293,58 +341,8 @@ class RedisCache(BaseCache):
                 str(e),
                 value,
             )
-            raise e
-
-        key = self.check_and_fix_namespace(key=key)
-        async with _redis_client as redis_client:
-            ttl = self.get_ttl(**kwargs)
-            print_verbose(
-                f"Set ASYNC Redis Cache: key: {key}\nValue {value}\nttl={ttl}"
-            )
-
-            try:
-                if not hasattr(redis_client, "set"):
-                    raise Exception(
-                        "Redis client cannot set cache. Attribute not found."
-                    )
-                await redis_client.set(name=key, value=json.dumps(value), ex=ttl)
-                print_verbose(
-                    f"Successfully Set ASYNC Redis Cache: key: {key}\nValue {value}\nttl={ttl}"
-                )
-                end_time = time.time()
-                _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_set_cache",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                        event_metadata={"key": key},
-                    )
-                )
-            except Exception as e:
-                end_time = time.time()
-                _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_failure_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        error=e,
-                        call_type="async_set_cache",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                        event_metadata={"key": key},
-                    )
-                )
-                # NON blocking - notify users Redis is throwing an exception
-                verbose_logger.error(
-                    "LiteLLM Redis Caching: async set() - Got exception from REDIS %s, Writing value=%s",
-                    str(e),
-                    value,
-                )
+            if isinstance(e, RedisClientInitError):
+                raise e.original_exception
 
     async def _pipeline_helper(
         self, pipe: pipeline, cache_list: List[Tuple[Any, Any]], ttl: Optional[float]
@@ -354,9 +352,12 @@ class RedisCache(BaseCache):
         for cache_key, cache_value in cache_list:
             cache_key = self.check_and_fix_namespace(key=cache_key)
             print_verbose(
-                f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
+                "Set ASYNC Redis Cache PIPELINE: key: %s\nValue %s\nttl=%s",
+                cache_key,
+                cache_value,
+                ttl,
             )
-            json_cache_value = json.dumps(cache_value)
+            json_cache_value = self._serialize_value(cache_value)
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
@@ -381,7 +382,10 @@ class RedisCache(BaseCache):
         start_time = time.time()
 
         print_verbose(
-            f"Set Async Redis Cache: key list: {cache_list}\nttl={ttl}, redis_version={self.redis_version}"
+            "Set Async Redis Cache: key list: %s\nttl=%s, redis_version=%s",
+            cache_list,
+            ttl,
+            self.redis_version,
         )
         cache_value: Any = None
         try:
@@ -389,36 +393,32 @@ class RedisCache(BaseCache):
                 async with redis_client.pipeline(transaction=True) as pipe:
                     results = await self._pipeline_helper(pipe, cache_list, ttl)
 
-            print_verbose(f"pipeline results: {results}")
+            print_verbose("pipeline results: %s", results)
             # Optionally, you could process 'results' to make sure that all set operations were successful.
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_success_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    call_type="async_set_cache_pipeline",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                )
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_set_cache_pipeline",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
             )
             return None
         except Exception as e:
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    call_type="async_set_cache_pipeline",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_set_cache_pipeline",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
             )
 
             verbose_logger.error(
@@ -455,16 +455,14 @@ class RedisCache(BaseCache):
         except Exception as e:
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                    call_type="async_set_cache_sadd",
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
+                call_type="async_set_cache_sadd",
             )
             # NON blocking - notify users Redis is throwing an exception
             verbose_logger.error(
@@ -477,40 +475,39 @@ class RedisCache(BaseCache):
         key = self.check_and_fix_namespace(key=key)
         async with _redis_client as redis_client:
             print_verbose(
-                f"Set ASYNC Redis Cache: key: {key}\nValue {value}\nttl={ttl}"
+                "Set ASYNC Redis Cache: key: %s\nValue %s\nttl=%s", key, value, ttl
             )
             try:
                 await self._set_cache_sadd_helper(
                     redis_client=redis_client, key=key, value=value, ttl=ttl
                 )
                 print_verbose(
-                    f"Successfully Set ASYNC Redis Cache SADD: key: {key}\nValue {value}\nttl={ttl}"
+                    "Successfully Set ASYNC Redis Cache SADD: key: %s\nValue %s\nttl=%s",
+                    key,
+                    value,
+                    ttl,
                 )
                 end_time = time.time()
                 _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_set_cache_sadd",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                    )
+                self.service_logger_obj.log_service_success(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type="async_set_cache_sadd",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
                 )
             except Exception as e:
                 end_time = time.time()
                 _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_failure_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        error=e,
-                        call_type="async_set_cache_sadd",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                    )
+                self.service_logger_obj.log_service_failure(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    error=e,
+                    call_type="async_set_cache_sadd",
+                    start_time=start_time,
+                    end_time=end_time,
+                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
                 )
                 # NON blocking - notify users Redis is throwing an exception
                 verbose_logger.error(
@@ -521,7 +518,8 @@ class RedisCache(BaseCache):
 
     async def batch_cache_write(self, key, value, **kwargs):
         print_verbose(
-            f"in batch cache writing for redis buffer size={len(self.redis_batch_writing_buffer)}",
+            "in batch cache writing for redis buffer size=%s",
+            len(self.redis_batch_writing_buffer),
         )
         key = self.check_and_fix_namespace(key=key)
         self.redis_batch_writing_buffer.append((key, value))
@@ -535,61 +533,149 @@ class RedisCache(BaseCache):
         ttl: Optional[int] = None,
         parent_otel_span: Optional[Span] = None,
     ) -> float:
-        from redis.asyncio import Redis
-
-        _redis_client: Redis = self.init_async_client()  # type: ignore
         start_time = time.time()
         _used_ttl = self.get_ttl(ttl=ttl)
         try:
-            async with _redis_client as redis_client:
-                result = await redis_client.incrbyfloat(name=key, amount=value)
-
-                if _used_ttl is not None:
-                    # check if key already has ttl, if not -> set ttl
-                    current_ttl = await redis_client.ttl(key)
-                    if current_ttl == -1:
-                        # Key has no expiration
-                        await redis_client.expire(key, _used_ttl)
+            # increment + set ttl if the key doesn't have one, in one step
+            result = await self.auto_pipeline.execute_command(
+                "eval",
+                *RedisAutoPipeline.get_increment_with_ttl_args(
+                    key=key, value=value, ttl=_used_ttl
+                ),
+            )
+            result = float(result)
 
-                ## LOGGING ##
-                end_time = time.time()
-                _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_increment",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=parent_otel_span,
-                    )
-                )
-                return result
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_increment",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+            return result
         except Exception as e:
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    call_type="async_increment",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=parent_otel_span,
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_increment",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
             )
             verbose_logger.error(
                 "LiteLLM Redis Caching: async async_increment() - Got exception from REDIS %s, Writing value=%s",
                 str(e),
                 value,
             )
+            if isinstance(e, RedisClientInitError):
+                raise e.original_exception
             raise e
 
+    def push_to_list(
+        self,
+        key,
+        values: List[Any],
+        max_size: int,
+        ttl: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Prepend `values` to the list at `key` and keep its first `max_size` items (LPUSH + LTRIM, in one round trip)
+        """
+        key = self.check_and_fix_namespace(key=key)
+        start_time = time.time()
+        try:
+            self.redis_client.eval(
+                *RedisAutoPipeline.get_push_with_trim_args(
+                    key=key,
+                    values=[json.dumps(value) for value in values],
+                    max_size=max_size,
+                    ttl=self.get_ttl(ttl=ttl),
+                )
+            )
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.service_success_hook(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="push_to_list",
+                start_time=start_time,
+                end_time=end_time,
+            )
+        except Exception as e:
+            # NON blocking - notify users Redis is throwing an exception
+            verbose_logger.error(
+                "LiteLLM Redis Caching: push_to_list() - Got exception from REDIS %s, Writing value=%s",
+                str(e),
+                values,
+            )
+
+    async def async_push_to_list(
+        self,
+        key,
+        values: List[Any],
+        max_size: int,
+        ttl: Optional[float] = None,
+        parent_otel_span: Optional[Span] = None,
+    ) -> None:
+        """
+        Prepend `values` to the list at `key` and keep its first `max_size` items (LPUSH + LTRIM, in one round trip)
+        """
+        key = self.check_and_fix_namespace(key=key)
+        start_time = time.time()
+        try:
+            await self.auto_pipeline.execute_command(
+                "eval",
+                *RedisAutoPipeline.get_push_with_trim_args(
+                    key=key,
+                    values=[json.dumps(value) for value in values],
+                    max_size=max_size,
+                    ttl=self.get_ttl(ttl=ttl),
+                ),
+            )
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_push_to_list",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_push_to_list",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+            # NON blocking - notify users Redis is throwing an exception
+            verbose_logger.error(
+                "LiteLLM Redis Caching: async_push_to_list() - Got exception from REDIS %s, Writing value=%s",
+                str(e),
+                values,
+            )
+
     async def flush_cache_buffer(self):
         print_verbose(
-            f"flushing to redis....reached size of buffer {len(self.redis_batch_writing_buffer)}"
+            "flushing to redis....reached size of buffer %s",
+            len(self.redis_batch_writing_buffer),
         )
         await self.async_set_cache_pipeline(self.redis_batch_writing_buffer)
         self.redis_batch_writing_buffer = []
@@ -600,6 +686,8 @@ class RedisCache(BaseCache):
         """
         if cached_response is None:
             return cached_response
+        if is_cache_codec_encoded(cached_response):
+            return decode_cache_value(cached_response)
         # cached_response is in `b{} convert it to ModelResponse
         cached_response = cached_response.decode("utf-8")  # Convert bytes to string
         try:
@@ -613,7 +701,7 @@ class RedisCache(BaseCache):
     def get_cache(self, key, parent_otel_span: Optional[Span] = None, **kwargs):
         try:
             key = self.check_and_fix_namespace(key=key)
-            print_verbose(f"Get Redis Cache: key: {key}")
+            print_verbose("Get Redis Cache: key: %s", key)
             start_time = time.time()
             cached_response = self.redis_client.get(key)
             end_time = time.time()
@@ -627,7 +715,7 @@ class RedisCache(BaseCache):
                 parent_otel_span=parent_otel_span,
             )
             print_verbose(
-                f"Got Redis Cache: key: {key}, cached_response {cached_response}"
+                "Got Redis Cache: key: %s, cached_response %s", key, cached_response
             )
             return self._get_cache_logic(cached_response=cached_response)
         except Exception as e:
@@ -664,67 +752,66 @@ class RedisCache(BaseCache):
             # 'results' is a list of values corresponding to the order of keys in 'key_list'.
             key_value_dict = dict(zip(key_list, results))
 
-            decoded_results = {
-                k.decode("utf-8"): self._get_cache_logic(v)
-                for k, v in key_value_dict.items()
-            }
+            decoded_results = {}
+            for k, v in key_value_dict.items():
+                if isinstance(k, bytes):
+                    k = k.decode("utf-8")
+                v = self._get_cache_logic(v)
+                decoded_results[k] = v
 
             return decoded_results
         except Exception as e:
-            print_verbose(f"Error occurred in pipeline read - {str(e)}")
+            print_verbose("Error occurred in pipeline read - %s", str(e))
             return key_value_dict
 
     async def async_get_cache(
         self, key, parent_otel_span: Optional[Span] = None, **kwargs
     ):
-        from redis.asyncio import Redis
-
-        _redis_client: Redis = self.init_async_client()  # type: ignore
         key = self.check_and_fix_namespace(key=key)
         start_time = time.time()
-        async with _redis_client as redis_client:
-            try:
-                print_verbose(f"Get Async Redis Cache: key: {key}")
-                cached_response = await redis_client.get(key)
-                print_verbose(
-                    f"Got Async Redis Cache: key: {key}, cached_response {cached_response}"
-                )
-                response = self._get_cache_logic(cached_response=cached_response)
-                ## LOGGING ##
-                end_time = time.time()
-                _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_get_cache",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=parent_otel_span,
-                        event_metadata={"key": key},
-                    )
-                )
-                return response
-            except Exception as e:
-                ## LOGGING ##
-                end_time = time.time()
-                _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_failure_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        error=e,
-                        call_type="async_get_cache",
-                        start_time=start_time,
-                        end_time=end_time,
-                        parent_otel_span=parent_otel_span,
-                        event_metadata={"key": key},
-                    )
-                )
-                # NON blocking - notify users Redis is throwing an exception
-                print_verbose(
-                    f"litellm.caching.caching: async get() - Got exception from REDIS: {str(e)}"
-                )
+        try:
+            print_verbose("Get Async Redis Cache: key: %s", key)
+            cached_response = await self.auto_pipeline.execute_command("get", key)
+            print_verbose(
+                "Got Async Redis Cache: key: %s, cached_response %s",
+                key,
+                cached_response,
+            )
+            response = self._get_cache_logic(cached_response=cached_response)
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_get_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+                event_metadata={"key": key},
+            )
+            return response
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_get_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+                event_metadata={"key": key},
+            )
+            # NON blocking - notify users Redis is throwing an exception
+            print_verbose(
+                "litellm.caching.caching: async get() - Got exception from REDIS: %s",
+                str(e),
+            )
+            if isinstance(e, RedisClientInitError):
+                raise e.original_exception
 
     async def async_batch_get_cache(
         self, key_list: List[str], parent_otel_span: Optional[Span] = None
@@ -746,15 +833,13 @@ class RedisCache(BaseCache):
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_success_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    call_type="async_batch_get_cache",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=parent_otel_span,
-                )
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_batch_get_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
             )
 
             # Associate the results back with their keys.
@@ -773,20 +858,97 @@ class RedisCache(BaseCache):
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_failure_hook(
-                    service=ServiceTypes.REDIS,
-                    duration=_duration,
-                    error=e,
-                    call_type="async_batch_get_cache",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=parent_otel_span,
-                )
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_batch_get_cache",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
             )
-            print_verbose(f"Error occurred in pipeline read - {str(e)}")
+            print_verbose("Error occurred in pipeline read - %s", str(e))
             return key_value_dict
 
+    @staticmethod
+    def _decode_list(items: Optional[List[Any]]) -> List[Any]:
+        return [json.loads(item) for item in items or []]
+
+    def batch_get_lists(
+        self, key_list: List[str], parent_otel_span: Optional[Span] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Read the lists written by `push_to_list` (newest first), in one pipeline. Missing keys -> []
+        """
+        start_time = time.time()
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for cache_key in key_list:
+                pipe.lrange(self.check_and_fix_namespace(key=cache_key), 0, -1)
+            results = pipe.execute()
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.service_success_hook(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="batch_get_lists",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+            return {
+                key: self._decode_list(result) for key, result in zip(key_list, results)
+            }
+        except Exception as e:
+            print_verbose("Error occurred in pipeline list read - %s", str(e))
+            return {}
+
+    async def async_batch_get_lists(
+        self, key_list: List[str], parent_otel_span: Optional[Span] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Read the lists written by `push_to_list` (newest first) - the LRANGEs are auto-pipelined into one round trip. Missing keys -> []
+        """
+        start_time = time.time()
+        try:
+            results = await asyncio.gather(
+                *[
+                    self.auto_pipeline.execute_command(
+                        "lrange", self.check_and_fix_namespace(key=cache_key), 0, -1
+                    )
+                    for cache_key in key_list
+                ]
+            )
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                call_type="async_batch_get_lists",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+            return {
+                key: self._decode_list(result) for key, result in zip(key_list, results)
+            }
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            self.service_logger_obj.log_service_failure(
+                service=ServiceTypes.REDIS,
+                duration=_duration,
+                error=e,
+                call_type="async_batch_get_lists",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=parent_otel_span,
+            )
+            print_verbose("Error occurred in pipeline list read - %s", str(e))
+            return {}
+
     def sync_ping(self) -> bool:
         """
         Tests if the sync redis client is correctly setup.
@@ -795,7 +957,7 @@ class RedisCache(BaseCache):
         start_time = time.time()
         try:
             response: bool = self.redis_client.ping()  # type: ignore
-            print_verbose(f"Redis Cache PING: {response}")
+            print_verbose("Redis Cache PING: %s", response)
             ## LOGGING ##
             end_time = time.time()
             _duration = end_time - start_time
@@ -833,12 +995,10 @@ class RedisCache(BaseCache):
                 ## LOGGING ##
                 end_time = time.time()
                 _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_success_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        call_type="async_ping",
-                    )
+                self.service_logger_obj.log_service_success(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type="async_ping",
                 )
                 return response
             except Exception as e:
@@ -846,13 +1006,11 @@ class RedisCache(BaseCache):
                 ## LOGGING ##
                 end_time = time.time()
                 _duration = end_time - start_time
-                asyncio.create_task(
-                    self.service_logger_obj.async_service_failure_hook(
-                        service=ServiceTypes.REDIS,
-                        duration=_duration,
-                        error=e,
-                        call_type="async_ping",
-                    )
+                self.service_logger_obj.log_service_failure(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    error=e,
+                    call_type="async_ping",
                 )
                 verbose_logger.error(
                     f"LiteLLM Redis Cache PING: - Got exception from REDIS : {str(e)}"
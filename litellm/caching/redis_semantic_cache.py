@@ -73,14 +73,14 @@ class RedisSemanticCache(BaseCache):
                     raise Exception("Redis host, port, and password must be provided")
 
             redis_url = "redis://:" + password + "@" + host + ":" + port
-        print_verbose(f"redis semantic-cache redis_url: {redis_url}")
+        print_verbose("redis semantic-cache redis_url: %s", redis_url)
         if use_async is False:
             self.index = SearchIndex.from_dict(schema)
             self.index.connect(redis_url=redis_url)
             try:
                 self.index.create(overwrite=False)  # don't overwrite existing index
             except Exception as e:
-                print_verbose(f"Got exception creating semantic cache index: {str(e)}")
+                print_verbose("Got exception creating semantic cache index: %s", str(e))
         elif use_async is True:
             schema["index"]["name"] = "litellm_semantic_cache_index_async"
             self.index = SearchIndex.from_dict(schema)
@@ -109,7 +109,7 @@ class RedisSemanticCache(BaseCache):
     def set_cache(self, key, value, **kwargs):
         import numpy as np
 
-        print_verbose(f"redis semantic-cache set_cache, kwargs: {kwargs}")
+        print_verbose("redis semantic-cache set_cache, kwargs: %s", kwargs)
 
         # get the prompt
         messages = kwargs["messages"]
@@ -140,7 +140,7 @@ class RedisSemanticCache(BaseCache):
         return
 
     def get_cache(self, key, **kwargs):
-        print_verbose(f"sync redis semantic-cache get_cache, kwargs: {kwargs}")
+        print_verbose("sync redis semantic-cache get_cache, kwargs: %s", kwargs)
         import numpy as np
         from redisvl.query import VectorQuery
 
@@ -180,13 +180,20 @@ class RedisSemanticCache(BaseCache):
 
         # check similarity, if more than self.similarity_threshold, return results
         print_verbose(
-            f"semantic cache: similarity threshold: {self.similarity_threshold}, similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {cached_prompt}"
+            "semantic cache: similarity threshold: %s, similarity: %s, prompt: %s, closest_cached_prompt: %s",
+            self.similarity_threshold,
+            similarity,
+            prompt,
+            cached_prompt,
         )
         if similarity > self.similarity_threshold:
             # cache hit !
             cached_value = results[0]["response"]
             print_verbose(
-                f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
+                "got a cache hit, similarity: %s, Current prompt: %s, cached_prompt: %s",
+                similarity,
+                prompt,
+                cached_prompt,
             )
             return self._get_cache_logic(cached_response=cached_value)
         else:
@@ -203,8 +210,8 @@ class RedisSemanticCache(BaseCache):
         try:
             await self.index.acreate(overwrite=False)  # don't overwrite existing index
         except Exception as e:
-            print_verbose(f"Got exception creating semantic cache index: {str(e)}")
-        print_verbose(f"async redis semantic-cache set_cache, kwargs: {kwargs}")
+            print_verbose("Got exception creating semantic cache index: %s", str(e))
+        print_verbose("async redis semantic-cache set_cache, kwargs: %s", kwargs)
 
         # get the prompt
         messages = kwargs["messages"]
@@ -252,7 +259,7 @@ class RedisSemanticCache(BaseCache):
         return
 
     async def async_get_cache(self, key, **kwargs):
-        print_verbose(f"async redis semantic-cache get_cache, kwargs: {kwargs}")
+        print_verbose("async redis semantic-cache get_cache, kwargs: %s", kwargs)
         import numpy as np
         from redisvl.query import VectorQuery
 
@@ -312,7 +319,11 @@ class RedisSemanticCache(BaseCache):
 
         # check similarity, if more than self.similarity_threshold, return results
         print_verbose(
-            f"semantic cache: similarity threshold: {self.similarity_threshold}, similarity: {similarity}, prompt: {prompt}, closest_cached_prompt: {cached_prompt}"
+            "semantic cache: similarity threshold: %s, similarity: %s, prompt: %s, closest_cached_prompt: %s",
+            self.similarity_threshold,
+            similarity,
+            prompt,
+            cached_prompt,
         )
 
         # update kwargs["metadata"] with similarity, don't rewrite the original metadata
@@ -322,7 +333,10 @@ class RedisSemanticCache(BaseCache):
             # cache hit !
             cached_value = results[0]["response"]
             print_verbose(
-                f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
+                "got a cache hit, similarity: %s, Current prompt: %s, cached_prompt: %s",
+                similarity,
+                prompt,
+                cached_prompt,
             )
             return self._get_cache_logic(cached_response=cached_value)
         else:
@@ -12,13 +12,19 @@ Has 4 methods:
 import ast
 import asyncio
 import json
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.types.caching import LiteLLMCacheType
 
 from .base_cache import BaseCache
+from .cache_codec import (
+    CacheCodec,
+    decode_cache_value,
+    get_cache_codec,
+    is_cache_codec_encoded,
+)
 
 
 class S3Cache(BaseCache):
@@ -35,11 +41,14 @@ class S3Cache(BaseCache):
         s3_aws_session_token=None,
         s3_config=None,
         s3_path=None,
+        cache_codec: Optional[Union[CacheCodec, dict]] = None,
         **kwargs,
     ):
         import boto3
 
         self.bucket_name = s3_bucket_name
+        # binary encoding for cached values. None = json
+        self.cache_codec = get_cache_codec(cache_codec)
         self.key_prefix = s3_path.rstrip("/") + "/" if s3_path else ""
         # Create an S3 client with custom endpoint URL
 
@@ -59,10 +68,16 @@ class S3Cache(BaseCache):
 
     def set_cache(self, key, value, **kwargs):
         try:
-            print_verbose(f"LiteLLM SET Cache - S3. Key={key}. Value={value}")
+            print_verbose("LiteLLM SET Cache - S3. Key=%s. Value=%s", key, value)
             ttl = kwargs.get("ttl", None)
-            # Convert value to JSON before storing in S3
-            serialized_value = json.dumps(value)
+            # Convert value to JSON (or the binary cache codec) before storing in S3
+            serialized_value: Union[str, bytes]
+            if self.cache_codec is not None:
+                serialized_value = self.cache_codec.encode(value)
+                content_type = "application/octet-stream"
+            else:
+                serialized_value = json.dumps(value)
+                content_type = "application/json"
             key = self.key_prefix + key
 
             if ttl is not None:
@@ -79,7 +94,7 @@ class S3Cache(BaseCache):
                     Body=serialized_value,
                     Expires=expiration_time,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
@@ -91,13 +106,13 @@ class S3Cache(BaseCache):
                     Key=key,
                     Body=serialized_value,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
         except Exception as e:
             # NON blocking - notify users S3 is throwing an exception
-            print_verbose(f"S3 Caching: set_cache() - Got exception from S3: {e}")
+            print_verbose("S3 Caching: set_cache() - Got exception from S3: %s", e)
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -109,16 +124,20 @@ class S3Cache(BaseCache):
         try:
             key = self.key_prefix + key
 
-            print_verbose(f"Get S3 Cache: key: {key}")
+            print_verbose("Get S3 Cache: key: %s", key)
             # Download the data from S3
             cached_response = self.s3_client.get_object(
                 Bucket=self.bucket_name, Key=key
             )
 
             if cached_response is not None:
+                cached_response = cached_response["Body"].read()
+            if is_cache_codec_encoded(cached_response):
+                cached_response = decode_cache_value(cached_response)
+            elif cached_response is not None:
                 # cached_response is in `b{} convert it to ModelResponse
-                cached_response = (
-                    cached_response["Body"].read().decode("utf-8")
+                cached_response = cached_response.decode(
+                    "utf-8"
                 )  # Convert bytes to string
                 try:
                     cached_response = json.loads(
@@ -129,14 +148,18 @@ class S3Cache(BaseCache):
             if type(cached_response) is not dict:
                 cached_response = dict(cached_response)
             verbose_logger.debug(
-                f"Got S3 Cache: key: {key}, cached_response {cached_response}. Type Response {type(cached_response)}"
+                "Got S3 Cache: key: %s, cached_response %s. Type Response %s",
+                key,
+                cached_response,
+                type(cached_response),
             )
 
             return cached_response
         except botocore.exceptions.ClientError as e:  # type: ignore
             if e.response["Error"]["Code"] == "NoSuchKey":
                 verbose_logger.debug(
-                    f"S3 Cache: The specified key '{key}' does not exist in the S3 bucket."
+                    "S3 Cache: The specified key '%s' does not exist in the S3 bucket.",
+                    key,
                 )
                 return None
 
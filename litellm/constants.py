@@ -1 +1,3 @@
 ROUTER_MAX_FALLBACKS = 5
+# batch files rewritten by the router spill to a temp file above this size
+BATCH_FILE_MAX_IN_MEMORY_SIZE = 5 * 1024 * 1024
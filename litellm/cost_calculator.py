@@ -616,9 +616,7 @@ def completion_cost(  # noqa: PLR0915
                 cache_read_input_tokens = prompt_tokens_details.get("cached_tokens", 0)
 
             total_time = getattr(completion_response, "_response_ms", 0)
-            verbose_logger.debug(
-                f"completion_response response ms: {getattr(completion_response, '_response_ms', None)} "
-            )
+            verbose_logger.debug("completion_response response ms: %s", total_time)
             model = _select_model_name_for_cost_calc(
                 model=model, completion_response=completion_response
             )
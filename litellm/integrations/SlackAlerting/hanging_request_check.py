@@ -0,0 +1,227 @@
+"""
+Tracks in-flight proxy requests and alerts on the ones that are hanging.
+
+Requests are kept in a hashed timer wheel, with only the metadata needed for the alert.
+- adding / completing a request is O(1)
+- one sweeper task fires the alerts, and exits when no requests are tracked
+"""
+
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm.litellm_core_utils.exception_mapping_utils import (
+    _add_key_name_and_team_to_alert,
+)
+from litellm.proxy._types import AlertType
+from litellm.types.integrations.slack_alerting import HangingRequestData
+
+if TYPE_CHECKING:
+    from .slack_alerting import SlackAlerting as _SlackAlerting
+
+    SlackAlertingType = _SlackAlerting
+else:
+    SlackAlertingType = Any
+
+T = TypeVar("T")
+
+MAX_MESSAGES_CHARS_IN_ALERT = 100
+
+
+class HashedTimerWheel(Generic[T]):
+    """
+    Hashed timer wheel - `num_slots` buckets of `tick_seconds` each.
+
+    An entry due at tick `t` is stored in bucket `t % num_slots`, so scheduling and cancelling are O(1),
+    and advancing the wheel by one tick only looks at one bucket.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, num_slots: int = 512):
+        self.tick_seconds = tick_seconds
+        self.num_slots = num_slots
+        # slot -> {key: (due tick, item)}
+        self.slots: List[Dict[str, Tuple[int, T]]] = [{} for _ in range(num_slots)]
+        self.key_to_slot: Dict[str, int] = {}
+        self.current_tick = 0
+
+    def __len__(self) -> int:
+        return len(self.key_to_slot)
+
+    def schedule(self, key: str, delay_seconds: float, item: T) -> None:
+        self.cancel(key)
+        due_tick = self.current_tick + max(
+            1, math.ceil(delay_seconds / self.tick_seconds)
+        )
+        slot = due_tick % self.num_slots
+        self.slots[slot][key] = (due_tick, item)
+        self.key_to_slot[key] = slot
+
+    def cancel(self, key: str) -> bool:
+        slot = self.key_to_slot.pop(key, None)
+        if slot is None:
+            return False
+        self.slots[slot].pop(key, None)
+        return True
+
+    def advance(self, ticks: int = 1) -> List[T]:
+        """
+        Move the wheel forward, and return the items that are now due.
+        """
+        expired: List[T] = []
+        for _ in range(min(ticks, self.num_slots)):
+            self.current_tick += 1
+            expired.extend(self._pop_due(self.current_tick % self.num_slots))
+        if ticks > self.num_slots:
+            # skipped over the whole wheel - every slot has been visited, re-check them all
+            self.current_tick += ticks - self.num_slots
+            for slot in range(self.num_slots):
+                expired.extend(self._pop_due(slot))
+        return expired
+
+    def _pop_due(self, slot: int) -> List[T]:
+        bucket = self.slots[slot]
+        due_keys = [
+            key
+            for key, (due_tick, _) in bucket.items()
+            if due_tick <= self.current_tick
+        ]
+        expired: List[T] = []
+        for key in due_keys:
+            expired.append(bucket.pop(key)[1])
+            self.key_to_slot.pop(key, None)
+        return expired
+
+
+class AlertingHangingRequestCheck:
+    """
+    Sends a `llm_requests_hanging` alert for requests still running after `alerting_threshold` seconds
+    """
+
+    def __init__(
+        self,
+        slack_alerting_object: SlackAlertingType,
+        tick_seconds: float = 1.0,
+    ):
+        self.slack_alerting_object = slack_alerting_object
+        self.timer_wheel: HashedTimerWheel[HangingRequestData] = HashedTimerWheel(
+            tick_seconds=tick_seconds
+        )
+        self.sweeper_task: Optional[asyncio.Task] = None
+
+    def is_enabled(self) -> bool:
+        return (
+            self.slack_alerting_object.alerting is not None
+            and len(self.slack_alerting_object.alerting) > 0
+            and AlertType.llm_requests_hanging in self.slack_alerting_object.alert_types
+        )
+
+    def add_request_to_hanging_request_check(self, request_data: dict) -> None:
+        """
+        Start tracking a request. Only keeps the model, a preview of the messages and the request metadata.
+        """
+        litellm_call_id = request_data.get("litellm_call_id")
+        if litellm_call_id is None:
+            return
+        metadata = request_data.get("metadata")
+        self.timer_wheel.schedule(
+            key=litellm_call_id,
+            delay_seconds=self.slack_alerting_object.alerting_threshold,
+            item=HangingRequestData(
+                litellm_call_id=litellm_call_id,
+                model=request_data.get("model", ""),
+                messages_preview=_get_messages_preview(request_data),
+                metadata=metadata if isinstance(metadata, dict) else None,
+            ),
+        )
+        if self.sweeper_task is None or self.sweeper_task.done():
+            self.sweeper_task = asyncio.create_task(self._run_sweeper())
+
+    def remove_request_from_hanging_request_check(self, litellm_call_id: str) -> None:
+        self.timer_wheel.cancel(litellm_call_id)
+
+    async def _run_sweeper(self) -> None:
+        tick_seconds = self.timer_wheel.tick_seconds
+        last_tick_time = time.monotonic()
+        while len(self.timer_wheel) > 0:
+            await asyncio.sleep(tick_seconds)
+            now = time.monotonic()
+            elapsed_ticks = int((now - last_tick_time) / tick_seconds)
+            if elapsed_ticks <= 0:
+                continue
+            last_tick_time += elapsed_ticks * tick_seconds
+
+            hanging_requests = self.timer_wheel.advance(ticks=elapsed_ticks)
+            if len(hanging_requests) > 0:
+                await asyncio.gather(
+                    *[
+                        self.send_hanging_request_alert(hanging_request)
+                        for hanging_request in hanging_requests
+                    ],
+                    return_exceptions=True,
+                )
+
+    async def send_hanging_request_alert(
+        self, hanging_request: HangingRequestData
+    ) -> None:
+        request_info = f"\nRequest Model: `{hanging_request['model']}`\nMessages: `{hanging_request['messages_preview']}`"
+        alerting_metadata: dict = {}
+        metadata = hanging_request["metadata"]
+        if metadata is not None:
+            request_info = _add_key_name_and_team_to_alert(
+                request_info=request_info, metadata=metadata
+            )
+            request_info += f"\nAPI Base: `{metadata.get('api_base', '') or ''}`"
+            if "alerting_metadata" in metadata:
+                alerting_metadata = metadata["alerting_metadata"]
+
+            # add deployment latencies to alert
+            _deployment_latency_map = (
+                self.slack_alerting_object._get_deployment_latencies_to_alert(
+                    metadata=metadata
+                )
+            )
+            if _deployment_latency_map is not None:
+                request_info += f"\nDeployment Latencies\n{_deployment_latency_map}"
+
+        alerting_message = f"`Requests are hanging - {self.slack_alerting_object.alerting_threshold}s+ request time`"
+        try:
+            await self.slack_alerting_object.send_alert(
+                message=alerting_message + request_info,
+                level="Medium",
+                alert_type=AlertType.llm_requests_hanging,
+                alerting_metadata=alerting_metadata,
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "Error sending hanging request alert - {}".format(str(e))
+            )
+
+
+def _get_messages_preview(request_data: dict) -> str:
+    """
+    First 100 chars of the request's messages (or input), without converting all of them to a string
+    """
+    if litellm.turn_off_message_logging or litellm.redact_messages_in_exceptions:
+        return "Message not logged. litellm.redact_messages_in_exceptions=True"
+
+    messages = request_data.get("messages", None)
+    if messages is None:
+        # if messages does not exist fallback to "input"
+        messages = request_data.get("input", None)
+
+    try:
+        if isinstance(messages, list):
+            parts: List[str] = []
+            length = 1
+            for message in messages:
+                parts.append(repr(message))
+                length += len(parts[-1]) + 2
+                if length >= MAX_MESSAGES_CHARS_IN_ALERT:
+                    break
+            return ("[" + ", ".join(parts) + "]")[:MAX_MESSAGES_CHARS_IN_ALERT]
+        return str(messages)[:MAX_MESSAGES_CHARS_IN_ALERT]
+    except Exception:
+        return ""
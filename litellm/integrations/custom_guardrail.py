@@ -6,6 +6,10 @@ from litellm.types.guardrails import GuardrailEventHooks
 
 
 class CustomGuardrail(CustomLogger):
+    # Set to True on guardrails whose pre-call / during-call hooks only inspect the
+    # request (accept or reject it) and never modify it.
+    # The proxy runs read-only guardrails concurrently instead of one after another.
+    read_only: bool = False
 
     def __init__(
         self,
@@ -10,6 +10,8 @@ async_log_success_event:  will store batch of DD_MAX_BATCH_SIZE in memory and fl
 
 async_service_failure_hook: Logs failures from Redis, Postgres (Adjacent systems), as 'WARNING' on DataDog
 
+async_service_metrics_summary_hook: Logs periodic latency summaries from Redis, Postgres (Adjacent systems), as 'INFO' on DataDog
+
 For batching specific details see CustomBatchLogger class
 """
 
@@ -32,7 +34,7 @@ from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
 )
-from litellm.types.services import ServiceLoggerPayload
+from litellm.types.services import ServiceLoggerPayload, ServiceMetricsSummary
 
 from .types import DD_ERRORS, DatadogPayload, DataDogStatus
 from .utils import make_json_serializable
@@ -382,3 +384,29 @@ class DataDogLogger(CustomBatchLogger):
         No user has asked for this so far, this might be spammy on datatdog. If need arises we can implement this
         """
         return
+
+    async def async_service_metrics_summary_hook(
+        self, summaries: List[ServiceMetricsSummary]
+    ):
+        """
+        Logs aggregated latency / error counts from Redis, Postgres (Adjacent systems), as 'INFO' on DataDog
+
+        One log per service call_type, per flush interval - instead of one log per call
+        """
+        try:
+            import json
+
+            for summary in summaries:
+                _dd_payload = DatadogPayload(
+                    ddsource="litellm",
+                    ddtags="",
+                    hostname="",
+                    message=json.dumps(summary.model_dump()),
+                    service="litellm-server",
+                    status=DataDogStatus.INFO,
+                )
+                self.log_queue.append(_dd_payload)
+        except Exception as e:
+            verbose_logger.exception(
+                f"Datadog: Logger - Exception in async_service_metrics_summary_hook: {e}"
+            )
@@ -53,6 +53,13 @@ class OpenTelemetryConfig:
     exporter: Union[str, SpanExporter] = "console"
     endpoint: Optional[str] = None
     headers: Optional[str] = None
+    # tail-based sampling - fraction of traces exported. Errors + slow requests are always exported
+    sample_rate: Optional[float] = None
+    slow_request_threshold: Optional[float] = None  # seconds
+    max_attribute_length: Optional[int] = None  # longer string attributes are truncated
+    # batch span processor queue - defaults to OTEL_BSP_MAX_QUEUE_SIZE / OTEL_BSP_MAX_EXPORT_BATCH_SIZE
+    max_queue_size: Optional[int] = None
+    max_export_batch_size: Optional[int] = None
 
     @classmethod
     def from_env(cls):
@@ -62,19 +69,39 @@ class OpenTelemetryConfig:
         OTEL_ENDPOINT="https://api.honeycomb.io/v1/traces"
 
         OTEL_HEADERS gets sent as headers = {"x-honeycomb-team": "B85YgLm96******"}
+
+        OTEL_SAMPLE_RATE=0.1 - export 10% of traces, plus every failed request
+        OTEL_SLOW_REQUEST_THRESHOLD=5 - always export requests slower than 5s
+        OTEL_MAX_ATTRIBUTE_LENGTH=4096 - truncate long attributes (e.g. message bodies)
+
+        For head-based sampling, use the standard OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG env vars.
         """
         from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
             InMemorySpanExporter,
         )
 
+        sample_rate = os.getenv("OTEL_SAMPLE_RATE")
+        slow_request_threshold = os.getenv("OTEL_SLOW_REQUEST_THRESHOLD")
+        max_attribute_length = os.getenv("OTEL_MAX_ATTRIBUTE_LENGTH")
+        sampling_params: Dict[str, Any] = {
+            "sample_rate": float(sample_rate) if sample_rate else None,
+            "slow_request_threshold": (
+                float(slow_request_threshold) if slow_request_threshold else None
+            ),
+            "max_attribute_length": (
+                int(max_attribute_length) if max_attribute_length else None
+            ),
+        }
+
         if os.getenv("OTEL_EXPORTER") == "in_memory":
-            return cls(exporter=InMemorySpanExporter())
+            return cls(exporter=InMemorySpanExporter(), **sampling_params)
         return cls(
             exporter=os.getenv("OTEL_EXPORTER", "console"),
             endpoint=os.getenv("OTEL_ENDPOINT"),
             headers=os.getenv(
                 "OTEL_HEADERS"
             ),  # example: OTEL_HEADERS=x-honeycomb-team=B85YgLm96VGdFisfJVme1H"
+            **sampling_params,
         )
 
 
@@ -87,7 +114,7 @@ class OpenTelemetry(CustomLogger):
     ):
         from opentelemetry import trace
         from opentelemetry.sdk.resources import Resource
-        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace import SpanLimits, TracerProvider
 
         if config is None:
             config = OpenTelemetryConfig.from_env()
@@ -96,10 +123,27 @@ class OpenTelemetry(CustomLogger):
         self.OTEL_EXPORTER = self.config.exporter
         self.OTEL_ENDPOINT = self.config.endpoint
         self.OTEL_HEADERS = self.config.headers
-        provider = TracerProvider(resource=Resource(attributes=LITELLM_RESOURCE))
-        provider.add_span_processor(self._get_span_processor())
+        provider = TracerProvider(
+            resource=Resource(attributes=LITELLM_RESOURCE),
+            span_limits=SpanLimits(
+                max_attribute_length=self.config.max_attribute_length
+            ),
+        )
+        span_processor = self._get_span_processor()
+        if self.config.sample_rate is not None:
+            from litellm.integrations.opentelemetry_helpers.tail_sampling import (
+                TailSamplingSpanProcessor,
+            )
+
+            span_processor = TailSamplingSpanProcessor(
+                span_processor=span_processor,
+                sample_rate=self.config.sample_rate,
+                slow_request_threshold=self.config.slow_request_threshold,
+            )
+        provider.add_span_processor(span_processor)
         self.callback_name = callback_name
 
+        self.tracer_provider = provider
         trace.set_tracer_provider(provider)
         self.tracer = trace.get_tracer(LITELLM_TRACER_NAME)
 
@@ -306,9 +350,13 @@ class OpenTelemetry(CustomLogger):
             context=_parent_context,
         )
         span.set_status(Status(StatusCode.OK))
-        self.set_attributes(span, kwargs, response_obj)
+        if span.is_recording():
+            self.set_attributes(span, kwargs, response_obj)
 
-        if litellm.turn_off_message_logging is True:
+        if not span.is_recording():
+            # not sampled by the head sampler (OTEL_TRACES_SAMPLER)
+            pass
+        elif litellm.turn_off_message_logging is True:
             pass
         elif self.message_logging is not True:
             pass
@@ -757,15 +805,17 @@ class OpenTelemetry(CustomLogger):
             carrier = {"traceparent": traceparent}
             return TraceContextTextMapPropagator().extract(carrier=carrier), None
 
-    def _get_span_processor(self):
-        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
-            OTLPSpanExporter as OTLPSpanExporterGRPC,
-        )
-        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-            OTLPSpanExporter as OTLPSpanExporterHTTP,
+    def _get_batch_span_processor(self, exporter: SpanExporter):
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        return BatchSpanProcessor(
+            exporter,
+            max_queue_size=self.config.max_queue_size,
+            max_export_batch_size=self.config.max_export_batch_size,
         )
+
+    def _get_span_processor(self):
         from opentelemetry.sdk.trace.export import (
-            BatchSpanProcessor,
             ConsoleSpanExporter,
             SimpleSpanProcessor,
             SpanExporter,
@@ -794,13 +844,17 @@ class OpenTelemetry(CustomLogger):
                 "OpenTelemetry: intiializing console exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(ConsoleSpanExporter())
+            return self._get_batch_span_processor(ConsoleSpanExporter())
         elif self.OTEL_EXPORTER == "otlp_http":
             verbose_logger.debug(
                 "OpenTelemetry: intiializing http exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter as OTLPSpanExporterHTTP,
+            )
+
+            return self._get_batch_span_processor(
                 OTLPSpanExporterHTTP(
                     endpoint=self.OTEL_ENDPOINT, headers=_split_otel_headers
                 ),
@@ -810,7 +864,11 @@ class OpenTelemetry(CustomLogger):
                 "OpenTelemetry: intiializing grpc exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter as OTLPSpanExporterGRPC,
+            )
+
+            return self._get_batch_span_processor(
                 OTLPSpanExporterGRPC(
                     endpoint=self.OTEL_ENDPOINT, headers=_split_otel_headers
                 ),
@@ -820,7 +878,7 @@ class OpenTelemetry(CustomLogger):
                 "OpenTelemetry: intiializing console exporter. Value of OTEL_EXPORTER: %s",
                 self.OTEL_EXPORTER,
             )
-            return BatchSpanProcessor(ConsoleSpanExporter())
+            return self._get_batch_span_processor(ConsoleSpanExporter())
 
     async def async_management_endpoint_success_hook(
         self,
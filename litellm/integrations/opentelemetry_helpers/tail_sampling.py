@@ -0,0 +1,100 @@
+"""
+Tail-based sampling for the OpenTelemetry integration
+
+Spans are buffered per trace until the local root span ends (e.g. the proxy request span, or `litellm_request` on the SDK). The whole trace is then exported if:
+- any span in it errored
+- the root span took longer than `slow_request_threshold` seconds
+- the trace id is sampled at `sample_rate` (same ratio check as the `TraceIdRatioBased` head sampler)
+
+Otherwise the whole trace is dropped, before it reaches the exporter.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+DEFAULT_MAX_BUFFERED_TRACES = 2048
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    def __init__(
+        self,
+        span_processor: SpanProcessor,
+        sample_rate: float,
+        slow_request_threshold: Optional[float] = None,
+        max_buffered_traces: int = DEFAULT_MAX_BUFFERED_TRACES,
+    ):
+        self.span_processor = span_processor
+        self.sample_rate = sample_rate
+        self.slow_request_threshold = slow_request_threshold
+        self.max_buffered_traces = max_buffered_traces
+        self.trace_id_upper_bound = round(sample_rate * (_TRACE_ID_LIMIT + 1))
+        # trace id -> ended spans, waiting for the local root span to end
+        self.buffered_traces: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        # trace id -> export decision - for spans that end after their root (e.g. async service hooks)
+        self.decided_traces: "OrderedDict[int, bool]" = OrderedDict()
+        # sync calls end spans on the logging thread pool
+        self.lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.span_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id  # type: ignore
+        is_local_root = span.parent is None or span.parent.is_remote
+        with self.lock:
+            if not is_local_root:
+                decision = self.decided_traces.get(trace_id)
+                if decision is None:
+                    self._buffer_span(trace_id=trace_id, span=span)
+                    return
+                spans = [span]
+            else:
+                spans = self.buffered_traces.pop(trace_id, [])
+                spans.append(span)
+                decision = self._should_export(spans=spans, root_span=span)
+                self.decided_traces[trace_id] = decision
+                if len(self.decided_traces) > self.max_buffered_traces:
+                    self.decided_traces.popitem(last=False)
+        if decision is True:
+            for _span in spans:
+                self.span_processor.on_end(_span)
+
+    def _buffer_span(self, trace_id: int, span: ReadableSpan) -> None:
+        spans = self.buffered_traces.get(trace_id)
+        if spans is None:
+            if len(self.buffered_traces) >= self.max_buffered_traces:
+                # root span never ended - drop the oldest trace
+                self.buffered_traces.popitem(last=False)
+            spans = self.buffered_traces[trace_id] = []
+        spans.append(span)
+
+    def _should_export(
+        self, spans: List[ReadableSpan], root_span: ReadableSpan
+    ) -> bool:
+        for span in spans:
+            if span.status.status_code == StatusCode.ERROR:
+                return True
+        if (
+            self.slow_request_threshold is not None
+            and root_span.start_time is not None
+            and root_span.end_time is not None
+            and (root_span.end_time - root_span.start_time) / 1e9
+            >= self.slow_request_threshold
+        ):
+            return True
+        trace_id = root_span.context.trace_id  # type: ignore
+        return trace_id & _TRACE_ID_LIMIT < self.trace_id_upper_bound
+
+    def shutdown(self) -> None:
+        with self.lock:
+            self.buffered_traces.clear()
+        self.span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> Any:
+        return self.span_processor.force_flush(timeout_millis)
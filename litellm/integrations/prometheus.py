@@ -7,7 +7,7 @@ import sys
 import traceback
 import uuid
 from datetime import date, datetime, timedelta
-from typing import Optional, TypedDict, Union
+from typing import Dict, Optional, TypedDict, Union
 
 import dotenv
 import requests  # type: ignore
@@ -172,6 +172,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_team_budget_metric",
                 "Remaining budget for team",
                 labelnames=["team_id", "team_alias"],
+                multiprocess_mode="livemostrecent",
             )
 
             # Remaining Budget for API Key
@@ -179,6 +180,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_budget_metric",
                 "Remaining budget for api key",
                 labelnames=["hashed_api_key", "api_key_alias"],
+                multiprocess_mode="livemostrecent",
             )
 
             ########################################
@@ -189,6 +191,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_requests_for_model",
                 "Remaining Requests API Key can make for model (model based rpm limit on key)",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
+                multiprocess_mode="livemostrecent",
             )
 
             # Remaining MODEL TPM limit for API Key
@@ -196,6 +199,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_remaining_api_key_tokens_for_model",
                 "Remaining Tokens API Key can make for model (model based tpm limit on key)",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
+                multiprocess_mode="livemostrecent",
             )
 
             ########################################
@@ -214,6 +218,7 @@ class PrometheusLogger(CustomLogger):
                     "hashed_api_key",
                     "api_key_alias",
                 ],
+                multiprocess_mode="livemostrecent",
             )
 
             self.litellm_remaining_tokens_metric = Gauge(
@@ -227,6 +232,7 @@ class PrometheusLogger(CustomLogger):
                     "hashed_api_key",
                     "api_key_alias",
                 ],
+                multiprocess_mode="livemostrecent",
             )
             # Get all keys
             _logged_llm_labels = [
@@ -247,6 +253,7 @@ class PrometheusLogger(CustomLogger):
                 "litellm_deployment_state",
                 "LLM Deployment Analytics - The state of the deployment: 0 = healthy, 1 = partial outage, 2 = complete outage",
                 labelnames=_logged_llm_labels,
+                multiprocess_mode="livemostrecent",
             )
 
             self.litellm_deployment_cooled_down = Counter(
@@ -330,10 +337,35 @@ class PrometheusLogger(CustomLogger):
                 ],
             )
 
+            if litellm.prometheus_label_cardinality_limits:
+                self._apply_label_cardinality_limits(
+                    label_limits=litellm.prometheus_label_cardinality_limits
+                )
+
         except Exception as e:
             print_verbose(f"Got exception on init prometheus client {str(e)}")
             raise e
 
+    def _apply_label_cardinality_limits(self, label_limits: Dict[str, int]):
+        """
+        Wrap every metric, so label values past the limit are reported as PROMETHEUS_OVERFLOW_LABEL_VALUE
+        """
+        from prometheus_client.metrics import MetricWrapperBase
+
+        from litellm.integrations.prometheus_helpers.label_limits import (
+            LabelLimitedMetric,
+            PrometheusLabelLimiter,
+        )
+
+        label_limiter = PrometheusLabelLimiter(label_limits=label_limits)
+        for attr, value in list(vars(self).items()):
+            if isinstance(value, MetricWrapperBase) and len(value._labelnames) > 0:
+                setattr(
+                    self,
+                    attr,
+                    LabelLimitedMetric(metric=value, label_limiter=label_limiter),
+                )
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         # Define prometheus client
         from litellm.types.utils import StandardLoggingPayload
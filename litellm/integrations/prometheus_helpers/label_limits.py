@@ -0,0 +1,80 @@
+"""
+Caps the number of distinct values per prometheus label
+
+Labels like `end_user`, `hashed_api_key` and `api_key_alias` are unbounded - every new value creates a new series (and a new set of buckets for histograms) that's kept in memory until the process restarts.
+
+Set the max distinct values per label with `litellm.prometheus_label_cardinality_limits`:
+```yaml
+litellm_settings:
+  callbacks: ["prometheus"]
+  prometheus_label_cardinality_limits:
+    end_user: 1000
+    hashed_api_key: 5000
+```
+Values seen after a label hits its limit are reported as `PROMETHEUS_OVERFLOW_LABEL_VALUE`.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from litellm.types.integrations.prometheus import PROMETHEUS_OVERFLOW_LABEL_VALUE
+
+
+class PrometheusLabelLimiter:
+    def __init__(self, label_limits: Dict[str, int]):
+        self.label_limits = label_limits
+        # label name -> values with their own series
+        self.label_values: Dict[str, Set[Optional[str]]] = {
+            label: set() for label in label_limits
+        }
+
+    def get_label_value(self, label: str, value: Optional[str]) -> Optional[str]:
+        limit = self.label_limits.get(label)
+        if limit is None:
+            return value
+        label_values = self.label_values[label]
+        if value in label_values:
+            return value
+        if len(label_values) < limit:
+            label_values.add(value)
+            return value
+        return PROMETHEUS_OVERFLOW_LABEL_VALUE
+
+
+class LabelLimitedMetric:
+    """
+    Wraps a prometheus_client metric - `labels()` applies the label limits.
+
+    The child metric for a set of label values is cached, so the limits are only checked the first time a set of label values is seen.
+    """
+
+    def __init__(self, metric: Any, label_limiter: PrometheusLabelLimiter):
+        self.metric = metric
+        self.label_limiter = label_limiter
+        self.labelnames: Tuple[str, ...] = tuple(metric._labelnames)
+        self.limited_label_indexes: List[int] = [
+            idx
+            for idx, label in enumerate(self.labelnames)
+            if label in label_limiter.label_limits
+        ]
+        self.children: Dict[Tuple[Any, ...], Any] = {}
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> Any:
+        if labelkwargs:
+            labelvalues = tuple(labelkwargs[label] for label in self.labelnames)
+        child = self.children.get(labelvalues)
+        if child is not None:
+            return child
+
+        limited_labelvalues = list(labelvalues)
+        for idx in self.limited_label_indexes:
+            limited_labelvalues[idx] = self.label_limiter.get_label_value(
+                label=self.labelnames[idx], value=labelvalues[idx]
+            )
+        child = self.metric.labels(*limited_labelvalues)
+        if PROMETHEUS_OVERFLOW_LABEL_VALUE not in limited_labelvalues:
+            # don't cache overflowed values - that would grow without bound again
+            self.children[labelvalues] = child
+        return child
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.metric, name)
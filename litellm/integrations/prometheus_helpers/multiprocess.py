@@ -0,0 +1,36 @@
+"""
+/metrics for a proxy running with multiple workers
+
+prometheus_client keeps metrics in memory per process, so with `--num_workers > 1` each scrape only sees the worker that handled it.
+
+Set `PROMETHEUS_MULTIPROC_DIR` (an empty directory, cleared before the proxy starts) to have every worker write its metrics to mmap'd files in that directory - `/metrics` then aggregates all workers.
+"""
+
+import os
+from typing import Any
+
+
+def is_prometheus_multiprocess_mode() -> bool:
+    return os.getenv("PROMETHEUS_MULTIPROC_DIR") is not None
+
+
+def get_metrics_asgi_app() -> Any:
+    """
+    ASGI app for `/metrics` - aggregates all workers, if `PROMETHEUS_MULTIPROC_DIR` is set
+    """
+    from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
+
+    if is_prometheus_multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
+
+
+def prometheus_child_exit(server: Any, worker: Any) -> None:
+    """
+    gunicorn `child_exit` hook - removes the live gauge values of a worker that exited
+    """
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -162,62 +162,44 @@ class PrometheusServicesLogger:
                         amount=1,  # LOG TOTAL REQUESTS TO PROMETHEUS
                     )
 
-    def service_failure_hook(self, payload: ServiceLoggerPayload):
+    def service_failure_hook(
+        self,
+        payload: ServiceLoggerPayload,
+        error: Union[str, Exception] = "",
+    ):
         if self.mock_testing:
             self.mock_testing_failure_calls += 1
+        error_class = error.__class__.__name__
+        function_name = payload.call_type
 
         if payload.service.value in self.payload_to_prometheus_map:
             prom_objects = self.payload_to_prometheus_map[payload.service.value]
             for obj in prom_objects:
-                if isinstance(obj, self.Counter):
+                # increment both failed and total requests
+                if isinstance(obj, self.Counter) and "failed_requests" in obj._name:
                     self.increment_counter(
                         counter=obj,
                         labels=payload.service.value,
-                        amount=1,  # LOG ERROR COUNT / TOTAL REQUESTS TO PROMETHEUS
-                    )
-
-    async def async_service_success_hook(self, payload: ServiceLoggerPayload):
-        """
-        Log successful call to prometheus
-        """
-        if self.mock_testing:
-            self.mock_testing_success_calls += 1
-
-        if payload.service.value in self.payload_to_prometheus_map:
-            prom_objects = self.payload_to_prometheus_map[payload.service.value]
-            for obj in prom_objects:
-                if isinstance(obj, self.Histogram):
-                    self.observe_histogram(
-                        histogram=obj,
-                        labels=payload.service.value,
-                        amount=payload.duration,
+                        # log additional_labels=["error_class", "function_name"], used for debugging what's going wrong with the DB
+                        additional_labels=[error_class, function_name],
+                        amount=1,  # LOG ERROR COUNT TO PROMETHEUS
                     )
-                elif isinstance(obj, self.Counter) and "total_requests" in obj._name:
+                elif isinstance(obj, self.Counter):
                     self.increment_counter(
                         counter=obj,
                         labels=payload.service.value,
                         amount=1,  # LOG TOTAL REQUESTS TO PROMETHEUS
                     )
 
+    async def async_service_success_hook(self, payload: ServiceLoggerPayload):
+        """
+        Log successful call to prometheus
+        """
+        self.service_success_hook(payload=payload)
+
     async def async_service_failure_hook(
         self,
         payload: ServiceLoggerPayload,
         error: Union[str, Exception],
     ):
-        if self.mock_testing:
-            self.mock_testing_failure_calls += 1
-        error_class = error.__class__.__name__
-        function_name = payload.call_type
-
-        if payload.service.value in self.payload_to_prometheus_map:
-            prom_objects = self.payload_to_prometheus_map[payload.service.value]
-            for obj in prom_objects:
-                # increment both failed and total requests
-                if isinstance(obj, self.Counter):
-                    self.increment_counter(
-                        counter=obj,
-                        labels=payload.service.value,
-                        # log additional_labels=["error_class", "function_name"], used for debugging what's going wrong with the DB
-                        additional_labels=[error_class, function_name],
-                        amount=1,  # LOG ERROR COUNT TO PROMETHEUS
-                    )
+        self.service_failure_hook(payload=payload, error=error)
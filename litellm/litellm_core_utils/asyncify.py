@@ -1,5 +1,7 @@
+import asyncio
 import functools
-from typing import Awaitable, Callable, Optional
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Optional
 
 import anyio
 import anyio.to_thread
@@ -67,3 +69,46 @@ def asyncify(
         )
 
     return wrapper
+
+
+_background_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_event_loop_lock = threading.Lock()
+
+
+def _get_background_event_loop() -> asyncio.AbstractEventLoop:
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is None or _background_event_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="litellm-sync-to-async-bridge",
+                daemon=True,
+            ).start()
+            _background_event_loop = loop
+        return _background_event_loop
+
+
+def run_async_function(
+    async_function: Callable[..., Coroutine[Any, Any, T_Retval]],
+    *args: Any,
+    **kwargs: Any,
+) -> T_Retval:
+    """
+    Run an async function from sync code, and wait for its result.
+
+    Uses one long-lived event loop running in a daemon thread, instead of creating a new thread + event loop per call.
+    Works whether or not the calling thread already has a running event loop.
+    """
+    loop = _get_background_event_loop()
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        raise RuntimeError(
+            "run_async_function() can't be called from a coroutine running on the background event loop - await the function instead."
+        )
+    return asyncio.run_coroutine_threadsafe(
+        async_function(*args, **kwargs), loop
+    ).result()
@@ -1,5 +1,6 @@
 # What is this?
 ## Helper utilities
+import copy
 import os
 from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple, Union
 
@@ -69,6 +70,25 @@ def remove_index_from_tool_calls(messages, tool_calls):
     return
 
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def snapshot_messages(messages: Any) -> Any:
+    """
+    Copy of the request messages, for logging.
+
+    Only the dicts / lists are copied - strings (e.g. base64 images / audio) are immutable, so they're shared with the request instead of being walked + copied by `copy.deepcopy`.
+    Any other objects (e.g. pydantic messages) are deep copied.
+    """
+    if isinstance(messages, dict):
+        return {k: snapshot_messages(v) for k, v in messages.items()}
+    if isinstance(messages, list):
+        return [snapshot_messages(v) for v in messages]
+    if isinstance(messages, _IMMUTABLE_TYPES):
+        return messages
+    return copy.deepcopy(messages)
+
+
 def get_litellm_metadata_from_kwargs(kwargs: dict):
     """
     Helper to get litellm metadata from all litellm request kwargs
@@ -452,7 +452,7 @@ def exception_type(  # type: ignore  # noqa: PLR0915
                     )
                 if hasattr(original_exception, "status_code"):
                     verbose_logger.debug(
-                        f"status_code: {original_exception.status_code}"
+                        "status_code: %s", original_exception.status_code
                     )
                     if original_exception.status_code == 401:
                         exception_mapping_worked = True
@@ -1736,7 +1736,7 @@ def exception_type(  # type: ignore  # noqa: PLR0915
                     )
                 elif hasattr(original_exception, "status_code"):
                     verbose_logger.debug(
-                        f"status code: {original_exception.status_code}"
+                        "status code: %s", original_exception.status_code
                     )
                     if original_exception.status_code == 401:
                         exception_mapping_worked = True
@@ -2149,7 +2149,9 @@ def exception_logging(
         model_call_details["additional_args"] = additional_args
         # User Logging -> if you pass in a custom logging function or want to use sentry breadcrumbs
         verbose_logger.debug(
-            f"Logging Details: logger_fn - {logger_fn} | callable(logger_fn) - {callable(logger_fn)}"
+            "Logging Details: logger_fn - %s | callable(logger_fn) - %s",
+            logger_fn,
+            callable(logger_fn),
         )
         if logger_fn and callable(logger_fn):
             try:
@@ -2158,11 +2160,13 @@ def exception_logging(
                 )  # Expectation: any logger function passed in by the user should accept a dict object
             except Exception:
                 verbose_logger.debug(
-                    f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while logging {traceback.format_exc()}"
+                    "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while logging %s",
+                    traceback.format_exc(),
                 )
     except Exception:
         verbose_logger.debug(
-            f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while logging {traceback.format_exc()}"
+            "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while logging %s",
+            traceback.format_exc(),
         )
         pass
 
@@ -0,0 +1,28 @@
+"""
+Fast json (de)serialization to / from bytes - uses orjson when it's installed, else the stdlib json module
+
+orjson is looked up once, at import time - not on every call. Used on per-line / per-entry hot paths (batch .jsonl files, cache entries).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def fast_json_dumps(value: Any) -> bytes:
+    """
+    Compact json bytes for `value`
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def fast_json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
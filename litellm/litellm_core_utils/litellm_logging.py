@@ -4,6 +4,7 @@
 import copy
 import datetime
 import json
+import logging
 import os
 import re
 import subprocess
@@ -28,6 +29,7 @@ from litellm.caching.caching_handler import LLMCachingHandler
 from litellm.cost_calculator import _select_model_name_for_cost_calc
 from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.core_helpers import snapshot_messages
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
     redact_message_input_output_from_logging,
@@ -89,6 +91,7 @@ from ..integrations.traceloop import TraceloopLogger
 from ..integrations.weights_biases import WeightsBiasesLogger
 from .exception_mapping_utils import _get_response_headers
 from .logging_utils import _assemble_complete_response_from_streaming_chunks
+from .streaming_chunk_builder_utils import StreamingResponseAccumulator
 
 try:
     from ..proxy.enterprise.enterprise_callbacks.generic_api_callback import (
@@ -96,7 +99,8 @@ try:
     )
 except Exception as e:
     verbose_logger.debug(
-        f"[Non-Blocking] Unable to import GenericAPILogger - LiteLLM Enterprise Feature - {str(e)}"
+        "[Non-Blocking] Unable to import GenericAPILogger - LiteLLM Enterprise Feature - %s",
+        str(e),
     )
 
 _in_memory_loggers: List[Any] = []
@@ -133,6 +137,30 @@ local_cache: Optional[Dict[str, str]] = {}
 last_fetched_at = None
 last_fetched_at_keys = None
 
+MAX_COST_FAILURE_TRACEBACKS = 1000
+_cost_failure_tracebacks: Dict[tuple, str] = {}
+
+
+def _format_cost_failure_traceback(e: Exception) -> str:
+    """
+    `traceback.format_exc()` of a cost calculation failure - memoized by the exception + the lines it was raised from
+
+    e.g. every request to a model without pricing fails the same way, and on python 3.11+ formatting the traceback (the column positions in the large cost calculation functions) costs ~1ms
+    """
+    raised_from = []
+    tb = e.__traceback__
+    while tb is not None:
+        raised_from.append((tb.tb_frame.f_code, tb.tb_lineno))
+        tb = tb.tb_next
+    key = (type(e), str(e), tuple(raised_from))
+    traceback_str = _cost_failure_tracebacks.get(key)
+    if traceback_str is None:
+        traceback_str = traceback.format_exc()
+        if len(_cost_failure_tracebacks) >= MAX_COST_FAILURE_TRACEBACKS:
+            _cost_failure_tracebacks.clear()
+        _cost_failure_tracebacks[key] = traceback_str
+    return traceback_str
+
 
 ####
 class ServiceTraceIDCache:
@@ -233,17 +261,18 @@ class Logging:
                     new_messages.append({"role": "user", "content": m})
                 messages = new_messages
         self.model = model
-        self.messages = copy.deepcopy(messages)
+        self.messages = snapshot_messages(messages)
         self.stream = stream
         self.start_time = start_time  # log the call start time
         self.call_type = call_type
         self.litellm_call_id = litellm_call_id
         self.function_id = function_id
-        self.streaming_chunks: List[Any] = []  # for generating complete stream response
-        self.sync_streaming_chunks: List[Any] = (
-            []
-        )  # for generating complete stream response
+        # for generating complete stream response
+        self.streaming_chunks = StreamingResponseAccumulator()
+        self.sync_streaming_chunks = StreamingResponseAccumulator()
         self.model_call_details: Dict[Any, Any] = {}
+        # (result, cache_hit, response_cost) of the last cost calculation - the response headers + sync / async success handlers calculate the cost of the same result
+        self._last_response_cost: Optional[Tuple[Any, bool, Optional[float]]] = None
 
         # Initialize dynamic callbacks
         self.dynamic_input_callbacks: Optional[
@@ -379,7 +408,7 @@ class Logging:
         self.user = user
         self.litellm_params = scrub_sensitive_keys_in_metadata(litellm_params)
         self.logger_fn = litellm_params.get("logger_fn", None)
-        verbose_logger.debug(f"self.optional_params: {self.optional_params}")
+        verbose_logger.debug("self.optional_params: %s", self.optional_params)
 
         self.model_call_details = {
             "model": self.model,
@@ -412,6 +441,28 @@ class Logging:
         if "custom_llm_provider" in self.model_call_details:
             self.custom_llm_provider = self.model_call_details["custom_llm_provider"]
 
+    def _get_request_curl_command(
+        self, api_base: str, masked_headers: dict, data: Any, additional_args: dict
+    ) -> Any:
+        formatted_headers = " ".join(
+            [f"-H '{k}: {v}'" for k, v in masked_headers.items()]
+        )
+
+        curl_command: Any = "\n\nPOST Request Sent from LiteLLM:\n"
+        curl_command += "curl -X POST \\\n"
+        curl_command += f"{api_base} \\\n"
+        curl_command += (
+            f"{formatted_headers} \\\n" if formatted_headers.strip() != "" else ""
+        )
+        curl_command += f"-d '{str(data)}'\n"
+        if additional_args.get("request_str", None) is not None:
+            # print the sagemaker / bedrock client request
+            curl_command = "\nRequest Sent from LiteLLM:\n"
+            curl_command += additional_args.get("request_str", None)
+        elif api_base == "":
+            curl_command = self.model_call_details
+        return curl_command
+
     def _pre_call(self, input, api_key, model=None, additional_args={}):
         """
         Common helper function across the sync + async pre-call function
@@ -459,33 +510,32 @@ class Logging:
                 )
                 for k, v in headers.items()
             }
-            formatted_headers = " ".join(
-                [f"-H '{k}: {v}'" for k, v in masked_headers.items()]
-            )
 
-            verbose_logger.debug(f"PRE-API-CALL ADDITIONAL ARGS: {additional_args}")
+            verbose_logger.debug("PRE-API-CALL ADDITIONAL ARGS: %s", additional_args)
 
-            curl_command = "\n\nPOST Request Sent from LiteLLM:\n"
-            curl_command += "curl -X POST \\\n"
-            curl_command += f"{api_base} \\\n"
-            curl_command += (
-                f"{formatted_headers} \\\n" if formatted_headers.strip() != "" else ""
-            )
-            curl_command += f"-d '{str(data)}'\n"
-            if additional_args.get("request_str", None) is not None:
-                # print the sagemaker / bedrock client request
-                curl_command = "\nRequest Sent from LiteLLM:\n"
-                curl_command += additional_args.get("request_str", None)
-            elif api_base == "":
-                curl_command = self.model_call_details
+            # `str(data)` is O(request size) - only build the curl command if it's printed / logged
+            curl_command: Any = None
+            if log_raw_request_response is True or (
+                not json_logs
+                and (
+                    litellm.set_verbose is True
+                    or verbose_logger.isEnabledFor(logging.DEBUG)
+                )
+            ):
+                curl_command = self._get_request_curl_command(
+                    api_base=api_base,
+                    masked_headers=masked_headers,
+                    data=data,
+                    additional_args=additional_args,
+                )
 
             if json_logs:
                 verbose_logger.debug(
                     "POST Request Sent from LiteLLM",
                     extra={"api_base": {api_base}, **masked_headers},
                 )
-            else:
-                print_verbose(f"\033[92m{curl_command}\033[0m\n", log_level="DEBUG")
+            elif curl_command is not None:
+                print_verbose("\x1b[92m%s\x1b[0m\n", curl_command, log_level="DEBUG")
             # log raw request to provider (like LangFuse) -- if opted in.
             if log_raw_request_response is True:
                 _litellm_params = self.model_call_details.get("litellm_params", {})
@@ -530,7 +580,7 @@ class Logging:
                         verbose_logger.debug("reaches supabase for logging!")
                         model = self.model_call_details["model"]
                         messages = self.model_call_details["input"]
-                        verbose_logger.debug(f"supabaseClient: {supabaseClient}")
+                        verbose_logger.debug("supabaseClient: %s", supabaseClient)
                         supabaseClient.input_log_event(
                             model=model,
                             messages=messages,
@@ -577,7 +627,8 @@ class Logging:
                         )
                     )
                     verbose_logger.debug(
-                        f"LiteLLM.Logging: is sentry capture exception initialized {capture_exception}"
+                        "LiteLLM.Logging: is sentry capture exception initialized %s",
+                        capture_exception,
                     )
                     if capture_exception:  # log this error to sentry for debugging
                         capture_exception(e)
@@ -609,19 +660,17 @@ class Logging:
 
             if json_logs:
                 verbose_logger.debug(
-                    "RAW RESPONSE:\n{}\n\n".format(
-                        self.model_call_details.get(
-                            "original_response", self.model_call_details
-                        )
+                    "RAW RESPONSE:\n%s\n\n",
+                    self.model_call_details.get(
+                        "original_response", self.model_call_details
                     ),
                 )
             else:
                 print_verbose(
-                    "RAW RESPONSE:\n{}\n\n".format(
-                        self.model_call_details.get(
-                            "original_response", self.model_call_details
-                        )
-                    )
+                    "RAW RESPONSE:\n%s\n\n",
+                    self.model_call_details.get(
+                        "original_response", self.model_call_details
+                    ),
                 )
             if self.logger_fn and callable(self.logger_fn):
                 try:
@@ -678,7 +727,8 @@ class Logging:
                         )
                     )
                     verbose_logger.debug(
-                        f"LiteLLM.Logging: is sentry capture exception initialized {capture_exception}"
+                        "LiteLLM.Logging: is sentry capture exception initialized %s",
+                        capture_exception,
                     )
                     if capture_exception:  # log this error to sentry for debugging
                         capture_exception(e)
@@ -717,6 +767,13 @@ class Logging:
         if cache_hit is None:
             cache_hit = self.model_call_details.get("cache_hit", False)
 
+        if (
+            self._last_response_cost is not None
+            and self._last_response_cost[0] is result
+            and self._last_response_cost[1] == cache_hit
+        ):
+            return self._last_response_cost[2]
+
         try:
             response_cost_calculator_kwargs = {
                 "response_object": result,
@@ -745,13 +802,13 @@ class Logging:
             response_cost = litellm.response_cost_calculator(
                 **response_cost_calculator_kwargs
             )
-
+            self._last_response_cost = (result, cache_hit, response_cost)
             return response_cost
         except Exception as e:  # error calculating cost
             self.model_call_details["response_cost_failure_debug_information"] = (
                 StandardLoggingModelCostFailureDebugInformation(
                     error_str=str(e),
-                    traceback_str=traceback.format_exc(),
+                    traceback_str=_format_cost_failure_traceback(e),
                     model=response_cost_calculator_kwargs["model"],
                     cache_hit=response_cost_calculator_kwargs["cache_hit"],
                     custom_llm_provider=response_cost_calculator_kwargs[
@@ -762,6 +819,8 @@ class Logging:
                     custom_pricing=response_cost_calculator_kwargs["custom_pricing"],
                 )
             )
+            # e.g. unmapped models - don't fail (+ format the traceback) again for the same result
+            self._last_response_cost = (result, cache_hit, None)
 
         return None
 
@@ -868,7 +927,7 @@ class Logging:
     def success_handler(  # noqa: PLR0915
         self, result=None, start_time=None, end_time=None, cache_hit=None, **kwargs
     ):
-        print_verbose(f"Logging Details LiteLLM-Success Call: Cache_hit={cache_hit}")
+        print_verbose("Logging Details LiteLLM-Success Call: Cache_hit=%s", cache_hit)
         start_time, end_time, result = self._success_handler_helper_fn(
             start_time=start_time,
             end_time=end_time,
@@ -877,7 +936,7 @@ class Logging:
         )
         # print(f"original response in success handler: {self.model_call_details['original_response']}")
         try:
-            verbose_logger.debug(f"success callbacks: {litellm.success_callback}")
+            verbose_logger.debug("success callbacks: %s", litellm.success_callback)
 
             ## BUILD COMPLETE STREAMED RESPONSE
             complete_streaming_response: Optional[
@@ -896,9 +955,6 @@ class Logging:
                     streaming_chunks=self.sync_streaming_chunks,
                     is_async=False,
                 )
-            _caching_complete_streaming_response: Optional[
-                Union[ModelResponse, TextCompletionResponse]
-            ] = None
             if complete_streaming_response is not None:
                 verbose_logger.debug(
                     "Logging Details LiteLLM-Success Call streaming complete"
@@ -906,9 +962,6 @@ class Logging:
                 self.model_call_details["complete_streaming_response"] = (
                     complete_streaming_response
                 )
-                _caching_complete_streaming_response = copy.deepcopy(
-                    complete_streaming_response
-                )
                 self.model_call_details["response_cost"] = (
                     self._response_cost_calculator(result=complete_streaming_response)
                 )
@@ -1109,7 +1162,8 @@ class Logging:
                         # this only logs streaming once, complete_streaming_response exists i.e when stream ends
                         if self.stream:
                             verbose_logger.debug(
-                                f"is complete_streaming_response in kwargs: {kwargs.get('complete_streaming_response', None)}"
+                                "is complete_streaming_response in kwargs: %s",
+                                kwargs.get("complete_streaming_response", None),
                             )
                             if complete_streaming_response is None:
                                 continue
@@ -1151,7 +1205,8 @@ class Logging:
                         # this only logs streaming once, complete_streaming_response exists i.e when stream ends
                         if self.stream:
                             verbose_logger.debug(
-                                f"is complete_streaming_response in kwargs: {kwargs.get('complete_streaming_response', None)}"
+                                "is complete_streaming_response in kwargs: %s",
+                                kwargs.get("complete_streaming_response", None),
                             )
                             if complete_streaming_response is None:
                                 continue
@@ -1178,7 +1233,8 @@ class Logging:
                         # this only logs streaming once, complete_streaming_response exists i.e when stream ends
                         if self.stream:
                             verbose_logger.debug(
-                                f"is complete_streaming_response in kwargs: {kwargs.get('complete_streaming_response', None)}"
+                                "is complete_streaming_response in kwargs: %s",
+                                kwargs.get("complete_streaming_response", None),
                             )
                             if complete_streaming_response is None:
                                 continue
@@ -1369,10 +1425,12 @@ class Logging:
 
                 except Exception as e:
                     print_verbose(
-                        f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging with integrations {traceback.format_exc()}"
+                        "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging with integrations %s",
+                        traceback.format_exc(),
                     )
                     print_verbose(
-                        f"LiteLLM.Logging: is sentry capture exception initialized {capture_exception}"
+                        "LiteLLM.Logging: is sentry capture exception initialized %s",
+                        capture_exception,
                     )
                     if capture_exception:  # log this error to sentry for debugging
                         capture_exception(e)
@@ -1390,7 +1448,7 @@ class Logging:
         Implementing async callbacks, to handle asyncio event loop issues when custom integrations need to use async functions.
         """
         print_verbose(
-            "Logging Details LiteLLM-Async Success Call, cache_hit={}".format(cache_hit)
+            "Logging Details LiteLLM-Async Success Call, cache_hit=%s", cache_hit
         )
         start_time, end_time, result = self._success_handler_helper_fn(
             start_time=start_time, end_time=end_time, result=result, cache_hit=cache_hit
@@ -1435,7 +1493,9 @@ class Logging:
                     )
 
                 verbose_logger.debug(
-                    f"Model={self.model}; cost={self.model_call_details['response_cost']}"
+                    "Model=%s; cost=%s",
+                    self.model,
+                    self.model_call_details["response_cost"],
                 )
             except litellm.NotFoundError:
                 verbose_logger.warning(
@@ -1726,7 +1786,7 @@ class Logging:
         self, exception, traceback_exception, start_time=None, end_time=None
     ):
         verbose_logger.debug(
-            f"Logging Details LiteLLM-Failure Call: {litellm.failure_callback}"
+            "Logging Details LiteLLM-Failure Call: %s", litellm.failure_callback
         )
         try:
             start_time, end_time = self._failure_handler_helper_fn(
@@ -1795,11 +1855,12 @@ class Logging:
                             capture_exception(exception)
                         else:
                             print_verbose(
-                                f"capture exception not initialized: {capture_exception}"
+                                "capture exception not initialized: %s",
+                                capture_exception,
                             )
                     elif callback == "supabase" and supabaseClient is not None:
                         print_verbose("reaches supabase for logging!")
-                        print_verbose(f"supabaseClient: {supabaseClient}")
+                        print_verbose("supabaseClient: %s", supabaseClient)
                         supabaseClient.log_event(
                             model=self.model if hasattr(self, "model") else "",
                             messages=self.messages,
@@ -1904,10 +1965,12 @@ class Logging:
 
                 except Exception as e:
                     print_verbose(
-                        f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while failure logging with integrations {str(e)}"
+                        "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while failure logging with integrations %s",
+                        str(e),
                     )
                     print_verbose(
-                        f"LiteLLM.Logging: is sentry capture exception initialized {capture_exception}"
+                        "LiteLLM.Logging: is sentry capture exception initialized %s",
+                        capture_exception,
                     )
                     if capture_exception:  # log this error to sentry for debugging
                         capture_exception(e)
@@ -2096,7 +2159,7 @@ def set_callbacks(callback_list, function_id=None):  # noqa: PLR0915
                     signing_secret=os.environ.get("SLACK_API_SECRET"),
                 )
                 alerts_channel = os.environ["SLACK_API_CHANNEL"]
-                print_verbose(f"Initialized Slack App: {slack_app}")
+                print_verbose("Initialized Slack App: %s", slack_app)
             elif callback == "traceloop":
                 traceloopLogger = TraceloopLogger()
             elif callback == "athina":
@@ -2608,10 +2671,9 @@ class StandardLoggingPayloadSetup:
                     model_map_value=_model_cost_information,
                 )
             except Exception:
-                verbose_logger.debug(  # keep in debug otherwise it will trigger on every call
-                    "Model={} is not mapped in model cost map. Defaulting to None model_cost_information for standard_logging_payload".format(
-                        model_cost_name
-                    )
+                verbose_logger.debug(
+                    "Model=%s is not mapped in model cost map. Defaulting to None model_cost_information for standard_logging_payload",
+                    model_cost_name,
                 )
                 model_cost_information = StandardLoggingModelInformation(
                     model_map_key=model_cost_name, model_map_value=None
@@ -2664,7 +2726,9 @@ class StandardLoggingPayloadSetup:
                     additional_logging_headers[key] = int(additiona_headers[_key])  # type: ignore
                 except (ValueError, TypeError):
                     verbose_logger.debug(
-                        f"Could not convert {additiona_headers[_key]} to int for key {key}."
+                        "Could not convert %s to int for key %s.",
+                        additiona_headers[_key],
+                        key,
                     )
         return additional_logging_headers
 
@@ -5,6 +5,7 @@ from typing import List, Literal, Optional, Tuple, Union
 
 import litellm
 from litellm import verbose_logger
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import get_pricing_record
 
 """
 Gemini pricing covers: 
@@ -125,9 +126,8 @@ def cost_per_character(
                 prompt_cost = prompt_characters * model_info["input_cost_per_character"]
         except Exception as e:
             verbose_logger.debug(
-                "litellm.litellm_core_utils.llm_cost_calc.google.py::cost_per_character(): Exception occured - {}\nDefaulting to None".format(
-                    str(e)
-                )
+                "litellm.litellm_core_utils.llm_cost_calc.google.py::cost_per_character(): Exception occured - %s\nDefaulting to None",
+                str(e),
             )
             prompt_cost, _ = cost_per_token(
                 model=model,
@@ -173,9 +173,8 @@ def cost_per_character(
                 )
         except Exception as e:
             verbose_logger.debug(
-                "litellm.litellm_core_utils.llm_cost_calc.google.py::cost_per_character(): Exception occured - {}\nDefaulting to None".format(
-                    str(e)
-                )
+                "litellm.litellm_core_utils.llm_cost_calc.google.py::cost_per_character(): Exception occured - %s\nDefaulting to None",
+                str(e),
             )
             _, completion_cost = cost_per_token(
                 model=model,
@@ -208,10 +207,8 @@ def cost_per_token(
     Raises:
         Exception if model requires >128k pricing, but model cost not mapped
     """
-    ## GET MODEL INFO
-    model_info = litellm.get_model_info(
-        model=model, custom_llm_provider=custom_llm_provider
-    )
+    ## GET PRICING
+    pricing = get_pricing_record(model=model, custom_llm_provider=custom_llm_provider)
 
     ## CALCULATE INPUT COST
     if (
@@ -219,16 +216,13 @@ def cost_per_token(
         and model not in models_without_dynamic_pricing
     ):
         assert (
-            "input_cost_per_token_above_128k_tokens" in model_info
-            and model_info["input_cost_per_token_above_128k_tokens"] is not None
-        ), "model info for model={} does not have pricing for > 128k tokens\nmodel_info={}".format(
-            model, model_info
-        )
-        prompt_cost = (
-            prompt_tokens * model_info["input_cost_per_token_above_128k_tokens"]
+            pricing.input_cost_per_token_above_128k_tokens is not None
+        ), "model info for model={} does not have pricing for > 128k tokens\npricing={}".format(
+            model, pricing
         )
+        prompt_cost = prompt_tokens * pricing.input_cost_per_token_above_128k_tokens
     else:
-        prompt_cost = prompt_tokens * model_info["input_cost_per_token"]
+        prompt_cost = prompt_tokens * pricing.input_cost_per_token
 
     ## CALCULATE OUTPUT COST
     if (
@@ -236,15 +230,14 @@ def cost_per_token(
         and model not in models_without_dynamic_pricing
     ):
         assert (
-            "output_cost_per_token_above_128k_tokens" in model_info
-            and model_info["output_cost_per_token_above_128k_tokens"] is not None
-        ), "model info for model={} does not have pricing for > 128k tokens\nmodel_info={}".format(
-            model, model_info
+            pricing.output_cost_per_token_above_128k_tokens is not None
+        ), "model info for model={} does not have pricing for > 128k tokens\npricing={}".format(
+            model, pricing
         )
         completion_cost = (
-            completion_tokens * model_info["output_cost_per_token_above_128k_tokens"]
+            completion_tokens * pricing.output_cost_per_token_above_128k_tokens
         )
     else:
-        completion_cost = completion_tokens * model_info["output_cost_per_token"]
+        completion_cost = completion_tokens * pricing.output_cost_per_token
 
     return prompt_cost, completion_cost
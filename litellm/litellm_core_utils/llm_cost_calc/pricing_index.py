@@ -0,0 +1,82 @@
+# What is this?
+## Memoized per-model pricing records, for the cost calculation hot path
+
+"""
+`get_model_info` checks several candidate keys in `litellm.model_cost` (`provider/model`, stripped vertex versions, fine-tune names, ...) and the supported openai params, on every call.
+
+The pricing record of a (model, custom_llm_provider) is resolved once, then cost calculation is arithmetic on the record.
+
+The index is cleared when `litellm.model_cost` is replaced, or models are registered with `litellm.register_model`.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import litellm
+
+MAX_PRICING_RECORDS = 10000
+
+
+class PricingRecord(NamedTuple):
+    key: str  # the key in litellm.model_cost
+    input_cost_per_token: float
+    output_cost_per_token: float
+    cache_read_input_token_cost: Optional[float]
+    cache_creation_input_token_cost: Optional[float]
+    input_cost_per_token_above_128k_tokens: Optional[float]
+    output_cost_per_token_above_128k_tokens: Optional[float]
+    input_cost_per_audio_token: Optional[float]
+    output_cost_per_audio_token: Optional[float]
+    output_cost_per_second: Optional[float]
+
+
+_pricing_records: Dict[Tuple[str, Optional[str]], PricingRecord] = {}
+# the `litellm.model_cost` the records were resolved from - a reference, so a replaced map is never mistaken for it
+_indexed_model_cost: Optional[dict] = None
+
+
+def clear_pricing_index() -> None:
+    _pricing_records.clear()
+
+
+def get_pricing_record(
+    model: str, custom_llm_provider: Optional[str] = None
+) -> PricingRecord:
+    """
+    Raises:
+        Exception if the model is not mapped - see `get_model_info`. Unmapped models are not memoized.
+    """
+    global _indexed_model_cost
+
+    if _indexed_model_cost is not litellm.model_cost:
+        _pricing_records.clear()
+        _indexed_model_cost = litellm.model_cost
+
+    pricing_record = _pricing_records.get((model, custom_llm_provider))
+    if pricing_record is not None:
+        return pricing_record
+
+    model_info = litellm.get_model_info(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    pricing_record = PricingRecord(
+        key=model_info.get("key") or model,
+        input_cost_per_token=model_info["input_cost_per_token"],
+        output_cost_per_token=model_info["output_cost_per_token"],
+        cache_read_input_token_cost=model_info.get("cache_read_input_token_cost"),
+        cache_creation_input_token_cost=model_info.get(
+            "cache_creation_input_token_cost"
+        ),
+        input_cost_per_token_above_128k_tokens=model_info.get(
+            "input_cost_per_token_above_128k_tokens"
+        ),
+        output_cost_per_token_above_128k_tokens=model_info.get(
+            "output_cost_per_token_above_128k_tokens"
+        ),
+        input_cost_per_audio_token=model_info.get("input_cost_per_audio_token"),
+        output_cost_per_audio_token=model_info.get("output_cost_per_audio_token"),
+        output_cost_per_second=model_info.get("output_cost_per_second"),
+    )
+    if len(_pricing_records) >= MAX_PRICING_RECORDS:
+        _pricing_records.clear()
+    _pricing_records[(model, custom_llm_provider)] = pricing_record
+    return pricing_record
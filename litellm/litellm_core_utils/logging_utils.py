@@ -6,10 +6,14 @@ from litellm.types.utils import ModelResponse, TextCompletionResponse
 
 if TYPE_CHECKING:
     from litellm import ModelResponse as _ModelResponse
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingResponseAccumulator,
+    )
 
     LiteLLMModelResponse = _ModelResponse
 else:
     LiteLLMModelResponse = Any
+    StreamingResponseAccumulator = Any
 
 
 import litellm
@@ -42,14 +46,14 @@ def _assemble_complete_response_from_streaming_chunks(
     start_time: datetime,
     end_time: datetime,
     request_kwargs: dict,
-    streaming_chunks: List[Any],
+    streaming_chunks: Union[List[Any], StreamingResponseAccumulator],
     is_async: bool,
 ):
     """
     Assemble a complete response from a streaming chunks
 
+    - add the chunk to the streaming_chunks (a list, or a `StreamingResponseAccumulator`)
     - assemble a complete streaming response if result.choices[0].finish_reason is not None
-    - else append the chunk to the streaming_chunks
 
 
     Args:
@@ -57,7 +61,7 @@ def _assemble_complete_response_from_streaming_chunks(
         start_time: datetime
         end_time: datetime
         request_kwargs: dict
-        streaming_chunks: List[Any]
+        streaming_chunks: Union[List[Any], StreamingResponseAccumulator]
         is_async: bool
 
     Returns:
@@ -67,8 +71,11 @@ def _assemble_complete_response_from_streaming_chunks(
     complete_streaming_response: Optional[
         Union[ModelResponse, TextCompletionResponse]
     ] = None
-    if result.choices[0].finish_reason is not None:  # if it's the last chunk
+    if isinstance(streaming_chunks, list):
         streaming_chunks.append(result)
+    else:
+        streaming_chunks.add_chunk(result)
+    if result.choices[0].finish_reason is not None:  # if it's the last chunk
         try:
             complete_streaming_response = litellm.stream_chunk_builder(
                 chunks=streaming_chunks,
@@ -84,6 +91,4 @@ def _assemble_complete_response_from_streaming_chunks(
             )
             verbose_logger.exception(log_message)
             complete_streaming_response = None
-    else:
-        streaming_chunks.append(result)
     return complete_streaming_response
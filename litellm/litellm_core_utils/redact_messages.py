@@ -7,7 +7,6 @@
 #
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
-import copy
 from typing import TYPE_CHECKING, Any, Optional
 
 import litellm
@@ -34,6 +33,31 @@ def redact_message_input_output_from_custom_logger(
     return result
 
 
+def _redact_choices(response):
+    """
+    Returns a copy of the response with the choice content redacted.
+
+    Only the response, choices and messages are copied - the rest (usage, hidden params, etc.) is shared with the original response, which is left as-is.
+    """
+    _response = response.model_copy()
+    if getattr(response, "choices", None) is None:
+        return _response
+
+    _choices = []
+    for choice in response.choices:
+        if isinstance(choice, litellm.Choices):
+            choice = choice.model_copy()
+            choice.message = choice.message.model_copy()
+            choice.message.content = "redacted-by-litellm"
+        elif isinstance(choice, litellm.utils.StreamingChoices):
+            choice = choice.model_copy()
+            choice.delta = choice.delta.model_copy()
+            choice.delta.content = "redacted-by-litellm"
+        _choices.append(choice)
+    _response.choices = _choices
+    return _response
+
+
 def perform_redaction(model_call_details: dict, result):
     """
     Performs the actual redaction on the logging object and result.
@@ -50,23 +74,13 @@ def perform_redaction(model_call_details: dict, result):
         model_call_details.get("stream", False) is True
         and "complete_streaming_response" in model_call_details
     ):
-        _streaming_response = model_call_details["complete_streaming_response"]
-        for choice in _streaming_response.choices:
-            if isinstance(choice, litellm.Choices):
-                choice.message.content = "redacted-by-litellm"
-            elif isinstance(choice, litellm.utils.StreamingChoices):
-                choice.delta.content = "redacted-by-litellm"
+        model_call_details["complete_streaming_response"] = _redact_choices(
+            model_call_details["complete_streaming_response"]
+        )
 
     # Redact result
     if result is not None and isinstance(result, litellm.ModelResponse):
-        _result = copy.deepcopy(result)
-        if hasattr(_result, "choices") and _result.choices is not None:
-            for choice in _result.choices:
-                if isinstance(choice, litellm.Choices):
-                    choice.message.content = "redacted-by-litellm"
-                elif isinstance(choice, litellm.utils.StreamingChoices):
-                    choice.delta.content = "redacted-by-litellm"
-        return _result
+        return _redact_choices(result)
     else:
         return "redacted-by-litellm"
 
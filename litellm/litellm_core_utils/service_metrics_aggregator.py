@@ -0,0 +1,77 @@
+"""
+In-process latency / error aggregation for litellm-adjacent services (redis / postgres / router)
+
+`ServiceLogging` records every service call here, instead of creating a task per call. The stats are flushed as one `ServiceMetricsSummary` per (service, call_type), every `litellm.service_metrics_flush_interval` seconds.
+
+No locks - `flush()` swaps out the whole stats dict instead of clearing it. Sync calls recorded from other threads can race with the event loop, but that only skews a monitoring count - it's not worth a lock on every redis / db call.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from litellm.types.integrations.prometheus import LATENCY_BUCKETS
+from litellm.types.services import ServiceMetricsSummary
+
+
+class _ServiceCallStats:
+    __slots__ = ("count", "error_count", "total_duration", "max_duration", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+
+class ServiceMetricsAggregator:
+    def __init__(self) -> None:
+        self.stats: Dict[Tuple[str, str], _ServiceCallStats] = {}
+
+    def record(
+        self, service: str, call_type: str, duration: float, is_error: bool = False
+    ) -> None:
+        key = (service, call_type)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = _ServiceCallStats()
+        stats.count += 1
+        if is_error:
+            stats.error_count += 1
+        stats.total_duration += duration
+        if duration > stats.max_duration:
+            stats.max_duration = duration
+        stats.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def flush(self) -> List[ServiceMetricsSummary]:
+        """
+        Returns the summaries since the last flush, and resets the stats
+        """
+        stats, self.stats = self.stats, {}
+        return [
+            ServiceMetricsSummary(
+                service=service,
+                call_type=call_type,
+                count=call_stats.count,
+                error_count=call_stats.error_count,
+                avg_duration=call_stats.total_duration / call_stats.count,
+                max_duration=call_stats.max_duration,
+                p50_duration=self._get_percentile(call_stats, 0.5),
+                p95_duration=self._get_percentile(call_stats, 0.95),
+                p99_duration=self._get_percentile(call_stats, 0.99),
+            )
+            for (service, call_type), call_stats in stats.items()
+        ]
+
+    @staticmethod
+    def _get_percentile(call_stats: _ServiceCallStats, percentile: float) -> float:
+        """
+        Upper bound of the bucket the percentile falls in - capped at the max seen duration
+        """
+        target = percentile * call_stats.count
+        cumulative = 0
+        for upper_bound, bucket_count in zip(LATENCY_BUCKETS, call_stats.buckets):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(upper_bound, call_stats.max_duration)
+        return call_stats.max_duration
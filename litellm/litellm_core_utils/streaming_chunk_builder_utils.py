@@ -1,343 +1,466 @@
 import base64
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-
-from litellm.exceptions import APIError
-from litellm.types.llms.openai import (
-    ChatCompletionAssistantContentValue,
-    ChatCompletionAudioDelta,
-    ChatCompletionToolCallChunk,
-    ChatCompletionToolCallFunctionChunk,
-)
+from typing import Any, List, Optional, Union, cast
+
+import litellm
+from litellm._logging import print_verbose, verbose_logger
+from litellm.llms.prompt_templates.common_utils import get_content_from_model_response
+from litellm.types.llms.openai import ChatCompletionAudioDelta
 from litellm.types.utils import (
     ChatCompletionAudioResponse,
     ChatCompletionMessageToolCall,
+    Choices,
     CompletionTokensDetails,
     Function,
     FunctionCall,
     ModelResponse,
     PromptTokensDetails,
+    TextChoices,
+    TextCompletionResponse,
     Usage,
 )
-from litellm.utils import print_verbose, token_counter
 
+DEFAULT_REORDER_WINDOW = 16
+
+
+def _get_created_at(chunk: Any) -> float:
+    hidden_params = getattr(chunk, "_hidden_params", None) or {}
+    created_at = hidden_params.get("created_at")
+    return created_at if created_at is not None else float("inf")
+
+
+def _usage_chunk_calculation_helper(usage_chunk: Usage) -> dict:
+    prompt_tokens = 0
+    completion_tokens = 0
+    ## anthropic prompt caching information ##
+    cache_creation_input_tokens: Optional[int] = None
+    cache_read_input_tokens: Optional[int] = None
+    completion_tokens_details: Optional[CompletionTokensDetails] = None
+    prompt_tokens_details: Optional[PromptTokensDetails] = None
+
+    if "prompt_tokens" in usage_chunk:
+        prompt_tokens = usage_chunk.get("prompt_tokens", 0) or 0
+    if "completion_tokens" in usage_chunk:
+        completion_tokens = usage_chunk.get("completion_tokens", 0) or 0
+    if "cache_creation_input_tokens" in usage_chunk:
+        cache_creation_input_tokens = usage_chunk.get("cache_creation_input_tokens")
+    if "cache_read_input_tokens" in usage_chunk:
+        cache_read_input_tokens = usage_chunk.get("cache_read_input_tokens")
+    if hasattr(usage_chunk, "completion_tokens_details"):
+        if isinstance(usage_chunk.completion_tokens_details, dict):
+            completion_tokens_details = CompletionTokensDetails(
+                **usage_chunk.completion_tokens_details
+            )
+        elif isinstance(usage_chunk.completion_tokens_details, CompletionTokensDetails):
+            completion_tokens_details = usage_chunk.completion_tokens_details
+    if hasattr(usage_chunk, "prompt_tokens_details"):
+        if isinstance(usage_chunk.prompt_tokens_details, dict):
+            prompt_tokens_details = PromptTokensDetails(
+                **usage_chunk.prompt_tokens_details
+            )
+        elif isinstance(usage_chunk.prompt_tokens_details, PromptTokensDetails):
+            prompt_tokens_details = usage_chunk.prompt_tokens_details
+
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cache_creation_input_tokens": cache_creation_input_tokens,
+        "cache_read_input_tokens": cache_read_input_tokens,
+        "completion_tokens_details": completion_tokens_details,
+        "prompt_tokens_details": prompt_tokens_details,
+    }
 
-class ChunkProcessor:
-    def __init__(self, chunks: List, messages: Optional[list] = None):
-        self.chunks = self._sort_chunks(chunks)
-        self.messages = messages
-        self.first_chunk = chunks[0]
 
-    def _sort_chunks(self, chunks: list) -> list:
-        if not chunks:
-            return []
-        if chunks[0]._hidden_params.get("created_at"):
-            return sorted(
-                chunks, key=lambda x: x._hidden_params.get("created_at", float("inf"))
+class StreamingResponseAccumulator:
+    """
+    Builds the complete response of a stream, one chunk at a time
+
+    Each chunk is processed once, as it is added - running content / tool call / function call / audio buffers + usage. No chunk list is kept, so `build()` only joins the buffers.
+
+    - `reorder_window`: chunks are held back until `reorder_window` newer chunks arrived, and released sorted by `_hidden_params["created_at"]` - the logging threads can receive chunks out of order. A chunk older than an already released one overflows the window - it is logged, and processed right away, out of order
+    - thread-safe - the sync success handler runs on the logging thread pool
+    """
+
+    def __init__(self, reorder_window: int = DEFAULT_REORDER_WINDOW):
+        self.reorder_window = reorder_window
+        self.pending_chunks: List[Any] = []
+        self.last_released_created_at = float("-inf")
+        self.reorder_window_overflowed = False
+        self.lock = threading.Lock()
+        self.num_chunks = 0
+
+        self.first_chunk: Optional[Any] = None
+        self.is_text_completion = False
+        self.finish_reason: Optional[str] = "stop"
+        self.hidden_params: dict = {}
+        self.logprobs: Optional[Any] = None
+
+        self.content_list: List[str] = []
+        self.has_content = False
+
+        ## tool calls ##
+        self.has_tool_calls = False
+        self.tool_calls_list: List[ChatCompletionMessageToolCall] = []
+        self.tool_call_argument_list: List[str] = []
+        self.tool_call_id: Optional[str] = None
+        self.tool_call_name: Optional[str] = None
+        self.tool_call_type: Optional[str] = None
+        self.tool_call_prev_index: Optional[int] = None
+        self.tool_call_prev_name: Optional[str] = None
+        self.tool_call_prev_id: Optional[str] = None
+        self.tool_call_curr_id: Optional[str] = None
+        self.tool_call_curr_index = 0
+
+        ## function call ##
+        self.function_call_name: Optional[str] = None
+        self.function_call_argument_list: Optional[List[str]] = None
+
+        ## audio ##
+        self.has_audio = False
+        self.audio_data_list: List[str] = []
+        self.audio_transcript_list: List[str] = []
+        self.audio_expires_at: Optional[int] = None
+        self.audio_id: Optional[str] = None
+
+        ## usage ##
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_creation_input_tokens: Optional[int] = None
+        self.cache_read_input_tokens: Optional[int] = None
+        self.completion_tokens_details: Optional[CompletionTokensDetails] = None
+        self.prompt_tokens_details: Optional[PromptTokensDetails] = None
+        # usage of the last chunk with usage, as reported - see `get_total_usage`
+        self.last_usage_prompt_tokens: Optional[int] = None
+        self.last_usage_completion_tokens: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self.num_chunks
+
+    def add_chunk(self, chunk: Any) -> None:
+        with self.lock:
+            self.num_chunks += 1
+            if self.reorder_window <= 0:
+                self._process_chunk(chunk)
+                return
+            created_at = _get_created_at(chunk)
+            if created_at < self.last_released_created_at:
+                if not self.reorder_window_overflowed:
+                    verbose_logger.warning(
+                        "StreamingResponseAccumulator: chunk arrived more than %s chunks out of order - adding it to the response out of order",
+                        self.reorder_window,
+                    )
+                self.reorder_window_overflowed = True
+                self._process_chunk(chunk)
+                return
+            # insert after the chunks with the same `created_at` - keeps the arrival order of ties
+            index = len(self.pending_chunks)
+            while (
+                index > 0
+                and _get_created_at(self.pending_chunks[index - 1]) > created_at
+            ):
+                index -= 1
+            self.pending_chunks.insert(index, chunk)
+            if len(self.pending_chunks) > self.reorder_window:
+                self._release_chunk(self.pending_chunks.pop(0))
+
+    def _release_chunk(self, chunk: Any) -> None:
+        created_at = _get_created_at(chunk)
+        if created_at != float("inf"):
+            self.last_released_created_at = max(
+                self.last_released_created_at, created_at
             )
-        return chunks
-
-    def update_model_response_with_hidden_params(
-        self, model_response: ModelResponse, chunk: Optional[Dict[str, Any]] = None
-    ) -> ModelResponse:
-        if chunk is None:
-            return model_response
-        # set hidden params from chunk to model_response
-        if model_response is not None and hasattr(model_response, "_hidden_params"):
-            model_response._hidden_params = chunk.get("_hidden_params", {})
-        return model_response
-
-    def build_base_response(self, chunks: List[Dict[str, Any]]) -> ModelResponse:
+        self._process_chunk(chunk)
+
+    def _process_chunk(self, chunk: Any) -> None:  # noqa: PLR0915
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+            self.is_text_completion = isinstance(chunk["choices"][0], TextChoices)
+        self.hidden_params = chunk.get("_hidden_params", {})
+
+        choices = chunk["choices"]
+        if self.is_text_completion:
+            if len(choices) > 0:
+                self.finish_reason = choices[0]["finish_reason"]
+                self.logprobs = choices[0]["logprobs"]
+            for choice in choices:
+                if (
+                    choice is not None
+                    and hasattr(choice, "text")
+                    and choice.get("text") is not None
+                ):
+                    self.content_list.append(choice.get("text"))
+            return
+
+        if len(choices) > 0:
+            if hasattr(choices[0], "finish_reason"):
+                self.finish_reason = choices[0].finish_reason
+            elif "finish_reason" in choices[0]:
+                self.finish_reason = choices[0]["finish_reason"]
+
+            delta = choices[0]["delta"]
+            if "tool_calls" in delta and delta["tool_calls"] is not None:
+                self._add_tool_call_chunk(choices)
+            if "function_call" in delta and delta["function_call"] is not None:
+                self._add_function_call_chunk(choices)
+            if "content" in delta and delta["content"] is not None:
+                self.has_content = True
+                for choice in choices:
+                    content = choice.get("delta", {}).get("content", "")
+                    if content is None:
+                        continue  # openai v1.0.0 sets content = None for chunks
+                    self.content_list.append(content)
+            if "audio" in delta and delta["audio"] is not None:
+                self._add_audio_chunk(choices)
+
+        usage_chunk: Optional[Usage] = None
+        if "usage" in chunk:
+            usage_chunk = chunk["usage"]
+            if usage_chunk is not None:
+                if "prompt_tokens" in usage_chunk:
+                    self.last_usage_prompt_tokens = usage_chunk.get("prompt_tokens")
+                if "completion_tokens" in usage_chunk:
+                    self.last_usage_completion_tokens = usage_chunk.get(
+                        "completion_tokens"
+                    )
+        elif isinstance(chunk, ModelResponse) and hasattr(chunk, "_hidden_params"):
+            usage_chunk = chunk._hidden_params.get("usage", None)
+        if usage_chunk is not None:
+            self._add_usage_chunk(usage_chunk)
+
+    def _add_tool_call_chunk(self, choices: List[Any]) -> None:
+        self.has_tool_calls = True
+        for choice in choices:
+            delta = choice.get("delta", {})
+            tool_calls = delta.get("tool_calls", "")
+            # Check if a tool call is present
+            if tool_calls and tool_calls[0].function is not None:
+                if tool_calls[0].id:
+                    self.tool_call_id = tool_calls[0].id
+                    self.tool_call_curr_id = self.tool_call_id
+                    if self.tool_call_prev_id is None:
+                        self.tool_call_prev_id = self.tool_call_curr_id
+                if tool_calls[0].index:
+                    self.tool_call_curr_index = tool_calls[0].index
+                if tool_calls[0].function.arguments:
+                    self.tool_call_argument_list.append(
+                        tool_calls[0].function.arguments
+                    )
+                if tool_calls[0].function.name:
+                    self.tool_call_name = tool_calls[0].function.name
+                if tool_calls[0].type:
+                    self.tool_call_type = tool_calls[0].type
+        if self.tool_call_prev_index is None:
+            self.tool_call_prev_index = self.tool_call_curr_index
+        if self.tool_call_prev_name is None:
+            self.tool_call_prev_name = self.tool_call_name
+        if self.tool_call_curr_index != self.tool_call_prev_index:  # new tool call
+            self.tool_calls_list.append(
+                ChatCompletionMessageToolCall(
+                    id=self.tool_call_prev_id,
+                    function=Function(
+                        arguments="".join(self.tool_call_argument_list),
+                        name=self.tool_call_prev_name,
+                    ),
+                    type=self.tool_call_type,
+                )
+            )
+            self.tool_call_argument_list = []  # reset
+            self.tool_call_prev_index = self.tool_call_curr_index
+            self.tool_call_prev_id = self.tool_call_curr_id
+            self.tool_call_prev_name = self.tool_call_name
+
+    def _add_function_call_chunk(self, choices: List[Any]) -> None:
+        if self.function_call_argument_list is None:
+            self.function_call_name = choices[0]["delta"].get("function_call", "").name
+            self.function_call_argument_list = []
+        for choice in choices:
+            function_call = choice.get("delta", {}).get("function_call", "")
+            # Check if a function call is present
+            if function_call:
+                self.function_call_argument_list.append(function_call.arguments)
+
+    def _add_audio_chunk(self, choices: List[Any]) -> None:
+        self.has_audio = True
+        for choice in choices:
+            delta = choice.get("delta") or {}
+            audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
+            if audio is not None:
+                for k, v in audio.items():
+                    if k == "data" and v is not None and isinstance(v, str):
+                        self.audio_data_list.append(v)
+                    elif k == "transcript" and v is not None and isinstance(v, str):
+                        self.audio_transcript_list.append(v)
+                    elif k == "expires_at" and v is not None and isinstance(v, int):
+                        self.audio_expires_at = v
+                    elif k == "id" and v is not None and isinstance(v, str):
+                        self.audio_id = v
+
+    def _add_usage_chunk(self, usage_chunk: Usage) -> None:
+        usage_chunk_dict = _usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            self.prompt_tokens = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            self.completion_tokens = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None:
+            self.cache_creation_input_tokens = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None:
+            self.cache_read_input_tokens = usage_chunk_dict["cache_read_input_tokens"]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            self.completion_tokens_details = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        self.prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
+
+    def flush(self) -> None:
+        """
+        Process the chunks still held in the reorder window
+        """
+        with self.lock:
+            for chunk in self.pending_chunks:
+                self._release_chunk(chunk)
+            self.pending_chunks = []
+
+    def build(
+        self, messages: Optional[list] = None
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        The complete response for the chunks added so far. Can be called again after adding more chunks.
+        """
+        self.flush()
+        with self.lock:
+            if self.first_chunk is None:
+                return None
+            if self.is_text_completion:
+                return self._build_text_completion_response(messages=messages)
+            return self._build_model_response(messages=messages)
+
+    def _build_model_response(self, messages: Optional[list]) -> ModelResponse:
         chunk = self.first_chunk
-        id = chunk["id"]
-        object = chunk["object"]
-        created = chunk["created"]
         model = chunk["model"]
-        system_fingerprint = chunk.get("system_fingerprint", None)
-
-        role = chunk["choices"][0]["delta"]["role"]
-        finish_reason = "stop"
-        for chunk in chunks:
-            if "choices" in chunk and len(chunk["choices"]) > 0:
-                if hasattr(chunk["choices"][0], "finish_reason"):
-                    finish_reason = chunk["choices"][0].finish_reason
-                elif "finish_reason" in chunk["choices"][0]:
-                    finish_reason = chunk["choices"][0]["finish_reason"]
-
-        # Initialize the response dictionary
         response = ModelResponse(
             **{
-                "id": id,
-                "object": object,
-                "created": created,
+                "id": chunk["id"],
+                "object": chunk["object"],
+                "created": chunk["created"],
                 "model": model,
-                "system_fingerprint": system_fingerprint,
+                "system_fingerprint": chunk.get("system_fingerprint", None),
                 "choices": [
                     {
                         "index": 0,
-                        "message": {"role": role, "content": ""},
-                        "finish_reason": finish_reason,
+                        "message": {
+                            "role": chunk["choices"][0]["delta"]["role"],
+                            "content": "",
+                        },
+                        "finish_reason": self.finish_reason,
                     }
                 ],
                 "usage": {
-                    "prompt_tokens": 0,  # Modify as needed
-                    "completion_tokens": 0,  # Modify as needed
-                    "total_tokens": 0,  # Modify as needed
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
                 },
             }
         )
-
-        response = self.update_model_response_with_hidden_params(
-            model_response=response, chunk=chunk
-        )
-        return response
-
-    def get_combined_tool_content(
-        self, tool_call_chunks: List[Dict[str, Any]]
-    ) -> List[ChatCompletionMessageToolCall]:
-        argument_list: List = []
-        delta = tool_call_chunks[0]["choices"][0]["delta"]
-        id = None
-        name = None
-        type = None
-        tool_calls_list: List[ChatCompletionMessageToolCall] = []
-        prev_index = None
-        prev_name = None
-        prev_id = None
-        curr_id = None
-        curr_index = 0
-        for chunk in tool_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                tool_calls = delta.get("tool_calls", "")
-                # Check if a tool call is present
-                if tool_calls and tool_calls[0].function is not None:
-                    if tool_calls[0].id:
-                        id = tool_calls[0].id
-                        curr_id = id
-                        if prev_id is None:
-                            prev_id = curr_id
-                    if tool_calls[0].index:
-                        curr_index = tool_calls[0].index
-                    if tool_calls[0].function.arguments:
-                        # Now, tool_calls is expected to be a dictionary
-                        arguments = tool_calls[0].function.arguments
-                        argument_list.append(arguments)
-                    if tool_calls[0].function.name:
-                        name = tool_calls[0].function.name
-                    if tool_calls[0].type:
-                        type = tool_calls[0].type
-            if prev_index is None:
-                prev_index = curr_index
-            if prev_name is None:
-                prev_name = name
-            if curr_index != prev_index:  # new tool call
-                combined_arguments = "".join(argument_list)
-                tool_calls_list.append(
-                    ChatCompletionMessageToolCall(
-                        id=prev_id,
-                        function=Function(
-                            arguments=combined_arguments,
-                            name=prev_name,
-                        ),
-                        type=type,
-                    )
+        # set hidden params from the last chunk to the response
+        response._hidden_params = self.hidden_params
+
+        _choice = cast(Choices, response.choices[0])
+        if self.has_tool_calls:
+            _choice.message.content = None
+            _choice.message.tool_calls = self.tool_calls_list + [
+                ChatCompletionMessageToolCall(
+                    id=self.tool_call_id,
+                    type="function",
+                    function=Function(
+                        # base case, return empty dict
+                        arguments="".join(self.tool_call_argument_list) or "{}",
+                        name=self.tool_call_name,
+                    ),
                 )
-                argument_list = []  # reset
-                prev_index = curr_index
-                prev_id = curr_id
-                prev_name = name
-
-        combined_arguments = (
-            "".join(argument_list) or "{}"
-        )  # base case, return empty dict
-
-        tool_calls_list.append(
-            ChatCompletionMessageToolCall(
-                id=id,
-                type="function",
-                function=Function(
-                    arguments=combined_arguments,
-                    name=name,
-                ),
+            ]
+        if self.function_call_argument_list is not None:
+            _choice.message.content = None
+            _choice.message.function_call = FunctionCall(
+                name=self.function_call_name,
+                arguments="".join(self.function_call_argument_list),
+            )
+        if self.has_content:
+            _choice.message.content = "".join(self.content_list)
+        if self.has_audio:
+            _choice.message.audio = ChatCompletionAudioResponse(
+                data=concatenate_base64_list(self.audio_data_list),
+                expires_at=self.audio_expires_at or int(time.time() + 3600),
+                transcript="".join(self.audio_transcript_list),
+                id=self.audio_id,
             )
-        )
-        return tool_calls_list
-
-    def get_combined_function_call_content(
-        self, function_call_chunks: List[Dict[str, Any]]
-    ) -> FunctionCall:
-        argument_list = []
-        delta = function_call_chunks[0]["choices"][0]["delta"]
-        function_call = delta.get("function_call", "")
-        function_call_name = function_call.name
-
-        for chunk in function_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                function_call = delta.get("function_call", "")
-
-                # Check if a function call is present
-                if function_call:
-                    # Now, function_call is expected to be a dictionary
-                    arguments = function_call.arguments
-                    argument_list.append(arguments)
-
-        combined_arguments = "".join(argument_list)
 
-        return FunctionCall(
-            name=function_call_name,
-            arguments=combined_arguments,
+        usage = self._calculate_usage(
+            model=model,
+            completion_output=get_content_from_model_response(response),
+            messages=messages,
         )
+        setattr(response, "usage", usage)
+        return response
 
-    def get_combined_content(
-        self, chunks: List[Dict[str, Any]]
-    ) -> ChatCompletionAssistantContentValue:
-        content_list: List[str] = []
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                content = delta.get("content", "")
-                if content is None:
-                    continue  # openai v1.0.0 sets content = None for chunks
-                content_list.append(content)
-
-        # Combine the "content" strings into a single string || combine the 'function' strings into a single string
-        combined_content = "".join(content_list)
-
-        # Update the "content" field within the response dictionary
-        return combined_content
-
-    def get_combined_audio_content(
-        self, chunks: List[Dict[str, Any]]
-    ) -> ChatCompletionAudioResponse:
-        base64_data_list: List[str] = []
-        transcript_list: List[str] = []
-        expires_at: Optional[int] = None
-        id: Optional[str] = None
-
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta") or {}
-                audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
-                if audio is not None:
-                    for k, v in audio.items():
-                        if k == "data" and v is not None and isinstance(v, str):
-                            base64_data_list.append(v)
-                        elif k == "transcript" and v is not None and isinstance(v, str):
-                            transcript_list.append(v)
-                        elif k == "expires_at" and v is not None and isinstance(v, int):
-                            expires_at = v
-                        elif k == "id" and v is not None and isinstance(v, str):
-                            id = v
-
-        concatenated_audio = concatenate_base64_list(base64_data_list)
-        return ChatCompletionAudioResponse(
-            data=concatenated_audio,
-            expires_at=expires_at or int(time.time() + 3600),
-            transcript="".join(transcript_list),
-            id=id,
+    def _build_text_completion_response(
+        self, messages: Optional[list]
+    ) -> TextCompletionResponse:
+        chunk = self.first_chunk
+        model = chunk["model"]
+        combined_content = "".join(self.content_list)
+        try:
+            prompt_tokens = litellm.token_counter(model=model, messages=messages)
+        except (
+            Exception
+        ):  # don't allow this failing to block a complete streaming response from being returned
+            print_verbose("token_counter failed, assuming prompt tokens is 0")
+            prompt_tokens = 0
+        completion_tokens = litellm.token_counter(
+            model=model,
+            text=combined_content,
+            count_response_tokens=True,
+        )
+        return TextCompletionResponse(
+            **{
+                "id": chunk["id"],
+                "object": chunk["object"],
+                "created": chunk["created"],
+                "model": model,
+                "system_fingerprint": chunk.get("system_fingerprint", None),
+                "choices": [
+                    {
+                        "text": combined_content,
+                        "index": 0,
+                        "logprobs": self.logprobs,
+                        "finish_reason": self.finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
         )
 
-    def _usage_chunk_calculation_helper(self, usage_chunk: Usage) -> dict:
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetails] = None
-
-        if "prompt_tokens" in usage_chunk:
-            prompt_tokens = usage_chunk.get("prompt_tokens", 0) or 0
-        if "completion_tokens" in usage_chunk:
-            completion_tokens = usage_chunk.get("completion_tokens", 0) or 0
-        if "cache_creation_input_tokens" in usage_chunk:
-            cache_creation_input_tokens = usage_chunk.get("cache_creation_input_tokens")
-        if "cache_read_input_tokens" in usage_chunk:
-            cache_read_input_tokens = usage_chunk.get("cache_read_input_tokens")
-        if hasattr(usage_chunk, "completion_tokens_details"):
-            if isinstance(usage_chunk.completion_tokens_details, dict):
-                completion_tokens_details = CompletionTokensDetails(
-                    **usage_chunk.completion_tokens_details
-                )
-            elif isinstance(
-                usage_chunk.completion_tokens_details, CompletionTokensDetails
-            ):
-                completion_tokens_details = usage_chunk.completion_tokens_details
-        if hasattr(usage_chunk, "prompt_tokens_details"):
-            if isinstance(usage_chunk.prompt_tokens_details, dict):
-                prompt_tokens_details = PromptTokensDetails(
-                    **usage_chunk.prompt_tokens_details
-                )
-            elif isinstance(usage_chunk.prompt_tokens_details, PromptTokensDetails):
-                prompt_tokens_details = usage_chunk.prompt_tokens_details
-
-        return {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "cache_creation_input_tokens": cache_creation_input_tokens,
-            "cache_read_input_tokens": cache_read_input_tokens,
-            "completion_tokens_details": completion_tokens_details,
-            "prompt_tokens_details": prompt_tokens_details,
-        }
-
-    def calculate_usage(
+    def _calculate_usage(
         self,
-        chunks: List[Union[Dict[str, Any], ModelResponse]],
         model: str,
         completion_output: str,
         messages: Optional[List] = None,
     ) -> Usage:
-        """
-        Calculate usage for the given chunks.
-        """
         returned_usage = Usage()
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetails] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif isinstance(chunk, ModelResponse) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None:
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None:
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
         try:
-            returned_usage.prompt_tokens = prompt_tokens or token_counter(
+            returned_usage.prompt_tokens = self.prompt_tokens or litellm.token_counter(
                 model=model, messages=messages
             )
         except (
@@ -345,7 +468,7 @@ class ChunkProcessor:
         ):  # don't allow this failing to block a complete streaming response from being returned
             print_verbose("token_counter failed, assuming prompt tokens is 0")
             returned_usage.prompt_tokens = 0
-        returned_usage.completion_tokens = completion_tokens or token_counter(
+        returned_usage.completion_tokens = self.completion_tokens or litellm.token_counter(
             model=model,
             text=completion_output,
             count_response_tokens=True,  # count_response_tokens is a Flag to tell token counter this is a response, No need to add extra tokens we do for input messages
@@ -354,25 +477,40 @@ class ChunkProcessor:
             returned_usage.prompt_tokens + returned_usage.completion_tokens
         )
 
-        if cache_creation_input_tokens is not None:
-            returned_usage._cache_creation_input_tokens = cache_creation_input_tokens
+        if self.cache_creation_input_tokens is not None:
+            returned_usage._cache_creation_input_tokens = (
+                self.cache_creation_input_tokens
+            )
             setattr(
                 returned_usage,
                 "cache_creation_input_tokens",
-                cache_creation_input_tokens,
+                self.cache_creation_input_tokens,
             )  # for anthropic
-        if cache_read_input_tokens is not None:
-            returned_usage._cache_read_input_tokens = cache_read_input_tokens
+        if self.cache_read_input_tokens is not None:
+            returned_usage._cache_read_input_tokens = self.cache_read_input_tokens
             setattr(
-                returned_usage, "cache_read_input_tokens", cache_read_input_tokens
+                returned_usage, "cache_read_input_tokens", self.cache_read_input_tokens
             )  # for anthropic
-        if completion_tokens_details is not None:
-            returned_usage.completion_tokens_details = completion_tokens_details
-        if prompt_tokens_details is not None:
-            returned_usage.prompt_tokens_details = prompt_tokens_details
+        if self.completion_tokens_details is not None:
+            returned_usage.completion_tokens_details = self.completion_tokens_details
+        if self.prompt_tokens_details is not None:
+            returned_usage.prompt_tokens_details = self.prompt_tokens_details
 
         return returned_usage
 
+    def get_total_usage(self) -> Usage:
+        """
+        Assume most recent usage chunk has total usage uptil then - no token counting, so cheap to call mid-stream
+        """
+        with self.lock:
+            prompt_tokens = self.last_usage_prompt_tokens or 0
+            completion_tokens = self.last_usage_completion_tokens or 0
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
 
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 import litellm
 from litellm import verbose_logger
+from litellm._logging import _format_log_message
 from litellm.litellm_core_utils.redact_messages import (
     LiteLLMLoggingObject,
     redact_message_input_output_from_logging,
@@ -30,6 +31,7 @@ from .core_helpers import map_finish_reason, process_response_headers
 from .default_encoding import encoding
 from .exception_mapping_utils import exception_type
 from .rules import Rules
+from .streaming_chunk_builder_utils import StreamingResponseAccumulator
 
 MAX_THREADS = 100
 
@@ -37,10 +39,10 @@ MAX_THREADS = 100
 executor = ThreadPoolExecutor(max_workers=MAX_THREADS)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
     try:
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(_format_log_message(print_statement, args))  # noqa
     except Exception:
         pass
 
@@ -107,9 +109,13 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        # the returned chunks, built into the complete response as they stream - used for calculating the input/output tokens for stream options
+        self.streaming_response_accumulator = StreamingResponseAccumulator(
+            reorder_window=0
+        )
+        # content of the last returned chunk + how many times in a row it was returned - see `safety_checker`
+        self.last_chunk_content: Optional[Any] = None
+        self.repeated_chunk_count = 0
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
 
     def __iter__(self):
@@ -162,28 +168,37 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
+        if self.repeated_chunk_count >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
+            last_content = self.last_chunk_content
+            if (
+                last_content is not None
+                and isinstance(last_content, str)
+                and len(last_content) > 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                # All last n chunks are identical
+                raise litellm.InternalServerError(
+                    message="The model is repeating the same chunk = {}.".format(
+                        last_content
+                    ),
+                    model="",
+                    llm_provider="",
+                )
 
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+    def add_chunk(self, chunk: ModelResponse) -> None:
+        """
+        Add a returned chunk to the complete response + track repeated chunks for the `safety_checker`
+        """
+        self.streaming_response_accumulator.add_chunk(chunk)
+        content = (
+            chunk.choices[0].delta.content
+            if len(chunk.choices) > 0 and isinstance(chunk.choices[0], StreamingChoices)
+            else None
+        )
+        if self.repeated_chunk_count > 0 and content == self.last_chunk_content:
+            self.repeated_chunk_count += 1
+        else:
+            self.last_chunk_content = content
+            self.repeated_chunk_count = 1
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -266,10 +281,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -309,10 +324,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -440,7 +455,7 @@ class CustomStreamWrapper:
     def handle_cohere_chat_chunk(self, chunk):
         chunk = chunk.decode("utf-8")
         data_json = json.loads(chunk)
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         try:
             text = ""
             is_finished = False
@@ -464,7 +479,7 @@ class CustomStreamWrapper:
         is_finished = False
         finish_reason = ""
         text = ""
-        print_verbose(f"chunk: {chunk}")
+        print_verbose("chunk: %s", chunk)
         if "data: [DONE]" in chunk:
             text = ""
             is_finished = True
@@ -484,7 +499,10 @@ class CustomStreamWrapper:
                         is_finished = True
                         finish_reason = data_json["choices"][0]["finish_reason"]
                 print_verbose(
-                    f"text: {text}; is_finished: {is_finished}; finish_reason: {finish_reason}"
+                    "text: %s; is_finished: %s; finish_reason: %s",
+                    text,
+                    is_finished,
+                    finish_reason,
                 )
                 return {
                     "text": text,
@@ -527,7 +545,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -570,7 +588,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -591,7 +609,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -655,7 +673,7 @@ class CustomStreamWrapper:
 
     def handle_cloudlfare_stream(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             chunk = chunk.decode("utf-8")
             str_line = chunk
             text = ""
@@ -666,7 +684,7 @@ class CustomStreamWrapper:
                 return {"text": text, "is_finished": True, "finish_reason": "stop"}
             elif str_line.startswith("data:"):
                 data_json = json.loads(str_line[5:])
-                print_verbose(f"delta content: {data_json}")
+                print_verbose("delta content: %s", data_json)
                 text = data_json["response"]
                 return {
                     "text": text,
@@ -705,7 +723,7 @@ class CustomStreamWrapper:
                     "finish_reason": finish_reason,
                 }
             elif json_chunk["response"]:
-                print_verbose(f"delta content: {json_chunk}")
+                print_verbose("delta content: %s", json_chunk)
                 text = json_chunk["response"]
                 return {
                     "text": text,
@@ -740,7 +758,7 @@ class CustomStreamWrapper:
                     "finish_reason": finish_reason,
                 }
             elif "message" in json_chunk:
-                print_verbose(f"delta content: {json_chunk}")
+                print_verbose("delta content: %s", json_chunk)
                 text = json_chunk["message"]["content"]
                 return {
                     "text": text,
@@ -770,7 +788,7 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                print_verbose("chunk: %s (Type: %s)", chunk, type(chunk))
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -808,7 +826,7 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                print_verbose("chunk: %s (Type: %s)", chunk, type(chunk))
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -932,7 +950,10 @@ class CustomStreamWrapper:
     ):
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         if (
             "content" in completion_obj
@@ -955,7 +976,9 @@ class CustomStreamWrapper:
                 chunk=completion_obj["content"],
                 finish_reason=model_response.choices[0].finish_reason,
             )  # filter out bos/eos tokens from openai-compatible hf endpoints
-            print_verbose(f"hold - {hold}, model_response_str - {model_response_str}")
+            print_verbose(
+                "hold - %s, model_response_str - %s", hold, model_response_str
+            )
             if hold is False:
                 ## check if openai/azure chunk
                 original_chunk = response_obj.get("original_chunk", None)
@@ -971,11 +994,11 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    print_verbose("choice_json: %s", choice_json)
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        print_verbose("choices in streaming: %s", choices)
                         setattr(model_response, "choices", choices)
                     else:
                         return
@@ -987,7 +1010,7 @@ class CustomStreamWrapper:
                         "citations",
                         getattr(original_chunk, "citations", None),
                     )
-                    print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+                    print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
                     if self.sent_first_chunk is False:
                         model_response.choices[0].delta["role"] = "assistant"
                         self.sent_first_chunk = True
@@ -998,7 +1021,8 @@ class CustomStreamWrapper:
                         _initial_delta.pop("role", None)
                         model_response.choices[0].delta = Delta(**_initial_delta)
                     print_verbose(
-                        f"model_response.choices[0].delta: {model_response.choices[0].delta}"
+                        "model_response.choices[0].delta: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -1011,7 +1035,7 @@ class CustomStreamWrapper:
                     _index: Optional[int] = completion_obj.get("index")
                     if _index is not None:
                         model_response.choices[0].index = _index
-                print_verbose(f"returning model_response: {model_response}")
+                print_verbose("returning model_response: %s", model_response)
                 return model_response
             else:
                 return
@@ -1060,7 +1084,7 @@ class CustomStreamWrapper:
             return model_response
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self.add_chunk(model_response)
             return
 
     def chunk_creator(self, chunk):  # type: ignore  # noqa: PLR0915
@@ -1289,19 +1313,19 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "ollama":
                 response_obj = self.handle_ollama_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "ollama_chat":
                 response_obj = self.handle_ollama_chat_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cloudflare":
                 response_obj = self.handle_cloudlfare_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "watsonx":
@@ -1312,13 +1336,13 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "triton":
                 response_obj = self.handle_triton_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "text-completion-openai":
                 response_obj = self.handle_openai_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if response_obj["usage"] is not None:
@@ -1332,7 +1356,7 @@ class CustomStreamWrapper:
                     chunk
                 )
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if "usage" in response_obj is not None:
@@ -1344,7 +1368,7 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "azure_text":
                 response_obj = self.handle_azure_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cached_response":
@@ -1363,7 +1387,7 @@ class CustomStreamWrapper:
                 completion_obj["content"] = response_obj["text"]
                 if response_obj["tool_calls"] is not None:
                     completion_obj["tool_calls"] = response_obj["tool_calls"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if hasattr(chunk, "id"):
                     model_response.id = chunk.id
                     self.response_id = chunk.id
@@ -1380,7 +1404,7 @@ class CustomStreamWrapper:
                 if response_obj is None:
                     return
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                print_verbose("completion obj content: %s", completion_obj["content"])
                 if response_obj["is_finished"]:
                     if response_obj["finish_reason"] == "error":
                         raise Exception(
@@ -1424,7 +1448,9 @@ class CustomStreamWrapper:
 
             model_response.model = self.model
             print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             if (
@@ -1476,7 +1502,7 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            print_verbose("_json_delta: %s", _json_delta)
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta["role"] = (
                                     "assistant"  # mistral's api returns role as None
@@ -1512,10 +1538,10 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            print_verbose("original delta: %s", delta)
                             model_response.choices[0].delta = Delta(**delta)
                             print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1527,9 +1553,11 @@ class CustomStreamWrapper:
                         return model_response
                     return
             print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+            print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
 
             ## CHECK FOR TOOL USE
             if "tool_calls" in completion_obj and len(completion_obj["tool_calls"]) > 0:
@@ -1647,10 +1675,12 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponse] = self.chunk_creator(chunk=chunk)
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
@@ -1668,7 +1698,7 @@ class CustomStreamWrapper:
                         input=self.response_uptil_now, model=self.model
                     )
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self.add_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1685,7 +1715,7 @@ class CustomStreamWrapper:
                         )
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self.streaming_response_accumulator.get_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
                     return response
@@ -1693,7 +1723,8 @@ class CustomStreamWrapper:
         except StopIteration:
             if self.sent_last_chunk is True:
                 complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
+                    chunks=self.streaming_response_accumulator,
+                    messages=self.messages,
                 )
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1717,7 +1748,7 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self.streaming_response_accumulator.get_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
                 threading.Thread(
@@ -1807,13 +1838,13 @@ class CustomStreamWrapper:
                         continue
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
-                    print_verbose(f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}")
+                    print_verbose("PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk)
 
                     processed_chunk: Optional[ModelResponse] = self.chunk_creator(
                         chunk=chunk
                     )
                     print_verbose(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1848,7 +1879,7 @@ class CustomStreamWrapper:
                     self.rules.post_call_rules(
                         input=self.response_uptil_now, model=self.model
                     )
-                    self.chunks.append(processed_chunk)
+                    self.add_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1861,7 +1892,7 @@ class CustomStreamWrapper:
 
                         # Create a new object without the removed attribute
                         processed_chunk = self.model_response_creator(chunk=obj_dict)
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
                     return processed_chunk
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
@@ -1874,12 +1905,12 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[ModelResponse] = self.chunk_creator(
                             chunk=chunk
                         )
                         print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
@@ -1905,13 +1936,14 @@ class CustomStreamWrapper:
                             input=self.response_uptil_now, model=self.model
                         )
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self.add_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
                 complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
+                    chunks=self.streaming_response_accumulator,
+                    messages=self.messages,
                 )
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1987,26 +2019,6 @@ class CustomStreamWrapper:
             )
 
 
-def calculate_total_usage(chunks: List[ModelResponse]) -> Usage:
-    """Assume most recent usage chunk has total usage uptil then."""
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for chunk in chunks:
-        if "usage" in chunk:
-            if "prompt_tokens" in chunk["usage"]:
-                prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
-            if "completion_tokens" in chunk["usage"]:
-                completion_tokens = chunk["usage"].get("completion_tokens", 0) or 0
-
-    returned_usage_chunk = Usage(
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=prompt_tokens + completion_tokens,
-    )
-
-    return returned_usage_chunk
-
-
 def generic_chunk_has_all_required_fields(chunk: dict) -> bool:
     """
     Checks if the provided chunk dictionary contains all required fields for GenericStreamingChunk.
@@ -49,12 +49,16 @@ def get_modified_max_tokens(
 
         input_tokens += int(token_buffer)
         verbose_logger.debug(
-            f"max_output_tokens: {max_output_tokens}, user_max_tokens: {user_max_tokens}"
+            "max_output_tokens: %s, user_max_tokens: %s",
+            max_output_tokens,
+            user_max_tokens,
         )
         ## CASE 1: model input + output can't exceed X - happens when max input = max output, e.g. gpt-3.5-turbo
         if _model_info["max_input_tokens"] == max_output_tokens:
             verbose_logger.debug(
-                f"input_tokens: {input_tokens}, max_output_tokens: {max_output_tokens}"
+                "input_tokens: %s, max_output_tokens: %s",
+                input_tokens,
+                max_output_tokens,
             )
             if input_tokens > max_output_tokens:
                 pass  # allow call to fail normally - don't set max_tokens to negative.
@@ -62,7 +66,10 @@ def get_modified_max_tokens(
                 user_max_tokens + input_tokens > max_output_tokens
             ):  # we can still modify to keep it positive but below the limit
                 verbose_logger.debug(
-                    f"MODIFYING MAX TOKENS - user_max_tokens={user_max_tokens}, input_tokens={input_tokens}, max_output_tokens={max_output_tokens}"
+                    "MODIFYING MAX TOKENS - user_max_tokens=%s, input_tokens=%s, max_output_tokens=%s",
+                    user_max_tokens,
+                    input_tokens,
+                    max_output_tokens,
                 )
                 user_max_tokens = int(max_output_tokens - input_tokens)
         ## CASE 2: user_max_tokens> model max output tokens
@@ -70,7 +77,8 @@ def get_modified_max_tokens(
             user_max_tokens = max_output_tokens
 
         verbose_logger.debug(
-            f"litellm.litellm_core_utils.token_counter.py::get_modified_max_tokens() - user_max_tokens: {user_max_tokens}"
+            "litellm.litellm_core_utils.token_counter.py::get_modified_max_tokens() - user_max_tokens: %s",
+            user_max_tokens,
         )
 
         return user_max_tokens
@@ -6,8 +6,8 @@ Helper util for handling azure openai-specific cost calculation
 from typing import Optional, Tuple
 
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import get_pricing_record
 from litellm.types.utils import Usage
-from litellm.utils import get_model_info
 
 
 def cost_per_token(
@@ -23,39 +23,31 @@ def cost_per_token(
     Returns:
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
-    ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="azure")
+    ## GET PRICING
+    pricing = get_pricing_record(model=model, custom_llm_provider="azure")
     cached_tokens: Optional[int] = None
     ## CALCULATE INPUT COST
     non_cached_text_tokens = usage.prompt_tokens
     if usage.prompt_tokens_details and usage.prompt_tokens_details.cached_tokens:
         cached_tokens = usage.prompt_tokens_details.cached_tokens
         non_cached_text_tokens = non_cached_text_tokens - cached_tokens
-    prompt_cost: float = non_cached_text_tokens * model_info["input_cost_per_token"]
+    prompt_cost: float = non_cached_text_tokens * pricing.input_cost_per_token
 
     ## CALCULATE OUTPUT COST
-    completion_cost: float = (
-        usage["completion_tokens"] * model_info["output_cost_per_token"]
-    )
+    completion_cost: float = usage["completion_tokens"] * pricing.output_cost_per_token
 
     ## Prompt Caching cost calculation
-    if model_info.get("cache_read_input_token_cost") is not None and cached_tokens:
+    if pricing.cache_read_input_token_cost is not None and cached_tokens:
         # Note: We read ._cache_read_input_tokens from the Usage - since cost_calculator.py standardizes the cache read tokens on usage._cache_read_input_tokens
-        prompt_cost += cached_tokens * (
-            model_info.get("cache_read_input_token_cost", 0) or 0
-        )
+        prompt_cost += cached_tokens * pricing.cache_read_input_token_cost
 
     ## Speech / Audio cost calculation
-    if (
-        "output_cost_per_second" in model_info
-        and model_info["output_cost_per_second"] is not None
-        and response_time_ms is not None
-    ):
+    if pricing.output_cost_per_second is not None and response_time_ms is not None:
         verbose_logger.debug(
-            f"For model={model} - output_cost_per_second: {model_info.get('output_cost_per_second')}; response time: {response_time_ms}"
+            f"For model={model} - output_cost_per_second: {pricing.output_cost_per_second}; response time: {response_time_ms}"
         )
         ## COST PER SECOND ##
         prompt_cost = 0
-        completion_cost = model_info["output_cost_per_second"] * response_time_ms / 1000
+        completion_cost = pricing.output_cost_per_second * response_time_ms / 1000
 
     return prompt_cost, completion_cost
@@ -6,6 +6,7 @@ Helper util for handling openai-specific cost calculation
 from typing import Literal, Optional, Tuple
 
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import get_pricing_record
 from litellm.types.utils import CallTypes, Usage
 from litellm.utils import get_model_info
 
@@ -28,8 +29,8 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
     Returns:
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
-    ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="openai")
+    ## GET PRICING
+    pricing = get_pricing_record(model=model, custom_llm_provider="openai")
 
     ## CALCULATE INPUT COST
     ### Non-cached text tokens
@@ -38,33 +39,25 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
     if usage.prompt_tokens_details and usage.prompt_tokens_details.cached_tokens:
         cached_tokens = usage.prompt_tokens_details.cached_tokens
         non_cached_text_tokens = non_cached_text_tokens - cached_tokens
-    prompt_cost: float = non_cached_text_tokens * model_info["input_cost_per_token"]
+    prompt_cost: float = non_cached_text_tokens * pricing.input_cost_per_token
     ## Prompt Caching cost calculation
-    if model_info.get("cache_read_input_token_cost") is not None and cached_tokens:
+    if pricing.cache_read_input_token_cost is not None and cached_tokens:
         # Note: We read ._cache_read_input_tokens from the Usage - since cost_calculator.py standardizes the cache read tokens on usage._cache_read_input_tokens
-        prompt_cost += cached_tokens * (
-            model_info.get("cache_read_input_token_cost", 0) or 0
-        )
+        prompt_cost += cached_tokens * pricing.cache_read_input_token_cost
 
     _audio_tokens: Optional[int] = (
         usage.prompt_tokens_details.audio_tokens
         if usage.prompt_tokens_details is not None
         else None
     )
-    _audio_cost_per_token: Optional[float] = model_info.get(
-        "input_cost_per_audio_token"
-    )
+    _audio_cost_per_token: Optional[float] = pricing.input_cost_per_audio_token
     if _audio_tokens is not None and _audio_cost_per_token is not None:
         audio_cost: float = _audio_tokens * _audio_cost_per_token
         prompt_cost += audio_cost
 
     ## CALCULATE OUTPUT COST
-    completion_cost: float = (
-        usage["completion_tokens"] * model_info["output_cost_per_token"]
-    )
-    _output_cost_per_audio_token: Optional[float] = model_info.get(
-        "output_cost_per_audio_token"
-    )
+    completion_cost: float = usage["completion_tokens"] * pricing.output_cost_per_token
+    _output_cost_per_audio_token: Optional[float] = pricing.output_cost_per_audio_token
     _output_audio_tokens: Optional[int] = (
         usage.completion_tokens_details.audio_tokens
         if usage.completion_tokens_details is not None
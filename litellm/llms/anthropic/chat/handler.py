@@ -383,7 +383,7 @@ class AnthropicChatCompletion(BaseLLM):
         client: Optional[AsyncHTTPHandler] = None,
     ) -> Union[ModelResponse, CustomStreamWrapper]:
         async_handler = client or get_async_httpx_client(
-            llm_provider=litellm.LlmProviders.ANTHROPIC
+            llm_provider=litellm.LlmProviders.ANTHROPIC, api_base=api_base
         )
 
         try:
@@ -5,8 +5,8 @@ Helper util for handling anthropic-specific cost calculation
 
 from typing import Tuple
 
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import get_pricing_record
 from litellm.types.utils import Usage
-from litellm.utils import get_model_info
 
 
 def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
@@ -20,8 +20,8 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
     Returns:
         Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
     """
-    ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider="anthropic")
+    ## GET PRICING
+    pricing = get_pricing_record(model=model, custom_llm_provider="anthropic")
 
     ## CALCULATE INPUT COST
     ### Cost of processing (non-cache hit + cache hit) + Cost of cache-writing (cache writing)
@@ -33,9 +33,9 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
         cache_hit_tokens = usage.prompt_tokens_details.cached_tokens
         non_cache_hit_tokens = non_cache_hit_tokens - cache_hit_tokens
 
-    prompt_cost = float(non_cache_hit_tokens) * model_info["input_cost_per_token"]
+    prompt_cost = float(non_cache_hit_tokens) * pricing.input_cost_per_token
 
-    _cache_read_input_token_cost = model_info.get("cache_read_input_token_cost")
+    _cache_read_input_token_cost = pricing.cache_read_input_token_cost
     if (
         _cache_read_input_token_cost is not None
         and usage.prompt_tokens_details
@@ -47,13 +47,13 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
         )
 
     ### CACHE WRITING COST
-    _cache_creation_input_token_cost = model_info.get("cache_creation_input_token_cost")
+    _cache_creation_input_token_cost = pricing.cache_creation_input_token_cost
     if _cache_creation_input_token_cost is not None:
         prompt_cost += (
             float(usage._cache_creation_input_tokens) * _cache_creation_input_token_cost
         )
 
     ## CALCULATE OUTPUT COST
-    completion_cost = usage["completion_tokens"] * model_info["output_cost_per_token"]
+    completion_cost = usage["completion_tokens"] * pricing.output_cost_per_token
 
     return prompt_cost, completion_cost
@@ -131,7 +131,9 @@ class BedrockEmbedding(BaseAWSLLM):
                     timeout = httpx.Timeout(timeout)
                 _params["timeout"] = timeout
             client = get_async_httpx_client(
-                params=_params, llm_provider=litellm.LlmProviders.BEDROCK
+                params=_params,
+                llm_provider=litellm.LlmProviders.BEDROCK,
+                api_base=api_base,
             )
         else:
             client = client
@@ -109,6 +109,7 @@ class BedrockImageGeneration(BaseAWSLLM):
         async_client = get_async_httpx_client(
             llm_provider=litellm.LlmProviders.BEDROCK,
             params={"timeout": timeout},
+            api_base=prepared_request.endpoint_url,
         )
 
         try:
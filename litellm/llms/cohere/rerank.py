@@ -103,7 +103,9 @@ class CohereRerank(BaseLLM):
     ) -> RerankResponse:
         request_data_dict = request_data.dict(exclude_none=True)
 
-        client = get_async_httpx_client(llm_provider=litellm.LlmProviders.COHERE)
+        client = get_async_httpx_client(
+            llm_provider=litellm.LlmProviders.COHERE, api_base=api_base
+        )
 
         response = await client.post(
             api_base,
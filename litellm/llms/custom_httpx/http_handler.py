@@ -1,12 +1,26 @@
 import asyncio
 import os
+import time
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
 
 import httpx
 from httpx import USE_CLIENT_DEFAULT
 
 import litellm
+from litellm._logging import verbose_logger
 
 from .types import httpxSpecialProvider
 
@@ -28,6 +42,122 @@ headers = {
 _DEFAULT_TIMEOUT = httpx.Timeout(timeout=5.0, connect=5.0)
 
 
+def _is_http2_available() -> bool:
+    try:
+        import h2  # type: ignore # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+class _HostSlotReleasingStream(httpx.AsyncByteStream):
+    """
+    Response stream that gives the per-host slot back when the response is closed
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class PooledAsyncHTTPTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport with an optional cap on concurrent requests per host, and pool stats for monitoring.
+
+    The connection pool (`limits`) is shared by all hosts - `max_connections_per_host` stops one slow host from using all of it.
+    """
+
+    def __init__(
+        self,
+        verify: Any,
+        cert: Any,
+        limits: httpx.Limits,
+        http2: bool = False,
+        max_connections_per_host: Optional[int] = None,
+    ):
+        self.transport = httpx.AsyncHTTPTransport(
+            verify=verify, cert=cert, limits=limits, http2=http2
+        )
+        self.http2 = http2
+        self.max_connections_per_host = max_connections_per_host
+        self.host_semaphores: Dict[
+            Tuple[bytes, bytes, Optional[int]], asyncio.Semaphore
+        ] = {}
+        self.active_requests = 0
+        self.waiters = 0
+        self.last_request_time = time.time()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.last_request_time = time.time()
+        semaphore: Optional[asyncio.Semaphore] = None
+        if self.max_connections_per_host is not None:
+            host_key = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+            semaphore = self.host_semaphores.get(host_key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_connections_per_host)
+                self.host_semaphores[host_key] = semaphore
+            self.waiters += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                self.waiters -= 1
+
+        self.active_requests += 1
+
+        def _release() -> None:
+            self.active_requests -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            _release()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_HostSlotReleasingStream(stream=response.stream, release=_release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        connections: list = []
+        _pool = getattr(self.transport, "_pool", None)
+        if _pool is not None:
+            try:
+                connections = list(_pool.connections)
+            except Exception:
+                pass
+        return {
+            "active_requests": self.active_requests,
+            "waiters": self.waiters,
+            "total_connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+            "http2": self.http2,
+            "seconds_since_last_request": time.time() - self.last_request_time,
+        }
+
+
 class AsyncHTTPHandler:
     def __init__(
         self,
@@ -35,9 +165,19 @@ class AsyncHTTPHandler:
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]] = None,
         concurrent_limit=1000,
         client_alias: Optional[str] = None,  # name for client in logs
+        http2: Optional[bool] = None,  # defaults to `litellm.enable_http2`
+        max_connections_per_host: Optional[
+            int
+        ] = None,  # defaults to `litellm.max_connections_per_host`
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
+        self.http2 = litellm.enable_http2 if http2 is None else http2
+        self.max_connections_per_host = (
+            litellm.max_connections_per_host
+            if max_connections_per_host is None
+            else max_connections_per_host
+        )
         self.client = self.create_client(
             timeout=timeout, concurrent_limit=concurrent_limit, event_hooks=event_hooks
         )
@@ -59,20 +199,41 @@ class AsyncHTTPHandler:
 
         if timeout is None:
             timeout = _DEFAULT_TIMEOUT
-        # Create a client with a connection pool
 
+        http2 = self.http2
+        if http2 is True and not _is_http2_available():
+            verbose_logger.warning(
+                "litellm.enable_http2 is set, but the 'h2' package is not installed. Falling back to HTTP/1.1. Run `pip install h2` to use HTTP/2."
+            )
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=concurrent_limit,
+            max_keepalive_connections=concurrent_limit,
+        )
+        # Create a client with a connection pool
         return httpx.AsyncClient(
             event_hooks=event_hooks,
             timeout=timeout,
-            limits=httpx.Limits(
-                max_connections=concurrent_limit,
-                max_keepalive_connections=concurrent_limit,
-            ),
+            limits=limits,
             verify=ssl_verify,
             cert=cert,
             headers=headers,
+            transport=PooledAsyncHTTPTransport(
+                verify=ssl_verify,
+                cert=cert,
+                limits=limits,
+                http2=http2,
+                max_connections_per_host=self.max_connections_per_host,
+            ),
         )
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        transport = getattr(self.client, "_transport", None)
+        if isinstance(transport, PooledAsyncHTTPTransport):
+            return transport.get_pool_stats()
+        return {}
+
     async def close(self):
         # Close the client when you're done with it
         await self.client.aclose()
@@ -428,36 +589,163 @@ class HTTPHandler:
             pass
 
 
+def _normalize_client_param(value: Any) -> Any:
+    if isinstance(value, httpx.Timeout):
+        return ("timeout", value.connect, value.read, value.write, value.pool)
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                ((str(k), _normalize_client_param(v)) for k, v in value.items()),
+                key=lambda item: item[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_client_param(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
+
+
+def _normalize_api_base(api_base: Optional[str]) -> Optional[str]:
+    """
+    'HTTPS://api.openai.com/v1/' -> 'https://api.openai.com:443'
+    """
+    if api_base is None:
+        return None
+    try:
+        parsed = urlparse(api_base.strip())
+        scheme = (parsed.scheme or "https").lower()
+        port = parsed.port or (443 if scheme == "https" else 80)
+        return f"{scheme}://{(parsed.hostname or '').lower()}:{port}"
+    except Exception:
+        return api_base
+
+
+class AsyncHTTPClientRegistry:
+    """
+    Shared async httpx clients, one per (provider, api base, TLS settings, timeout, client params).
+
+    - clients with no requests for `idle_client_ttl` seconds are evicted
+    - `close()` closes every client, on proxy shutdown
+    - `get_pool_stats()` reports active requests / idle connections / waiters per client
+    """
+
+    def __init__(self, idle_client_ttl: float = 3600, eviction_interval: float = 60):
+        self.idle_client_ttl = idle_client_ttl
+        self.eviction_interval = eviction_interval
+        self.clients: Dict[tuple, AsyncHTTPHandler] = {}
+        self.last_eviction_time = time.time()
+
+    def get_client_key(
+        self,
+        llm_provider: Union[LlmProviders, httpxSpecialProvider, str],
+        params: Optional[dict] = None,
+        api_base: Optional[str] = None,
+    ) -> tuple:
+        _params = params or {}
+        return (
+            str(getattr(llm_provider, "value", llm_provider)),
+            _normalize_api_base(api_base),
+            _normalize_client_param(os.getenv("SSL_VERIFY", litellm.ssl_verify)),
+            _normalize_client_param(
+                os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate)
+            ),
+            _normalize_client_param(_params.get("timeout")),
+            _normalize_client_param(
+                {k: v for k, v in _params.items() if k != "timeout"}
+            ),
+            litellm.enable_http2,
+            litellm.max_connections_per_host,
+        )
+
+    def get_client(
+        self,
+        llm_provider: Union[LlmProviders, httpxSpecialProvider, str],
+        params: Optional[dict] = None,
+        api_base: Optional[str] = None,
+    ) -> AsyncHTTPHandler:
+        self.evict_idle_clients()
+        client_key = self.get_client_key(
+            llm_provider=llm_provider, params=params, api_base=api_base
+        )
+        _client = self.clients.get(client_key)
+        if _client is not None:
+            return _client
+
+        if params is not None:
+            _client = AsyncHTTPHandler(**params)
+        else:
+            _client = AsyncHTTPHandler(
+                timeout=httpx.Timeout(timeout=600.0, connect=5.0)
+            )
+        self.clients[client_key] = _client
+        return _client
+
+    def evict_idle_clients(self, force: bool = False) -> None:
+        """
+        Remove clients that have been idle for longer than `idle_client_ttl` from the registry.
+
+        Evicted clients are not closed here, callers may still hold a reference to them - they're closed when garbage collected (`AsyncHTTPHandler.__del__`).
+        """
+        now = time.time()
+        if not force and now - self.last_eviction_time < self.eviction_interval:
+            return
+        self.last_eviction_time = now
+        for client_key, _client in list(self.clients.items()):
+            stats = _client.get_pool_stats()
+            if (
+                stats.get("active_requests", 0) == 0
+                and stats.get("waiters", 0) == 0
+                and stats.get("seconds_since_last_request", 0) > self.idle_client_ttl
+            ):
+                self.clients.pop(client_key, None)
+
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        pool_stats: List[Dict[str, Any]] = []
+        for client_key, _client in self.clients.items():
+            pool_stats.append(
+                {
+                    "llm_provider": client_key[0],
+                    "api_base": client_key[1],
+                    "client_alias": _client.client_alias,
+                    **_client.get_pool_stats(),
+                }
+            )
+        return pool_stats
+
+    async def close(self) -> None:
+        clients = list(self.clients.values())
+        self.clients.clear()
+        for _client in clients:
+            try:
+                await _client.close()
+            except Exception as e:
+                verbose_logger.debug("Error closing async httpx client - %s", str(e))
+
+
+async_http_client_registry = AsyncHTTPClientRegistry()
+
+
 def get_async_httpx_client(
     llm_provider: Union[LlmProviders, httpxSpecialProvider],
     params: Optional[dict] = None,
+    api_base: Optional[str] = None,
 ) -> AsyncHTTPHandler:
     """
-    Retrieves the async HTTP client from the cache
+    Retrieves the async HTTP client from the shared client registry
     If not present, creates a new client
 
     Caches the new client and returns it.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
-    if _cache_key_name in litellm.in_memory_llm_clients_cache:
-        return litellm.in_memory_llm_clients_cache[_cache_key_name]
-
-    if params is not None:
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
-            timeout=httpx.Timeout(timeout=600.0, connect=5.0)
-        )
-    litellm.in_memory_llm_clients_cache[_cache_key_name] = _new_client
-    return _new_client
+    return async_http_client_registry.get_client(
+        llm_provider=llm_provider, params=params, api_base=api_base
+    )
 
 
 def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
@@ -182,7 +182,7 @@ async def make_call(
 ):
     if client is None:
         client = get_async_httpx_client(
-            llm_provider=litellm.LlmProviders.DATABRICKS
+            llm_provider=litellm.LlmProviders.DATABRICKS, api_base=api_base
         )  # Create a new client if none provided
     response = await client.post(api_base, headers=headers, data=data, stream=True)
 
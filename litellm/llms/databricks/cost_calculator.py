@@ -5,8 +5,8 @@ Helper util for handling databricks-specific cost calculation
 
 from typing import Tuple
 
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import get_pricing_record
 from litellm.types.utils import Usage
-from litellm.utils import get_model_info
 
 
 def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
@@ -53,14 +53,14 @@ def cost_per_token(model: str, usage: Usage) -> Tuple[float, float]:
         "llama-2-70b-chat"
     ):
         base_model = "databricks-llama-2-70b-chat"
-    ## GET MODEL INFO
-    model_info = get_model_info(model=base_model, custom_llm_provider="databricks")
+    ## GET PRICING
+    pricing = get_pricing_record(model=base_model, custom_llm_provider="databricks")
 
     ## CALCULATE INPUT COST
 
-    prompt_cost: float = usage["prompt_tokens"] * model_info["input_cost_per_token"]
+    prompt_cost: float = usage["prompt_tokens"] * pricing.input_cost_per_token
 
     ## CALCULATE OUTPUT COST
-    completion_cost = usage["completion_tokens"] * model_info["output_cost_per_token"]
+    completion_cost = usage["completion_tokens"] * pricing.output_cost_per_token
 
     return prompt_cost, completion_cost
@@ -40,7 +40,11 @@ from litellm.types.llms.openai import (
 )
 from litellm.types.utils import GenericImageParsingChunk
 
-from .image_handling import async_convert_url_to_base64, convert_url_to_base64
+from .image_handling import (
+    async_convert_url_to_base64,
+    convert_url_to_base64,
+    prefetch_image_urls,
+)
 
 
 def default_pt(messages):
@@ -803,6 +807,8 @@ def anthropic_messages_pt_xml(messages: list):
     5. System messages are a separate param to the Messages API (used for tool calling)
     6. Ensure we only accept role, content. (message.name is not supported)
     """
+    # fetch all image urls in parallel, before converting them one by one
+    prefetch_image_urls(messages=messages)
     # add role=tool support to allow function call result/error submission
     user_message_types = {"user", "tool"}
     # reformat messages to ensure user/assistant are alternating, if there's either 2 consecutive 'user' messages or 2 consecutive 'assistant' message, merge them.
@@ -1354,6 +1360,8 @@ def anthropic_messages_pt(  # noqa: PLR0915
     5. System messages are a separate param to the Messages API
     6. Ensure we only accept role, content. (message.name is not supported)
     """
+    # fetch all image urls in parallel, before converting them one by one
+    prefetch_image_urls(messages=messages)
     # add role=tool support to allow function call result/error submission
     user_message_types = {"user", "tool", "function"}
     # reformat messages to ensure user/assistant are alternating, if there's either 2 consecutive 'user' messages or 2 consecutive 'assistant' message, merge them.
@@ -2173,23 +2181,16 @@ from litellm.types.llms.bedrock import ToolUseBlock as BedrockToolUseBlock
 
 def get_image_details(image_url) -> Tuple[str, str]:
     try:
-        import base64
-
-        client = HTTPHandler(concurrent_limit=1)
-        # Send a GET request to the image URL
-        response = client.get(image_url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        # fetched + base64-encoded once, then read from the image cache
+        data_url = convert_url_to_base64(url=image_url)
+        content_type, base64_bytes = data_url.split("data:")[1].split(";base64,")
 
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
-        if not content_type or "image" not in content_type:
+        if "image" not in content_type:
             raise ValueError(
                 f"URL does not point to a valid image (content-type: {content_type})"
             )
 
-        # Convert the image content to base64 bytes
-        base64_bytes = base64.b64encode(response.content).decode("utf-8")
-
         # Get mime-type
         mime_type = content_type.split("/")[
             1
@@ -2428,6 +2429,9 @@ def _bedrock_converse_messages_pt(  # noqa: PLR0915
             llm_provider=llm_provider,
         )
 
+    # fetch all image urls in parallel, before converting them one by one
+    prefetch_image_urls(messages=messages)
+
     # if initial message is assistant message
     if messages[0].get("role") is not None and messages[0]["role"] == "assistant":
         if user_continue_message is not None:
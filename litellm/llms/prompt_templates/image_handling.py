@@ -3,20 +3,160 @@ Helper functions to handle images passed in messages
 """
 
 import base64
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 
 from httpx import Response
 
 import litellm
 from litellm import verbose_logger
-from litellm.caching.caching import InMemoryCache
 from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
 
-MAX_IMGS_IN_MEMORY = 10
+MAX_URLS_IN_MEMORY = 10000
+MAX_PARALLEL_IMAGE_FETCHES = 8
 
-in_memory_cache = InMemoryCache(max_size_in_memory=MAX_IMGS_IN_MEMORY)
+
+class MediaCache:
+    """
+    Bounded-bytes LRU cache of fetched images, as base64 data urls - `data:image/png;base64,...`
+
+    - keyed by url -> content hash. The same image under different urls is encoded + stored once
+    - url -> content hash entries expire after `url_ttl` seconds, so a url serving a new image is re-fetched. The content-addressed data urls don't expire
+    - `max_bytes` bounds the in-memory data urls. The least recently used images are evicted first
+    - optional disk tier (`cache_dir`, requires `pip install diskcache`) - checked on an in-memory miss, survives restarts and is shared across workers
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        url_ttl: Optional[float] = None,
+    ):
+        # None = read `litellm.media_cache_max_bytes` / `litellm.media_cache_dir` / `litellm.media_cache_url_ttl` on use, so they can be set after import
+        self._max_bytes = max_bytes
+        self._cache_dir = cache_dir
+        self._url_ttl = url_ttl
+        self.current_bytes = 0
+        # url -> (content hash, expiry timestamp)
+        self.url_to_content_hash: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.content_hash_to_data_url: "OrderedDict[str, str]" = OrderedDict()
+        # sync calls convert images on the prefetch thread pool
+        self.lock = threading.Lock()
+        self._disk_cache: Optional[Any] = None
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return litellm.media_cache_max_bytes
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        if self._cache_dir is not None:
+            return self._cache_dir
+        return litellm.media_cache_dir
+
+    @property
+    def url_ttl(self) -> float:
+        if self._url_ttl is not None:
+            return self._url_ttl
+        return litellm.media_cache_url_ttl
+
+    @property
+    def disk_cache(self) -> Optional[Any]:
+        if self.cache_dir is None:
+            return None
+        if self._disk_cache is None:
+            import diskcache as dc
+
+            self._disk_cache = dc.Cache(self.cache_dir)
+        return self._disk_cache
+
+    def get(self, url: str) -> Optional[str]:
+        with self.lock:
+            url_entry = self.url_to_content_hash.get(url)
+            if url_entry is not None:
+                content_hash, expires_at = url_entry
+                if time.time() >= expires_at:
+                    self.url_to_content_hash.pop(url, None)
+                else:
+                    data_url = self.content_hash_to_data_url.get(content_hash)
+                    if data_url is not None:
+                        self.url_to_content_hash.move_to_end(url)
+                        self.content_hash_to_data_url.move_to_end(content_hash)
+                        return data_url
+        disk_cache = self.disk_cache
+        if disk_cache is None:
+            return None
+        content_hash, expires_at = disk_cache.get("url:" + url, expire_time=True)
+        if content_hash is None:
+            return None
+        data_url = disk_cache.get("content:" + content_hash)
+        if data_url is None:
+            return None
+        # keep the disk entry's expiry, so the url isn't cached for longer than `url_ttl`
+        self._set_in_memory(
+            url=url, content_hash=content_hash, data_url=data_url, expires_at=expires_at
+        )
+        return data_url
+
+    def set(self, url: str, content: bytes, media_type: str) -> str:
+        """
+        Returns the data url for the image - only base64-encoded if the content is not cached yet
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        with self.lock:
+            data_url = self.content_hash_to_data_url.get(content_hash)
+        if data_url is None:
+            data_url = "data:{};base64,{}".format(
+                media_type, base64.b64encode(content).decode("utf-8")
+            )
+        self._set_in_memory(url=url, content_hash=content_hash, data_url=data_url)
+        disk_cache = self.disk_cache
+        if disk_cache is not None:
+            disk_cache.set("content:" + content_hash, data_url)
+            disk_cache.set("url:" + url, content_hash, expire=self.url_ttl)
+        return data_url
+
+    def _set_in_memory(
+        self,
+        url: str,
+        content_hash: str,
+        data_url: str,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        if len(data_url) > self.max_bytes:
+            return
+        if expires_at is None:
+            expires_at = time.time() + self.url_ttl
+        with self.lock:
+            self.url_to_content_hash[url] = (content_hash, expires_at)
+            self.url_to_content_hash.move_to_end(url)
+            if len(self.url_to_content_hash) > MAX_URLS_IN_MEMORY:
+                self.url_to_content_hash.popitem(last=False)
+            if content_hash not in self.content_hash_to_data_url:
+                self.current_bytes += len(data_url)
+            self.content_hash_to_data_url[content_hash] = data_url
+            self.content_hash_to_data_url.move_to_end(content_hash)
+            while self.current_bytes > self.max_bytes:
+                _, evicted_data_url = self.content_hash_to_data_url.popitem(last=False)
+                self.current_bytes -= len(evicted_data_url)
+
+    def flush(self) -> None:
+        with self.lock:
+            self.url_to_content_hash.clear()
+            self.content_hash_to_data_url.clear()
+            self.current_bytes = 0
+
+
+media_cache = MediaCache()
 
 
 def _process_image_response(response: Response, url: str) -> str:
@@ -25,9 +165,6 @@ def _process_image_response(response: Response, url: str) -> str:
             f"Error: Unable to fetch image from URL. Status code: {response.status_code}, url={url}"
         )
 
-    image_bytes = response.content
-    base64_image = base64.b64encode(image_bytes).decode("utf-8")
-
     image_type = response.headers.get("Content-Type")
     if image_type is None:
         img_type = url.split(".")[-1].lower()
@@ -46,13 +183,11 @@ def _process_image_response(response: Response, url: str) -> str:
     else:
         img_type = image_type
 
-    result = f"data:{img_type};base64,{base64_image}"
-    in_memory_cache.set_cache(url, result)
-    return result
+    return media_cache.set(url=url, content=response.content, media_type=img_type)
 
 
 async def async_convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
+    cached_result = media_cache.get(url)
     if cached_result:
         return cached_result
 
@@ -69,7 +204,7 @@ async def async_convert_url_to_base64(url: str) -> str:
 
 
 def convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
+    cached_result = media_cache.get(url)
     if cached_result:
         return cached_result
 
@@ -85,3 +220,61 @@ def convert_url_to_base64(url: str) -> str:
     raise Exception(
         f"Error: Unable to fetch image from URL after 3 attempts. url={url}"
     )
+
+
+def _get_image_urls(messages: List[Any]) -> List[str]:
+    """
+    Unique http(s) image urls in the openai-format messages
+    """
+    image_urls: List[str] = []
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for element in content:
+            if not isinstance(element, dict) or element.get("type") != "image_url":
+                continue
+            image_url = element.get("image_url")
+            if isinstance(image_url, dict):
+                image_url = image_url.get("url")
+            if (
+                isinstance(image_url, str)
+                and image_url.startswith("http")
+                and image_url not in image_urls
+            ):
+                image_urls.append(image_url)
+    return image_urls
+
+
+_image_fetch_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _prefetch_image_url(url: str) -> None:
+    try:
+        convert_url_to_base64(url=url)
+    except Exception:
+        pass  # raised again when the message is converted
+
+
+def prefetch_image_urls(
+    messages: List[Any], should_fetch: Optional[Callable[[str], bool]] = None
+) -> None:
+    """
+    Fetch all the uncached image urls in the messages in parallel - the per-image conversion then reads them from `media_cache`
+
+    `should_fetch`: skip urls the provider takes as-is (e.g. gemini file uris)
+    """
+    global _image_fetch_executor
+
+    image_urls = [
+        url
+        for url in _get_image_urls(messages)
+        if (should_fetch is None or should_fetch(url)) and media_cache.get(url) is None
+    ]
+    if len(image_urls) < 2:
+        return
+    if _image_fetch_executor is None:
+        _image_fetch_executor = ThreadPoolExecutor(
+            max_workers=MAX_PARALLEL_IMAGE_FETCHES
+        )
+    list(_image_fetch_executor.map(_prefetch_image_url, image_urls))
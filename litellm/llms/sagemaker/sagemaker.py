@@ -566,7 +566,7 @@ class SagemakerLLM(BaseAWSLLM):
         try:
             if client is None:
                 client = get_async_httpx_client(
-                    llm_provider=litellm.LlmProviders.SAGEMAKER
+                    llm_provider=litellm.LlmProviders.SAGEMAKER, api_base=api_base
                 )  # Create a new client if none provided
             response = await client.post(
                 api_base,
@@ -672,9 +672,6 @@ class SagemakerLLM(BaseAWSLLM):
         model_id: Optional[str],
     ):
         timeout = 300.0
-        async_handler = get_async_httpx_client(
-            llm_provider=litellm.LlmProviders.SAGEMAKER
-        )
 
         async_transform_prompt = asyncify(self._transform_prompt)
 
@@ -694,6 +691,9 @@ class SagemakerLLM(BaseAWSLLM):
         }
 
         prepared_request = await asyncified_prepare_request(**prepared_request_args)
+        async_handler = get_async_httpx_client(
+            llm_provider=litellm.LlmProviders.SAGEMAKER, api_base=prepared_request.url
+        )
         ## LOGGING
         logging_obj.pre_call(
             input=[],
@@ -79,7 +79,8 @@ class TogetherAIRerank(BaseLLM):
         api_key: str,
     ) -> RerankResponse:
         client = get_async_httpx_client(
-            llm_provider=litellm.LlmProviders.TOGETHER_AI
+            llm_provider=litellm.LlmProviders.TOGETHER_AI,
+            api_base="https://api.together.xyz/v1/rerank",
         )  # Use async client
 
         response = await client.post(
@@ -19,6 +19,7 @@ from litellm.llms.prompt_templates.factory import (
     convert_to_gemini_tool_call_result,
     response_schema_prompt,
 )
+from litellm.llms.prompt_templates.image_handling import prefetch_image_urls
 from litellm.types.files import (
     get_file_mime_type_for_file_type,
     get_file_type_from_extension,
@@ -120,6 +121,12 @@ def _gemini_convert_messages_with_history(  # noqa: PLR0915
     - Roles must alternate b/w 'user' and 'model' (same as anthropic -> merge consecutive roles)
     - Please ensure that function response turn comes immediately after a function call turn
     """
+    # fetch the image urls gemini can't take as file uris in parallel, before converting them one by one
+    prefetch_image_urls(
+        messages=messages,
+        should_fetch=lambda url: "https://" in url
+        and _get_image_mime_type_from_url(url) is None,
+    )
     user_message_types = {"user", "system"}
     contents: List[ContentType] = []
 
@@ -1232,7 +1232,9 @@ class VertexLLM(VertexBase):
             _async_client_params["timeout"] = timeout
         if client is None or not isinstance(client, AsyncHTTPHandler):
             client = get_async_httpx_client(
-                params=_async_client_params, llm_provider=litellm.LlmProviders.VERTEX_AI
+                params=_async_client_params,
+                llm_provider=litellm.LlmProviders.VERTEX_AI,
+                api_base=api_base,
             )
         else:
             client = client  # type: ignore
@@ -187,7 +187,7 @@ class VertexTextToSpeechAPI(VertexLLM):
         import base64
 
         async_handler = get_async_httpx_client(
-            llm_provider=litellm.LlmProviders.VERTEX_AI
+            llm_provider=litellm.LlmProviders.VERTEX_AI, api_base=url
         )
 
         response = await async_handler.post(
@@ -80,9 +80,11 @@ from litellm.utils import (
     validate_chat_completion_user_messages,
 )
 
-from ._logging import verbose_logger
+from ._logging import _format_log_message, verbose_logger
 from .caching.caching import disable_cache, enable_cache, update_cache
-from .litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from .litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingResponseAccumulator,
+)
 from .llms import (
     aleph_alpha,
     baseten,
@@ -507,11 +509,11 @@ async def acompletion(
 
 async def _async_streaming(response, model, custom_llm_provider, args):
     try:
-        print_verbose(f"received response in _async_streaming: {response}")
+        print_verbose("received response in _async_streaming: %s", response)
         if asyncio.iscoroutine(response):
             response = await response
         async for line in response:
-            print_verbose(f"line in async streaming: {line}")
+            print_verbose("line in async streaming: %s", line)
             yield line
     except Exception as e:
         custom_llm_provider = custom_llm_provider or "openai"
@@ -5250,11 +5252,16 @@ async def ahealth_check(  # noqa: PLR0915
 
 ####### HELPER FUNCTIONS ################
 ## Set verbose to true -> ```litellm.set_verbose = True```
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """
+    `print_statement` can be a %-style format string, e.g. `print_verbose("response: %s", response)`.
+
+    `args` are only formatted if the message is logged / printed.
+    """
     try:
-        verbose_logger.debug(print_statement)
+        verbose_logger.debug(print_statement, *args)
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(_format_log_message(print_statement, args))  # noqa
     except Exception:
         pass
 
@@ -5273,80 +5280,23 @@ def config_completion(**kwargs):
 def stream_chunk_builder_text_completion(
     chunks: list, messages: Optional[List] = None
 ) -> TextCompletionResponse:
-    id = chunks[0]["id"]
-    object = chunks[0]["object"]
-    created = chunks[0]["created"]
-    model = chunks[0]["model"]
-    system_fingerprint = chunks[0].get("system_fingerprint", None)
-    finish_reason = chunks[-1]["choices"][0]["finish_reason"]
-    logprobs = chunks[-1]["choices"][0]["logprobs"]
-
-    response = {
-        "id": id,
-        "object": object,
-        "created": created,
-        "model": model,
-        "system_fingerprint": system_fingerprint,
-        "choices": [
-            {
-                "text": None,
-                "index": 0,
-                "logprobs": logprobs,
-                "finish_reason": finish_reason,
-            }
-        ],
-        "usage": {
-            "prompt_tokens": None,
-            "completion_tokens": None,
-            "total_tokens": None,
-        },
-    }
-    content_list = []
+    accumulator = StreamingResponseAccumulator(reorder_window=0)
     for chunk in chunks:
-        choices = chunk["choices"]
-        for choice in choices:
-            if (
-                choice is not None
-                and hasattr(choice, "text")
-                and choice.get("text") is not None
-            ):
-                _choice = choice.get("text")
-                content_list.append(_choice)
-
-    # Combine the "content" strings into a single string || combine the 'function' strings into a single string
-    combined_content = "".join(content_list)
+        accumulator.add_chunk(chunk)
+    return cast(TextCompletionResponse, accumulator.build(messages=messages))
 
-    # Update the "content" field within the response dictionary
-    response["choices"][0]["text"] = combined_content
 
-    if len(combined_content) > 0:
-        pass
-    else:
-        pass
-    # # Update usage information if needed
-    try:
-        response["usage"]["prompt_tokens"] = token_counter(
-            model=model, messages=messages
-        )
-    except (
-        Exception
-    ):  # don't allow this failing to block a complete streaming response from being returned
-        print_verbose("token_counter failed, assuming prompt tokens is 0")
-        response["usage"]["prompt_tokens"] = 0
-    response["usage"]["completion_tokens"] = token_counter(
-        model=model,
-        text=combined_content,
-        count_response_tokens=True,  # count_response_tokens is a Flag to tell token counter this is a response, No need to add extra tokens we do for input messages
-    )
-    response["usage"]["total_tokens"] = (
-        response["usage"]["prompt_tokens"] + response["usage"]["completion_tokens"]
-    )
-    return TextCompletionResponse(**response)
-
-
-def stream_chunk_builder(  # noqa: PLR0915
-    chunks: list, messages: Optional[list] = None, start_time=None, end_time=None
+def stream_chunk_builder(
+    chunks: Union[list, StreamingResponseAccumulator],
+    messages: Optional[list] = None,
+    start_time=None,
+    end_time=None,
 ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+    """
+    Build the complete response of a stream
+
+    `chunks` is either the list of chunks, or a `StreamingResponseAccumulator` the chunks were added to while streaming
+    """
     try:
         if chunks is None:
             raise litellm.APIError(
@@ -5355,93 +5305,20 @@ def stream_chunk_builder(  # noqa: PLR0915
                 llm_provider="",
                 model="",
             )
+        if isinstance(chunks, StreamingResponseAccumulator):
+            return chunks.build(messages=messages)
         if not chunks:
             return None
 
-        processor = ChunkProcessor(chunks, messages)
-        chunks = processor.chunks
-
-        ### BASE-CASE ###
-        if len(chunks) == 0:
-            return None
-        ## Route to the text completion logic
-        if isinstance(
-            chunks[0]["choices"][0], litellm.utils.TextChoices
-        ):  # route to the text completion logic
-            return stream_chunk_builder_text_completion(
-                chunks=chunks, messages=messages
-            )
-
-        model = chunks[0]["model"]
-        # Initialize the response dictionary
-        response = processor.build_base_response(chunks)
-
-        tool_call_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "tool_calls" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["tool_calls"] is not None
-        ]
-
-        if len(tool_call_chunks) > 0:
-            tool_calls_list = processor.get_combined_tool_content(tool_call_chunks)
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.content = None
-            _choice.message.tool_calls = tool_calls_list
-
-        function_call_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "function_call" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["function_call"] is not None
-        ]
-
-        if len(function_call_chunks) > 0:
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.content = None
-            _choice.message.function_call = (
-                processor.get_combined_function_call_content(function_call_chunks)
-            )
-
-        content_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "content" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["content"] is not None
-        ]
-
-        if len(content_chunks) > 0:
-            response["choices"][0]["message"]["content"] = (
-                processor.get_combined_content(content_chunks)
+        # a list is sorted as a whole - no need to buffer chunks
+        accumulator = StreamingResponseAccumulator(reorder_window=0)
+        if chunks[0]._hidden_params.get("created_at"):
+            chunks = sorted(
+                chunks, key=lambda x: x._hidden_params.get("created_at", float("inf"))
             )
-
-        audio_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "audio" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["audio"] is not None
-        ]
-
-        if len(audio_chunks) > 0:
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.audio = processor.get_combined_audio_content(audio_chunks)
-
-        completion_output = get_content_from_model_response(response)
-
-        usage = processor.calculate_usage(
-            chunks=chunks,
-            model=model,
-            completion_output=completion_output,
-            messages=messages,
-        )
-
-        setattr(response, "usage", usage)
-
-        return response
+        for chunk in chunks:
+            accumulator.add_chunk(chunk)
+        return accumulator.build(messages=messages)
     except Exception as e:
         verbose_logger.exception(
             "litellm.main.py::stream_chunk_builder() - Exception occurred - {}".format(
@@ -5,9 +5,27 @@ import sys
 import uuid
 from dataclasses import fields
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Extra, Field, Json, model_validator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Extra,
+    Field,
+    Json,
+    PrivateAttr,
+    model_validator,
+)
 from typing_extensions import Annotated, TypedDict
 
 from litellm.types.integrations.slack_alerting import AlertType
@@ -270,7 +288,11 @@ class LiteLLMRoutes(enum.Enum):
     ]
 
     # NOTE: ROUTES ONLY FOR MASTER KEY - only the Master Key should be able to Reset Spend
-    master_key_only_routes = ["/global/spend/reset", "/key/list"]
+    master_key_only_routes = [
+        "/global/spend/reset",
+        "/global/spend/rollups/backfill",
+        "/key/list",
+    ]
 
     sso_only_routes = [
         "/sso/get/ui_settings",
@@ -1414,6 +1436,11 @@ class UserAPIKeyAuth(
     user_tpm_limit: Optional[int] = None
     user_rpm_limit: Optional[int] = None
 
+    # (router access group index version, models list it was expanded into, allowed models) - see `auth_checks._get_key_allowed_models`
+    _allowed_models_cache: Optional[Tuple[Optional[int], List[str], FrozenSet[str]]] = (
+        PrivateAttr(default=None)
+    )
+
     @model_validator(mode="before")
     @classmethod
     def check_api_key(cls, values):
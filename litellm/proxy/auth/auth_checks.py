@@ -11,7 +11,7 @@ Run checks for:
 import time
 import traceback
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Literal, Optional
 
 import httpx
 from pydantic import BaseModel
@@ -31,6 +31,7 @@ from litellm.proxy._types import (
     LitellmUserRoles,
     UserAPIKeyAuth,
 )
+from litellm.proxy.auth.key_lookup import virtual_key_lookup
 from litellm.proxy.auth.route_checks import RouteChecks
 from litellm.proxy.utils import PrismaClient, ProxyLogging, log_db_metrics
 from litellm.types.services import ServiceLoggerPayload, ServiceTypes
@@ -357,35 +358,19 @@ async def get_end_user_object(
 
 
 def model_in_access_group(model: str, team_models: Optional[List[str]]) -> bool:
-    from collections import defaultdict
-
     from litellm.proxy.proxy_server import llm_router
 
     if team_models is None:
         return True
     if model in team_models:
         return True
+    if llm_router is None:
+        return False
 
-    access_groups = defaultdict(list)
-    if llm_router:
-        access_groups = llm_router.get_model_access_groups()
-
-    models_in_current_access_groups = []
-    if len(access_groups) > 0:  # check if token contains any model access groups
-        for idx, m in enumerate(
-            team_models
-        ):  # loop token models, if any of them are an access group add the access group
-            if m in access_groups:
-                # if it is an access group we need to remove it from valid_token.models
-                models_in_group = access_groups[m]
-                models_in_current_access_groups.extend(models_in_group)
-
-    # Filter out models that are access_groups
-    filtered_models = [m for m in team_models if m not in access_groups]
-    filtered_models += models_in_current_access_groups
-
-    if model in filtered_models:
-        return True
+    access_groups = llm_router.get_model_access_groups_index()
+    for team_model in team_models:
+        if team_model in access_groups and model in access_groups[team_model]:
+            return True
     return False
 
 
@@ -554,6 +539,7 @@ async def _delete_cache_key_object(
     key = hashed_token
 
     user_api_key_cache.delete_cache(key=key)
+    virtual_key_lookup.invalidate(hashed_token=hashed_token)
 
     ## UPDATE REDIS CACHE ##
     if proxy_logging_obj is not None:
@@ -684,10 +670,39 @@ async def get_key_object(
         key=key
     )
 
+    async def _fetch_key_object() -> Optional[UserAPIKeyAuth]:
+        _valid_token: Optional[BaseModel] = await prisma_client.get_data(  # type: ignore
+            token=hashed_token,
+            table_name="combined_view",
+            parent_otel_span=parent_otel_span,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+        if _valid_token is None:
+            return None
+        return UserAPIKeyAuth(**_valid_token.model_dump(exclude_none=True))
+
+    async def _save_key_object_to_cache(key_obj: UserAPIKeyAuth) -> None:
+        await _cache_key_object(
+            hashed_token=hashed_token,
+            user_api_key_obj=key_obj,
+            user_api_key_cache=user_api_key_cache,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+
     if cached_key_obj is not None:
         if isinstance(cached_key_obj, dict):
-            return UserAPIKeyAuth(**cached_key_obj)
-        elif isinstance(cached_key_obj, UserAPIKeyAuth):
+            cached_key_obj = UserAPIKeyAuth(**cached_key_obj)
+        if isinstance(cached_key_obj, UserAPIKeyAuth):
+            ## REFRESH AHEAD - re-read hot keys from the db before they expire from the cache
+            if virtual_key_lookup.should_refresh(
+                cached_key_obj=cached_key_obj,
+                cache_ttl=user_api_key_cache.default_in_memory_ttl,
+            ):
+                virtual_key_lookup.schedule_refresh(
+                    hashed_token=hashed_token,
+                    fetch_key=_fetch_key_object,
+                    cache_key=_save_key_object_to_cache,
+                )
             return cached_key_obj
 
     if check_cache_only:
@@ -697,26 +712,15 @@ async def get_key_object(
 
     # else, check db
     try:
-        _valid_token: Optional[BaseModel] = await prisma_client.get_data(
-            token=hashed_token,
-            table_name="combined_view",
-            parent_otel_span=parent_otel_span,
-            proxy_logging_obj=proxy_logging_obj,
+        _response = await virtual_key_lookup.get_or_fetch(
+            hashed_token=hashed_token,
+            fetch_key=_fetch_key_object,
+            cache_key=_save_key_object_to_cache,
         )
 
-        if _valid_token is None:
+        if _response is None:
             raise Exception
 
-        _response = UserAPIKeyAuth(**_valid_token.model_dump(exclude_none=True))
-
-        # save the key object to cache
-        await _cache_key_object(
-            hashed_token=hashed_token,
-            user_api_key_obj=_response,
-            user_api_key_cache=user_api_key_cache,
-            proxy_logging_obj=proxy_logging_obj,
-        )
-
         return _response
     except httpx.ConnectError as e:
         return await _handle_failed_db_connection_for_get_key_object(e=e)
@@ -822,49 +826,67 @@ async def can_key_call_model(
     if model in litellm.model_alias_map:
         model = litellm.model_alias_map[model]
 
-    ## check if model in allowed model names
-    verbose_proxy_logger.debug(
-        f"LLM Model List pre access group check: {llm_model_list}"
-    )
-    from collections import defaultdict
-
     from litellm.proxy.proxy_server import llm_router
 
-    access_groups = defaultdict(list)
-    if llm_router:
-        access_groups = llm_router.get_model_access_groups()
-
-    models_in_current_access_groups = []
-    if len(access_groups) > 0:  # check if token contains any model access groups
-        for idx, m in enumerate(
-            valid_token.models
-        ):  # loop token models, if any of them are an access group add the access group
-            if m in access_groups:
-                # if it is an access group we need to remove it from valid_token.models
-                models_in_group = access_groups[m]
-                models_in_current_access_groups.extend(models_in_group)
-
-    # Filter out models that are access_groups
-    filtered_models = [m for m in valid_token.models if m not in access_groups]
-
-    filtered_models += models_in_current_access_groups
-    verbose_proxy_logger.debug(f"model: {model}; allowed_models: {filtered_models}")
+    allowed_models = _get_key_allowed_models(
+        valid_token=valid_token, llm_router=llm_router
+    )
+    verbose_proxy_logger.debug(
+        "model: %s; allowed_models: %s", model, valid_token.models
+    )
 
     all_model_access: bool = False
 
     if (
-        len(filtered_models) == 0
-        or "*" in filtered_models
-        or "openai/*" in filtered_models
+        len(allowed_models) == 0
+        or "*" in allowed_models
+        or "openai/*" in allowed_models
     ):
         all_model_access = True
 
-    if model is not None and model not in filtered_models and all_model_access is False:
+    if model is not None and model not in allowed_models and all_model_access is False:
         raise ValueError(
             f"API Key not allowed to access model. This token can only access models={valid_token.models}. Tried to access {model}"
         )
+    return True
+
+
+def _get_key_allowed_models(
+    valid_token: UserAPIKeyAuth, llm_router: Optional[litellm.Router]
+) -> FrozenSet[str]:
+    """
+    Returns the models a key can call, with the access groups in `valid_token.models` expanded into their models.
+
+    Sets `valid_token.models` to the expanded list.
+    The result is cached on the key object, until its models or the router's deployments change.
+    """
+    index_version: Optional[int] = None
+    access_groups: Dict[str, FrozenSet[str]] = {}
+    if llm_router is not None:
+        index_version = llm_router.model_access_groups_index_version
+
+    cached = valid_token._allowed_models_cache
+    if (
+        cached is not None
+        and cached[0] == index_version
+        and cached[1] is valid_token.models
+    ):
+        return cached[2]
+
+    if llm_router is not None:
+        access_groups = llm_router.get_model_access_groups_index()
+
+    # Filter out models that are access_groups, add the models in those access groups
+    filtered_models = [m for m in valid_token.models if m not in access_groups]
+    for m in valid_token.models:
+        if m in access_groups:
+            filtered_models.extend(sorted(access_groups[m]))
+
     valid_token.models = filtered_models
-    verbose_proxy_logger.debug(
-        f"filtered allowed_models: {filtered_models}; valid_token.models: {valid_token.models}"
+    allowed_models = frozenset(filtered_models)
+    valid_token._allowed_models_cache = (
+        index_version,
+        valid_token.models,
+        allowed_models,
     )
-    return True
+    return allowed_models
@@ -0,0 +1,164 @@
+"""
+Lookup layer for Virtual Keys read from the LiteLLM DB
+
+Sits between the user_api_key_cache and `prisma_client.get_data(table_name="combined_view")`:
+
+1. Negative cache - hashed tokens that don't exist in the DB are remembered for a short TTL, so repeated bad keys never reach the DB
+2. Single flight - concurrent cache misses for the same hashed token share one DB query
+3. Refresh ahead - keys read close to their cache expiry are refreshed in the background, so hot keys never miss the cache
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.proxy._types import UserAPIKeyAuth
+
+FetchKeyFn = Callable[[], Awaitable[Optional[UserAPIKeyAuth]]]
+CacheKeyFn = Callable[[UserAPIKeyAuth], Awaitable[None]]
+
+
+class VirtualKeyLookup:
+    def __init__(
+        self,
+        negative_cache_ttl: float = 5,
+        refresh_ahead_window: float = 10,
+        max_negative_cache_size: int = 10000,
+    ):
+        """
+        Args:
+            negative_cache_ttl: seconds to remember that a hashed token doesn't exist in the DB
+            refresh_ahead_window: refresh a cached key in the background when it is read within this many seconds of its cache expiry
+            max_negative_cache_size: max number of missing hashed tokens to remember
+        """
+        self.negative_cache_ttl = negative_cache_ttl
+        self.refresh_ahead_window = refresh_ahead_window
+        # hashed_token -> time the negative cache entry expires
+        self.negative_cache = LimitedSizeOrderedDict(max_size=max_negative_cache_size)
+        # hashed_token -> DB query currently running for it
+        self.in_flight: Dict[str, asyncio.Task] = {}
+        # hashed_token -> value of `self.invalidation_count` when it was last invalidated
+        self.last_invalidated = LimitedSizeOrderedDict(max_size=max_negative_cache_size)
+        self.invalidation_count = 0
+
+    def is_known_missing(self, hashed_token: str) -> bool:
+        expires_at = self.negative_cache.get(hashed_token)
+        if expires_at is None:
+            return False
+        if time.time() >= expires_at:
+            self.negative_cache.pop(hashed_token, None)
+            return False
+        return True
+
+    def invalidate(self, hashed_token: str) -> None:
+        """
+        Forget everything known about a hashed token.
+
+        Call this when a key is created, updated or deleted. Any DB query already running for the key will not write its result to the cache.
+        """
+        self.negative_cache.pop(hashed_token, None)
+        self.in_flight.pop(hashed_token, None)
+        self.invalidation_count += 1
+        self.last_invalidated[hashed_token] = self.invalidation_count
+
+    def should_refresh(
+        self, cached_key_obj: UserAPIKeyAuth, cache_ttl: Optional[float]
+    ) -> bool:
+        if cache_ttl is None or cached_key_obj.last_refreshed_at is None:
+            return False
+        cache_age = time.time() - cached_key_obj.last_refreshed_at
+        return cache_age >= cache_ttl - self.refresh_ahead_window
+
+    async def get_or_fetch(
+        self,
+        hashed_token: str,
+        fetch_key: FetchKeyFn,
+        cache_key: CacheKeyFn,
+    ) -> Optional[UserAPIKeyAuth]:
+        """
+        Returns the key object for `hashed_token`, or None if it doesn't exist in the DB.
+
+        Concurrent calls for the same hashed token wait on the same `fetch_key()` call.
+        """
+        if self.is_known_missing(hashed_token):
+            return None
+
+        task = self.in_flight.get(hashed_token)
+        if task is None:
+            task = self._start_fetch(
+                hashed_token=hashed_token, fetch_key=fetch_key, cache_key=cache_key
+            )
+        # shield - a cancelled caller should not cancel the query other callers are waiting on
+        return await asyncio.shield(task)
+
+    def schedule_refresh(
+        self,
+        hashed_token: str,
+        fetch_key: FetchKeyFn,
+        cache_key: CacheKeyFn,
+    ) -> None:
+        """
+        Refresh a cached key in the background. No-op if a query for this key is already running.
+        """
+        if hashed_token in self.in_flight:
+            return
+        self._start_fetch(
+            hashed_token=hashed_token, fetch_key=fetch_key, cache_key=cache_key
+        )
+
+    def _start_fetch(
+        self,
+        hashed_token: str,
+        fetch_key: FetchKeyFn,
+        cache_key: CacheKeyFn,
+    ) -> asyncio.Task:
+        task = asyncio.ensure_future(
+            self._fetch(
+                hashed_token=hashed_token,
+                fetch_key=fetch_key,
+                cache_key=cache_key,
+                invalidation_count=self.invalidation_count,
+            )
+        )
+        task.add_done_callback(self._on_fetch_done)
+        self.in_flight[hashed_token] = task
+        return task
+
+    async def _fetch(
+        self,
+        hashed_token: str,
+        fetch_key: FetchKeyFn,
+        cache_key: CacheKeyFn,
+        invalidation_count: int,
+    ) -> Optional[UserAPIKeyAuth]:
+        try:
+            key_obj = await fetch_key()
+            if self.last_invalidated.get(hashed_token, -1) > invalidation_count:
+                # key was created / updated / deleted while we were reading it - don't cache a stale result
+                return key_obj
+            if key_obj is None:
+                self.negative_cache[hashed_token] = (
+                    time.time() + self.negative_cache_ttl
+                )
+            else:
+                await cache_key(key_obj)
+            return key_obj
+        finally:
+            if self.in_flight.get(hashed_token) is asyncio.current_task():
+                self.in_flight.pop(hashed_token, None)
+
+    @staticmethod
+    def _on_fetch_done(task: asyncio.Task) -> None:
+        # retrieve the exception, so background refreshes with no waiters don't log 'Task exception was never retrieved'
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is not None:
+            verbose_proxy_logger.debug(
+                "VirtualKeyLookup: failed to read key from DB - %s", str(exception)
+            )
+
+
+virtual_key_lookup = VirtualKeyLookup()
@@ -114,6 +114,14 @@ async def memory_usage_in_mem_cache_items():
     }
 
 
+@router.get("/httpx-client-pool-stats", include_in_schema=False)
+async def httpx_client_pool_stats():
+    # returns connection pool stats for each shared async httpx client
+    from litellm.llms.custom_httpx.http_handler import async_http_client_registry
+
+    return {"clients": async_http_client_registry.get_pool_stats()}
+
+
 @router.get("/otel-spans", include_in_schema=False)
 async def get_otel_spans():
     from litellm.integrations.opentelemetry import OpenTelemetry
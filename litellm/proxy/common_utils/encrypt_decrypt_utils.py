@@ -1,5 +1,6 @@
 import base64
 import os
+from functools import lru_cache
 
 from litellm._logging import verbose_proxy_logger
 
@@ -60,18 +61,25 @@ def decrypt_value_helper(value: str):
         pass
 
 
-def encrypt_value(value: str, signing_key: str):
+@lru_cache(maxsize=8)
+def _get_secret_box(signing_key: str):
+    """
+    SecretBox for the signing key - cached, so the key isn't re-derived for every value encrypted / decrypted
+    """
     import hashlib
 
     import nacl.secret
-    import nacl.utils
 
     # get 32 byte master key #
     hash_object = hashlib.sha256(signing_key.encode())
     hash_bytes = hash_object.digest()
 
     # initialize secret box #
-    box = nacl.secret.SecretBox(hash_bytes)
+    return nacl.secret.SecretBox(hash_bytes)
+
+
+def encrypt_value(value: str, signing_key: str):
+    box = _get_secret_box(signing_key)
 
     # encode message #
     value_bytes = value.encode("utf-8")
@@ -82,17 +90,7 @@ def encrypt_value(value: str, signing_key: str):
 
 
 def decrypt_value(value: bytes, signing_key: str) -> str:
-    import hashlib
-
-    import nacl.secret
-    import nacl.utils
-
-    # get 32 byte master key #
-    hash_object = hashlib.sha256(signing_key.encode())
-    hash_bytes = hash_object.digest()
-
-    # initialize secret box #
-    box = nacl.secret.SecretBox(hash_bytes)
+    box = _get_secret_box(signing_key)
 
     # Convert the bytes object to a string
     plaintext = box.decrypt(value)
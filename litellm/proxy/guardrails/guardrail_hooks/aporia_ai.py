@@ -45,6 +45,8 @@ GUARDRAIL_NAME = "aporia"
 
 
 class AporiaGuardrail(CustomGuardrail):
+    read_only = True
+
     def __init__(
         self, api_key: Optional[str] = None, api_base: Optional[str] = None, **kwargs
     ):
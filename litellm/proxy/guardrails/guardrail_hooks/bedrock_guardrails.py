@@ -50,6 +50,8 @@ GUARDRAIL_NAME = "bedrock"
 
 
 class BedrockGuardrail(CustomGuardrail, BaseAWSLLM):
+    read_only = True
+
     def __init__(
         self,
         guardrailIdentifier: Optional[str] = None,
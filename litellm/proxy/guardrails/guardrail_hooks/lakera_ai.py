@@ -46,6 +46,8 @@ INPUT_POSITIONING_MAP = {
 
 
 class lakeraAI_Moderation(CustomGuardrail):
+    read_only = True
+
     def __init__(
         self,
         moderation_check: Literal["pre_call", "in_parallel"] = "in_parallel",
@@ -30,6 +30,7 @@ from litellm.proxy.auth.auth_checks import (
     _delete_cache_key_object,
     get_key_object,
 )
+from litellm.proxy.auth.key_lookup import virtual_key_lookup
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.management_helpers.utils import management_endpoint_wrapper
 from litellm.proxy.utils import _duration_in_seconds, _hash_token_if_needed
@@ -587,6 +588,7 @@ async def delete_key_fn(
             # remove hash token from cache
             hashed_token = hash_token(key)
             user_api_key_cache.delete_cache(hashed_token)
+            virtual_key_lookup.invalidate(hashed_token=hashed_token)
 
         verbose_proxy_logger.debug(
             f"/keys/delete - cache after delete: {user_api_key_cache.in_memory_cache.cache_dict}"
@@ -1006,6 +1008,7 @@ async def generate_key_helper_fn(  # noqa: PLR0915
             create_key_response = await prisma_client.insert_data(
                 data=key_data, table_name="key"
             )
+            virtual_key_lookup.invalidate(hashed_token=_hash_token_if_needed(token))
             key_data["token_id"] = getattr(create_key_response, "token", None)
     except Exception as e:
         verbose_proxy_logger.error(
@@ -1356,6 +1359,7 @@ async def block_key(
     record = await prisma_client.db.litellm_verificationtoken.update(
         where={"token": hashed_token}, data={"blocked": True}  # type: ignore
     )
+    virtual_key_lookup.invalidate(hashed_token=hashed_token)
 
     ## UPDATE KEY CACHE
 
@@ -1448,6 +1452,7 @@ async def unblock_key(
     record = await prisma_client.db.litellm_verificationtoken.update(
         where={"token": hashed_token}, data={"blocked": False}  # type: ignore
     )
+    virtual_key_lookup.invalidate(hashed_token=hashed_token)
 
     ## UPDATE KEY CACHE
 
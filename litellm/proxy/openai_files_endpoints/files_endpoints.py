@@ -8,7 +8,7 @@
 import asyncio
 import traceback
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import IO, List, Optional
 
 import fastapi
 import httpx
@@ -24,10 +24,12 @@ from fastapi import (
     UploadFile,
     status,
 )
+from fastapi.responses import FileResponse
 
 import litellm
 from litellm import CreateFileRequest, FileContentRequest, get_secret_str
 from litellm._logging import verbose_proxy_logger
+from litellm.batches.local_batch_engine import local_batch_engine
 from litellm.batches.main import FileObject
 from litellm.proxy._types import *
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
@@ -67,15 +69,15 @@ def get_files_provider_config(
     return None
 
 
-def get_first_json_object(file_content_bytes: bytes) -> Optional[dict]:
+def get_first_json_object_from_file(file: IO[bytes]) -> Optional[dict]:
+    """
+    Parse the first line of an uploaded file, without reading the rest of it
+    """
     try:
-        # Decode the bytes to a string and split into lines
-        file_content = file_content_bytes.decode("utf-8")
-        first_line = file_content.splitlines()[0].strip()
-
-        # Parse the JSON object from the first line
-        json_object = json.loads(first_line)
-        return json_object
+        file.seek(0)
+        first_line = file.readline().strip()
+        file.seek(0)
+        return json.loads(first_line)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
@@ -155,9 +157,6 @@ async def create_file(
     try:
         if provider is not None:
             custom_llm_provider = provider
-        # Use orjson to parse JSON data, orjson speeds up requests significantly
-        # Read the file content
-        file_content = await file.read()
         # Prepare the data for forwarding
 
         data = {"purpose": purpose}
@@ -173,13 +172,14 @@ async def create_file(
         )
 
         # Prepare the file data according to FileTypes
-        file_data = (file.filename, file_content, file.content_type)
+        # pass the uploaded file object (spooled to disk by starlette for large uploads), so it's streamed to the provider instead of read into memory
+        file_data = (file.filename, file.file, file.content_type)
 
         ## check if model is a loadbalanced model
         router_model: Optional[str] = None
         is_router_model = False
         if litellm.enable_loadbalancing_on_batch_endpoints is True:
-            json_obj = get_first_json_object(file_content_bytes=file_content)
+            json_obj = get_first_json_object_from_file(file=file.file)
             if json_obj:
                 router_model = get_model_from_json_obj(json_object=json_obj)
                 is_router_model = is_known_model(
@@ -204,6 +204,11 @@ async def create_file(
             response = await llm_router.acreate_file(
                 model=router_model, **_create_file_request
             )
+        elif custom_llm_provider == "local":
+            # input file for a batch run on the proxy
+            response = await local_batch_engine.acreate_file(
+                file=file.file, purpose=purpose, filename=file.filename or ""
+            )
         else:
             # get configs for custom_llm_provider
             llm_provider_config = get_files_provider_config(
@@ -671,6 +676,11 @@ async def get_file_content(
             proxy_config=proxy_config,
         )
 
+        if provider == "local":
+            return FileResponse(
+                path=local_batch_engine.get_file_path(file_id),
+                media_type="application/jsonl",
+            )
         if provider is None:
             provider = "openai"
         response = await litellm.afile_content(
@@ -799,6 +799,15 @@ def run_server(  # noqa: PLR0915
                 gunicorn_options["certfile"] = ssl_certfile_path
                 gunicorn_options["keyfile"] = ssl_keyfile_path
 
+            from litellm.integrations.prometheus_helpers.multiprocess import (
+                is_prometheus_multiprocess_mode,
+                prometheus_child_exit,
+            )
+
+            if is_prometheus_multiprocess_mode():
+                # drop the live gauge values of exited workers from /metrics
+                gunicorn_options["child_exit"] = prometheus_child_exit
+
             StandaloneApplication(
                 app=app, options=gunicorn_options
             ).run()  # Run gunicorn
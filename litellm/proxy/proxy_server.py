@@ -113,6 +113,7 @@ from litellm import (
     RetrieveBatchRequest,
 )
 from litellm._logging import verbose_proxy_logger, verbose_router_logger
+from litellm.batches.local_batch_engine import local_batch_engine
 from litellm.caching.caching import DualCache, RedisCache
 from litellm.exceptions import RejectedRequestError
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
@@ -120,6 +121,7 @@ from litellm.litellm_core_utils.core_helpers import (
     _get_parent_otel_span_from_kwargs,
     get_litellm_metadata_from_kwargs,
 )
+from litellm.llms.custom_httpx.http_handler import async_http_client_registry
 from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
 from litellm.proxy._types import *
 from litellm.proxy.analytics_endpoints.analytics_endpoints import (
@@ -1369,6 +1371,8 @@ class ProxyConfig:
 
     def __init__(self) -> None:
         self.config: Dict[str, Any] = {}
+        # db model_id -> updated_at, for the db models on the router. None until the first full sync
+        self.db_model_versions: Optional[Dict[str, str]] = None
 
     def is_yaml(self, config_file_path: str) -> bool:
         if not os.path.isfile(config_file_path):
@@ -1748,10 +1752,12 @@ class ProxyConfig:
                                 verbose_proxy_logger.debug(
                                     "Starting Prometheus Metrics on /metrics"
                                 )
-                                from prometheus_client import make_asgi_app
+                                from litellm.integrations.prometheus_helpers.multiprocess import (
+                                    get_metrics_asgi_app,
+                                )
 
                                 # Add prometheus asgi middleware to route /metrics requests
-                                metrics_app = make_asgi_app()
+                                metrics_app = get_metrics_asgi_app()
                                 app.mount("/metrics", metrics_app)
                     print(  # noqa
                         f"{blue_color_code} Initialized Success Callbacks - {litellm.success_callback} {reset_color_code}"
@@ -2192,11 +2198,34 @@ class ProxyConfig:
                 added_models += 1
         return added_models
 
+    def _delete_removed_db_deployments(self, deleted_model_ids: List[str]) -> int:
+        """
+        (Helper function of add deployment) -> for an incremental sync
+
+        Remove db models that were deleted from the db. db models are on the router with `model_info.id` = db model_id.
+
+        Return:
+        - int - returns number of deleted deployments
+        """
+        if llm_router is None:
+            return 0
+
+        deleted_deployments = 0
+        for model_id in deleted_model_ids:
+            if llm_router.delete_deployment(id=model_id) is not None:
+                deleted_deployments += 1
+        return deleted_deployments
+
     async def _update_llm_router(  # noqa: PLR0915
         self,
         new_models: list,
         proxy_logging_obj: ProxyLogging,
+        deleted_model_ids: Optional[List[str]] = None,
     ):
+        """
+        - new_models: all db models, or only the changed ones if `deleted_model_ids` is set
+        - deleted_model_ids: db model ids deleted since the last sync (incremental sync)
+        """
         global llm_router, llm_model_list, master_key, general_settings
         import base64
 
@@ -2236,6 +2265,17 @@ class ProxyConfig:
                         ),
                     )
                     verbose_proxy_logger.debug(f"updated llm_router: {llm_router}")
+            elif deleted_model_ids is not None:
+                verbose_proxy_logger.debug(
+                    "changed db models: %s, deleted db models: %s",
+                    len(new_models),
+                    len(deleted_model_ids),
+                )
+                ## DELETE MODEL LOGIC
+                self._delete_removed_db_deployments(deleted_model_ids=deleted_model_ids)
+
+                ## ADD MODEL LOGIC
+                self._add_deployment(db_models=new_models)
             else:
                 verbose_proxy_logger.debug(f"len new_models: {len(new_models)}")
                 ## DELETE MODEL LOGIC
@@ -2245,6 +2285,7 @@ class ProxyConfig:
                 self._add_deployment(db_models=new_models)
 
         except Exception as e:
+            self.db_model_versions = None
             verbose_proxy_logger.exception(
                 f"Error adding/deleting model to llm_router: {str(e)}"
             )
@@ -2426,15 +2467,26 @@ class ProxyConfig:
 
         return config
 
+    async def _get_db_model_versions(
+        self, prisma_client: PrismaClient
+    ) -> Dict[str, str]:
+        """
+        Returns {model_id: updated_at} for all db models - only reads 2 columns, so it's cheap to run on every sync
+        """
+        rows = await prisma_client.db.query_raw(
+            'SELECT model_id, updated_at FROM "LiteLLM_ProxyModelTable"'
+        )
+        return {row["model_id"]: str(row["updated_at"]) for row in rows}
+
     async def add_deployment(
         self,
         prisma_client: PrismaClient,
         proxy_logging_obj: ProxyLogging,
     ):
         """
-        - Check db for new models
-        - Check if model id's in router already
-        - If not, add to router
+        - Check db for new / updated / deleted models
+        - First run: load all db models
+        - After that: only fetch + decrypt + apply the models whose `updated_at` changed, and remove deleted ones
         """
         global llm_router, llm_model_list, master_key, general_settings
 
@@ -2444,17 +2496,49 @@ class ProxyConfig:
                     f"Master key is not initialized or formatted. master_key={master_key}"
                 )
             try:
-                new_models = await prisma_client.db.litellm_proxymodeltable.find_many()
+                # read before the models, so a model updated in between is picked up on the next sync
+                db_model_versions = await self._get_db_model_versions(
+                    prisma_client=prisma_client
+                )
+                if self.db_model_versions is None or llm_router is None:
+                    deleted_model_ids = None
+                    new_models = (
+                        await prisma_client.db.litellm_proxymodeltable.find_many()
+                    )
+                else:
+                    deleted_model_ids = [
+                        model_id
+                        for model_id in self.db_model_versions
+                        if model_id not in db_model_versions
+                    ]
+                    changed_model_ids = [
+                        model_id
+                        for model_id, updated_at in db_model_versions.items()
+                        if self.db_model_versions.get(model_id) != updated_at
+                    ]
+                    new_models = (
+                        await prisma_client.db.litellm_proxymodeltable.find_many(
+                            where={"model_id": {"in": changed_model_ids}}
+                        )
+                        if len(changed_model_ids) > 0
+                        else []
+                    )
             except Exception as e:
                 verbose_proxy_logger.exception(
                     "litellm.proxy_server.py::add_deployment() - Error getting new models from DB - {}".format(
                         str(e)
                     )
                 )
+                db_model_versions = None
+                deleted_model_ids = None
                 new_models = []
+            # changes are applied once - `_update_llm_router` resets this on failure, for a full sync on the next run
+            self.db_model_versions = db_model_versions
             # update llm router
             await self._update_llm_router(
-                new_models=new_models, proxy_logging_obj=proxy_logging_obj
+                new_models=new_models,
+                proxy_logging_obj=proxy_logging_obj,
+                deleted_model_ids=deleted_model_ids,
             )
 
             db_general_settings = await prisma_client.db.litellm_config.find_first(
@@ -3154,6 +3238,10 @@ async def startup_event():
     if prompt_injection_detection_obj is not None:  # [TODO] - REFACTOR THIS
         prompt_injection_detection_obj.update_environment(router=llm_router)
 
+    ## RESUME LOCAL BATCHES ## - batches run by the proxy ('local' provider) that were in progress when it stopped
+    if llm_router is not None and os.path.isdir(litellm.local_batch_storage_dir):
+        await local_batch_engine.resume(router=llm_router)
+
     verbose_proxy_logger.debug("prisma_client: %s", prisma_client)
     if prisma_client is not None and master_key is not None:
         ProxyStartupEvent._add_master_key_hash_to_db(
@@ -3337,15 +3425,16 @@ async def chat_completion(  # noqa: PLR0915
             data["model"] = litellm.model_alias_map[data["model"]]
 
         ### CALL HOOKS ### - modify/reject incoming data before calling the model
+        # set the call id before the hooks, so the hanging request check tracks the same id
+        litellm_call_id = request.headers.get("x-litellm-call-id", str(uuid.uuid4()))
+        data["litellm_call_id"] = litellm_call_id
         data = await proxy_logging_obj.pre_call_hook(  # type: ignore
             user_api_key_dict=user_api_key_dict, data=data, call_type="completion"
         )
 
         ## LOGGING OBJECT ## - initialize logging object for logging success/failure events for call
         ## IMPORTANT Note: - initialize this before running pre-call checks. Ensures we log rejected requests to langfuse.
-        data["litellm_call_id"] = request.headers.get(
-            "x-litellm-call-id", str(uuid.uuid4())
-        )
+        data["litellm_call_id"] = litellm_call_id
         logging_obj, data = litellm.utils.function_setup(
             original_function="acompletion",
             rules_obj=litellm.utils.Rules(),
@@ -5242,6 +5331,18 @@ async def create_batch(
                 )
 
             response = await llm_router.acreate_batch(**_create_batch_data)  # type: ignore
+        elif provider == "local":
+            # run the batch on the proxy, through the router
+            if llm_router is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "error": "LLM Router not initialized. Ensure models added to proxy."
+                    },
+                )
+            response = await local_batch_engine.acreate_batch(
+                router=llm_router, **_create_batch_data  # type: ignore
+            )
         else:
             if provider is None:
                 provider = "openai"
@@ -5348,7 +5449,11 @@ async def retrieve_batch(
             batch_id=batch_id,
         )
 
-        if litellm.enable_loadbalancing_on_batch_endpoints is True:
+        if provider == "local":
+            response = await local_batch_engine.aretrieve_batch(
+                **_retrieve_batch_request
+            )
+        elif litellm.enable_loadbalancing_on_batch_endpoints is True:
             if llm_router is None:
                 raise HTTPException(
                     status_code=500,
@@ -5457,6 +5562,8 @@ async def list_batches(
     global proxy_logging_obj
     verbose_proxy_logger.debug("GET /v1/batches after={} limit={}".format(after, limit))
     try:
+        if provider == "local":
+            return await local_batch_engine.alist_batches(after=after, limit=limit)
         if provider is None:
             provider = "openai"
         response = await litellm.alist_batches(
@@ -5513,6 +5620,94 @@ async def list_batches(
             )
 
 
+@router.post(
+    "/{provider}/v1/batches/{batch_id}/cancel",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+@router.post(
+    "/v1/batches/{batch_id}/cancel",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+@router.post(
+    "/batches/{batch_id}/cancel",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def cancel_batch(
+    fastapi_response: Response,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+    provider: Optional[str] = None,
+    batch_id: str = Path(
+        title="Batch ID to cancel", description="The ID of the batch to cancel"
+    ),
+):
+    """
+    Cancels a batch. Only supported for batches run by the proxy - provider='local'.
+    This is the equivalent of POST https://api.openai.com/v1/batches/{batch_id}/cancel
+    Supports Identical Params as: https://platform.openai.com/docs/api-reference/batch/cancel
+
+    Example Curl
+    ```
+    curl -X POST http://localhost:4000/local/v1/batches/batch_abc123/cancel \
+    -H "Authorization: Bearer sk-1234" \
+    -H "Content-Type: application/json" \
+
+    ```
+    """
+    global proxy_logging_obj
+    data: Dict = {"batch_id": batch_id}
+    try:
+        if provider != "local":
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "Cancelling batches is only supported for provider='local'. Got provider={}".format(
+                        provider
+                    )
+                },
+            )
+        _cancel_batch_request = CancelBatchRequest(batch_id=batch_id)
+        response = await local_batch_engine.acancel_batch(**_cancel_batch_request)
+
+        ### RESPONSE HEADERS ###
+        fastapi_response.headers.update(
+            get_custom_headers(
+                user_api_key_dict=user_api_key_dict,
+                version=version,
+                model_region=getattr(user_api_key_dict, "allowed_model_region", ""),
+                request_data=data,
+            )
+        )
+
+        return response
+    except Exception as e:
+        await proxy_logging_obj.post_call_failure_hook(
+            user_api_key_dict=user_api_key_dict, original_exception=e, request_data=data
+        )
+        verbose_proxy_logger.exception(
+            "litellm.proxy.proxy_server.cancel_batch(): Exception occured - {}".format(
+                str(e)
+            )
+        )
+        if isinstance(e, HTTPException):
+            raise ProxyException(
+                message=getattr(e, "message", str(e.detail)),
+                type=getattr(e, "type", "None"),
+                param=getattr(e, "param", "None"),
+                code=getattr(e, "status_code", status.HTTP_400_BAD_REQUEST),
+            )
+        else:
+            error_msg = f"{str(e)}"
+            raise ProxyException(
+                message=getattr(e, "message", error_msg),
+                type=getattr(e, "type", "None"),
+                param=getattr(e, "param", "None"),
+                code=getattr(e, "status_code", 500),
+            )
+
+
 ######################################################################
 
 #            END OF  /v1/batches Endpoints Implementation
@@ -9598,6 +9793,8 @@ async def shutdown_event():
     if db_writer_client is not None:
         await db_writer_client.close()
 
+    await async_http_client_registry.close()
+
     # flush remaining langfuse logs
     if "langfuse" in litellm.success_callback:
         try:
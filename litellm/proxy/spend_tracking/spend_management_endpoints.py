@@ -1,4 +1,5 @@
 #### SPEND MANAGEMENT #####
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
@@ -191,13 +192,14 @@ async def get_global_activity_internal_user(
 
     sql_query = """
     SELECT
-        date_trunc('day', "startTime") AS date,
-        COUNT(*) AS api_requests,
-        SUM(total_tokens) AS total_tokens
-    FROM "LiteLLM_SpendLogs"
-    WHERE "startTime" BETWEEN $1::date AND $2::date + interval '1 day'
+        period_start AS date,
+        SUM(api_requests)::bigint AS api_requests,
+        SUM(total_tokens)::bigint AS total_tokens
+    FROM "LiteLLM_DailySpendRollup"
+    WHERE period_start BETWEEN $1::date AND $2::date
+    AND request_tag = ''
     AND "user" = $3
-    GROUP BY date_trunc('day', "startTime")
+    GROUP BY period_start
     """
     db_response = await prisma_client.db.query_raw(
         sql_query, start_date, end_date, user_id
@@ -277,12 +279,13 @@ async def get_global_activity(
 
             sql_query = """
             SELECT
-                date_trunc('day', "startTime") AS date,
-                COUNT(*) AS api_requests,
-                SUM(total_tokens) AS total_tokens
-            FROM "LiteLLM_SpendLogs"
-            WHERE "startTime" BETWEEN $1::date AND $2::date + interval '1 day'
-            GROUP BY date_trunc('day', "startTime")
+                period_start AS date,
+                SUM(api_requests)::bigint AS api_requests,
+                SUM(total_tokens)::bigint AS total_tokens
+            FROM "LiteLLM_DailySpendRollup"
+            WHERE period_start BETWEEN $1::date AND $2::date
+            AND request_tag = ''
+            GROUP BY period_start
             """
             db_response = await prisma_client.db.query_raw(
                 sql_query, start_date_obj, end_date_obj
@@ -336,13 +339,14 @@ async def get_global_activity_model_internal_user(
     sql_query = """
     SELECT
         model_group,
-        date_trunc('day', "startTime") AS date,
-        COUNT(*) AS api_requests,
-        SUM(total_tokens) AS total_tokens
-    FROM "LiteLLM_SpendLogs"
-    WHERE "startTime" BETWEEN $1::date AND $2::date + interval '1 day'
+        period_start AS date,
+        SUM(api_requests)::bigint AS api_requests,
+        SUM(total_tokens)::bigint AS total_tokens
+    FROM "LiteLLM_DailySpendRollup"
+    WHERE period_start BETWEEN $1::date AND $2::date
+    AND request_tag = ''
     AND "user" = $3
-    GROUP BY model_group, date_trunc('day', "startTime")
+    GROUP BY model_group, period_start
     """
     db_response = await prisma_client.db.query_raw(
         sql_query, start_date, end_date, user_id
@@ -446,12 +450,13 @@ async def get_global_activity_model(
             sql_query = """
             SELECT
                 model_group,
-                date_trunc('day', "startTime") AS date,
-                COUNT(*) AS api_requests,
-                SUM(total_tokens) AS total_tokens
-            FROM "LiteLLM_SpendLogs"
-            WHERE "startTime" BETWEEN $1::date AND $2::date + interval '1 day'
-            GROUP BY model_group, date_trunc('day', "startTime")
+                period_start AS date,
+                SUM(api_requests)::bigint AS api_requests,
+                SUM(total_tokens)::bigint AS total_tokens
+            FROM "LiteLLM_DailySpendRollup"
+            WHERE period_start BETWEEN $1::date AND $2::date
+            AND request_tag = ''
+            GROUP BY model_group, period_start
             """
             db_response = await prisma_client.db.query_raw(
                 sql_query, start_date_obj, end_date_obj
@@ -842,8 +847,9 @@ async def get_global_spend_provider(
             SELECT
             model_id,
             SUM(spend) AS spend
-            FROM "LiteLLM_SpendLogs"
-            WHERE "startTime" BETWEEN $1::date AND $2::date 
+            FROM "LiteLLM_DailySpendRollup"
+            WHERE period_start >= $1::date AND period_start < $2::date
+            AND request_tag = ''
             AND length(model_id) > 0
             AND "user" = $3
             GROUP BY model_id
@@ -856,8 +862,10 @@ async def get_global_spend_provider(
             SELECT
             model_id,
             SUM(spend) AS spend
-            FROM "LiteLLM_SpendLogs"
-            WHERE "startTime" BETWEEN $1::date AND $2::date AND length(model_id) > 0
+            FROM "LiteLLM_DailySpendRollup"
+            WHERE period_start >= $1::date AND period_start < $2::date
+            AND request_tag = ''
+            AND length(model_id) > 0
             GROUP BY model_id
             """
             db_response = await prisma_client.db.query_raw(
@@ -997,9 +1005,10 @@ async def get_global_spend_report(
                         SUM(sl.prompt_tokens) AS model_input_tokens,
                         SUM(sl.completion_tokens) AS model_output_tokens
                     FROM
-                        "LiteLLM_SpendLogs" sl
+                        "LiteLLM_DailySpendRollup" sl
                     WHERE
-                        sl."startTime" BETWEEN $1::date AND $2::date AND sl.api_key = $3
+                        sl.period_start >= $1::date AND sl.period_start < $2::date
+                        AND sl.request_tag = '' AND sl.api_key = $3
                     GROUP BY
                         sl.api_key,
                         sl.model
@@ -1042,9 +1051,10 @@ async def get_global_spend_report(
                         SUM(sl.prompt_tokens) AS model_input_tokens,
                         SUM(sl.completion_tokens) AS model_output_tokens
                     FROM
-                        "LiteLLM_SpendLogs" sl
+                        "LiteLLM_DailySpendRollup" sl
                     WHERE
-                        sl."startTime" BETWEEN $1::date AND $2::date AND sl.user = $3
+                        sl.period_start >= $1::date AND sl.period_start < $2::date
+                        AND sl.request_tag = '' AND sl."user" = $3
                     GROUP BY
                         sl.api_key,
                         sl.model
@@ -1082,22 +1092,23 @@ async def get_global_spend_report(
 
             WITH SpendByModelApiKey AS (
                 SELECT
-                    date_trunc('day', sl."startTime") AS group_by_day,
+                    sl.period_start AS group_by_day,
                     COALESCE(tt.team_alias, 'Unassigned Team') AS team_name,
                     sl.model,
                     sl.api_key,
                     SUM(sl.spend) AS model_api_spend,
                     SUM(sl.total_tokens) AS model_api_tokens
                 FROM 
-                    "LiteLLM_SpendLogs" sl
+                    "LiteLLM_DailySpendRollup" sl
                 LEFT JOIN 
                     "LiteLLM_TeamTable" tt 
                 ON 
                     sl.team_id = tt.team_id
                 WHERE
-                    sl."startTime" BETWEEN $1::date AND $2::date
+                    sl.period_start >= $1::date AND sl.period_start < $2::date
+                    AND sl.request_tag = ''
                 GROUP BY
-                    date_trunc('day', sl."startTime"),
+                    sl.period_start,
                     tt.team_alias,
                     sl.model,
                     sl.api_key
@@ -1145,18 +1156,19 @@ async def get_global_spend_report(
 
             WITH SpendByModelApiKey AS (
                 SELECT
-                    date_trunc('day', sl."startTime") AS group_by_day,
+                    sl.period_start AS group_by_day,
                     sl.end_user AS customer,
                     sl.model,
                     sl.api_key,
                     SUM(sl.spend) AS model_api_spend,
                     SUM(sl.total_tokens) AS model_api_tokens
                 FROM
-                    "LiteLLM_SpendLogs" sl
+                    "LiteLLM_DailySpendRollup" sl
                 WHERE
-                    sl."startTime" BETWEEN $1::date AND $2::date
+                    sl.period_start >= $1::date AND sl.period_start < $2::date
+                    AND sl.request_tag = ''
                 GROUP BY
-                    date_trunc('day', sl."startTime"),
+                    sl.period_start,
                     customer,
                     sl.model,
                     sl.api_key
@@ -1209,9 +1221,10 @@ async def get_global_spend_report(
                         SUM(sl.prompt_tokens) AS model_input_tokens,
                         SUM(sl.completion_tokens) AS model_output_tokens
                     FROM
-                        "LiteLLM_SpendLogs" sl
+                        "LiteLLM_DailySpendRollup" sl
                     WHERE
-                        sl."startTime" BETWEEN $1::date AND $2::date
+                        sl.period_start >= $1::date AND sl.period_start < $2::date
+                        AND sl.request_tag = ''
                     GROUP BY
                         sl.api_key,
                         sl.model
@@ -1403,11 +1416,12 @@ async def _get_spend_report_for_time_range(
             t.team_alias,
             SUM(s.spend) AS total_spend
         FROM
-            "LiteLLM_SpendLogs" s
+            "LiteLLM_DailySpendRollup" s
         LEFT JOIN
             "LiteLLM_TeamTable" t ON s.team_id = t.team_id
         WHERE
-            s."startTime"::DATE >= $1::date AND s."startTime"::DATE <= $2::date
+            s.period_start BETWEEN $1::date AND $2::date
+            AND s.request_tag = ''
         GROUP BY
             t.team_alias
         ORDER BY
@@ -1417,12 +1431,13 @@ async def _get_spend_report_for_time_range(
 
         # get spend per tag for today
         sql_query = """
-        SELECT 
-        jsonb_array_elements_text(request_tags) AS individual_request_tag,
+        SELECT
+        request_tag AS individual_request_tag,
         SUM(spend) AS total_spend
-        FROM "LiteLLM_SpendLogs"
-        WHERE "startTime"::DATE >= $1::date AND "startTime"::DATE <= $2::date
-        GROUP BY individual_request_tag
+        FROM "LiteLLM_DailySpendRollup"
+        WHERE period_start BETWEEN $1::date AND $2::date
+        AND request_tag <> ''
+        GROUP BY request_tag
         ORDER BY total_spend DESC;
         """
 
@@ -1925,6 +1940,74 @@ async def global_spend_refresh():
             }
 
 
+@router.post(
+    "/global/spend/rollups/backfill",
+    tags=["Budget & Spend Tracking"],
+    dependencies=[Depends(user_api_key_auth)],
+    include_in_schema=False,
+)
+async def global_spend_rollups_backfill(
+    start_date: Optional[str] = fastapi.Query(
+        default=None,
+        description="Day from which to backfill the spend rollups. Defaults to the oldest spend log",
+    ),
+    end_date: Optional[str] = fastapi.Query(
+        default=None,
+        description="Day till which to backfill the spend rollups (included). Defaults to today, up to the start of the current hour",
+    ),
+):
+    """
+    ADMIN ONLY / MASTER KEY Only Endpoint
+
+    (Re)build the hourly + daily spend rollups - read by the /global/spend/* endpoints - from LiteLLM_SpendLogs.
+
+    Run this once after upgrading, to include the spend logs written before the rollup tables existed - until then, the /global/spend/* and /global/activity endpoints only return the spend logged since the upgrade. Runs in the background, and is safe to re-run.
+
+    Stops at the start of the current hour - re-run it after the hour of the upgrade is over, to include the requests of that hour logged before the upgrade.
+    """
+    from litellm.proxy.proxy_server import prisma_client
+    from litellm.proxy.spend_tracking.spend_rollups import backfill_spend_rollups
+
+    if prisma_client is None:
+        raise ProxyException(
+            message="Prisma Client is not initialized",
+            type="internal_error",
+            param="None",
+            code=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    start_date_obj = (
+        datetime.strptime(start_date, "%Y-%m-%d") if start_date is not None else None
+    )
+    end_date_obj = (
+        datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        if end_date is not None
+        else None
+    )
+
+    async def _backfill_spend_rollups():
+        try:
+            num_days = await backfill_spend_rollups(
+                prisma_client=prisma_client,
+                start_time=start_date_obj,
+                end_time=end_date_obj,
+            )
+            verbose_proxy_logger.info(
+                "Spend rollups backfilled for {} days".format(num_days)
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "Failed to backfill spend rollups - {}".format(str(e))
+            )
+
+    asyncio.create_task(_backfill_spend_rollups())
+
+    return {
+        "message": "Spend rollups backfill started",
+        "status": "success",
+    }
+
+
 async def global_spend_for_internal_user(
     api_key: Optional[str] = None,
     user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
@@ -2118,13 +2201,14 @@ async def global_spend_key_internal_user(
 
     sql_query = """
             WITH top_api_keys AS (
-            SELECT 
+            SELECT
                 api_key,
                 SUM(spend) as total_spend
-            FROM 
-                "LiteLLM_SpendLogs"
-            WHERE 
+            FROM
+                "LiteLLM_DailySpendRollup"
+            WHERE
                 "user" = $1
+                AND request_tag = ''
             GROUP BY 
                 api_key
             ORDER BY 
@@ -2181,9 +2265,36 @@ async def global_spend_keys(
         return response
     if prisma_client is None:
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
-    sql_query = f"""SELECT * FROM "Last30dKeysBySpend" LIMIT {limit};"""
+    sql_query = """
+        WITH top_api_keys AS (
+            SELECT
+                api_key,
+                SUM(spend) AS total_spend
+            FROM
+                "LiteLLM_DailySpendRollup"
+            WHERE
+                period_start >= CURRENT_DATE - INTERVAL '30 days'
+                AND request_tag = ''
+            GROUP BY
+                api_key
+            ORDER BY
+                total_spend DESC
+            LIMIT $1
+        )
+        SELECT
+            t.api_key,
+            v.key_alias,
+            v.key_name,
+            t.total_spend
+        FROM
+            top_api_keys t
+        LEFT JOIN
+            "LiteLLM_VerificationToken" v ON t.api_key = v.token
+        ORDER BY
+            t.total_spend DESC;
+    """
 
-    response = await prisma_client.db.query_raw(query=sql_query)
+    response = await prisma_client.db.query_raw(sql_query, limit)
 
     return response
 
@@ -2207,17 +2318,18 @@ async def global_spend_per_team():
     sql_query = """
         SELECT
             t.team_alias as team_alias,
-            DATE(s."startTime") AS spend_date,
+            DATE(s.period_start) AS spend_date,
             SUM(s.spend) AS total_spend
         FROM
-            "LiteLLM_SpendLogs" s
+            "LiteLLM_DailySpendRollup" s
         LEFT JOIN
             "LiteLLM_TeamTable" t ON s.team_id = t.team_id
         WHERE
-            s."startTime" >= CURRENT_DATE - INTERVAL '30 days'
+            s.period_start >= CURRENT_DATE - INTERVAL '30 days'
+            AND s.request_tag = ''
         GROUP BY
             t.team_alias,
-            DATE(s."startTime")
+            DATE(s.period_start)
         ORDER BY
             spend_date;
         """
@@ -2345,10 +2457,11 @@ async def global_spend_end_users(data: Optional[GlobalEndUsersSpend] = None):
     endTime = endTime or datetime.now()
 
     sql_query = """
-SELECT end_user, COUNT(*) AS total_count, SUM(spend) AS total_spend
-FROM "LiteLLM_SpendLogs"
-WHERE "startTime" >= $1::timestamp
-  AND "startTime" < $2::timestamp
+SELECT end_user, SUM(api_requests)::bigint AS total_count, SUM(spend) AS total_spend
+FROM "LiteLLM_HourlySpendRollup"
+WHERE period_start >= date_trunc('hour', $1::timestamp)
+  AND period_start < $2::timestamp
+  AND request_tag = ''
   AND (
     CASE
       WHEN $3::TEXT IS NULL THEN TRUE
@@ -2379,14 +2492,15 @@ async def global_spend_models_internal_user(
         raise HTTPException(status_code=500, detail={"error": "No user_id found"})
 
     sql_query = """
-        SELECT 
+        SELECT
             model,
             SUM(spend) as total_spend,
-            SUM(total_tokens) as total_tokens
-        FROM 
-            "LiteLLM_SpendLogs"
-        WHERE 
+            SUM(total_tokens)::bigint as total_tokens
+        FROM
+            "LiteLLM_DailySpendRollup"
+        WHERE
             "user" = $1
+            AND request_tag = ''
         GROUP BY 
             model
         ORDER BY 
@@ -2431,9 +2545,24 @@ async def global_spend_models(
     if prisma_client is None:
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
 
-    sql_query = f"""SELECT * FROM "Last30dModelsBySpend" LIMIT {limit};"""
+    sql_query = """
+        SELECT
+            model,
+            SUM(spend) AS total_spend
+        FROM
+            "LiteLLM_DailySpendRollup"
+        WHERE
+            period_start >= CURRENT_DATE - INTERVAL '30 days'
+            AND request_tag = ''
+            AND model != ''
+        GROUP BY
+            model
+        ORDER BY
+            total_spend DESC
+        LIMIT $1;
+    """
 
-    response = await prisma_client.db.query_raw(query=sql_query)
+    response = await prisma_client.db.query_raw(sql_query, limit)
 
     return response
 
@@ -0,0 +1,371 @@
+"""
+Hourly / daily spend rollups - `LiteLLM_SpendLogs`, pre-aggregated per (key, user, team, end_user, model, tag)
+
+The analytics endpoints (`/global/activity`, `/global/spend/report`, ...) read these tables, instead of aggregating the raw spend logs on every request.
+
+- `insert_spend_logs` + `update_spend_rollups`: called by `update_spend`, in one transaction - only the spend logs actually inserted are counted, so a retried / duplicate request id is not counted twice
+- `backfill_spend_rollups`: (re)builds the rollups from the existing spend logs, up to the last completed hour. Idempotent - overwrites the rollup rows of each hour it covers
+
+Until the backfill has run, the rollups only hold the spend logged since the upgrade.
+
+Rows with `request_tag = ''` hold the totals. A request with tags is also counted once in the row of each of its tags - so only sum rows with `request_tag = ''` for totals.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from litellm._logging import verbose_proxy_logger
+from litellm.proxy._types import SpendLogsPayload
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient
+else:
+    PrismaClient = Any
+
+HOURLY_SPEND_ROLLUP_TABLE = "LiteLLM_HourlySpendRollup"
+DAILY_SPEND_ROLLUP_TABLE = "LiteLLM_DailySpendRollup"
+
+ROLLUP_DIMENSIONS = [
+    "api_key",
+    "user",
+    "team_id",
+    "end_user",
+    "model",
+    "model_group",
+    "model_id",
+    "request_tag",
+]
+ROLLUP_COUNTERS = [
+    "spend",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "api_requests",
+]
+_COUNTER_TYPES = {
+    "spend": "double precision",
+    "prompt_tokens": "bigint",
+    "completion_tokens": "bigint",
+    "total_tokens": "bigint",
+    "api_requests": "bigint",
+}
+
+BACKFILL_LOCK_TIMEOUT_SECONDS = 300
+
+_ROLLUP_COLUMNS = ", ".join(
+    '"{}"'.format(column) for column in ["period_start"] + ROLLUP_DIMENSIONS
+)
+_ALL_COLUMNS = _ROLLUP_COLUMNS + ", " + ", ".join(ROLLUP_COUNTERS)
+
+
+def _get_upsert_query(table: str, increment: bool) -> str:
+    """
+    `increment=True` adds to the existing rows (write path), else overwrites them (backfill)
+    """
+    if increment:
+        set_clause = ", ".join(
+            "{0} = t.{0} + EXCLUDED.{0}".format(counter) for counter in ROLLUP_COUNTERS
+        )
+    else:
+        set_clause = ", ".join(
+            "{0} = EXCLUDED.{0}".format(counter) for counter in ROLLUP_COUNTERS
+        )
+    return (
+        'INSERT INTO "{}" AS t ({}) {{select_query}} '
+        "ON CONFLICT ({}) DO UPDATE SET {}".format(
+            table, _ALL_COLUMNS, _ROLLUP_COLUMNS, set_clause
+        )
+    )
+
+
+def _get_unnest_upsert_query(table: str) -> str:
+    """
+    One row per array index - all values are sent as text[], and cast here
+    """
+    columns = ["period_start"] + ROLLUP_DIMENSIONS + ROLLUP_COUNTERS
+    unnest_args = ", ".join("${}::text[]".format(i + 1) for i in range(len(columns)))
+    select_columns = ["r.period_start::timestamp(3)"]
+    select_columns += ['r."{}"'.format(dimension) for dimension in ROLLUP_DIMENSIONS]
+    select_columns += [
+        "r.{}::{}".format(counter, _COUNTER_TYPES[counter])
+        for counter in ROLLUP_COUNTERS
+    ]
+    select_query = "SELECT {} FROM unnest({}) AS r({})".format(
+        ", ".join(select_columns),
+        unnest_args,
+        ", ".join('"{}"'.format(column) for column in columns),
+    )
+    return _get_upsert_query(table=table, increment=True).format(
+        select_query=select_query
+    )
+
+
+def _to_utc_naive(start_time: Union[datetime, str]) -> datetime:
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    if start_time.tzinfo is not None:
+        start_time = start_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return start_time
+
+
+def _get_request_tags(request_tags: Any) -> List[str]:
+    """
+    Unique, non-empty tags - `request_tags` is a json string on the spend logs payload
+    """
+    if isinstance(request_tags, str):
+        try:
+            request_tags = json.loads(request_tags)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(request_tags, list):
+        return []
+    tags: List[str] = []
+    for tag in request_tags:
+        if isinstance(tag, str) and tag != "" and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def aggregate_spend_logs(
+    spend_logs: List[dict],
+) -> Tuple[Dict[tuple, List[float]], Dict[tuple, List[float]]]:
+    """
+    Returns the hourly and daily rollup rows for a batch of spend logs payloads
+
+    {(period_start, *ROLLUP_DIMENSIONS): [spend, prompt_tokens, completion_tokens, total_tokens, api_requests]}
+    """
+    hourly_rows: Dict[tuple, List[float]] = {}
+    daily_rows: Dict[tuple, List[float]] = {}
+    for spend_log in spend_logs:
+        start_time = spend_log.get("startTime")
+        if start_time is None:
+            continue
+        start_time = _to_utc_naive(start_time)
+        hour = start_time.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+        dimensions = tuple(
+            spend_log.get(dimension) or "" for dimension in ROLLUP_DIMENSIONS[:-1]
+        )
+        counters = [
+            float(spend_log.get("spend") or 0.0),
+            int(spend_log.get("prompt_tokens") or 0),
+            int(spend_log.get("completion_tokens") or 0),
+            int(spend_log.get("total_tokens") or 0),
+            1,
+        ]
+        for request_tag in [""] + _get_request_tags(spend_log.get("request_tags")):
+            for rows, period_start in ((hourly_rows, hour), (daily_rows, day)):
+                key = (period_start,) + dimensions + (request_tag,)
+                row = rows.get(key)
+                if row is None:
+                    rows[key] = list(counters)
+                else:
+                    for i, value in enumerate(counters):
+                        row[i] += value
+    return hourly_rows, daily_rows
+
+
+def _get_unnest_params(rows: Dict[tuple, List[float]]) -> List[List[str]]:
+    columns: List[List[str]] = [
+        [] for _ in range(1 + len(ROLLUP_DIMENSIONS) + len(ROLLUP_COUNTERS))
+    ]
+    for key, counters in rows.items():
+        columns[0].append(key[0].isoformat())
+        for i, value in enumerate(key[1:] + tuple(counters), start=1):
+            columns[i].append(str(value))
+    return columns
+
+
+_SPEND_LOGS_JSON_COLUMNS = ["metadata", "request_tags"]
+_SPEND_LOGS_DATETIME_COLUMNS = ["startTime", "endTime", "completionStartTime"]
+
+
+def _get_spend_log_record(spend_log: dict) -> dict:
+    """
+    Spend logs payload -> json record for `jsonb_populate_recordset` - utc timestamps, and the json str columns parsed
+    """
+    record = dict(spend_log)
+    for column in _SPEND_LOGS_DATETIME_COLUMNS:
+        if record.get(column) is not None:
+            record[column] = _to_utc_naive(record[column]).isoformat()
+    for column in _SPEND_LOGS_JSON_COLUMNS:
+        if isinstance(record.get(column), str):
+            try:
+                record[column] = json.loads(record[column])
+            except json.JSONDecodeError:
+                pass
+    return record
+
+
+async def insert_spend_logs(db: Any, spend_logs: List[dict]) -> List[dict]:
+    """
+    Write a batch of spend logs payloads, skipping request ids already in `LiteLLM_SpendLogs`
+
+    Returns the payloads actually inserted - the ones to count in the rollups
+    """
+    if len(spend_logs) == 0:
+        return []
+    records = [_get_spend_log_record(spend_log) for spend_log in spend_logs]
+    columns = ", ".join(
+        '"{}"'.format(column)
+        for column in SpendLogsPayload.__annotations__
+        if all(column in record for record in records)
+    )
+    response = await db.query_raw(
+        'INSERT INTO "LiteLLM_SpendLogs" ({0}) '
+        'SELECT {0} FROM jsonb_populate_recordset(NULL::"LiteLLM_SpendLogs", $1::jsonb) '
+        "ON CONFLICT (request_id) DO NOTHING RETURNING request_id".format(columns),
+        json.dumps(records, default=str),
+    )
+    inserted_request_ids = {row["request_id"] for row in response or []}
+    inserted_spend_logs: List[dict] = []
+    for spend_log in spend_logs:
+        # a request id repeated within the batch is only inserted once
+        if spend_log.get("request_id") in inserted_request_ids:
+            inserted_request_ids.discard(spend_log["request_id"])
+            inserted_spend_logs.append(spend_log)
+    return inserted_spend_logs
+
+
+async def update_spend_rollups(db: Any, spend_logs: List[dict]) -> None:
+    """
+    Increment the hourly + daily rollups with a batch of spend logs payloads
+
+    `db` is the prisma client, or the transaction the spend logs are written in
+    """
+    if len(spend_logs) == 0:
+        return
+    hourly_rows, daily_rows = aggregate_spend_logs(spend_logs=spend_logs)
+    for table, rows in (
+        (HOURLY_SPEND_ROLLUP_TABLE, hourly_rows),
+        (DAILY_SPEND_ROLLUP_TABLE, daily_rows),
+    ):
+        if len(rows) == 0:
+            continue
+        await db.execute_raw(
+            _get_unnest_upsert_query(table=table), *_get_unnest_params(rows)
+        )
+
+
+_BACKFILL_HOURLY_SELECT_QUERY = """
+SELECT
+    date_trunc('hour', s."startTime"),
+    COALESCE(s.api_key, ''),
+    COALESCE(s."user", ''),
+    COALESCE(s.team_id, ''),
+    COALESCE(s.end_user, ''),
+    COALESCE(s.model, ''),
+    COALESCE(s.model_group, ''),
+    COALESCE(s.model_id, ''),
+    tags.request_tag,
+    SUM(s.spend),
+    SUM(s.prompt_tokens)::bigint,
+    SUM(s.completion_tokens)::bigint,
+    SUM(s.total_tokens)::bigint,
+    COUNT(*)
+FROM "LiteLLM_SpendLogs" s
+CROSS JOIN LATERAL (
+    SELECT '' AS request_tag
+    UNION
+    SELECT jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(s.request_tags) = 'array' THEN s.request_tags ELSE '[]'::jsonb END
+    )
+) AS tags
+WHERE s."startTime" >= $1::timestamp AND s."startTime" < $2::timestamp
+GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+"""
+
+_BACKFILL_DAILY_SELECT_QUERY = """
+SELECT
+    date_trunc('day', period_start),
+    api_key,
+    "user",
+    team_id,
+    end_user,
+    model,
+    model_group,
+    model_id,
+    request_tag,
+    SUM(spend),
+    SUM(prompt_tokens)::bigint,
+    SUM(completion_tokens)::bigint,
+    SUM(total_tokens)::bigint,
+    SUM(api_requests)::bigint
+FROM "LiteLLM_HourlySpendRollup"
+WHERE period_start >= $1::timestamp AND period_start < $2::timestamp
+GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+"""
+
+
+async def _backfill_day(
+    prisma_client: PrismaClient,
+    day: datetime,
+    end_time: datetime,
+    lock_tables: bool,
+) -> None:
+    """
+    Overwrite the hourly rollups of `[day, end_time)`, then the daily rollup of `day` - summed from all of its hourly rows, so the live increments of the hours after `end_time` are kept
+
+    `lock_tables=True` blocks the live increments while each table is overwritten - else an increment committed mid-query would be lost
+    """
+    next_day = day + timedelta(days=1)
+    for table, select_query, params in (
+        (HOURLY_SPEND_ROLLUP_TABLE, _BACKFILL_HOURLY_SELECT_QUERY, (day, end_time)),
+        (DAILY_SPEND_ROLLUP_TABLE, _BACKFILL_DAILY_SELECT_QUERY, (day, next_day)),
+    ):
+        upsert_query = _get_upsert_query(table=table, increment=False).format(
+            select_query=select_query
+        )
+        if not lock_tables:
+            await prisma_client.db.execute_raw(upsert_query, *params)
+            continue
+        async with prisma_client.db.tx(
+            timeout=timedelta(seconds=BACKFILL_LOCK_TIMEOUT_SECONDS)
+        ) as transaction:
+            await transaction.execute_raw(
+                'LOCK TABLE "{}" IN SHARE ROW EXCLUSIVE MODE'.format(table)
+            )
+            await transaction.execute_raw(upsert_query, *params)
+
+
+async def backfill_spend_rollups(
+    prisma_client: PrismaClient,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+) -> int:
+    """
+    Rebuild the rollups from `LiteLLM_SpendLogs`, one day at a time (so each query only scans a day of logs)
+
+    Covers `[start_time, end_time)`. Defaults to all the spend logs. `end_time` is capped to the start of the current hour - the current hour is only counted by the live increments.
+
+    Returns the number of days backfilled.
+    """
+    if start_time is None:
+        response = await prisma_client.db.query_raw(
+            'SELECT MIN("startTime") AS start_time FROM "LiteLLM_SpendLogs"'
+        )
+        if not response or response[0].get("start_time") is None:
+            return 0
+        start_time = _to_utc_naive(response[0]["start_time"])
+    current_hour = datetime.now(timezone.utc).replace(
+        tzinfo=None, minute=0, second=0, microsecond=0
+    )
+    if end_time is None or end_time > current_hour:
+        end_time = current_hour
+
+    day = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+    num_days = 0
+    while day < end_time:
+        next_day = day + timedelta(days=1)
+        await _backfill_day(
+            prisma_client=prisma_client,
+            day=day,
+            end_time=min(next_day, end_time),
+            # spend logs of the last day can still be written while it's backfilled
+            lock_tables=next_day >= end_time,
+        )
+        verbose_proxy_logger.debug("Backfilled spend rollups for %s", day.date())
+        day = next_day
+        num_days += 1
+    return num_days
@@ -10,6 +10,7 @@ import subprocess
 import threading
 import time
 import traceback
+import uuid
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -17,6 +18,7 @@ from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    Coroutine,
     List,
     Literal,
     Optional,
@@ -80,6 +82,10 @@ from litellm.proxy.hooks.max_budget_limiter import _PROXY_MaxBudgetLimiter
 from litellm.proxy.hooks.parallel_request_limiter import (
     _PROXY_MaxParallelRequestsHandler,
 )
+from litellm.proxy.spend_tracking.spend_rollups import (
+    insert_spend_logs,
+    update_spend_rollups,
+)
 from litellm.secret_managers.main import str_to_bool
 from litellm.types.integrations.slack_alerting import DEFAULT_ALERT_TYPES
 from litellm.types.utils import CallTypes, LoggedLiteLLMParams
@@ -134,6 +140,30 @@ def safe_deep_copy(data):
     return new_data
 
 
+async def _run_concurrently_until_first_error(coroutines: List[Coroutine]) -> None:
+    """
+    Runs the coroutines concurrently.
+
+    Raises the first exception raised by any of them, and cancels the ones still running.
+    """
+    if len(coroutines) == 0:
+        return
+    if len(coroutines) == 1:
+        await coroutines[0]
+        return
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            await next_done
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
 class InternalUsageCache:
     def __init__(self, dual_cache: DualCache):
         self.dual_cache: DualCache = dual_cache
@@ -274,6 +304,10 @@ class ProxyLogging:
         )
         self.premium_user = premium_user
         self.service_logging_obj = ServiceLogging()
+        ## resolved pre-call hook callbacks, cached until litellm.callbacks changes ##
+        self._pre_call_hook_callbacks: Optional[List[CustomLogger]] = None
+        self._pre_call_hook_callbacks_source: List = []
+        self._pre_call_hook_in_memory_loggers_count: int = 0
 
     def startup_event(
         self,
@@ -400,19 +434,9 @@ class ProxyLogging:
         if self.alerting is None:
             return
 
-        # current alerting threshold
-        alerting_threshold: float = self.alerting_threshold
-
-        # add a 100 second buffer to the alerting threshold
-        # ensures we don't send errant hanging request slack alerts
-        alerting_threshold += 100
-
-        await self.internal_usage_cache.async_set_cache(
-            key="request_status:{}".format(litellm_call_id),
-            value=status,
-            local_only=True,
-            ttl=alerting_threshold,
-            litellm_parent_otel_span=None,
+        # request finished - stop tracking it as a possibly hanging request
+        self.slack_alerting_instance.hanging_request_check.remove_request_from_hanging_request_check(
+            litellm_call_id=litellm_call_id
         )
 
     async def process_pre_call_hook_response(self, response, data, call_type):
@@ -493,27 +517,24 @@ class ProxyLogging:
         3. /image/generation
         """
         print_verbose("Inside Proxy Logging Pre-call hook!")
-        ### ALERTING ###
-        asyncio.create_task(
-            self.slack_alerting_instance.response_taking_too_long(request_data=data)
-        )
-
         if data is None:
             return None
 
-        try:
-            for callback in litellm.callbacks:
-                _callback = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
+        ### ALERTING ###
+        if self.slack_alerting_instance.hanging_request_check.is_enabled():
+            if data.get("litellm_call_id") is None:
+                data["litellm_call_id"] = str(uuid.uuid4())
+            self.slack_alerting_instance.hanging_request_check.add_request_to_hanging_request_check(
+                request_data=data
+            )
 
-                if _callback is not None and isinstance(_callback, CustomGuardrail):
-                    from litellm.types.guardrails import GuardrailEventHooks
+        from litellm.types.guardrails import GuardrailEventHooks
 
+        try:
+            # read-only guardrails queued up since the last mutating hook
+            read_only_guardrails: List[CustomGuardrail] = []
+            for _callback in self._get_pre_call_hook_callbacks():
+                if isinstance(_callback, CustomGuardrail):
                     if (
                         _callback.should_run_guardrail(
                             data=data, event_type=GuardrailEventHooks.pre_call
@@ -521,38 +542,119 @@ class ProxyLogging:
                         is not True
                     ):
                         continue
+                    if _callback.read_only is True:
+                        read_only_guardrails.append(_callback)
+                        continue
 
-                    response = await _callback.async_pre_call_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        cache=self.call_details["user_api_key_cache"],
-                        data=data,  # type: ignore
-                        call_type=call_type,
-                    )
-                    if response is not None:
-                        data = await self.process_pre_call_hook_response(
-                            response=response, data=data, call_type=call_type
-                        )
+                # mutating hook - run the queued read-only checks first, so hooks keep their order
+                await self._run_read_only_pre_call_guardrails(
+                    guardrails=read_only_guardrails,
+                    user_api_key_dict=user_api_key_dict,
+                    data=data,
+                    call_type=call_type,
+                )
+                read_only_guardrails = []
 
-                elif (
-                    _callback is not None
-                    and isinstance(_callback, CustomLogger)
-                    and "async_pre_call_hook" in vars(_callback.__class__)
-                ):
-                    response = await _callback.async_pre_call_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        cache=self.call_details["user_api_key_cache"],
-                        data=data,  # type: ignore
-                        call_type=call_type,
+                response = await _callback.async_pre_call_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    cache=self.call_details["user_api_key_cache"],
+                    data=data,  # type: ignore
+                    call_type=call_type,
+                )
+                if response is not None:
+                    data = await self.process_pre_call_hook_response(
+                        response=response, data=data, call_type=call_type
                     )
-                    if response is not None:
-                        data = await self.process_pre_call_hook_response(
-                            response=response, data=data, call_type=call_type
-                        )
 
+            await self._run_read_only_pre_call_guardrails(
+                guardrails=read_only_guardrails,
+                user_api_key_dict=user_api_key_dict,
+                data=data,
+                call_type=call_type,
+            )
             return data
         except Exception as e:
             raise e
 
+    def _get_pre_call_hook_callbacks(self) -> List[CustomLogger]:
+        """
+        Returns the callbacks in `litellm.callbacks` that implement a pre-call hook, in order.
+
+        String callbacks are resolved to their CustomLogger instance.
+        The result is cached until `litellm.callbacks` or the initialized in-memory loggers change.
+        """
+        _in_memory_loggers = (
+            litellm.litellm_core_utils.litellm_logging._in_memory_loggers
+        )
+        if (
+            self._pre_call_hook_callbacks is not None
+            and self._pre_call_hook_callbacks_source == litellm.callbacks
+            and self._pre_call_hook_in_memory_loggers_count == len(_in_memory_loggers)
+        ):
+            return self._pre_call_hook_callbacks
+
+        pre_call_hook_callbacks: List[CustomLogger] = []
+        for callback in litellm.callbacks:
+            _callback = None
+            if isinstance(callback, str):
+                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                    callback  # type: ignore
+                )
+            else:
+                _callback = callback  # type: ignore
+
+            if _callback is not None and isinstance(_callback, CustomGuardrail):
+                pre_call_hook_callbacks.append(_callback)
+            elif (
+                _callback is not None
+                and isinstance(_callback, CustomLogger)
+                and "async_pre_call_hook" in vars(_callback.__class__)
+            ):
+                pre_call_hook_callbacks.append(_callback)
+
+        self._pre_call_hook_callbacks = pre_call_hook_callbacks
+        self._pre_call_hook_callbacks_source = list(litellm.callbacks)
+        self._pre_call_hook_in_memory_loggers_count = len(_in_memory_loggers)
+        return pre_call_hook_callbacks
+
+    async def _run_read_only_pre_call_guardrails(
+        self,
+        guardrails: List[CustomGuardrail],
+        user_api_key_dict: UserAPIKeyAuth,
+        data: dict,
+        call_type: Literal[
+            "completion",
+            "text_completion",
+            "embeddings",
+            "image_generation",
+            "moderation",
+            "audio_transcription",
+            "pass_through_endpoint",
+            "rerank",
+        ],
+    ):
+        """
+        Runs read-only guardrails concurrently. The first rejection cancels the rest.
+
+        Any modified request returned by a read-only guardrail is ignored.
+        """
+
+        async def _run_guardrail(guardrail: CustomGuardrail):
+            response = await guardrail.async_pre_call_hook(
+                user_api_key_dict=user_api_key_dict,
+                cache=self.call_details["user_api_key_cache"],
+                data=data,
+                call_type=call_type,
+            )
+            if response is not None:
+                await self.process_pre_call_hook_response(
+                    response=response, data=data, call_type=call_type
+                )
+
+        await _run_concurrently_until_first_error(
+            [_run_guardrail(guardrail) for guardrail in guardrails]
+        )
+
     async def during_call_hook(
         self,
         data: dict,
@@ -567,38 +669,66 @@ class ProxyLogging:
     ):
         """
         Runs the CustomGuardrail's async_moderation_hook()
+
+        Read-only guardrails run concurrently, the first rejection cancels the rest.
+        Other guardrails run in order.
         """
+        read_only_guardrails: List[CustomGuardrail] = []
         for callback in litellm.callbacks:
-            try:
-                if isinstance(callback, CustomGuardrail):
-                    ################################################################
-                    # Check if guardrail should be run for GuardrailEventHooks.during_call hook
-                    ################################################################
-
-                    # V1 implementation - backwards compatibility
-                    if callback.event_hook is None and hasattr(
-                        callback, "moderation_check"
+            if isinstance(callback, CustomGuardrail):
+                ################################################################
+                # Check if guardrail should be run for GuardrailEventHooks.during_call hook
+                ################################################################
+
+                # V1 implementation - backwards compatibility
+                if callback.event_hook is None and hasattr(
+                    callback, "moderation_check"
+                ):
+                    if callback.moderation_check == "pre_call":  # type: ignore
+                        break
+                else:
+                    # Main - V2 Guardrails implementation
+                    from litellm.types.guardrails import GuardrailEventHooks
+
+                    if (
+                        callback.should_run_guardrail(
+                            data=data, event_type=GuardrailEventHooks.during_call
+                        )
+                        is not True
                     ):
-                        if callback.moderation_check == "pre_call":  # type: ignore
-                            return
-                    else:
-                        # Main - V2 Guardrails implementation
-                        from litellm.types.guardrails import GuardrailEventHooks
+                        continue
 
-                        if (
-                            callback.should_run_guardrail(
-                                data=data, event_type=GuardrailEventHooks.during_call
-                            )
-                            is not True
-                        ):
-                            continue
-                    await callback.async_moderation_hook(
-                        data=data,
-                        user_api_key_dict=user_api_key_dict,
-                        call_type=call_type,
-                    )
-            except Exception as e:
-                raise e
+                if callback.read_only is True:
+                    read_only_guardrails.append(callback)
+                    continue
+
+                await _run_concurrently_until_first_error(
+                    [
+                        guardrail.async_moderation_hook(
+                            data=data,
+                            user_api_key_dict=user_api_key_dict,
+                            call_type=call_type,
+                        )
+                        for guardrail in read_only_guardrails
+                    ]
+                )
+                read_only_guardrails = []
+                await callback.async_moderation_hook(
+                    data=data,
+                    user_api_key_dict=user_api_key_dict,
+                    call_type=call_type,
+                )
+
+        await _run_concurrently_until_first_error(
+            [
+                guardrail.async_moderation_hook(
+                    data=data,
+                    user_api_key_dict=user_api_key_dict,
+                    call_type=call_type,
+                )
+                for guardrail in read_only_guardrails
+            ]
+        )
         return data
 
     async def failed_tracking_alert(
@@ -2952,17 +3082,24 @@ async def update_spend(  # noqa: PLR0915
                             for entry in batch
                         ]
 
-                        await prisma_client.db.litellm_spendlogs.create_many(
-                            data=batch_with_dates, skip_duplicates=True  # type: ignore
-                        )
+                        # write the logs + increment the spend rollups atomically - so a retried batch is not counted twice
+                        async with prisma_client.db.tx(
+                            timeout=timedelta(seconds=60)
+                        ) as transaction:
+                            inserted_spend_logs = await insert_spend_logs(
+                                db=transaction, spend_logs=batch_with_dates
+                            )
+                            await update_spend_rollups(
+                                db=transaction, spend_logs=inserted_spend_logs
+                            )
 
+                        # Remove the processed logs from spend_logs
+                        prisma_client.spend_log_transactions = (
+                            prisma_client.spend_log_transactions[len(batch) :]
+                        )
                         verbose_proxy_logger.debug(
                             f"Flushed {len(batch)} logs to the DB."
                         )
-                    # Remove the processed logs from spend_logs
-                    prisma_client.spend_log_transactions = (
-                        prisma_client.spend_log_transactions[len(logs_to_process) :]
-                    )
 
                     verbose_proxy_logger.debug(
                         f"{len(logs_to_process)} logs processed. Remaining in queue: {len(prisma_client.spend_log_transactions)}"
@@ -12,6 +12,7 @@ import concurrent
 import copy
 import datetime as datetime_og
 import enum
+import functools
 import hashlib
 import inspect
 import json
@@ -29,6 +30,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Literal,
@@ -66,6 +68,12 @@ from litellm.router_utils.batch_utils import (
     replace_model_in_jsonl,
 )
 from litellm.router_utils.client_initalization_utils import InitalizeOpenAISDKClient
+from litellm.router_utils.embedding_batcher import (
+    EmbeddingBatcher,
+    aembedding_without_logging,
+    log_caller_failure,
+    log_caller_success,
+)
 from litellm.router_utils.cooldown_cache import CooldownCache
 from litellm.router_utils.cooldown_callbacks import router_cooldown_event_callback
 from litellm.router_utils.cooldown_handlers import (
@@ -376,6 +384,9 @@ class Router:
         self.default_max_parallel_requests = default_max_parallel_requests
         self.provider_default_deployment_ids: List[str] = []
         self.pattern_router = PatternMatchRouter()
+        ## ACCESS GROUP INDEX - {access_group: frozenset(model_names)}, rebuilt when deployments change
+        self._model_access_groups_index: Optional[Dict[str, FrozenSet[str]]] = None
+        self.model_access_groups_index_version: int = 0
 
         if model_list is not None:
             model_list = copy.deepcopy(model_list)
@@ -508,12 +519,18 @@ class Router:
         else:
             litellm.failure_callback = [self.deployment_callback_on_failure]
         verbose_router_logger.debug(
-            f"Intialized router with Routing strategy: {self.routing_strategy}\n\n"
-            f"Routing enable_pre_call_checks: {self.enable_pre_call_checks}\n\n"
-            f"Routing fallbacks: {self.fallbacks}\n\n"
-            f"Routing content fallbacks: {self.content_policy_fallbacks}\n\n"
-            f"Routing context window fallbacks: {self.context_window_fallbacks}\n\n"
-            f"Router Redis Caching={self.cache.redis_cache}\n"
+            "Intialized router with Routing strategy: %s\n\n"
+            "Routing enable_pre_call_checks: %s\n\n"
+            "Routing fallbacks: %s\n\n"
+            "Routing content fallbacks: %s\n\n"
+            "Routing context window fallbacks: %s\n\n"
+            "Router Redis Caching=%s\n",
+            self.routing_strategy,
+            self.enable_pre_call_checks,
+            self.fallbacks,
+            self.content_policy_fallbacks,
+            self.context_window_fallbacks,
+            self.cache.redis_cache,
         )
         self.service_logger_obj = ServiceLogging()
         self.routing_strategy_args = routing_strategy_args
@@ -532,6 +549,8 @@ class Router:
         self.model_group_retry_policy: Optional[Dict[str, RetryPolicy]] = (
             model_group_retry_policy
         )
+        # deployment id -> batcher, for deployments with `model_info.embedding_batching`
+        self.embedding_batchers: Dict[str, Optional[EmbeddingBatcher]] = {}
 
         self.allowed_fails_policy: Optional[AllowedFailsPolicy] = None
         if allowed_fails_policy is not None:
@@ -661,7 +680,7 @@ class Router:
             return _deployment_copy
         except Exception as e:
             verbose_router_logger.debug(
-                f"Error occurred while printing deployment - {str(e)}"
+                "Error occurred while printing deployment - %s", str(e)
             )
             raise e
 
@@ -675,7 +694,7 @@ class Router:
         response = router.completion(model="gpt-3.5-turbo", messages=[{"role": "user", "content": "Hey, how's it going?"}]
         """
         try:
-            verbose_router_logger.debug(f"router.completion(model={model},..)")
+            verbose_router_logger.debug("router.completion(model=%s,..)", model)
             kwargs["model"] = model
             kwargs["messages"] = messages
             kwargs["original_function"] = self._completion
@@ -795,15 +814,13 @@ class Router:
                 response = await self.async_function_with_fallbacks(**kwargs)
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_success_hook(
-                    service=ServiceTypes.ROUTER,
-                    duration=_duration,
-                    call_type="acompletion",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                )
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.ROUTER,
+                duration=_duration,
+                call_type="acompletion",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
             )
 
             return response
@@ -830,7 +847,7 @@ class Router:
         model_name = None
         try:
             verbose_router_logger.debug(
-                f"Inside _acompletion()- model: {model}; kwargs: {kwargs}"
+                "Inside _acompletion()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             start_time = time.time()
@@ -842,15 +859,13 @@ class Router:
             )
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_success_hook(
-                    service=ServiceTypes.ROUTER,
-                    duration=_duration,
-                    call_type="async_get_available_deployment",
-                    start_time=start_time,
-                    end_time=end_time,
-                    parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
-                )
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.ROUTER,
+                duration=_duration,
+                call_type="async_get_available_deployment",
+                start_time=start_time,
+                end_time=end_time,
+                parent_otel_span=_get_parent_otel_span_from_kwargs(kwargs),
             )
 
             # debug how often this deployment picked
@@ -1198,7 +1213,7 @@ class Router:
                 return await self.acompletion(model=model, messages=messages, stream=stream, **kwargs)  # type: ignore
             except asyncio.CancelledError:
                 verbose_router_logger.debug(
-                    "Received 'task.cancel'. Cancelling call w/ model={}.".format(model)
+                    "Received 'task.cancel'. Cancelling call w/ model=%s.", model
                 )
                 raise
             except Exception as e:
@@ -1349,7 +1364,7 @@ class Router:
         model_name = ""
         try:
             verbose_router_logger.debug(
-                f"Inside _image_generation()- model: {model}; kwargs: {kwargs}"
+                "Inside _image_generation()- model: %s; kwargs: %s", model, kwargs
             )
             deployment = self.get_available_deployment(
                 model=model,
@@ -1417,7 +1432,7 @@ class Router:
         model_name = model
         try:
             verbose_router_logger.debug(
-                f"Inside _image_generation()- model: {model}; kwargs: {kwargs}"
+                "Inside _image_generation()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -1532,7 +1547,7 @@ class Router:
         model_name = model
         try:
             verbose_router_logger.debug(
-                f"Inside _atranscription()- model: {model}; kwargs: {kwargs}"
+                "Inside _atranscription()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -1710,7 +1725,7 @@ class Router:
         model_name = None
         try:
             verbose_router_logger.debug(
-                f"Inside _rerank()- model: {model}; kwargs: {kwargs}"
+                "Inside _rerank()- model: %s; kwargs: %s", model, kwargs
             )
             deployment = await self.async_get_available_deployment(
                 model=model,
@@ -1859,7 +1874,7 @@ class Router:
     async def _atext_completion(self, model: str, prompt: str, **kwargs):
         try:
             verbose_router_logger.debug(
-                f"Inside _atext_completion()- model: {model}; kwargs: {kwargs}"
+                "Inside _atext_completion()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -1959,7 +1974,7 @@ class Router:
     async def _aadapter_completion(self, adapter_id: str, model: str, **kwargs):
         try:
             verbose_router_logger.debug(
-                f"Inside _aadapter_completion()- model: {model}; kwargs: {kwargs}"
+                "Inside _aadapter_completion()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -2049,7 +2064,7 @@ class Router:
         model_name = None
         try:
             verbose_router_logger.debug(
-                f"Inside embedding()- model: {model}; kwargs: {kwargs}"
+                "Inside embedding()- model: %s; kwargs: %s", model, kwargs
             )
             deployment = self.get_available_deployment(
                 model=model,
@@ -2132,7 +2147,7 @@ class Router:
         model_name = None
         try:
             verbose_router_logger.debug(
-                f"Inside _aembedding()- model: {model}; kwargs: {kwargs}"
+                "Inside _aembedding()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -2149,15 +2164,28 @@ class Router:
             )
 
             self.total_calls[model_name] += 1
-            response = litellm.aembedding(
-                **{
-                    **data,
-                    "input": input,
-                    "caching": self.cache_responses,
-                    "client": model_client,
-                    **kwargs,
-                }
-            )
+            embedding_batcher = self._get_embedding_batcher(deployment=deployment)
+            if embedding_batcher is not None and embedding_batcher.can_batch(input):
+                response = self._abatched_embedding(
+                    embedding_batcher=embedding_batcher,
+                    input=input,
+                    call_kwargs={
+                        **data,
+                        "caching": self.cache_responses,
+                        "client": model_client,
+                        **kwargs,
+                    },
+                )
+            else:
+                response = litellm.aembedding(
+                    **{
+                        **data,
+                        "input": input,
+                        "caching": self.cache_responses,
+                        "client": model_client,
+                        **kwargs,
+                    }
+                )
 
             ### CONCURRENCY-SAFE RPM CHECKS ###
             rpm_semaphore = self._get_client(
@@ -2197,6 +2225,54 @@ class Router:
                 self.fail_calls[model_name] += 1
             raise e
 
+    async def _abatched_embedding(
+        self,
+        embedding_batcher: EmbeddingBatcher,
+        input: Union[str, List[str]],
+        call_kwargs: dict,
+    ) -> litellm.EmbeddingResponse:
+        """
+        Send the input as part of a shared provider request.
+
+        Success / failure is logged for this caller - with its own litellm_call_id and its share of the batch usage.
+        """
+        start_time = datetime.now()
+        try:
+            response = await embedding_batcher.aembedding(
+                input=input,
+                group_key=embedding_batcher.get_group_key(call_kwargs),
+                embedding_fn=functools.partial(
+                    aembedding_without_logging,
+                    **{
+                        k: v
+                        for k, v in call_kwargs.items()
+                        if k not in ("litellm_call_id", "litellm_logging_obj")
+                    },
+                ),
+            )
+        except Exception as e:
+            await log_caller_failure(
+                exception=e, input=input, call_kwargs=call_kwargs, start_time=start_time
+            )
+            raise e
+        log_caller_success(
+            response=response,
+            input=input,
+            call_kwargs=call_kwargs,
+            start_time=start_time,
+        )
+        return response
+
+    def _get_embedding_batcher(self, deployment: dict) -> Optional[EmbeddingBatcher]:
+        model_id = deployment.get("model_info", {}).get("id")
+        if model_id is None:
+            return None
+        if model_id not in self.embedding_batchers:
+            self.embedding_batchers[model_id] = EmbeddingBatcher.from_model_info(
+                deployment.get("model_info")
+            )
+        return self.embedding_batchers[model_id]
+
     #### FILES API ####
     async def acreate_file(
         self,
@@ -2230,7 +2306,7 @@ class Router:
     ) -> FileObject:
         try:
             verbose_router_logger.debug(
-                f"Inside _atext_completion()- model: {model}; kwargs: {kwargs}"
+                "Inside _atext_completion()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -2253,8 +2329,20 @@ class Router:
             stripped_model, custom_llm_provider, _, _ = get_llm_provider(
                 model=data["model"]
             )
-            kwargs["file"] = replace_model_in_jsonl(
-                file_content=kwargs["file"], new_model_name=stripped_model
+            # rewriting a large file is blocking I/O - keep it off the event loop
+            modified_file = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    replace_model_in_jsonl,
+                    file_content=kwargs["file"],
+                    new_model_name=stripped_model,
+                ),
+            )
+            # (filename, file, content type) - the openai sdk only accepts bare file objects that are io.IOBase instances
+            kwargs["file"] = (
+                (modified_file.name, modified_file, "application/jsonl")
+                if modified_file is not None
+                else None
             )
 
             response = litellm.acreate_file(
@@ -2337,7 +2425,7 @@ class Router:
     ) -> Batch:
         try:
             verbose_router_logger.debug(
-                f"Inside _acreate_batch()- model: {model}; kwargs: {kwargs}"
+                "Inside _acreate_batch()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             deployment = await self.async_get_available_deployment(
@@ -2626,10 +2714,10 @@ class Router:
             )
 
             response = await self.async_function_with_retries(*args, **kwargs)
-            verbose_router_logger.debug(f"Async Response: {response}")
+            verbose_router_logger.debug("Async Response: %s", response)
             return response
         except Exception as e:
-            verbose_router_logger.debug(f"Traceback{traceback.format_exc()}")
+            verbose_router_logger.debug("Traceback%s", traceback.format_exc())
             original_exception = e
             fallback_model_group = None
             original_model_group: Optional[str] = kwargs.get("model")  # type: ignore
@@ -2723,7 +2811,7 @@ class Router:
 
                         e.message += "\n{}".format(error_message)
                 if fallbacks is not None:
-                    verbose_router_logger.debug(f"inside model fallbacks: {fallbacks}")
+                    verbose_router_logger.debug("inside model fallbacks: %s", fallbacks)
                     generic_fallback_idx: Optional[int] = None
                     ## check for specific model group-specific fallbacks
                     for idx, item in enumerate(fallbacks):
@@ -2844,7 +2932,7 @@ class Router:
 
     async def async_function_with_retries(self, *args, **kwargs):  # noqa: PLR0915
         verbose_router_logger.debug(
-            f"Inside async function with retries: args - {args}; kwargs - {kwargs}"
+            "Inside async function with retries: args - %s; kwargs - %s", args, kwargs
         )
         original_function = kwargs.pop("original_function")
         fallbacks = kwargs.pop("fallbacks", self.fallbacks)
@@ -2866,7 +2954,9 @@ class Router:
                 _metadata.update({"model_group_size": len(model_list)})
 
         verbose_router_logger.debug(
-            f"async function w/ retries: original_function - {original_function}, num_retries - {num_retries}"
+            "async function w/ retries: original_function - %s, num_retries - %s",
+            original_function,
+            num_retries,
         )
         try:
             self._handle_mock_testing_rate_limit_error(
@@ -3174,7 +3264,7 @@ class Router:
         Try calling the model 3 times. Shuffle-between available deployments.
         """
         verbose_router_logger.debug(
-            f"Inside function with retries: args - {args}; kwargs - {kwargs}"
+            "Inside function with retries: args - %s; kwargs - %s", args, kwargs
         )
         original_function = kwargs.pop("original_function")
         num_retries = kwargs.pop("num_retries")
@@ -3233,7 +3323,9 @@ class Router:
             time.sleep(_timeout)
             for current_attempt in range(num_retries):
                 verbose_router_logger.debug(
-                    f"retrying request. Current attempt - {current_attempt}; retries left: {num_retries}"
+                    "retrying request. Current attempt - %s; retries left: %s",
+                    current_attempt,
+                    num_retries,
                 )
                 try:
                     # if the function call is successful, no exception will be raised and we'll break out of the loop
@@ -3805,6 +3897,7 @@ class Router:
         model = deployment.to_json(exclude_none=True)
 
         self.model_list.append(model)
+        self._invalidate_model_access_groups_index()
         return deployment
 
     def deployment_is_active_for_environment(self, deployment: Deployment) -> bool:
@@ -3850,6 +3943,8 @@ class Router:
     def set_model_list(self, model_list: list):
         original_model_list = copy.deepcopy(model_list)
         self.model_list = []
+        self._invalidate_model_access_groups_index()
+        self.embedding_batchers = {}
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
         import os
 
@@ -3889,7 +3984,7 @@ class Router:
                 )
 
         verbose_router_logger.debug(
-            f"\nInitialized Model List {self.get_model_names()}"
+            "\nInitialized Model List %s", self.get_model_names()
         )
         self.model_names = [m["model_name"] for m in model_list]
 
@@ -3985,9 +4080,9 @@ class Router:
                     deployment.litellm_params.region_name = region
             except Exception as e:
                 verbose_router_logger.debug(
-                    "Unable to get the region for azure model - {}, {}".format(
-                        deployment.litellm_params.model, str(e)
-                    )
+                    "Unable to get the region for azure model - %s, %s",
+                    deployment.litellm_params.model,
+                    str(e),
                 )
                 pass  # [NON-BLOCKING]
 
@@ -4010,6 +4105,7 @@ class Router:
         # add to model list
         _deployment = deployment.to_json(exclude_none=True)
         self.model_list.append(_deployment)
+        self._invalidate_model_access_groups_index()
 
         # initialize client
         self._add_deployment(deployment=deployment)
@@ -4047,6 +4143,8 @@ class Router:
 
             if removal_idx is not None:
                 self.model_list.pop(removal_idx)
+                self._invalidate_model_access_groups_index()
+                self.embedding_batchers.pop(_deployment_model_id, None)
 
         # if the model_id is not in router
         self.add_deployment(deployment=deployment)
@@ -4069,6 +4167,8 @@ class Router:
         try:
             if deployment_idx is not None:
                 item = self.model_list.pop(deployment_idx)
+                self._invalidate_model_access_groups_index()
+                self.embedding_batchers.pop(id, None)
                 return item
             else:
                 return None
@@ -4568,6 +4668,23 @@ class Router:
 
         return access_groups
 
+    def get_model_access_groups_index(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Returns {access_group: frozenset(model_names)}
+
+        Built once from the model list, and rebuilt only after deployments are added / updated / deleted.
+        """
+        if self._model_access_groups_index is None:
+            self._model_access_groups_index = {
+                access_group: frozenset(model_names)
+                for access_group, model_names in self.get_model_access_groups().items()
+            }
+        return self._model_access_groups_index
+
+    def _invalidate_model_access_groups_index(self):
+        self._model_access_groups_index = None
+        self.model_access_groups_index_version += 1
+
     def get_settings(self):
         """
         Get router settings method, returns a dictionary of the settings and their values.
@@ -4646,8 +4763,8 @@ class Router:
                         )
                     setattr(self, var, kwargs[var])
             else:
-                verbose_router_logger.debug("Setting {} is not allowed".format(var))
-        verbose_router_logger.debug(f"Updated Router settings: {self.get_settings()}")
+                verbose_router_logger.debug("Setting %s is not allowed", var)
+        verbose_router_logger.debug("Updated Router settings: %s", self.get_settings())
 
     def _get_client(self, deployment, kwargs, client_type=None):
         """
@@ -4757,7 +4874,7 @@ class Router:
         """
 
         verbose_router_logger.debug(
-            f"Starting Pre-call checks for deployments in model={model}"
+            "Starting Pre-call checks for deployments in model=%s", model
         )
 
         _returned_deployments = copy.deepcopy(healthy_deployments)
@@ -4893,7 +5010,7 @@ class Router:
                         if k not in supported_openai_params and k in special_params:
                             # if not -> invalid model
                             verbose_router_logger.debug(
-                                f"INVALID MODEL INDEX @ REQUEST KWARG FILTERING, k={k}"
+                                "INVALID MODEL INDEX @ REQUEST KWARG FILTERING, k=%s", k
                             )
                             invalid_model_indices.append(idx)
 
@@ -5014,7 +5131,7 @@ class Router:
             healthy_deployments = self._get_deployment_by_litellm_model(model=model)
 
         verbose_router_logger.debug(
-            f"initial list of deployments: {healthy_deployments}"
+            "initial list of deployments: %s", healthy_deployments
         )
 
         if len(healthy_deployments) == 0:
@@ -5075,9 +5192,11 @@ class Router:
                 litellm_router_instance=self, parent_otel_span=parent_otel_span
             )
             verbose_router_logger.debug(
-                f"async cooldown deployments: {cooldown_deployments}"
+                "async cooldown deployments: %s", cooldown_deployments
+            )
+            verbose_router_logger.debug(
+                "cooldown_deployments: %s", cooldown_deployments
             )
-            verbose_router_logger.debug(f"cooldown_deployments: {cooldown_deployments}")
             healthy_deployments = self._filter_cooldown_deployments(
                 healthy_deployments=healthy_deployments,
                 cooldown_deployments=cooldown_deployments,
@@ -5182,15 +5301,13 @@ class Router:
 
             end_time = time.time()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.service_logger_obj.async_service_success_hook(
-                    service=ServiceTypes.ROUTER,
-                    duration=_duration,
-                    call_type="<routing_strategy>.async_get_available_deployments",
-                    parent_otel_span=parent_otel_span,
-                    start_time=start_time,
-                    end_time=end_time,
-                )
+            self.service_logger_obj.log_service_success(
+                service=ServiceTypes.ROUTER,
+                duration=_duration,
+                call_type="<routing_strategy>.async_get_available_deployments",
+                parent_otel_span=parent_otel_span,
+                start_time=start_time,
+                end_time=end_time,
             )
 
             return deployment
@@ -5352,7 +5469,7 @@ class Router:
         """
         # filter out the deployments currently cooling down
         deployments_to_remove = []
-        verbose_router_logger.debug(f"cooldown deployments: {cooldown_deployments}")
+        verbose_router_logger.debug("cooldown deployments: %s", cooldown_deployments)
         # Find deployments in model_list whose model_id is cooling down
         for deployment in healthy_deployments:
             deployment_id = deployment["model_info"]["id"]
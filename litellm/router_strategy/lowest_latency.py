@@ -1,9 +1,10 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
+import asyncio
+import math
 import random
-import traceback
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -34,13 +35,63 @@ class LiteLLMBase(BaseModel):
             return self.dict()
 
 
+def _to_seconds(value: Union[float, timedelta]) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
 class RoutingArgs(LiteLLMBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    latency_percentile: Optional[float] = (
+        None  # e.g. 50 / 90 - route on the p50 / p90 latency (or time to first token) instead of the mean
+    )
+
+
+LATENCY_FIELDS = ("latency", "time_to_first_token")
+USAGE_KEY_TTL = 60  # tpm / rpm counters are per minute
+
+
+def get_deployment_latency_key(model_group: str, id: str) -> str:
+    return f"{model_group}_latency:{id}:samples"
+
+
+def _get_latency_sample(
+    latency: float, time_to_first_token: Optional[float] = None
+) -> Dict[str, float]:
+    sample = {"latency": latency}
+    if time_to_first_token is not None:
+        sample["time_to_first_token"] = time_to_first_token
+    return sample
+
+
+def get_deployment_usage_keys(
+    model_group: str, id: str, precise_minute: str
+) -> Tuple[str, str]:
+    """
+    Returns - (tpm key, rpm key)
+    """
+    key = f"{model_group}_latency:{id}:{precise_minute}"
+    return f"{key}:tpm", f"{key}:rpm"
+
+
+def _get_precise_minute() -> str:
+    return datetime.now().strftime("%Y-%m-%d-%H-%M")
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
+    """
+    Per deployment, the router cache has:
+    - `{model_group}_latency:{id}:samples` - a list of the last `max_latency_list_size` (latency, time to first token) samples, newest first
+    - `{model_group}_latency:{id}:{minute}:tpm` / `:rpm` - usage counters for the current minute
+
+    A success pushes one sample to its deployment's list, and the list is trimmed in the same step (LPUSH + LTRIM on redis),
+    so workers sharing redis all add to the same list without overwriting each other's samples - and routing reads one list per deployment.
+    The tpm / rpm counters are incremented, not read + rewritten - concurrent workers don't overwrite each other's counts.
+    """
+
     test_flag: bool = False
     logged_success: int = 0
     logged_failure: int = 0
@@ -52,140 +103,80 @@ class LowestLatencyLoggingHandler(CustomLogger):
         self.model_list = model_list
         self.routing_args = RoutingArgs(**routing_args)
 
-    def log_success_event(  # noqa: PLR0915
+    def _get_success_values(
         self, kwargs, response_obj, start_time, end_time
-    ):
-        try:
-            """
-            Update latency usage on success
-            """
-            if kwargs["litellm_params"].get("metadata") is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"]["metadata"].get(
-                    "model_group", None
-                )
-
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms: timedelta = end_time - start_time
-                time_to_first_token_response_time: Optional[timedelta] = None
+    ) -> Optional[Tuple[str, str, float, Optional[float], int]]:
+        """
+        Returns - (deployment id, model_group, latency, time to first token, total tokens), or None if the call isn't for a router deployment
+        """
+        if kwargs["litellm_params"].get("metadata") is None:
+            return None
+        model_group = kwargs["litellm_params"]["metadata"].get("model_group", None)
+        id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
+        if model_group is None or id is None:
+            return None
 
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
+        response_ms: Union[float, timedelta] = end_time - start_time
+        time_to_first_token_response_time: Optional[Union[float, timedelta]] = None
+        if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
+            # only log ttft for streaming request
+            time_to_first_token_response_time = (
+                kwargs.get("completion_start_time", end_time) - start_time
+            )
 
-                final_value: Union[float, timedelta] = response_ms
-                time_to_first_token: Optional[float] = None
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        final_value = float(
-                            response_ms.total_seconds() / completion_tokens
-                        )
-
-                        if time_to_first_token_response_time is not None:
-                            time_to_first_token = float(
-                                time_to_first_token_response_time.total_seconds()
-                                / completion_tokens
-                            )
-
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    self.router_cache.get_cache(
-                        key=latency_key, parent_otel_span=parent_otel_span
+        final_value = _to_seconds(response_ms)
+        time_to_first_token: Optional[float] = None
+        total_tokens = 0
+
+        if isinstance(response_obj, ModelResponse):
+            _usage = getattr(response_obj, "usage", None)
+            if _usage is not None:
+                completion_tokens = _usage.completion_tokens
+                total_tokens = _usage.total_tokens
+                final_value = float(final_value / completion_tokens)
+
+                if time_to_first_token_response_time is not None:
+                    time_to_first_token = float(
+                        _to_seconds(time_to_first_token_response_time)
+                        / completion_tokens
                     )
-                    or {}
-                )
-
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
-
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+        return str(id), model_group, final_value, time_to_first_token, total_tokens
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
-                )
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        """
+        Update latency usage on success
+        """
+        try:
+            values = self._get_success_values(
+                kwargs, response_obj, start_time, end_time
+            )
+            if values is None:
+                return
+            id, model_group, latency, time_to_first_token, total_tokens = values
+
+            ## Latency + time to first token
+            self.router_cache.push_to_list(
+                key=get_deployment_latency_key(model_group=model_group, id=id),
+                values=[_get_latency_sample(latency, time_to_first_token)],
+                max_size=self.routing_args.max_latency_list_size,
+                ttl=self.routing_args.ttl,
+            )
 
-                self.router_cache.set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
+            ## TPM / RPM
+            tpm_key, rpm_key = get_deployment_usage_keys(
+                model_group=model_group, id=id, precise_minute=_get_precise_minute()
+            )
+            self.router_cache.increment_cache(
+                key=tpm_key, value=total_tokens, ttl=USAGE_KEY_TTL
+            )
+            self.router_cache.increment_cache(key=rpm_key, value=1, ttl=USAGE_KEY_TTL)
 
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::log_success_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
@@ -197,200 +188,73 @@ class LowestLatencyLoggingHandler(CustomLogger):
         """
         try:
             _exception = kwargs.get("exception", None)
-            if isinstance(_exception, litellm.Timeout):
-                if kwargs["litellm_params"].get("metadata") is None:
-                    pass
-                else:
-                    model_group = kwargs["litellm_params"]["metadata"].get(
-                        "model_group", None
-                    )
-
-                    id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                    if model_group is None or id is None:
-                        return
-                    elif isinstance(id, int):
-                        id = str(id)
-
-                    # ------------
-                    # Setup values
-                    # ------------
-                    """
-                    {
-                        {model_group}_map: {
-                            id: {
-                                "latency": [..]
-                                f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                            }
-                        }
-                    }
-                    """
-                    latency_key = f"{model_group}_map"
-                    request_count_dict = (
-                        await self.router_cache.async_get_cache(key=latency_key) or {}
-                    )
-
-                    if id not in request_count_dict:
-                        request_count_dict[id] = {}
-
-                    ## Latency - give 1000s penalty for failing
-                    if (
-                        len(request_count_dict[id].get("latency", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault("latency", []).append(1000.0)
-                    else:
-                        request_count_dict[id]["latency"] = request_count_dict[id][
-                            "latency"
-                        ][: self.routing_args.max_latency_list_size - 1] + [1000.0]
-
-                    await self.router_cache.async_set_cache(
-                        key=latency_key,
-                        value=request_count_dict,
-                        ttl=self.routing_args.ttl,
-                    )  # reset map within window
-            else:
+            if not isinstance(_exception, litellm.Timeout):
                 # do nothing if it's not a timeout error
                 return
+            if kwargs["litellm_params"].get("metadata") is None:
+                return
+            model_group = kwargs["litellm_params"]["metadata"].get("model_group", None)
+            id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
+            if model_group is None or id is None:
+                return
+
+            ## Latency - give 1000s penalty for failing
+            await self.router_cache.async_push_to_list(
+                key=get_deployment_latency_key(model_group=model_group, id=str(id)),
+                values=[_get_latency_sample(1000.0)],
+                max_size=self.routing_args.max_latency_list_size,
+                ttl=self.routing_args.ttl,
+            )
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::async_log_failure_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
             pass
 
-    async def async_log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        """
+        Update latency usage on success
+        """
         try:
-            """
-            Update latency usage on success
-            """
-            if kwargs["litellm_params"].get("metadata") is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"]["metadata"].get(
-                    "model_group", None
-                )
-
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            "time_to_first_token": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms: timedelta = end_time - start_time
-                time_to_first_token_response_time: Optional[timedelta] = None
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
-
-                final_value: Union[float, timedelta] = response_ms
-                total_tokens = 0
-                time_to_first_token: Optional[float] = None
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        final_value = float(
-                            response_ms.total_seconds() / completion_tokens
-                        )
-
-                        if time_to_first_token_response_time is not None:
-                            time_to_first_token = float(
-                                time_to_first_token_response_time.total_seconds()
-                                / completion_tokens
-                            )
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    await self.router_cache.async_get_cache(
-                        key=latency_key,
-                        parent_otel_span=parent_otel_span,
-                        local_only=True,
-                    )
-                    or {}
-                )
-
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
-
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
-
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
-                )
+            values = self._get_success_values(
+                kwargs, response_obj, start_time, end_time
+            )
+            if values is None:
+                return
+            id, model_group, latency, time_to_first_token, total_tokens = values
+            parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
+
+            ## Latency + time to first token
+            await self.router_cache.async_push_to_list(
+                key=get_deployment_latency_key(model_group=model_group, id=id),
+                values=[_get_latency_sample(latency, time_to_first_token)],
+                max_size=self.routing_args.max_latency_list_size,
+                parent_otel_span=parent_otel_span,
+                ttl=self.routing_args.ttl,
+            )
 
-                await self.router_cache.async_set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
+            ## TPM / RPM
+            tpm_key, rpm_key = get_deployment_usage_keys(
+                model_group=model_group, id=id, precise_minute=_get_precise_minute()
+            )
+            await self.router_cache.async_increment_cache(
+                key=tpm_key,
+                value=total_tokens,
+                parent_otel_span=parent_otel_span,
+                ttl=USAGE_KEY_TTL,
+            )
+            await self.router_cache.async_increment_cache(
+                key=rpm_key,
+                value=1,
+                parent_otel_span=parent_otel_span,
+                ttl=USAGE_KEY_TTL,
+            )
 
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
                 "litellm.router_strategy.lowest_latency.py::async_log_success_event(): Exception occured - {}".format(
@@ -399,6 +263,73 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             pass
 
+    def _get_latency_statistic(self, values: List[Any]) -> float:
+        """
+        mean of the values, or the `latency_percentile` (nearest rank) if set
+        """
+        latencies = [
+            v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)
+        ]
+        if len(latencies) == 0:
+            return 0.0
+        if self.routing_args.latency_percentile is None:
+            return sum(latencies) / len(latencies)
+        latencies.sort()
+        rank = math.ceil(self.routing_args.latency_percentile / 100 * len(latencies))
+        return float(latencies[min(max(rank, 1), len(latencies)) - 1])
+
+    def _get_deployment_keys(
+        self, model_group: str, healthy_deployments: list
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Returns - (deployment ids, latency key of each deployment, [tpm key, rpm key] of each deployment)
+        """
+        precise_minute = _get_precise_minute()
+        ids: List[str] = []
+        latency_keys: List[str] = []
+        usage_keys: List[str] = []
+        for deployment in healthy_deployments:
+            id = str(deployment["model_info"]["id"])
+            ids.append(id)
+            latency_keys.append(
+                get_deployment_latency_key(model_group=model_group, id=id)
+            )
+            usage_keys.extend(
+                get_deployment_usage_keys(
+                    model_group=model_group, id=id, precise_minute=precise_minute
+                )
+            )
+        return ids, latency_keys, usage_keys
+
+    def _get_request_count_dict(
+        self,
+        ids: List[str],
+        latency_values: Optional[List[Any]],
+        usage_values: Optional[List[Any]],
+    ) -> Dict:
+        """
+        Combine the per-deployment cache values into `{id: {"latency": [..], "time_to_first_token": [..], "tpm": int, "rpm": int}}`
+        """
+        request_count_dict: Dict[str, Dict[str, Any]] = {}
+        latency_values = latency_values or [None] * len(ids)
+        usage_values = usage_values or [None] * (2 * len(ids))
+        for i, id in enumerate(ids):
+            samples = [
+                sample for sample in latency_values[i] or [] if isinstance(sample, dict)
+            ]
+            tpm, rpm = usage_values[2 * i], usage_values[2 * i + 1]
+            if len(samples) == 0 and tpm is None and rpm is None:
+                continue
+            item_map: Dict[str, Any] = {}
+            for field in LATENCY_FIELDS:
+                values = [sample[field] for sample in samples if field in sample]
+                if len(values) > 0:
+                    item_map[field] = values
+            item_map["tpm"] = int(float(tpm or 0))
+            item_map["rpm"] = int(float(rpm or 0))
+            request_count_dict[id] = item_map
+        return request_count_dict
+
     def _get_available_deployments(  # noqa: PLR0915
         self,
         model_group: str,
@@ -416,11 +347,6 @@ class LowestLatencyLoggingHandler(CustomLogger):
         _latency_per_deployment = {}
         lowest_latency = float("inf")
 
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_hour = datetime.now().strftime("%H")
-        current_minute = datetime.now().strftime("%M")
-        precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
         deployment = None
 
         if request_count_dict is None:  # base case
@@ -429,10 +355,11 @@ class LowestLatencyLoggingHandler(CustomLogger):
         all_deployments = request_count_dict
         for d in healthy_deployments:
             ## if healthy deployment not yet used
-            if d["model_info"]["id"] not in all_deployments:
-                all_deployments[d["model_info"]["id"]] = {
+            if str(d["model_info"]["id"]) not in all_deployments:
+                all_deployments[str(d["model_info"]["id"])] = {
                     "latency": [0],
-                    precise_minute: {"tpm": 0, "rpm": 0},
+                    "tpm": 0,
+                    "rpm": 0,
                 }
 
         try:
@@ -452,7 +379,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
             ## get the item from model list
             _deployment = None
             for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
+                if item == str(m["model_info"]["id"]):
                     _deployment = m
 
             if _deployment is None:
@@ -473,25 +400,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             item_latency = item_map.get("latency", [])
             item_ttft_latency = item_map.get("time_to_first_token", [])
-            item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
-            item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
+            item_rpm = item_map.get("rpm", 0)
+            item_tpm = item_map.get("tpm", 0)
 
-            # get average latency or average ttft (depending on streaming/non-streaming)
-            total: float = 0.0
+            # get average (or percentile) latency or ttft (depending on streaming/non-streaming)
             if (
                 request_kwargs is not None
                 and request_kwargs.get("stream", None) is not None
                 and request_kwargs["stream"] is True
                 and len(item_ttft_latency) > 0
             ):
-                for _call_latency in item_ttft_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
+                item_latency = self._get_latency_statistic(item_ttft_latency)
             else:
-                for _call_latency in item_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            item_latency = total / len(item_latency)
+                item_latency = self._get_latency_statistic(item_latency)
 
             # -------------- #
             # Debugging Logic
@@ -549,17 +470,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
     ):
-        # get list of potential deployments
-        latency_key = f"{model_group}_map"
-
+        # get latency + usage of each deployment - 1 list + 2 counters per deployment, read in parallel
         parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
             request_kwargs
         )
-        request_count_dict = (
-            await self.router_cache.async_get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
-            )
-            or {}
+        ids, latency_keys, usage_keys = self._get_deployment_keys(
+            model_group=model_group, healthy_deployments=healthy_deployments
+        )
+        latency_values, usage_values = await asyncio.gather(
+            self.router_cache.async_batch_get_lists(
+                keys=latency_keys, parent_otel_span=parent_otel_span
+            ),
+            self.router_cache.async_batch_get_cache(
+                keys=usage_keys, parent_otel_span=parent_otel_span
+            ),
         )
 
         return self._get_available_deployments(
@@ -568,7 +492,9 @@ class LowestLatencyLoggingHandler(CustomLogger):
             messages,
             input,
             request_kwargs,
-            request_count_dict,
+            self._get_request_count_dict(
+                ids=ids, latency_values=latency_values, usage_values=usage_values
+            ),
         )
 
     def get_available_deployments(
@@ -582,17 +508,18 @@ class LowestLatencyLoggingHandler(CustomLogger):
         """
         Returns a deployment with the lowest latency
         """
-        # get list of potential deployments
-        latency_key = f"{model_group}_map"
-
+        # get latency + usage of each deployment - 1 list + 2 counters per deployment
         parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
             request_kwargs
         )
-        request_count_dict = (
-            self.router_cache.get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
-            )
-            or {}
+        ids, latency_keys, usage_keys = self._get_deployment_keys(
+            model_group=model_group, healthy_deployments=healthy_deployments
+        )
+        latency_values = self.router_cache.batch_get_lists(
+            keys=latency_keys, parent_otel_span=parent_otel_span
+        )
+        usage_values = self.router_cache.batch_get_cache(
+            keys=usage_keys, parent_otel_span=parent_otel_span
         )
 
         return self._get_available_deployments(
@@ -601,5 +528,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
             messages,
             input,
             request_kwargs,
-            request_count_dict,
+            self._get_request_count_dict(
+                ids=ids, latency_values=latency_values, usage_values=usage_values
+            ),
         )
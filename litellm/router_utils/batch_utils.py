@@ -1,50 +1,85 @@
 import io
 import json
-from typing import IO, Optional, Tuple, Union
+import os
+import tempfile
+from typing import IO, Any, Iterator, Optional, Tuple, Union
 
+from litellm.constants import BATCH_FILE_MAX_IN_MEMORY_SIZE
+from litellm.litellm_core_utils.json_utils import fast_json_dumps, fast_json_loads
 
-class InMemoryFile(io.BytesIO):
-    def __init__(self, content: bytes, name: str):
-        super().__init__(content)
+
+class SpooledJsonlFile(tempfile.SpooledTemporaryFile):
+    """
+    Kept in memory up to `max_size` bytes, then moved to a temp file on disk
+    """
+
+    # plain attribute - shadows SpooledTemporaryFile's read-only `name` property (the temp file's path, once rolled over)
+    name: str = "modified_file.jsonl"  # type: ignore
+
+    def __init__(self, name: str, max_size: int = BATCH_FILE_MAX_IN_MEMORY_SIZE):
+        super().__init__(max_size=max_size, mode="w+b")
         self.name = name
 
 
+def _iter_lines(
+    file_content: Union[bytes, str, IO[bytes], Tuple[Any, ...]]
+) -> Iterator[bytes]:
+    """
+    Yield the lines of a file, without reading all of it into memory when it's a file-like object
+    """
+    if isinstance(file_content, tuple):
+        file_content = file_content[1]
+    if isinstance(file_content, str):
+        file_content = file_content.encode("utf-8")
+    if isinstance(file_content, (bytes, bytearray)):
+        file_content = io.BytesIO(file_content)
+    if not hasattr(file_content, "read"):
+        raise TypeError(f"Unsupported file content type: {type(file_content)}")
+
+    if hasattr(file_content, "seek"):
+        file_content.seek(0)
+    for line in file_content:
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        yield line
+
+
 def replace_model_in_jsonl(
     file_content: Union[bytes, Tuple[str, bytes, str]], new_model_name: str
-) -> Optional[InMemoryFile]:
+) -> Optional[IO[bytes]]:
+    """
+    Rewrite `body.model` on each line of a batch .jsonl file.
+
+    The file is read and written one line at a time - the output is kept in memory up to BATCH_FILE_MAX_IN_MEMORY_SIZE bytes, then spooled to a temp file.
+    Returns None if the file isn't valid jsonl.
+    """
+    name = "modified_file.jsonl"
+    if isinstance(file_content, tuple) and isinstance(file_content[0], str):
+        name = file_content[0]
+    elif isinstance(getattr(file_content, "name", None), str):
+        name = os.path.basename(file_content.name)  # type: ignore
+    modified_file = SpooledJsonlFile(name=name)
     try:
-        # Decode the bytes to a string and split into lines
-        # If file_content is a file-like object, read the bytes
-        if hasattr(file_content, "read"):
-            file_content_bytes = file_content.read()  # type: ignore
-        elif isinstance(file_content, tuple):
-            file_content_bytes = file_content[1]
-        else:
-            file_content_bytes = file_content
-
-        # Decode the bytes to a string and split into lines
-        if isinstance(file_content_bytes, bytes):
-            file_content_str = file_content_bytes.decode("utf-8")
-        else:
-            file_content_str = file_content_bytes
-        lines = file_content_str.splitlines()
-        modified_lines = []
-        for line in lines:
+        for line in _iter_lines(file_content):
+            line = line.strip()
+            if not line:
+                continue
             # Parse each line as a JSON object
-            json_object = json.loads(line.strip())
+            json_object = fast_json_loads(line)
 
             # Replace the model name if it exists
-            if "body" in json_object:
+            if isinstance(json_object, dict) and isinstance(
+                json_object.get("body"), dict
+            ):
                 json_object["body"]["model"] = new_model_name
 
-            # Convert the modified JSON object back to a string
-            modified_lines.append(json.dumps(json_object))
-
-        # Reassemble the modified lines and return as bytes
-        modified_file_content = "\n".join(modified_lines).encode("utf-8")
-        return InMemoryFile(modified_file_content, name="modified_file.jsonl")  # type: ignore
+            modified_file.write(fast_json_dumps(json_object))
+            modified_file.write(b"\n")
+        modified_file.seek(0)
+        return modified_file  # type: ignore
 
     except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
+        modified_file.close()
         return None
 
 
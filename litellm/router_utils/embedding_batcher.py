@@ -0,0 +1,377 @@
+"""
+Micro-batching for concurrent embedding requests to the same deployment
+
+Enabled per deployment, with `model_info.embedding_batching`:
+```yaml
+model_list:
+  - model_name: text-embedding-3-small
+    litellm_params:
+      model: text-embedding-3-small
+    model_info:
+      embedding_batching:
+        max_wait_ms: 5 # max time the first input waits for others to join its batch
+        max_batch_size: 256 # max inputs per provider request
+        max_batch_tokens: 100000 # optional - max (estimated) tokens per provider request
+```
+
+Inputs from concurrent `Router.aembedding` calls are collected for up to `max_wait_ms`, or until the batch is full, and sent as one provider request.
+Each caller gets back its own vectors, with the batch usage + response_cost split by its share of the (estimated) input tokens.
+
+Only calls with the same request params (dimensions, encoding_format, user) and the same api key / team / end user are batched together.
+The provider request itself isn't logged - success / failure callbacks (spend logs, router tpm/rpm tracking, ...) run once per caller, with the caller's litellm_call_id and its share of the usage.
+"""
+
+import asyncio
+import datetime
+import json
+import threading
+import traceback
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import litellm
+from litellm._logging import verbose_router_logger
+from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.types.router import EmbeddingBatchingConfig
+from litellm.types.utils import CallTypes, EmbeddingResponse, Usage
+
+EMBEDDING_BATCH_GROUP_PARAMS = ("dimensions", "encoding_format", "user", "input_type")
+EMBEDDING_BATCH_GROUP_METADATA = (
+    "user_api_key",
+    "user_api_key_team_id",
+    "user_api_key_end_user_id",
+)
+
+
+def _estimate_tokens(input: Union[str, List[int]]) -> int:
+    # ~4 characters per token - only used to pack batches + split usage between callers
+    if isinstance(input, str):
+        return len(input) // 4 + 1
+    return len(input)
+
+
+class _PendingEmbeddingBatch:
+    def __init__(self, embedding_fn: Callable[..., Awaitable[Any]]):
+        # the first caller's request is used for the provider call
+        self.embedding_fn = embedding_fn
+        self.inputs: List[Any] = []
+        self.tokens = 0
+        # (start, end, tokens, future) - one per caller
+        self.callers: List[Tuple[int, int, int, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        max_wait_ms: float = 5,
+        max_batch_size: int = 256,
+        max_batch_tokens: Optional[int] = None,
+    ):
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.pending: Dict[Tuple[int, str], _PendingEmbeddingBatch] = {}
+        # keeps a reference to in-flight provider requests, so they aren't garbage collected
+        self.send_tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_model_info(
+        cls, model_info: Optional[dict]
+    ) -> Optional["EmbeddingBatcher"]:
+        config: Optional[EmbeddingBatchingConfig] = (model_info or {}).get(
+            "embedding_batching"
+        )
+        if not config:
+            return None
+        return cls(**config)
+
+    @staticmethod
+    def can_batch(input: Any) -> bool:
+        if isinstance(input, str):
+            return True
+        return (
+            isinstance(input, list)
+            and len(input) > 0
+            and all(isinstance(item, str) for item in input)
+        )
+
+    @staticmethod
+    def get_group_key(kwargs: dict) -> str:
+        metadata = kwargs.get("metadata") or {}
+        return json.dumps(
+            [kwargs.get(param) for param in EMBEDDING_BATCH_GROUP_PARAMS]
+            + [metadata.get(key) for key in EMBEDDING_BATCH_GROUP_METADATA],
+            default=str,
+        )
+
+    def _is_full(
+        self, batch: _PendingEmbeddingBatch, num_inputs: int, tokens: int
+    ) -> bool:
+        if len(batch.inputs) + num_inputs > self.max_batch_size:
+            return True
+        return (
+            self.max_batch_tokens is not None
+            and batch.tokens + tokens > self.max_batch_tokens
+        )
+
+    async def aembedding(
+        self,
+        input: Union[str, List[str]],
+        group_key: str,
+        embedding_fn: Callable[..., Awaitable[Any]],
+    ) -> EmbeddingResponse:
+        """
+        Args:
+            input: the caller's input
+            group_key: only calls with the same group key are batched - see `get_group_key`
+            embedding_fn: called as `embedding_fn(input=<list of inputs>)` for the provider request - e.g. `aembedding_without_logging`
+        """
+        inputs = [input] if isinstance(input, str) else input
+        tokens = sum(_estimate_tokens(item) for item in inputs)
+        empty_batch = _PendingEmbeddingBatch(embedding_fn=embedding_fn)
+        if self._is_full(empty_batch, num_inputs=len(inputs), tokens=tokens):
+            # too big to share a request
+            return await embedding_fn(input=input)
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), group_key)
+        batch = self.pending.get(key)
+        if batch is not None and self._is_full(
+            batch, num_inputs=len(inputs), tokens=tokens
+        ):
+            self._flush(key, batch)
+            batch = None
+        if batch is None:
+            batch = empty_batch
+            self.pending[key] = batch
+            batch.timer = loop.call_later(
+                self.max_wait_ms / 1000, self._flush, key, batch
+            )
+
+        future = loop.create_future()
+        batch.callers.append(
+            (len(batch.inputs), len(batch.inputs) + len(inputs), tokens, future)
+        )
+        batch.inputs.extend(inputs)
+        batch.tokens += tokens
+        if len(batch.inputs) >= self.max_batch_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Tuple[int, str], batch: _PendingEmbeddingBatch) -> None:
+        if self.pending.get(key) is batch:
+            del self.pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        task = asyncio.create_task(self._send(batch))
+        self.send_tasks.add(task)
+        task.add_done_callback(self.send_tasks.discard)
+
+    async def _send(self, batch: _PendingEmbeddingBatch) -> None:
+        verbose_router_logger.debug(
+            "EmbeddingBatcher: sending {} inputs from {} calls".format(
+                len(batch.inputs), len(batch.callers)
+            )
+        )
+        try:
+            response = await batch.embedding_fn(input=batch.inputs)
+        except Exception as e:
+            for _, _, _, future in batch.callers:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        try:
+            responses = self._split_response(response=response, batch=batch)
+        except Exception as e:
+            verbose_router_logger.exception(
+                "EmbeddingBatcher: failed to split response - {}".format(str(e))
+            )
+            for _, _, _, future in batch.callers:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, _, future), caller_response in zip(batch.callers, responses):
+            if not future.done():
+                future.set_result(caller_response)
+
+    def _split_response(
+        self, response: EmbeddingResponse, batch: _PendingEmbeddingBatch
+    ) -> List[EmbeddingResponse]:
+        if len(response.data) != len(batch.inputs):
+            raise ValueError(
+                f"Expected {len(batch.inputs)} embeddings, got {len(response.data)}"
+            )
+        data = sorted(response.data, key=lambda item: item["index"])
+        usage: Optional[Usage] = getattr(response, "usage", None)
+        prompt_tokens = (usage.prompt_tokens or 0) if usage is not None else 0
+        hidden_params = getattr(response, "_hidden_params", {}) or {}
+        response_cost = hidden_params.get("response_cost")
+
+        responses: List[EmbeddingResponse] = []
+        tokens_before = 0
+        for start, end, tokens, _ in batch.callers:
+            # shares are rounded on the running total, so they add up to the batch usage
+            share_start = tokens_before / batch.tokens
+            tokens_before += tokens
+            share_end = tokens_before / batch.tokens
+            caller_prompt_tokens = round(prompt_tokens * share_end) - round(
+                prompt_tokens * share_start
+            )
+            caller_response = EmbeddingResponse(
+                model=response.model,
+                data=[
+                    _with_index(item, index)
+                    for index, item in enumerate(data[start:end])
+                ],
+                usage=Usage(
+                    prompt_tokens=caller_prompt_tokens,
+                    completion_tokens=0,
+                    total_tokens=caller_prompt_tokens,
+                ),
+            )
+            caller_response._hidden_params = {
+                **hidden_params,
+                "response_cost": (
+                    response_cost * (share_end - share_start)
+                    if response_cost is not None
+                    else None
+                ),
+                "embedding_batch_size": len(batch.inputs),
+            }
+            caller_response._response_ms = getattr(response, "_response_ms", None)  # type: ignore
+            responses.append(caller_response)
+        return responses
+
+
+class _UnloggedLoggingObj(LiteLLMLoggingObj):
+    """
+    Logging object for the shared provider request - its callers are logged instead, see `log_caller_success` / `log_caller_failure`
+    """
+
+    def success_handler(self, *args, **kwargs):
+        return None
+
+    async def async_success_handler(self, *args, **kwargs):
+        return None
+
+    def failure_handler(self, *args, **kwargs):
+        return None
+
+    async def async_failure_handler(self, *args, **kwargs):
+        return None
+
+
+async def aembedding_without_logging(**kwargs) -> EmbeddingResponse:
+    """
+    `litellm.aembedding`, without success / failure callbacks. Used as the `embedding_fn` of a batch.
+    """
+    logging_obj = _UnloggedLoggingObj(
+        model=kwargs["model"],
+        messages=None,
+        stream=False,
+        call_type=CallTypes.aembedding.value,
+        start_time=datetime.datetime.now(),
+        litellm_call_id=str(uuid.uuid4()),
+        function_id=str(uuid.uuid4()),
+    )
+    return await litellm.aembedding(**kwargs, litellm_logging_obj=logging_obj)
+
+
+def _get_caller_logging_obj(
+    input: Union[str, List[str]], call_kwargs: dict, start_time: datetime.datetime
+) -> LiteLLMLoggingObj:
+    """
+    The caller's logging object - set up like `litellm.aembedding` would for a call of its own
+    """
+    logging_obj: Optional[LiteLLMLoggingObj] = call_kwargs.get("litellm_logging_obj")
+    if logging_obj is None:
+        logging_obj, _ = litellm.utils.function_setup(
+            CallTypes.aembedding.value,
+            None,
+            start_time,
+            **{
+                **call_kwargs,
+                "input": input,
+                "litellm_call_id": call_kwargs.get("litellm_call_id")
+                or str(uuid.uuid4()),
+            },
+        )
+    model, custom_llm_provider, _, _ = litellm.get_llm_provider(
+        model=call_kwargs["model"],
+        custom_llm_provider=call_kwargs.get("custom_llm_provider"),
+        api_base=call_kwargs.get("api_base"),
+    )
+    logging_obj.update_environment_variables(  # type: ignore
+        model=model,
+        user=call_kwargs.get("user"),
+        optional_params={
+            param: call_kwargs[param]
+            for param in EMBEDDING_BATCH_GROUP_PARAMS
+            if call_kwargs.get(param) is not None
+        },
+        litellm_params={
+            "litellm_call_id": logging_obj.litellm_call_id,  # type: ignore
+            "metadata": call_kwargs.get("metadata"),
+            "model_info": call_kwargs.get("model_info"),
+            "proxy_server_request": call_kwargs.get("proxy_server_request"),
+            "api_base": call_kwargs.get("api_base"),
+            "aembedding": True,
+        },
+        custom_llm_provider=custom_llm_provider,
+    )
+    logging_obj.pre_call(input=input, api_key="")  # type: ignore
+    return logging_obj  # type: ignore
+
+
+def log_caller_success(
+    response: EmbeddingResponse,
+    input: Union[str, List[str]],
+    call_kwargs: dict,
+    start_time: datetime.datetime,
+) -> None:
+    """
+    Run the success callbacks for one caller of a batch - `response` has the caller's share of the usage
+    """
+    end_time = datetime.datetime.now()
+    logging_obj = _get_caller_logging_obj(
+        input=input, call_kwargs=call_kwargs, start_time=start_time
+    )
+    response._hidden_params["litellm_call_id"] = logging_obj.litellm_call_id
+    response._hidden_params["model_id"] = (call_kwargs.get("model_info") or {}).get(
+        "id"
+    )
+    asyncio.create_task(
+        logging_obj.async_success_handler(response, start_time, end_time)
+    )
+    threading.Thread(
+        target=logging_obj.success_handler, args=(response, start_time, end_time)
+    ).start()
+
+
+async def log_caller_failure(
+    exception: Exception,
+    input: Union[str, List[str]],
+    call_kwargs: dict,
+    start_time: datetime.datetime,
+) -> None:
+    """
+    Run the failure callbacks for one caller of a failed batch
+    """
+    end_time = datetime.datetime.now()
+    logging_obj = _get_caller_logging_obj(
+        input=input, call_kwargs=call_kwargs, start_time=start_time
+    )
+    traceback_exception = traceback.format_exc()
+    # not threaded - router retries / fallbacks rely on it, same as `litellm.aembedding`
+    logging_obj.failure_handler(exception, traceback_exception, start_time, end_time)
+    await logging_obj.async_failure_handler(
+        exception, traceback_exception, start_time, end_time
+    )
+
+
+def _with_index(item: Any, index: int) -> Any:
+    if isinstance(item, dict):
+        return {**item, "index": index}
+    return item.model_copy(update={"index": index})
@@ -2,6 +2,8 @@ REQUESTED_MODEL = "requested_model"
 EXCEPTION_STATUS = "exception_status"
 EXCEPTION_CLASS = "exception_class"
 EXCEPTION_LABELS = [EXCEPTION_STATUS, EXCEPTION_CLASS]
+# label value used once a label hits its `litellm.prometheus_label_cardinality_limits` limit
+PROMETHEUS_OVERFLOW_LABEL_VALUE = "__overflow__"
 LATENCY_BUCKETS = (
     0.005,
     0.00625,
@@ -22,6 +22,17 @@ class ProviderRegionOutageModel(BaseOutageModel):
     deployment_ids: Set[str]
 
 
+class HangingRequestData(TypedDict):
+    """
+    What's kept for an in-flight request, to alert on it if it hangs
+    """
+
+    litellm_call_id: str
+    model: str
+    messages_preview: str
+    metadata: Optional[dict]
+
+
 # we use this for the email header, please send a test email if you change this. verify it looks good on email
 LITELLM_LOGO_URL = "https://litellm-listing.s3.amazonaws.com/litellm_logo.png"
 LITELLM_SUPPORT_CONTACT = "support@berri.ai"
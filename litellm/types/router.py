@@ -432,6 +432,16 @@ class RouterErrors(enum.Enum):
     )
 
 
+class EmbeddingBatchingConfig(TypedDict, total=False):
+    """
+    `model_info.embedding_batching` - batch concurrent embedding requests to a deployment
+    """
+
+    max_wait_ms: float
+    max_batch_size: int
+    max_batch_tokens: Optional[int]
+
+
 class AllowedFailsPolicy(BaseModel):
     """
     Use this to set a custom number of allowed fails/minute before cooling down a deployment
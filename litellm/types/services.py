@@ -36,3 +36,19 @@ class ServiceLoggerPayload(BaseModel):
         except Exception as e:
             # if using pydantic v1
             return self.dict(**kwargs)
+
+
+class ServiceMetricsSummary(BaseModel):
+    """
+    Aggregated latency / error counts for a service call_type, over one flush interval
+    """
+
+    service: str
+    call_type: str
+    count: int
+    error_count: int
+    avg_duration: float
+    max_duration: float
+    p50_duration: float = Field(description="upper bound of the p50 latency bucket")
+    p95_duration: float = Field(description="upper bound of the p95 latency bucket")
+    p99_duration: float = Field(description="upper bound of the p99 latency bucket")
@@ -78,6 +78,7 @@ from litellm.litellm_core_utils.get_llm_provider_logic import (
 from litellm.litellm_core_utils.get_supported_openai_params import (
     get_supported_openai_params,
 )
+from litellm.litellm_core_utils.llm_cost_calc.pricing_index import clear_pricing_index
 from litellm.litellm_core_utils.llm_request_utils import _ensure_extra_body_is_safe
 from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response import (
     LiteLLMResponseObjectHandler,
@@ -154,7 +155,7 @@ from typing import (
 
 from openai import OpenAIError as OriginalError
 
-from ._logging import verbose_logger
+from ._logging import _format_log_message, verbose_logger
 from .caching.caching import (
     Cache,
     QdrantSemanticCache,
@@ -249,18 +250,24 @@ last_fetched_at_keys = None
 ############################################################
 def print_verbose(
     print_statement,
+    *args,
     logger_only: bool = False,
     log_level: Literal["DEBUG", "INFO", "ERROR"] = "DEBUG",
 ):
+    """
+    `print_statement` can be a %-style format string, e.g. `print_verbose("response: %s", response)`.
+
+    `args` are only formatted if the message is logged / printed.
+    """
     try:
         if log_level == "DEBUG":
-            verbose_logger.debug(print_statement)
+            verbose_logger.debug(print_statement, *args)
         elif log_level == "INFO":
-            verbose_logger.info(print_statement)
+            verbose_logger.info(print_statement, *args)
         elif log_level == "ERROR":
-            verbose_logger.error(print_statement)
+            verbose_logger.error(print_statement, *args)
         if litellm.set_verbose is True and logger_only is False:
-            print(print_statement)  # noqa
+            print(_format_log_message(print_statement, args))  # noqa
     except Exception:
         pass
 
@@ -322,7 +329,8 @@ def function_setup(  # noqa: PLR0915
                 if callback not in litellm._async_failure_callback:
                     litellm._async_failure_callback.append(callback)  # type: ignore
             print_verbose(
-                f"Initialized litellm callbacks, Async Success Callbacks: {litellm._async_success_callback}"
+                "Initialized litellm callbacks, Async Success Callbacks: %s",
+                litellm._async_success_callback,
             )
 
         if (
@@ -773,7 +781,10 @@ def client(original_function):  # noqa: PLR0915
 
             # [OPTIONAL] CHECK CACHE
             print_verbose(
-                f"SYNC kwargs[caching]: {kwargs.get('caching', False)}; litellm.cache: {litellm.cache}; kwargs.get('cache')['no-cache']: {kwargs.get('cache', {}).get('no-cache', False)}"
+                "SYNC kwargs[caching]: %s; litellm.cache: %s; kwargs.get('cache')['no-cache']: %s",
+                kwargs.get("caching", False),
+                litellm.cache,
+                kwargs.get("cache", {}).get("no-cache", False),
             )
             # if caching is false or cache["no-cache"]==True, don't run this
             if (
@@ -843,7 +854,7 @@ def client(original_function):  # noqa: PLR0915
                     )
                     kwargs["max_tokens"] = modified_max_tokens
                 except Exception as e:
-                    print_verbose(f"Error while checking max token limit: {str(e)}")
+                    print_verbose("Error while checking max token limit: %s", str(e))
             # MODEL CALL
             result = original_function(*args, **kwargs)
             end_time = datetime.datetime.now()
@@ -887,9 +898,8 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object, remove `handle_success` once it's deprecated
             verbose_logger.info("Wrapper: Completed Call, calling success_handler")
-            threading.Thread(
-                target=logging_obj.success_handler, args=(result, start_time, end_time)
-            ).start()
+            # on the shared thread pool - starting a thread per request blocks the caller until the thread runs
+            executor.submit(logging_obj.success_handler, result, start_time, end_time)
             # RETURN RESULT
             if hasattr(result, "_hidden_params"):
                 result._hidden_params["model_id"] = kwargs.get("model_info", {}).get(
@@ -1004,7 +1014,10 @@ def client(original_function):  # noqa: PLR0915
 
             # [OPTIONAL] CHECK CACHE
             print_verbose(
-                f"ASYNC kwargs[caching]: {kwargs.get('caching', False)}; litellm.cache: {litellm.cache}; kwargs.get('cache'): {kwargs.get('cache', None)}"
+                "ASYNC kwargs[caching]: %s; litellm.cache: %s; kwargs.get('cache'): %s",
+                kwargs.get("caching", False),
+                litellm.cache,
+                kwargs.get("cache", None),
             )
             _caching_handler_response: CachingHandlerResponse = (
                 await _llm_caching_handler._async_get_cache(
@@ -1089,16 +1102,15 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object
             print_verbose(
-                f"Async Wrapper: Completed Call, calling async_success_handler: {logging_obj.async_success_handler}"
+                "Async Wrapper: Completed Call, calling async_success_handler: %s",
+                logging_obj.async_success_handler,
             )
             # check if user does not want this to be logged
             asyncio.create_task(
                 logging_obj.async_success_handler(result, start_time, end_time)
             )
-            threading.Thread(
-                target=logging_obj.success_handler,
-                args=(result, start_time, end_time),
-            ).start()
+            # on the shared thread pool - starting a thread per request blocks the caller until the thread runs
+            executor.submit(logging_obj.success_handler, result, start_time, end_time)
 
             # REBUILD EMBEDDING CACHING
             if (
@@ -1261,7 +1273,7 @@ def openai_token_counter(  # noqa: PLR0915
 
     Borrowed from https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb.
     """
-    print_verbose(f"LiteLLM: Utils - Counting tokens for OpenAI model={model}")
+    print_verbose("LiteLLM: Utils - Counting tokens for OpenAI model=%s", model)
     try:
         if "gpt-4o" in model:
             encoding = tiktoken.get_encoding("o200k_base")
@@ -1605,7 +1617,7 @@ def token_counter(
     num_tokens = 0
     if text is None:
         if messages is not None:
-            print_verbose(f"token_counter messages received: {messages}")
+            print_verbose("token_counter messages received: %s", messages)
             text = ""
             for message in messages:
                 if message.get("content", None) is not None:
@@ -1657,7 +1669,7 @@ def token_counter(
                     model = model.replace("-35", "-3.5")
 
                 print_verbose(
-                    f"Token Counter - using OpenAI token counter, for model={model}"
+                    "Token Counter - using OpenAI token counter, for model=%s", model
                 )
                 num_tokens = openai_token_counter(
                     text=text,  # type: ignore
@@ -1670,7 +1682,7 @@ def token_counter(
                 )
             else:
                 print_verbose(
-                    f"Token Counter - using generic token counter, for model={model}"
+                    "Token Counter - using generic token counter, for model=%s", model
                 )
                 num_tokens = openai_token_counter(
                     text=text,  # type: ignore
@@ -1982,7 +1994,7 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         litellm.model_cost.setdefault(model_cost_key, {}).update(
             _update_dictionary(existing_model, value)  # type: ignore
         )
-        verbose_logger.debug(f"{key} added to model cost map")
+        verbose_logger.debug("%s added to model cost map", key)
         # add new model names to provider lists
         if value.get("litellm_provider") == "openai":
             if key not in litellm.open_ai_chat_completion_models:
@@ -2024,6 +2036,7 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         elif value.get("litellm_provider") == "bedrock":
             if key not in litellm.bedrock_models:
                 litellm.bedrock_models.append(key)
+    clear_pricing_index()
     return model_cost
 
 
@@ -2718,13 +2731,16 @@ def get_optional_params(  # noqa: PLR0915
 
     def _check_valid_arg(supported_params):
         verbose_logger.info(
-            f"\nLiteLLM completion() model= {model}; provider = {custom_llm_provider}"
+            "\nLiteLLM completion() model= %s; provider = %s",
+            model,
+            custom_llm_provider,
         )
         verbose_logger.debug(
-            f"\nLiteLLM: Params passed to completion() {passed_params}"
+            "\nLiteLLM: Params passed to completion() %s", passed_params
         )
         verbose_logger.debug(
-            f"\nLiteLLM: Non-Default params passed to completion() {non_default_params}"
+            "\nLiteLLM: Non-Default params passed to completion() %s",
+            non_default_params,
         )
         unsupported_params = {}
         for k in non_default_params.keys():
@@ -3640,9 +3656,10 @@ def get_optional_params(  # noqa: PLR0915
             )
         else:
             verbose_logger.debug(
-                "Azure optional params - api_version: api_version={}, litellm.api_version={}, os.environ['AZURE_API_VERSION']={}".format(
-                    api_version, litellm.api_version, get_secret("AZURE_API_VERSION")
-                )
+                "Azure optional params - api_version: api_version=%s, litellm.api_version=%s, os.environ['AZURE_API_VERSION']=%s",
+                api_version,
+                litellm.api_version,
+                get_secret("AZURE_API_VERSION"),
             )
             api_version = (
                 api_version
@@ -3705,9 +3722,8 @@ def get_optional_params(  # noqa: PLR0915
         if extra_headers is not None:
             optional_params["extra_headers"] = extra_headers
     if (
-        custom_llm_provider
-        in ["openai", "azure", "text-completion-openai"]
-        + litellm.openai_compatible_providers
+        custom_llm_provider in ("openai", "azure", "text-completion-openai")
+        or custom_llm_provider in litellm.openai_compatible_providers
     ):
         # for openai, azure we should pass the extra/passed params within `extra_body` https://github.com/openai/openai-python/blob/ac33853ba10d13ac149b1fa3ca6dba7d613065c9/src/openai/resources/models.py#L46
         if (
@@ -3734,7 +3750,7 @@ def get_optional_params(  # noqa: PLR0915
         for k in passed_params.keys():
             if k not in default_params.keys():
                 optional_params[k] = passed_params[k]
-    print_verbose(f"Final returned optional params: {optional_params}")
+    print_verbose("Final returned optional params: %s", optional_params)
     return optional_params
 
 
@@ -3888,7 +3904,7 @@ def _infer_model_region(litellm_params: LiteLLM_Params) -> Optional[AllowedModel
 
     if model_region is None:
         verbose_logger.debug(
-            "Cannot infer model region for model: {}".format(litellm_params.model)
+            "Cannot infer model region for model: %s", litellm_params.model
         )
         return None
 
@@ -4013,7 +4029,7 @@ def get_api_base(
                 model=model, **optional_params
             )  # convert to pydantic object
     except Exception as e:
-        verbose_logger.debug("Error occurred in getting api base - {}".format(str(e)))
+        verbose_logger.debug("Error occurred in getting api base - %s", str(e))
         return None
     # get llm provider
 
@@ -4035,7 +4051,7 @@ def get_api_base(
             api_key=_optional_params.api_key,
         )
     except Exception as e:
-        verbose_logger.debug("Error occurred in getting api base - {}".format(str(e)))
+        verbose_logger.debug("Error occurred in getting api base - %s", str(e))
         custom_llm_provider = None
         dynamic_api_base = None
 
@@ -4582,9 +4598,9 @@ def get_model_info(  # noqa: PLR0915
             if _input_cost_per_token is None:
                 # default value to 0, be noisy about this
                 verbose_logger.debug(
-                    "model={}, custom_llm_provider={} has no input_cost_per_token in model_cost_map. Defaulting to 0.".format(
-                        model, custom_llm_provider
-                    )
+                    "model=%s, custom_llm_provider=%s has no input_cost_per_token in model_cost_map. Defaulting to 0.",
+                    model,
+                    custom_llm_provider,
                 )
                 _input_cost_per_token = 0
 
@@ -4594,9 +4610,9 @@ def get_model_info(  # noqa: PLR0915
             if _output_cost_per_token is None:
                 # default value to 0, be noisy about this
                 verbose_logger.debug(
-                    "model={}, custom_llm_provider={} has no output_cost_per_token in model_cost_map. Defaulting to 0.".format(
-                        model, custom_llm_provider
-                    )
+                    "model=%s, custom_llm_provider=%s has no output_cost_per_token in model_cost_map. Defaulting to 0.",
+                    model,
+                    custom_llm_provider,
                 )
                 _output_cost_per_token = 0
 
@@ -5616,14 +5632,14 @@ def completion_with_fallbacks(**kwargs):
                 if kwargs.get("model"):
                     del kwargs["model"]
 
-                print_verbose(f"trying to make completion call with model: {model}")
+                print_verbose("trying to make completion call with model: %s", model)
                 kwargs["litellm_call_id"] = litellm_call_id
                 kwargs = {
                     **kwargs,
                     **nested_kwargs,
                 }  # combine the openai + litellm params at the same level
                 response = litellm.completion(**kwargs, model=model)
-                print_verbose(f"response: {response}")
+                print_verbose("response: %s", response)
                 if response is not None:
                     return response
 
@@ -5797,7 +5813,7 @@ def trim_messages(
             messages = messages[: -len(tool_messages)]
 
         current_tokens = token_counter(model=model or "", messages=messages)
-        print_verbose(f"Current tokens: {current_tokens}, max tokens: {max_tokens}")
+        print_verbose("Current tokens: %s, max tokens: %s", current_tokens, max_tokens)
 
         # Do nothing if current tokens under messages
         if current_tokens < max_tokens:
@@ -5805,7 +5821,10 @@ def trim_messages(
 
         #### Trimming messages if current_tokens > max_tokens
         print_verbose(
-            f"Need to trim input messages: {messages}, current_tokens{current_tokens}, max_tokens: {max_tokens}"
+            "Need to trim input messages: %s, current_tokens%s, max_tokens: %s",
+            messages,
+            current_tokens,
+            max_tokens,
         )
         system_message_event: Optional[dict] = None
         if system_message:
@@ -5903,6 +5922,10 @@ def print_args_passed_to_litellm(original_function, args, kwargs):
             and original_function.__name__ == "img_generation"
         ):
             return
+        elif litellm.set_verbose is not True and not verbose_logger.isEnabledFor(
+            logging.DEBUG
+        ):  # repr() of the request args is O(size of the messages)
+            return
 
         args_str = ", ".join(map(repr, args))
         kwargs_str = ", ".join(f"{key}={repr(value)}" for key, value in kwargs.items())
@@ -5914,18 +5937,21 @@ def print_args_passed_to_litellm(original_function, args, kwargs):
         )
         if args and kwargs:
             print_verbose(
-                f"\033[92mlitellm.{original_function.__name__}({args_str}, {kwargs_str})\033[0m"
+                "\033[92mlitellm.%s(%s, %s)\033[0m",
+                original_function.__name__,
+                args_str,
+                kwargs_str,
             )
         elif args:
             print_verbose(
-                f"\033[92mlitellm.{original_function.__name__}({args_str})\033[0m"
+                "\033[92mlitellm.%s(%s)\033[0m", original_function.__name__, args_str
             )
         elif kwargs:
             print_verbose(
-                f"\033[92mlitellm.{original_function.__name__}({kwargs_str})\033[0m"
+                "\033[92mlitellm.%s(%s)\033[0m", original_function.__name__, kwargs_str
             )
         else:
-            print_verbose(f"\033[92mlitellm.{original_function.__name__}()\033[0m")
+            print_verbose("\033[92mlitellm.%s()\033[0m", original_function.__name__)
         print_verbose("\n")  # new line after
     except Exception:
         # This should always be non blocking
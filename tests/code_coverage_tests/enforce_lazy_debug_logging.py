@@ -0,0 +1,118 @@
+"""
+Debug logs on hot paths should use lazy %-style args, e.g.
+
+    verbose_router_logger.debug("model: %s; kwargs: %s", model, kwargs)
+
+not
+
+    verbose_router_logger.debug(f"model: {model}; kwargs: {kwargs}")
+
+The f-string / .format() / % version formats the message (incl. str() of large dicts) on every call, even when debug logging is off.
+"""
+
+import ast
+import os
+from typing import List, Tuple
+
+HOT_PATHS = [
+    "./litellm/main.py",
+    "./litellm/utils.py",
+    "./litellm/router.py",
+    "./litellm/caching/",
+    "./litellm/litellm_core_utils/",
+]
+# HOT_PATHS = [
+#     "../../litellm/main.py",
+#     "../../litellm/utils.py",
+#     "../../litellm/router.py",
+#     "../../litellm/caching/",
+#     "../../litellm/litellm_core_utils/",
+# ]  # LOCAL TESTING
+
+LAZY_LOG_FUNCTIONS = ["print_verbose"]
+LAZY_LOG_METHODS = ["debug"]
+
+
+def is_lazy_log_call(node: ast.Call) -> bool:
+    """
+    `print_verbose(..)` or `<..>logger.debug(..)`
+    """
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id in LAZY_LOG_FUNCTIONS
+    if isinstance(func, ast.Attribute) and func.attr in LAZY_LOG_METHODS:
+        value = func.value
+        if isinstance(value, ast.Name):
+            return "logger" in value.id
+        if isinstance(value, ast.Attribute):
+            return "logger" in value.attr
+    return False
+
+
+def is_eager_format(node: ast.expr) -> bool:
+    if isinstance(node, ast.JoinedStr):
+        return any(isinstance(value, ast.FormattedValue) for value in node.values)
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "format"
+        and isinstance(node.func.value, ast.Constant)
+    ):
+        return True
+    if (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.Mod)
+        and isinstance(node.left, ast.Constant)
+        and isinstance(node.left.value, str)
+    ):
+        return True
+    return False
+
+
+def get_eager_log_calls(file_path: str) -> List[Tuple[str, int]]:
+    with open(file_path, "r") as file:
+        tree = ast.parse(file.read())
+
+    eager_log_calls = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and is_lazy_log_call(node)
+            and len(node.args) > 0
+            and is_eager_format(node.args[0])
+        ):
+            eager_log_calls.append((file_path, node.lineno))
+    return eager_log_calls
+
+
+def get_python_files(paths: List[str]) -> List[str]:
+    python_files = []
+    for path in paths:
+        if path.endswith(".py"):
+            python_files.append(path)
+            continue
+        for root, _, files in os.walk(path):
+            for file in files:
+                if file.endswith(".py"):
+                    python_files.append(os.path.join(root, file))
+    return sorted(python_files)
+
+
+def main():
+    eager_log_calls = []
+    for file_path in get_python_files(HOT_PATHS):
+        eager_log_calls.extend(get_eager_log_calls(file_path))
+
+    if eager_log_calls:
+        print("The following debug logs format their message eagerly:")
+        for file_path, lineno in eager_log_calls:
+            print(f"- {file_path}:{lineno}")
+        raise Exception(
+            f"{len(eager_log_calls)} debug logs use an f-string / .format() / %. Pass the values as args instead - e.g. `verbose_logger.debug('response: %s', response)`"
+        )
+    else:
+        print("All debug logs on hot paths use lazy formatting.")
+
+
+if __name__ == "__main__":
+    main()
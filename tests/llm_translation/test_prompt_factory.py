@@ -687,3 +687,114 @@ def test_just_system_message():
             llm_provider="bedrock",
         )
         assert "bedrock requires at least one non-system message" in str(e.value)
+
+
+def _get_mock_image_response(content: bytes):
+    import httpx
+
+    return httpx.Response(
+        status_code=200,
+        content=content,
+        headers={"Content-Type": "image/png"},
+        request=httpx.Request("GET", "https://example.com"),
+    )
+
+
+def test_anthropic_messages_pt_fetches_image_urls_in_parallel_and_caches_them():
+    """
+    Multi-turn vision conversations fetch each image url once, in parallel - later turns read the cache
+    """
+    import threading
+    import time
+
+    from litellm.llms.prompt_templates.image_handling import media_cache
+
+    media_cache.flush()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def mock_get(url, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.1)
+        with lock:
+            in_flight -= 1
+        # image-2 + image-3 are the same image
+        return _get_mock_image_response(b"image-1" if "image-1" in url else b"image-2")
+
+    image_urls = [
+        "https://example.com/image-1.png",
+        "https://example.com/image-2.png",
+        "https://example.com/image-3.png",
+    ]
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "describe these"}]
+            + [{"type": "image_url", "image_url": {"url": url}} for url in image_urls],
+        }
+    ]
+    with patch.object(
+        litellm.module_level_client, "get", side_effect=mock_get
+    ) as mock_client_get:
+        for _ in range(2):
+            anthropic_messages = anthropic_messages_pt(
+                messages=messages, model="claude-3-5-sonnet", llm_provider="anthropic"
+            )
+
+    assert mock_client_get.call_count == 3
+    assert max_in_flight == 3
+    image_blocks = [
+        block for block in anthropic_messages[0]["content"] if block["type"] == "image"
+    ]
+    assert len(image_blocks) == 3
+    assert image_blocks[0]["source"]["media_type"] == "image/png"
+    # same content under 2 urls is stored once
+    assert len(media_cache.content_hash_to_data_url) == 2
+    media_cache.flush()
+
+
+def test_media_cache_evicts_least_recently_used_images():
+    from litellm.llms.prompt_templates.image_handling import MediaCache
+
+    cache = MediaCache(max_bytes=150)
+    cache.set(url="https://a.png", content=b"a" * 30, media_type="image/png")
+    cache.set(url="https://b.png", content=b"b" * 30, media_type="image/png")
+    assert cache.get("https://a.png") is not None
+    cache.set(url="https://c.png", content=b"c" * 30, media_type="image/png")
+
+    assert cache.get("https://b.png") is None
+    assert cache.get("https://a.png") is not None
+    assert cache.get("https://c.png") is not None
+    assert cache.current_bytes <= 150
+
+
+def test_media_cache_url_entries_expire():
+    """
+    url -> content mappings expire after `url_ttl` (in memory + on disk), the content-addressed data urls don't
+    """
+    from unittest.mock import MagicMock
+
+    from litellm.llms.prompt_templates.image_handling import MediaCache
+
+    cache = MediaCache(max_bytes=1000, cache_dir="/tmp/unused", url_ttl=600)
+    cache._disk_cache = MagicMock()
+    cache._disk_cache.get.return_value = (None, None)
+    with patch("time.time", return_value=1000):
+        data_url = cache.set(
+            url="https://a.png", content=b"a" * 30, media_type="image/png"
+        )
+    cache._disk_cache.set.assert_any_call(
+        "url:https://a.png", cache.url_to_content_hash["https://a.png"][0], expire=600
+    )
+
+    with patch("time.time", return_value=1599):
+        assert cache.get("https://a.png") == data_url
+    with patch("time.time", return_value=1600):
+        assert cache.get("https://a.png") is None
+
+    assert "https://a.png" not in cache.url_to_content_hash
+    assert data_url in cache.content_hash_to_data_url.values()
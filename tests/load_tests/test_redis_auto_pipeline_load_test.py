@@ -0,0 +1,77 @@
+"""
+Redis round trips per LLM request, with and without auto-pipelining
+
+Needs a running redis - REDIS_HOST, REDIS_PORT, REDIS_PASSWORD
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import asyncio
+import litellm
+import pytest
+from litellm import Router
+
+
+async def make_router_calls(router: Router, num_requests: int) -> dict:
+    """
+    Returns Redis commands + round trips per LLM request
+    """
+    auto_pipeline = router.cache.redis_cache.auto_pipeline
+    auto_pipeline.num_commands = 0
+    auto_pipeline.num_round_trips = 0
+
+    tasks = [
+        router.acompletion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hello"}],
+            mock_response="hi",
+        )
+        for _ in range(num_requests)
+    ]
+    await asyncio.gather(*tasks)
+    await asyncio.sleep(1)  # let the async success callbacks write usage to redis
+
+    return {
+        "commands_per_request": auto_pipeline.num_commands / num_requests,
+        "round_trips_per_request": auto_pipeline.num_round_trips / num_requests,
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_auto_pipeline_round_trips_per_request():
+    """
+    Both runs share one event loop - the async redis connection pool is bound to the loop it was first used on
+    """
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {"model": "gpt-3.5-turbo", "rpm": 100000},
+            },
+            {
+                "model_name": "gpt-3.5-turbo",
+                "litellm_params": {"model": "gpt-4o-mini", "rpm": 100000},
+            },
+        ],
+        routing_strategy="usage-based-routing-v2",
+        redis_host=os.environ["REDIS_HOST"],
+        redis_port=int(os.environ["REDIS_PORT"]),
+        redis_password=os.environ.get("REDIS_PASSWORD"),
+    )
+    auto_pipeline = router.cache.redis_cache.auto_pipeline
+
+    auto_pipeline.enabled = False
+    before = await make_router_calls(router=router, num_requests=100)
+
+    auto_pipeline.enabled = True
+    after = await make_router_calls(router=router, num_requests=100)
+
+    assert after["commands_per_request"] == pytest.approx(
+        before["commands_per_request"], rel=0.2
+    ), f"without auto-pipelining: {before}, with auto-pipelining: {after}"
+    assert (
+        after["round_trips_per_request"] < before["round_trips_per_request"] / 2
+    ), f"without auto-pipelining: {before}, with auto-pipelining: {after}"
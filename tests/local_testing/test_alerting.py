@@ -146,14 +146,17 @@ def slack_alerting():
 # Test for hanging LLM responses
 @pytest.mark.asyncio
 async def test_response_taking_too_long_hanging(slack_alerting):
-    request_data = {
-        "model": "test_model",
-        "messages": "test_messages",
-        "litellm_status": "running",
-    }
+    from litellm.types.integrations.slack_alerting import HangingRequestData
+
+    hanging_request = HangingRequestData(
+        litellm_call_id="test_call_id",
+        model="test_model",
+        messages_preview="test_messages",
+        metadata=None,
+    )
     with patch.object(slack_alerting, "send_alert", new=AsyncMock()) as mock_send_alert:
-        await slack_alerting.response_taking_too_long(
-            type="hanging_request", request_data=request_data
+        await slack_alerting.hanging_request_check.send_hanging_request_alert(
+            hanging_request=hanging_request
         )
 
         mock_send_alert.assert_awaited_once()
@@ -874,3 +877,122 @@ async def test_langfuse_trace_id():
     assert returned_trace_id == int(
         litellm_logging_obj._get_trace_id(service_name="langfuse")
     )
+
+
+def test_hashed_timer_wheel():
+    from litellm.integrations.SlackAlerting.hanging_request_check import (
+        HashedTimerWheel,
+    )
+
+    timer_wheel = HashedTimerWheel(tick_seconds=1, num_slots=4)
+    timer_wheel.schedule(key="a", delay_seconds=2, item="a")
+    timer_wheel.schedule(key="b", delay_seconds=2, item="b")
+    timer_wheel.schedule(key="c", delay_seconds=6, item="c")  # wraps around the wheel
+    assert len(timer_wheel) == 3
+
+    assert timer_wheel.cancel("b") is True
+    assert timer_wheel.cancel("b") is False
+
+    assert timer_wheel.advance(ticks=1) == []
+    assert timer_wheel.advance(ticks=1) == ["a"]
+    assert timer_wheel.advance(ticks=3) == []
+    assert timer_wheel.advance(ticks=1) == ["c"]
+    assert len(timer_wheel) == 0
+
+    timer_wheel.schedule(key="d", delay_seconds=3, item="d")
+    assert timer_wheel.advance(ticks=10) == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_hanging_request_check_alerts_on_hanging_requests(slack_alerting):
+    from litellm.integrations.SlackAlerting.hanging_request_check import (
+        AlertingHangingRequestCheck,
+    )
+
+    slack_alerting.hanging_request_check = AlertingHangingRequestCheck(
+        slack_alerting_object=slack_alerting, tick_seconds=0.1
+    )
+    hanging_request_check = slack_alerting.hanging_request_check
+    assert hanging_request_check.is_enabled()
+
+    with patch.object(slack_alerting, "send_alert", new=AsyncMock()) as mock_send_alert:
+        hanging_request_check.add_request_to_hanging_request_check(
+            request_data={
+                "litellm_call_id": "hanging-request",
+                "model": "test_model",
+                "messages": [{"role": "user", "content": "hi"}],
+                "metadata": {"alerting_metadata": {"hello": "world"}},
+            }
+        )
+        hanging_request_check.add_request_to_hanging_request_check(
+            request_data={
+                "litellm_call_id": "completed-request",
+                "model": "test_model",
+                "messages": [{"role": "user", "content": "hi"}],
+            }
+        )
+        hanging_request_check.remove_request_from_hanging_request_check(
+            litellm_call_id="completed-request"
+        )
+        await asyncio.sleep(1.5)
+
+        mock_send_alert.assert_awaited_once()
+        assert "hi" in mock_send_alert.call_args[1]["message"]
+        assert mock_send_alert.call_args[1]["alerting_metadata"] == {"hello": "world"}
+        assert hanging_request_check.sweeper_task.done()
+
+
+@pytest.mark.asyncio
+async def test_hanging_request_check_disabled_creates_no_tasks():
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.proxy.utils import ProxyLogging
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    with patch("asyncio.create_task") as mock_create_task:
+        await proxy_logging_obj.pre_call_hook(
+            user_api_key_dict=UserAPIKeyAuth(),
+            data={"model": "gpt-4o", "messages": []},
+            call_type="completion",
+        )
+        mock_create_task.assert_not_called()
+    assert (
+        len(proxy_logging_obj.slack_alerting_instance.hanging_request_check.timer_wheel)
+        == 0
+    )
+
+
+def test_hanging_request_messages_preview():
+    from litellm.integrations.SlackAlerting.hanging_request_check import (
+        _get_messages_preview,
+    )
+
+    messages = [{"role": "user", "content": "hello world " * i} for i in range(20)]
+    assert _get_messages_preview({"messages": messages}) == str(messages)[:100]
+    assert _get_messages_preview({"messages": messages[:1]}) == str(messages[:1])
+    assert _get_messages_preview({"input": "hello"}) == "hello"
+
+
+@pytest.mark.asyncio
+async def test_update_request_status_removes_hanging_request():
+    from litellm.proxy.utils import ProxyLogging
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.update_values(
+        alerting=["slack"], alerting_threshold=100, redis_cache=None
+    )
+    hanging_request_check = (
+        proxy_logging_obj.slack_alerting_instance.hanging_request_check
+    )
+    hanging_request_check.add_request_to_hanging_request_check(
+        request_data={"litellm_call_id": "completed-request", "model": "gpt-4o"}
+    )
+    assert len(hanging_request_check.timer_wheel) == 1
+
+    await proxy_logging_obj.update_request_status(
+        litellm_call_id="completed-request", status="success"
+    )
+    assert len(hanging_request_check.timer_wheel) == 0
+    assert (
+        proxy_logging_obj.internal_usage_cache.dual_cache.in_memory_cache.cache_dict
+        == {}
+    )
@@ -21,6 +21,8 @@ from litellm.proxy.auth.auth_checks import get_end_user_object
 from litellm.caching.caching import DualCache
 from litellm.proxy._types import LiteLLM_EndUserTable, LiteLLM_BudgetTable
 from litellm.proxy.utils import PrismaClient
+from litellm.types.router import Deployment, LiteLLM_Params
+from unittest.mock import patch
 
 
 @pytest.mark.parametrize("customer_spend, customer_budget", [(0, 10), (10, 0)])
@@ -95,3 +97,228 @@ async def test_handle_failed_db_connection():
     print("_handle_failed_db_connection_for_get_key_object got exception", exc_info)
 
     assert str(exc_info.value) == "Failed to connect to DB"
+
+
+class _MockKeyDBClient:
+    """Stands in for PrismaClient.get_data(table_name='combined_view')"""
+
+    def __init__(self, key_rows: dict, delay: float = 0.05):
+        self.key_rows = key_rows
+        self.delay = delay
+        self.get_data_calls = 0
+
+    async def get_data(self, token, table_name, parent_otel_span, proxy_logging_obj):
+        self.get_data_calls += 1
+        await asyncio.sleep(self.delay)
+        return self.key_rows.get(token)
+
+
+@pytest.fixture
+def key_lookup(monkeypatch):
+    from litellm.proxy.auth import auth_checks
+    from litellm.proxy.auth.key_lookup import VirtualKeyLookup
+
+    _key_lookup = VirtualKeyLookup()
+    monkeypatch.setattr(auth_checks, "virtual_key_lookup", _key_lookup)
+    return _key_lookup
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_negative_cache(key_lookup):
+    """
+    A key that doesn't exist in the db should only be looked up once within the negative cache ttl
+    """
+    from litellm.proxy.auth.auth_checks import get_key_object
+
+    db_client = _MockKeyDBClient(key_rows={})
+    for _ in range(5):
+        with pytest.raises(Exception, match="Key doesn't exist in db"):
+            await get_key_object(
+                hashed_token="bad-key",
+                prisma_client=db_client,
+                user_api_key_cache=DualCache(),
+            )
+    assert db_client.get_data_calls == 1
+
+    key_lookup.negative_cache["bad-key"] = time.time() - 1  # expire negative cache
+    with pytest.raises(Exception):
+        await get_key_object(
+            hashed_token="bad-key",
+            prisma_client=db_client,
+            user_api_key_cache=DualCache(),
+        )
+    assert db_client.get_data_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_single_flight(key_lookup):
+    """
+    Concurrent cache misses for the same key should share one db query
+    """
+    from litellm.proxy.auth.auth_checks import get_key_object
+
+    db_client = _MockKeyDBClient(
+        key_rows={"good-key": UserAPIKeyAuth(token="good-key", models=["gpt-4o"])}
+    )
+    user_api_key_cache = DualCache()
+    results = await asyncio.gather(
+        *[
+            get_key_object(
+                hashed_token="good-key",
+                prisma_client=db_client,
+                user_api_key_cache=user_api_key_cache,
+            )
+            for _ in range(10)
+        ]
+    )
+    assert db_client.get_data_calls == 1
+    assert all(result.token == "good-key" for result in results)
+    assert user_api_key_cache.get_cache(key="good-key") is not None
+    assert key_lookup.in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_get_key_object_refresh_ahead(key_lookup):
+    """
+    Keys read close to their cache expiry should be refreshed in the background
+    """
+    from litellm.proxy.auth.auth_checks import get_key_object
+
+    db_client = _MockKeyDBClient(
+        key_rows={"good-key": UserAPIKeyAuth(token="good-key", spend=10)}, delay=0
+    )
+    user_api_key_cache = DualCache(default_in_memory_ttl=60)
+    stale_key_obj = UserAPIKeyAuth(token="good-key", spend=1)
+    stale_key_obj.last_refreshed_at = time.time() - 55
+    user_api_key_cache.set_cache(key="good-key", value=stale_key_obj)
+
+    cached = await get_key_object(
+        hashed_token="good-key",
+        prisma_client=db_client,
+        user_api_key_cache=user_api_key_cache,
+    )
+    assert cached.spend == 1  # served from cache, not blocked on the db
+    await asyncio.sleep(0.05)
+
+    assert db_client.get_data_calls == 1
+    assert user_api_key_cache.get_cache(key="good-key").spend == 10
+
+
+@pytest.mark.asyncio
+async def test_key_lookup_invalidate_skips_stale_result(key_lookup):
+    """
+    A key deleted while its db query is running should not be written to the cache
+    """
+    from litellm.proxy.auth.auth_checks import get_key_object
+
+    db_client = _MockKeyDBClient(
+        key_rows={"good-key": UserAPIKeyAuth(token="good-key")}
+    )
+    user_api_key_cache = DualCache()
+    lookup_task = asyncio.create_task(
+        get_key_object(
+            hashed_token="good-key",
+            prisma_client=db_client,
+            user_api_key_cache=user_api_key_cache,
+        )
+    )
+    await asyncio.sleep(0.01)
+    key_lookup.invalidate(hashed_token="good-key")
+    await lookup_task
+
+    assert user_api_key_cache.get_cache(key="good-key") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_key_object_does_not_invalidate_key_lookup(key_lookup):
+    """
+    Caching a key on a request is not a key change - the running db query should still be shared and its result cached
+    """
+    from litellm.proxy.auth.auth_checks import _cache_key_object, get_key_object
+
+    db_client = _MockKeyDBClient(
+        key_rows={"good-key": UserAPIKeyAuth(token="good-key", spend=10)}
+    )
+    user_api_key_cache = DualCache()
+    lookup_task = asyncio.create_task(
+        get_key_object(
+            hashed_token="good-key",
+            prisma_client=db_client,
+            user_api_key_cache=user_api_key_cache,
+        )
+    )
+    await asyncio.sleep(0.01)
+    await _cache_key_object(
+        hashed_token="good-key",
+        user_api_key_obj=UserAPIKeyAuth(token="good-key", spend=1),
+        user_api_key_cache=user_api_key_cache,
+        proxy_logging_obj=None,
+    )
+    assert "good-key" in key_lookup.in_flight
+    await lookup_task
+
+    assert db_client.get_data_calls == 1
+    assert key_lookup.invalidation_count == 0
+    assert user_api_key_cache.get_cache(key="good-key").spend == 10
+
+
+@pytest.mark.asyncio
+async def test_can_key_call_model_caches_allowed_models(monkeypatch):
+    """
+    Access groups on a key should be expanded once, and re-expanded only when the router's deployments change
+    """
+    from litellm.proxy import proxy_server
+    from litellm.proxy.auth.auth_checks import can_key_call_model, model_in_access_group
+
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake"},
+                "model_info": {"access_groups": ["beta-models"]},
+            },
+            {
+                "model_name": "gpt-4o-mini",
+                "litellm_params": {"model": "gpt-4o-mini", "api_key": "fake"},
+            },
+        ]
+    )
+    monkeypatch.setattr(proxy_server, "llm_router", router)
+
+    valid_token = UserAPIKeyAuth(token="my-key", models=["beta-models", "gpt-4o-mini"])
+    assert await can_key_call_model(
+        model="gpt-4o", llm_model_list=None, valid_token=valid_token
+    )
+    assert sorted(valid_token.models) == ["gpt-4o", "gpt-4o-mini"]
+
+    with patch.object(
+        router,
+        "get_model_access_groups_index",
+        wraps=router.get_model_access_groups_index,
+    ) as mock_index:
+        assert await can_key_call_model(
+            model="gpt-4o-mini", llm_model_list=None, valid_token=valid_token
+        )
+        with pytest.raises(ValueError, match="API Key not allowed to access model"):
+            await can_key_call_model(
+                model="claude-3", llm_model_list=None, valid_token=valid_token
+            )
+        mock_index.assert_not_called()
+
+        router.upsert_deployment(
+            Deployment(
+                model_name="claude-3",
+                litellm_params=LiteLLM_Params(
+                    model="anthropic/claude-3", api_key="fake"
+                ),
+                model_info={"id": "claude-3", "access_groups": ["beta-models"]},
+            )
+        )
+        team_token = UserAPIKeyAuth(token="my-team-key", models=["beta-models"])
+        assert await can_key_call_model(
+            model="claude-3", llm_model_list=None, valid_token=team_token
+        )
+        assert mock_index.call_count == 1
+
+    assert model_in_access_group(model="claude-3", team_models=["beta-models"])
+    assert not model_in_access_group(model="gpt-4o-mini", team_models=["beta-models"])
@@ -0,0 +1,187 @@
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.cache_codec import (
+    CacheCodec,
+    decode_cache_value,
+    is_cache_codec_encoded,
+)
+from litellm.types.utils import EmbeddingResponse, ImageResponse, ModelResponse
+
+
+def _get_chat_response() -> ModelResponse:
+    return ModelResponse(
+        model="gpt-4o",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": "The quick brown fox jumps over the lazy dog. " * 50,
+                },
+            }
+        ],
+        usage={"prompt_tokens": 10, "completion_tokens": 500, "total_tokens": 510},
+    )
+
+
+def _get_embedding_response() -> EmbeddingResponse:
+    return EmbeddingResponse(
+        model="text-embedding-3-small",
+        data=[
+            {
+                "object": "embedding",
+                "index": i,
+                "embedding": [((j * 7919 + i) % 1000) / 997 for j in range(1536)],
+            }
+            for i in range(2)
+        ],
+        usage={"prompt_tokens": 10, "total_tokens": 10},
+    )
+
+
+def _get_image_response() -> ImageResponse:
+    return ImageResponse(
+        created=int(time.time()),
+        data=[{"b64_json": "iVBORw0KGgoAAAANSUhEUgAAAAEAAAAB" * 200, "url": None}],
+    )
+
+
+def _get_cached_data(response) -> dict:
+    # how litellm.Cache stores responses
+    return {"timestamp": time.time(), "response": response.model_dump_json()}
+
+
+@pytest.mark.parametrize(
+    "codec_params",
+    [
+        {"format": "json"},
+        {"format": "json", "compression": "zlib", "compression_threshold": 256},
+    ],
+)
+def test_cache_codec_round_trip(codec_params):
+    codec = CacheCodec(**codec_params)
+
+    chat_response = _get_chat_response()
+    decoded = decode_cache_value(codec.encode(_get_cached_data(chat_response)))
+    assert (
+        decoded["response"]["choices"][0]["message"]["content"]
+        == chat_response.choices[0].message.content  # type: ignore
+    )
+
+    embedding_response = _get_embedding_response()
+    decoded = decode_cache_value(codec.encode(_get_cached_data(embedding_response)))
+    for original, cached in zip(embedding_response.data, decoded["response"]["data"]):
+        assert len(cached["embedding"]) == 1536
+        # embeddings are stored as float32
+        assert cached["embedding"] == pytest.approx(original["embedding"], rel=1e-6)
+
+    # values that aren't llm responses round trip as-is
+    assert decode_cache_value(codec.encode({"a": [1, 2, 3], "b": "c"})) == {
+        "a": [1, 2, 3],
+        "b": "c",
+    }
+
+
+def test_cache_codec_only_packs_embedding_responses():
+    """
+    Only `EmbeddingResponse.data[*].embedding` vectors are stored as float32 - other lists of numbers keep their exact values
+    """
+    codec = CacheCodec(format="json")
+    vector = [i / 3 for i in range(16)]
+
+    # an embedding item, as cached per input by `Cache.async_add_cache_pipeline`
+    embedding_item = {"object": "embedding", "index": 0, "embedding": vector}
+    encoded = codec.encode({"timestamp": time.time(), "response": embedding_item})
+    assert b"__litellm_f32__" in encoded
+    assert decode_cache_value(encoded)["response"]["embedding"] == pytest.approx(
+        vector, rel=1e-6
+    )
+
+    # not an embedding response - e.g. tool call arguments with an `embedding` key
+    tool_call_args = {"object": "chat.completion", "embedding": vector}
+    encoded = codec.encode({"timestamp": time.time(), "response": tool_call_args})
+    assert b"__litellm_f32__" not in encoded
+    assert decode_cache_value(encoded)["response"]["embedding"] == vector
+    assert decode_cache_value(codec.encode({"embedding": vector})) == {
+        "embedding": vector
+    }
+
+
+def test_cache_codec_reads_legacy_entries():
+    """
+    Entries written as json / python literal strings are not codec encoded, and keep being read with the old logic
+    """
+    from litellm.caching.redis_cache import RedisCache
+
+    legacy_entry = json.dumps(_get_cached_data(_get_chat_response())).encode("utf-8")
+    assert is_cache_codec_encoded(legacy_entry) is False
+
+    redis_cache = RedisCache.__new__(RedisCache)
+    assert (
+        redis_cache._get_cache_logic(legacy_entry)["response"]
+        == json.loads(legacy_entry)["response"]
+    )
+
+    encoded_entry = CacheCodec(format="json").encode({"hello": "world"})
+    assert is_cache_codec_encoded(encoded_entry) is True
+    assert redis_cache._get_cache_logic(encoded_entry) == {"hello": "world"}
+
+
+def test_cache_codec_bytes_and_time_per_entry():
+    """
+    Report bytes per cached entry + encode/decode time for chat, embedding and image responses
+    """
+    codecs = {
+        "json (current)": None,
+        "codec": CacheCodec(),
+        "codec + zlib": CacheCodec(compression="zlib"),
+    }
+    responses = {
+        "chat": _get_chat_response(),
+        "embedding": _get_embedding_response(),
+        "image": _get_image_response(),
+    }
+    num_runs = 20
+    for response_type, response in responses.items():
+        cached_data = _get_cached_data(response)
+        sizes = {}
+        for codec_name, codec in codecs.items():
+            start_time = time.perf_counter()
+            for _ in range(num_runs):
+                encoded = (
+                    json.dumps(cached_data).encode("utf-8")
+                    if codec is None
+                    else codec.encode(cached_data)
+                )
+            encode_time = (time.perf_counter() - start_time) / num_runs
+
+            start_time = time.perf_counter()
+            for _ in range(num_runs):
+                if codec is None:
+                    json.loads(json.loads(encoded)["response"])
+                else:
+                    decode_cache_value(encoded)
+            decode_time = (time.perf_counter() - start_time) / num_runs
+
+            sizes[codec_name] = len(encoded)
+            print(  # noqa
+                f"{response_type} - {codec_name}: {len(encoded)} bytes, encode={encode_time * 1000:.3f}ms, decode={decode_time * 1000:.3f}ms"
+            )
+
+        assert sizes["codec"] <= sizes["json (current)"]
+        assert sizes["codec + zlib"] < sizes["json (current)"]
+
+    # float32 embeddings are ~4 bytes per value, vs ~20 bytes as a json float
+    embedding_entry = CacheCodec().encode(_get_cached_data(_get_embedding_response()))
+    assert len(embedding_entry) < 2 * 1536 * 6
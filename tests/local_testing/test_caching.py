@@ -2320,6 +2320,11 @@ async def test_redis_caching_llm_caching_ttl(sync_mode):
         mock_redis_instance.__aenter__.return_value = mock_redis_instance
         mock_redis_instance.__aexit__.return_value = None
 
+        # async get / set / increment are sent through an auto-pipeline
+        mock_pipe_instance = MagicMock()
+        mock_pipe_instance.execute = AsyncMock(return_value=[True])
+        mock_redis_instance.pipeline = MagicMock(return_value=mock_pipe_instance)
+
     ## Set cache
     if sync_mode is True:
         with patch.object(cache_obj.redis_client, "set") as mock_set:
@@ -2334,8 +2339,8 @@ async def test_redis_caching_llm_caching_ttl(sync_mode):
             # Call async_set_cache
             await cache_obj.async_set_cache(key="test", value="test_value")
 
-            # Verify that the set method was called on the mock Redis instance
-            mock_redis_instance.set.assert_called_once_with(
+            # Verify that the set method was called on the mock Redis pipeline
+            mock_pipe_instance.set.assert_called_once_with(
                 name="test", value='"test_value"', ex=120
             )
 
@@ -2345,15 +2350,21 @@ async def test_redis_caching_llm_caching_ttl(sync_mode):
             cache_obj.increment_cache(key="test", value=1)
             mock_incr.assert_called_once_with("test")
     else:
+        from litellm.caching.redis_auto_pipeline import INCREMENT_WITH_TTL_SCRIPT
+
+        mock_pipe_instance.execute = AsyncMock(return_value=[b"1"])
         # Patch self.init_async_client to return our mock Redis client
         with patch.object(
             cache_obj, "init_async_client", return_value=mock_redis_instance
         ):
-            # Call async_set_cache
-            await cache_obj.async_increment(key="test", value="test_value")
+            # Call async_increment
+            result = await cache_obj.async_increment(key="test", value=1)
 
-            # Verify that the set method was called on the mock Redis instance
-            mock_redis_instance.ttl.assert_called_once_with("test")
+            # Verify that the ttl is set in the same step as the increment
+            mock_pipe_instance.eval.assert_called_once_with(
+                INCREMENT_WITH_TTL_SCRIPT, 1, "test", 1, 120_000
+            )
+            assert result == 1.0
 
 
 @pytest.mark.asyncio()
@@ -2433,3 +2444,194 @@ async def test_dual_cache_caching_batch_get_cache():
         await dc.async_batch_get_cache(keys=["test_key1", "test_key2"])
 
         assert mock_async_get_cache.call_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_redis_auto_pipeline_coalesces_commands():
+    """
+    Commands issued in the same event-loop tick are sent as one pipeline, and each caller gets its own result
+    """
+    from litellm.caching.redis_auto_pipeline import RedisAutoPipeline
+
+    mock_redis_instance = AsyncMock()
+    mock_redis_instance.__aenter__.return_value = mock_redis_instance
+    mock_redis_instance.__aexit__.return_value = None
+    mock_pipe_instance = MagicMock()
+    mock_pipe_instance.execute = AsyncMock(
+        return_value=[b"value_1", ValueError("WRONGTYPE"), True]
+    )
+    mock_redis_instance.pipeline = MagicMock(return_value=mock_pipe_instance)
+
+    auto_pipeline = RedisAutoPipeline(get_redis_client=lambda: mock_redis_instance)
+    results = await asyncio.gather(
+        auto_pipeline.execute_command("get", "key_1"),
+        auto_pipeline.execute_command("get", "key_2"),
+        auto_pipeline.execute_command("set", name="key_3", value="3", ex=10),
+        return_exceptions=True,
+    )
+
+    assert results[0] == b"value_1"
+    assert isinstance(results[1], ValueError)
+    assert results[2] is True
+    mock_redis_instance.pipeline.assert_called_once_with(transaction=False)
+    mock_pipe_instance.get.assert_has_calls([call("key_1"), call("key_2")])
+    mock_pipe_instance.set.assert_called_once_with(name="key_3", value="3", ex=10)
+    assert auto_pipeline.get_stats() == {"num_commands": 3, "num_round_trips": 1}
+
+    ## pipeline failure -> every caller gets the exception
+    mock_pipe_instance.execute = AsyncMock(side_effect=ConnectionError("down"))
+    results = await asyncio.gather(
+        auto_pipeline.execute_command("get", "key_1"),
+        auto_pipeline.execute_command("get", "key_2"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert auto_pipeline.get_stats()["num_round_trips"] == 2
+    # scheduled flushes are referenced until they finish
+    await asyncio.sleep(0)
+    assert len(auto_pipeline.flush_tasks) == 0
+
+
+def test_redis_auto_pipeline_increment_ttl_in_ms():
+    """
+    Sub-second ttls are rounded up to the next ms, instead of being truncated to 0 (= no ttl)
+    """
+    from litellm.caching.redis_auto_pipeline import RedisAutoPipeline
+
+    assert (
+        RedisAutoPipeline.get_increment_with_ttl_args(key="key_1", value=1, ttl=0.5)[-1]
+        == 500
+    )
+    assert (
+        RedisAutoPipeline.get_increment_with_ttl_args(key="key_1", value=1, ttl=0.0001)[
+            -1
+        ]
+        == 1
+    )
+    assert (
+        RedisAutoPipeline.get_increment_with_ttl_args(
+            key="key_1", value=1, ttl=timedelta(seconds=2)
+        )[-1]
+        == 2000
+    )
+    assert (
+        RedisAutoPipeline.get_increment_with_ttl_args(key="key_1", value=1, ttl=None)[
+            -1
+        ]
+        == 0
+    )
+
+
+@pytest.mark.asyncio()
+async def test_redis_async_set_cache_raises_client_init_error():
+    """
+    Errors creating the async redis client are raised to the caller, as before auto-pipelining
+    """
+    from litellm.caching.redis_cache import RedisCache
+
+    cache_obj = RedisCache(host="localhost", port=6379)
+    with patch.object(
+        cache_obj, "init_async_client", side_effect=ValueError("bad redis config")
+    ):
+        with pytest.raises(ValueError, match="bad redis config"):
+            await cache_obj.async_set_cache(key="test", value="test_value")
+
+
+def test_redis_auto_pipeline_push_with_trim_args():
+    from litellm.caching.redis_auto_pipeline import (
+        PUSH_WITH_TRIM_SCRIPT,
+        RedisAutoPipeline,
+    )
+
+    assert RedisAutoPipeline.get_push_with_trim_args(
+        key="key_1", values=['{"a": 1}', '{"b": 2}'], max_size=10, ttl=0.5
+    ) == (PUSH_WITH_TRIM_SCRIPT, 1, "key_1", 10, 500, '{"a": 1}', '{"b": 2}')
+    assert (
+        RedisAutoPipeline.get_push_with_trim_args(
+            key="key_1", values=["1"], max_size=10, ttl=None
+        )[4]
+        == 0
+    )
+
+
+@pytest.mark.asyncio()
+async def test_redis_push_to_list_and_batch_get_lists():
+    """
+    Pushes are one eval (LPUSH + LTRIM + PEXPIRE), list reads are auto-pipelined LRANGEs
+    """
+    from litellm.caching.redis_auto_pipeline import PUSH_WITH_TRIM_SCRIPT
+    from litellm.caching.redis_cache import RedisCache
+
+    cache_obj = RedisCache(host="localhost", port=6379)
+    with patch.object(
+        cache_obj.auto_pipeline, "execute_command", new=AsyncMock()
+    ) as mock_execute_command:
+        await cache_obj.async_push_to_list(
+            key="latency:1234", values=[{"latency": 1.0}], max_size=10, ttl=60
+        )
+        mock_execute_command.assert_awaited_once_with(
+            "eval",
+            PUSH_WITH_TRIM_SCRIPT,
+            1,
+            "latency:1234",
+            10,
+            60000,
+            '{"latency": 1.0}',
+        )
+
+        mock_execute_command.reset_mock()
+        mock_execute_command.side_effect = [
+            [b'{"latency": 2.0}', b'{"latency": 1.0}'],
+            [],
+        ]
+        assert await cache_obj.async_batch_get_lists(
+            key_list=["latency:1234", "latency:5678"]
+        ) == {
+            "latency:1234": [{"latency": 2.0}, {"latency": 1.0}],
+            "latency:5678": [],
+        }
+        mock_execute_command.assert_has_awaits(
+            [
+                call("lrange", "latency:1234", 0, -1),
+                call("lrange", "latency:5678", 0, -1),
+            ]
+        )
+
+
+def test_dual_cache_lists():
+    """
+    - pushes go to both caches, only the first `max_size` items are kept
+    - redis has every writer's items - it's re-read at most once per `redis_batch_cache_expiry`, and replaces the in-memory copy
+    """
+    from litellm.caching.dual_cache import DualCache
+    from litellm.caching.redis_cache import RedisCache
+
+    redis_cache = MagicMock(spec=RedisCache)
+    dual_cache = DualCache(redis_cache=redis_cache, default_redis_batch_cache_expiry=60)
+    for latency in [1.0, 2.0, 3.0]:
+        dual_cache.push_to_list(
+            key="latency:1234", values=[{"latency": latency}], max_size=2, ttl=60
+        )
+    assert dual_cache.in_memory_cache.get_cache(key="latency:1234") == [
+        {"latency": 3.0},
+        {"latency": 2.0},
+    ]
+    redis_cache.push_to_list.assert_called_with(
+        "latency:1234", [{"latency": 3.0}], max_size=2, ttl=60
+    )
+
+    # another worker pushed 4.0
+    redis_cache.batch_get_lists.return_value = {
+        "latency:1234": [{"latency": 4.0}, {"latency": 3.0}],
+        "latency:5678": [],
+    }
+    assert dual_cache.batch_get_lists(keys=["latency:1234", "latency:5678"]) == [
+        [{"latency": 4.0}, {"latency": 3.0}],
+        None,
+    ]
+    # within redis_batch_cache_expiry - served from memory
+    assert dual_cache.batch_get_lists(keys=["latency:1234", "latency:5678"]) == [
+        [{"latency": 4.0}, {"latency": 3.0}],
+        None,
+    ]
+    redis_cache.batch_get_lists.assert_called_once()
@@ -2634,3 +2634,124 @@ def test_completion_cost_azure_ai_meta():
     cost = completion_cost(model_response, custom_llm_provider="azure_ai")
 
     assert cost > 0
+
+
+def test_completion_cost_pricing_index(monkeypatch):
+    """
+    The pricing record is resolved once per (model, provider), and re-resolved when models are registered
+    """
+    from litellm import ModelResponse
+
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    monkeypatch.setattr(litellm, "model_cost", litellm.get_model_cost_map(url=""))
+
+    model_response = ModelResponse(
+        model="gpt-4o",
+        usage={"prompt_tokens": 1000, "completion_tokens": 200, "total_tokens": 1200},
+    )
+    expected_cost = (
+        1000 * litellm.model_cost["gpt-4o"]["input_cost_per_token"]
+        + 200 * litellm.model_cost["gpt-4o"]["output_cost_per_token"]
+    )
+    assert completion_cost(model_response, custom_llm_provider="openai") == (
+        pytest.approx(expected_cost)
+    )
+
+    with patch.object(
+        litellm, "get_model_info", side_effect=Exception("not memoized")
+    ) as mock_get_model_info:
+        for _ in range(10):
+            completion_cost(model_response, custom_llm_provider="openai")
+        mock_get_model_info.assert_not_called()
+
+    litellm.register_model(
+        {"gpt-4o": {"input_cost_per_token": 1e-3, "output_cost_per_token": 2e-3}}
+    )
+    assert completion_cost(model_response, custom_llm_provider="openai") == (
+        pytest.approx(1000 * 1e-3 + 200 * 2e-3)
+    )
+
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+    assert completion_cost(model_response, custom_llm_provider="openai") == (
+        pytest.approx(expected_cost)
+    )
+
+
+@pytest.mark.parametrize(
+    "model, custom_llm_provider",
+    [
+        ("gpt-4o", "openai"),
+        ("claude-3-5-sonnet-20240620", "anthropic"),
+        ("gemini-1.5-pro", "gemini"),
+    ],
+)
+def test_completion_cost_resolves_pricing_once(monkeypatch, model, custom_llm_provider):
+    """
+    Repeated cost calculations for a model resolve its pricing with `get_model_info` once - the timing comparison is in tests/load_tests/test_completion_cost_load_test.py
+    """
+    from litellm import ModelResponse
+
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    monkeypatch.setattr(litellm, "model_cost", litellm.get_model_cost_map(url=""))
+    model_response = ModelResponse(
+        model=model,
+        usage={
+            "prompt_tokens": 150000,
+            "completion_tokens": 200,
+            "total_tokens": 150200,
+            "prompt_tokens_details": {"cached_tokens": 100000},
+        },
+    )
+
+    with patch.object(
+        litellm, "get_model_info", wraps=litellm.get_model_info
+    ) as mock_get_model_info:
+        costs = [
+            completion_cost(model_response, custom_llm_provider=custom_llm_provider)
+            for _ in range(100)
+        ]
+
+    assert costs[0] > 0
+    assert costs == [costs[0]] * 100
+    assert mock_get_model_info.call_count == 1
+
+
+def test_cost_failure_traceback_memoized():
+    """
+    Every request to a model without pricing fails the cost calculation the same way - the traceback is only formatted once
+    """
+    from litellm import ModelResponse
+    from litellm.litellm_core_utils import litellm_logging
+
+    litellm_logging._cost_failure_tracebacks.clear()
+    with patch.object(
+        litellm_logging.traceback, "format_exc", return_value="traceback"
+    ) as mock_format_exc:
+        for _ in range(3):
+            logging_obj = litellm_logging.Logging(
+                model="my-unmapped-model",
+                messages=[{"role": "user", "content": "hi"}],
+                stream=False,
+                call_type="acompletion",
+                start_time=time.time(),
+                litellm_call_id="1234",
+                function_id="1",
+            )
+            logging_obj.update_environment_variables(
+                model="my-unmapped-model",
+                user=None,
+                optional_params={},
+                litellm_params={"custom_llm_provider": "hosted_vllm"},
+                custom_llm_provider="hosted_vllm",
+            )
+            model_response = ModelResponse(
+                model="my-unmapped-model",
+                usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            )
+            assert logging_obj._response_cost_calculator(result=model_response) is None
+            debug_information = logging_obj.model_call_details[
+                "response_cost_failure_debug_information"
+            ]
+            assert "my-unmapped-model" in debug_information["error_str"]
+            assert debug_information["traceback_str"] == "traceback"
+    assert mock_format_exc.call_count == 1
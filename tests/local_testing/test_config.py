@@ -288,3 +288,92 @@ async def test_add_and_delete_deployments(llm_router, model_list_flag_value):
             assert len(llm_router.model_list) == len(model_list)
         else:
             assert len(llm_router.model_list) == len(model_list) + prev_llm_router_val
+
+
+def _create_db_model(model_id: str, api_base: str, master_key: str) -> DBModel:
+    import base64
+
+    encrypted_litellm_params = LiteLLM_Params(
+        model="openai/gpt-4o-mini", api_key="sk-fake", api_base=api_base
+    ).dict(exclude_none=True)
+    for k, v in encrypted_litellm_params.items():
+        if isinstance(v, str):
+            encrypted_litellm_params[k] = base64.b64encode(
+                encrypt_value(v, master_key)
+            ).decode("utf-8")
+    return DBModel(
+        model_id=model_id,
+        model_name="gpt-4o-mini",
+        litellm_params=encrypted_litellm_params,
+        model_info={"id": model_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_deployment_incremental_db_sync():
+    """
+    - first sync loads all db models
+    - unchanged db -> no models fetched
+    - only updated / new models are fetched, deleted models are removed
+    """
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    master_key = "sk-1234"
+    llm_router = litellm.Router()
+    setattr(litellm.proxy.proxy_server, "llm_router", llm_router)
+    setattr(litellm.proxy.proxy_server, "master_key", master_key)
+    pc = ProxyConfig()
+    pc.get_config = AsyncMock(return_value={})
+    pl = ProxyLogging(DualCache())
+
+    db_models = {
+        "1": _create_db_model("1", "https://one.example.com", master_key),
+        "2": _create_db_model("2", "https://two.example.com", master_key),
+    }
+    versions = {"1": "2024-01-01T00:00:00", "2": "2024-01-01T00:00:00"}
+
+    async def _find_many(where=None):
+        model_ids = where["model_id"]["in"] if where else list(db_models)
+        return [db_models[model_id].model_copy(deep=True) for model_id in model_ids]
+
+    prisma_client = MagicMock()
+    prisma_client.db.query_raw = AsyncMock(
+        side_effect=lambda *args: [
+            {"model_id": model_id, "updated_at": updated_at}
+            for model_id, updated_at in versions.items()
+        ]
+    )
+    prisma_client.db.litellm_proxymodeltable.find_many = AsyncMock(
+        side_effect=_find_many
+    )
+    prisma_client.db.litellm_config.find_first = AsyncMock(return_value=None)
+
+    with patch.object(
+        litellm.proxy.proxy_server.proxy_config,
+        "get_config",
+        AsyncMock(return_value={}),
+    ):
+        await pc.add_deployment(prisma_client=prisma_client, proxy_logging_obj=pl)
+        assert sorted(llm_router.get_model_ids()) == ["1", "2"]
+        assert prisma_client.db.litellm_proxymodeltable.find_many.call_count == 1
+
+        # nothing changed
+        await pc.add_deployment(prisma_client=prisma_client, proxy_logging_obj=pl)
+        assert prisma_client.db.litellm_proxymodeltable.find_many.call_count == 1
+
+        # model 1 deleted, model 2 updated, model 3 added
+        del db_models["1"], versions["1"]
+        db_models["2"] = _create_db_model("2", "https://two-v2.example.com", master_key)
+        db_models["3"] = _create_db_model("3", "https://three.example.com", master_key)
+        versions["2"] = "2024-01-02T00:00:00"
+        versions["3"] = "2024-01-02T00:00:00"
+        await pc.add_deployment(prisma_client=prisma_client, proxy_logging_obj=pl)
+
+    find_many = prisma_client.db.litellm_proxymodeltable.find_many
+    assert find_many.call_count == 2
+    assert sorted(find_many.call_args.kwargs["where"]["model_id"]["in"]) == ["2", "3"]
+    assert sorted(llm_router.get_model_ids()) == ["2", "3"]
+    assert (
+        llm_router.get_deployment(model_id="2").litellm_params.api_base
+        == "https://two-v2.example.com"
+    )
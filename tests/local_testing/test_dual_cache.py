@@ -245,3 +245,41 @@ async def test_dual_cache_delete(is_async):
         result = dual_cache.get_cache(test_key)
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_sync_batch_get_cache_uses_sync_redis_client():
+    """
+    Sync batch reads should use the sync Redis client (mget) - also when called from inside a running event loop
+    """
+    in_memory = InMemoryCache()
+    redis_cache = MagicMock(spec=RedisCache)
+    redis_cache.batch_get_cache.return_value = {"key_2": "value_2", "key_3": None}
+    dual_cache = DualCache(in_memory_cache=in_memory, redis_cache=redis_cache)
+    in_memory.set_cache("key_1", "value_1")
+
+    with patch("asyncio.new_event_loop") as mock_new_event_loop:
+        results = dual_cache.batch_get_cache(
+            ["key_1", "key_2", "key_3", "key_2"], parent_otel_span=None
+        )
+        mock_new_event_loop.assert_not_called()
+
+    assert results == ["value_1", "value_2", None, "value_2"]
+    redis_cache.batch_get_cache.assert_called_once_with(
+        ["key_2", "key_3", "key_2"], parent_otel_span=None
+    )
+    redis_cache.async_batch_get_cache.assert_not_called()
+    assert in_memory.get_cache("key_2") == "value_2"
+
+
+def test_run_async_function_reuses_background_event_loop():
+    from litellm.litellm_core_utils.asyncify import run_async_function
+
+    async def get_running_loop(value):
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop(), value
+
+    loop_1, value_1 = run_async_function(get_running_loop, 1)
+    loop_2, value_2 = run_async_function(get_running_loop, value=2)
+    assert loop_1 is loop_2
+    assert (value_1, value_2) == (1, 2)
@@ -0,0 +1,208 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import Cache
+from litellm.caching.embedding_cache import DiskEmbeddingVectorStore, EmbeddingCache
+
+
+def _get_vector(seed: int, dimensions: int = 8) -> list:
+    return [(seed * 31 + i) / 64 for i in range(dimensions)]
+
+
+@pytest.mark.asyncio
+async def test_disk_embedding_cache_round_trip(tmp_path):
+    embedding_cache = EmbeddingCache(type="disk", disk_cache_dir=str(tmp_path))
+    inputs = ["hello", "world", [1, 2, 3]]
+    await embedding_cache.async_set_embeddings(
+        model="text-embedding-3-small",
+        dimensions=None,
+        inputs=inputs,
+        embeddings=[_get_vector(i) for i in range(len(inputs))],
+    )
+
+    cached = await embedding_cache.async_get_embeddings(
+        model="text-embedding-3-small",
+        dimensions=None,
+        inputs=["world", "unknown", [1, 2, 3], "hello"],
+    )
+    assert cached == [_get_vector(1), None, _get_vector(2), _get_vector(0)]
+
+    # same text, different dimensions / model -> different key
+    assert await embedding_cache.async_get_embeddings(
+        model="text-embedding-3-small", dimensions=256, inputs=["hello"]
+    ) == [None]
+    assert await embedding_cache.async_get_embeddings(
+        model="text-embedding-3-large", dimensions=None, inputs=["hello"]
+    ) == [None]
+
+    # vectors written after the file was mapped are readable
+    await embedding_cache.async_set_embeddings(
+        model="text-embedding-3-small",
+        dimensions=None,
+        inputs=["new"],
+        embeddings=[_get_vector(3, dimensions=16)],
+    )
+    assert await embedding_cache.async_get_embeddings(
+        model="text-embedding-3-small", dimensions=None, inputs=["new", "hello"]
+    ) == [_get_vector(3, dimensions=16), _get_vector(0)]
+    embedding_cache.vector_store.close()  # type: ignore
+
+    # index is reloaded from disk
+    reopened_store = DiskEmbeddingVectorStore(disk_cache_dir=str(tmp_path))
+    assert len(reopened_store.index) == 4
+    assert reopened_store.get_vectors(
+        [embedding_cache.get_cache_key("text-embedding-3-small", None, "new")]
+    ) == [_get_vector(3, dimensions=16)]
+    reopened_store.close()
+
+
+def test_disk_embedding_cache_ignores_partial_writes(tmp_path):
+    store = DiskEmbeddingVectorStore(disk_cache_dir=str(tmp_path))
+    store.set_vectors([("a", bytes(32))])
+    store.close()
+
+    # index line for a vector that never made it to the vector file + a truncated line
+    with open(os.path.join(str(tmp_path), "index.txt"), "a") as f:
+        f.write("b 32 8\nc 64")
+
+    reopened_store = DiskEmbeddingVectorStore(disk_cache_dir=str(tmp_path))
+    assert list(reopened_store.index.keys()) == ["a"]
+    assert reopened_store.get_vectors(["a", "b", "c"]) == [[0.0] * 8, None, None]
+    reopened_store.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_embedding_cache_uses_redis_namespace():
+    """
+    Vector keys get the RedisCache namespace, like every other key litellm writes to redis
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    from litellm.caching.cache_codec import pack_float32
+    from litellm.caching.redis_cache import RedisCache
+
+    redis_cache = RedisCache(host="localhost", port=6379, namespace="team-a")
+    mock_redis_instance = AsyncMock()
+    mock_redis_instance.__aenter__.return_value = mock_redis_instance
+    mock_redis_instance.__aexit__.return_value = None
+    mock_redis_instance.mget = AsyncMock(
+        return_value=[pack_float32(_get_vector(1)), None]
+    )
+
+    embedding_cache = EmbeddingCache(type="redis", redis_cache=redis_cache)
+    with patch.object(
+        redis_cache, "init_async_client", return_value=mock_redis_instance
+    ):
+        cached = await embedding_cache.async_get_embeddings(
+            model="text-embedding-3-small", dimensions=None, inputs=["hello", "world"]
+        )
+        await embedding_cache.async_set_embeddings(
+            model="text-embedding-3-small",
+            dimensions=None,
+            inputs=["world"],
+            embeddings=[_get_vector(2)],
+        )
+
+    assert cached == [_get_vector(1), None]
+    read_keys = mock_redis_instance.mget.call_args.args[0]
+    written_keys = list(mock_redis_instance.mset.call_args.args[0].keys())
+    assert all(key.startswith("team-a:litellm:embedding:") for key in read_keys)
+    assert written_keys == [read_keys[1]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_partial_hit_only_sends_misses():
+    """
+    - cache 2 items
+    - call with the 2 cached items + 1 new item -> only the new item is sent to the provider
+    """
+    litellm.cache = Cache(embedding_cache={"type": "local"})
+    try:
+        original_embedding = litellm.main.embedding
+        with patch.object(
+            litellm.main, "embedding", side_effect=original_embedding
+        ) as mock_embedding:
+            await litellm.aembedding(
+                model="text-embedding-3-small",
+                input=["cached-1"],
+                mock_response=_get_vector(1),
+            )
+            await litellm.aembedding(
+                model="text-embedding-3-small",
+                input=["cached-2"],
+                mock_response=_get_vector(2),
+            )
+            await asyncio.sleep(0.5)  # cache writes are done in a background task
+
+            response = await litellm.aembedding(
+                model="text-embedding-3-small",
+                input=["cached-1", "new", "cached-2"],
+                mock_response=_get_vector(3),
+            )
+
+            assert mock_embedding.call_count == 3
+            assert mock_embedding.call_args.kwargs["input"] == ["new"]
+
+        assert [item["embedding"] for item in response.data] == [
+            _get_vector(1),
+            _get_vector(3),
+            _get_vector(2),
+        ]
+        assert response._hidden_params["cache_hit"] is True
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_bytes_and_lookup_time(tmp_path):
+    """
+    Report bytes per vector + lookup time for 1,000 cached 1536-d vectors - disk embedding cache vs json entries (what the generic redis / disk caches store)
+    """
+    import json
+
+    inputs = [f"chunk-{i}" for i in range(1000)]
+    vectors = [_get_vector(i, dimensions=1536) for i in range(len(inputs))]
+
+    embedding_cache = EmbeddingCache(type="disk", disk_cache_dir=str(tmp_path))
+    await embedding_cache.async_set_embeddings(
+        model="text-embedding-3-small",
+        dimensions=None,
+        inputs=inputs,
+        embeddings=vectors,
+    )
+    start_time = time.perf_counter()
+    cached = await embedding_cache.async_get_embeddings(
+        model="text-embedding-3-small", dimensions=None, inputs=inputs
+    )
+    embedding_cache_time = time.perf_counter() - start_time
+    assert all(vector is not None for vector in cached)
+    embedding_cache_bytes = os.path.getsize(
+        embedding_cache.vector_store.vectors_path  # type: ignore
+    ) / len(inputs)
+    embedding_cache.vector_store.close()  # type: ignore
+
+    json_entries = [
+        json.dumps({"object": "embedding", "index": 0, "embedding": vector})
+        for vector in vectors
+    ]
+    start_time = time.perf_counter()
+    for entry in json_entries:
+        json.loads(entry)
+    json_time = time.perf_counter() - start_time
+    json_bytes = sum(len(entry) for entry in json_entries) / len(inputs)
+
+    print(  # noqa
+        f"1000 x 1536-d vectors: embedding cache={embedding_cache_bytes:.0f} bytes/vector, {embedding_cache_time * 1000:.1f}ms; json={json_bytes:.0f} bytes/vector, {json_time * 1000:.1f}ms"
+    )
+    assert embedding_cache_bytes == 1536 * 4
+    assert embedding_cache_bytes < json_bytes
@@ -0,0 +1,314 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import Router
+from litellm.batches.local_batch_engine import (
+    AdaptiveConcurrencyLimiter,
+    LocalBatchEngine,
+)
+
+
+def _get_router() -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o-mini",
+                "litellm_params": {
+                    "model": "gpt-4o-mini",
+                    "api_key": "fake-key",
+                    "mock_response": "hi",
+                },
+            }
+        ]
+    )
+
+
+def _get_input_file(num_requests: int) -> bytes:
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": f"hello {i}"}],
+                },
+            }
+        )
+        for i in range(num_requests)
+    ]
+    return "\n".join(lines).encode("utf-8")
+
+
+def _read_jsonl(path: str) -> list:
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def _wait_for_batch(engine: LocalBatchEngine, batch_id: str):
+    for _ in range(100):
+        batch = await engine.aretrieve_batch(batch_id)
+        if batch.status in ("completed", "failed", "cancelled"):
+            return batch
+        await asyncio.sleep(0.05)
+    raise TimeoutError(batch_id)
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_runs_batch(tmp_path):
+    engine = LocalBatchEngine(storage_dir=str(tmp_path), max_concurrency=4)
+    input_file = await engine.acreate_file(file=_get_input_file(10))
+    batch = await engine.acreate_batch(
+        router=_get_router(),
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+    )
+    batch = await _wait_for_batch(engine, batch.id)
+
+    assert batch.status == "completed"
+    assert batch.request_counts.total == 10  # type: ignore
+    assert batch.request_counts.completed == 10  # type: ignore
+    results = _read_jsonl(engine.get_file_path(batch.output_file_id))  # type: ignore
+    assert sorted(result["custom_id"] for result in results) == sorted(
+        f"request-{i}" for i in range(10)
+    )
+    assert results[0]["response"]["status_code"] == 200
+    assert results[0]["response"]["body"]["choices"][0]["message"]["content"] == "hi"
+    assert results[0]["error"] is None
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_create_file_off_the_event_loop(tmp_path):
+    """Uploaded file objects are copied in a worker thread, not on the event loop"""
+    import io
+    import threading
+
+    read_threads = []
+
+    class _UploadFile(io.BytesIO):
+        def read(self, *args):
+            read_threads.append(threading.current_thread())
+            return super().read(*args)
+
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(
+        file=_UploadFile(_get_input_file(3)), filename="batch.jsonl"
+    )
+
+    assert read_threads
+    assert all(thread is not threading.main_thread() for thread in read_threads)
+    assert input_file.filename == "batch.jsonl"
+    assert input_file.bytes == len(_get_input_file(3))
+    assert await engine.afile_content(input_file.id) == _get_input_file(3)
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_invalid_input_file(tmp_path):
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(file=_get_input_file(2))
+    batch = await engine.acreate_batch(
+        router=_get_router(), input_file_id=input_file.id, endpoint="/v1/embeddings"
+    )
+    batch = await _wait_for_batch(engine, batch.id)
+    assert batch.status == "failed"
+    assert "does not match the batch endpoint" in batch.errors.data[0].message  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_resume(tmp_path):
+    """
+    - batch was in progress when the process stopped, with 2 results (+ a partially written line) in the output file
+    - resume() only sends the remaining requests
+    """
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(file=_get_input_file(5))
+    batch = await engine.acreate_batch(
+        router=_get_router(),
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+    )
+    await _wait_for_batch(engine, batch.id)
+
+    # rewind the batch to a crash after the first 2 results
+    output_path = engine.get_file_path(batch.output_file_id)  # type: ignore
+    results = _read_jsonl(output_path)
+    with open(output_path, "w") as f:
+        for result in results[:2]:
+            f.write(json.dumps(result) + "\n")
+        f.write('{"id": "batch_req_')
+    batch.status = "in_progress"
+    engine._write_batch(batch)
+
+    restarted_engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    router = _get_router()
+    called_with = []
+    original_acompletion = router.acompletion
+
+    async def _acompletion(**kwargs):
+        called_with.append(kwargs["messages"][0]["content"])
+        return await original_acompletion(**kwargs)
+
+    router.acompletion = _acompletion  # type: ignore
+    assert await restarted_engine.resume(router=router) == [batch.id]
+    batch = await _wait_for_batch(restarted_engine, batch.id)
+
+    assert batch.status == "completed"
+    assert batch.request_counts.completed == 5  # type: ignore
+    assert len(called_with) == 3
+    assert sorted(result["custom_id"] for result in _read_jsonl(output_path)) == [
+        f"request-{i}" for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_rate_limit_retries(tmp_path):
+    engine = LocalBatchEngine(
+        storage_dir=str(tmp_path), max_concurrency=4, max_rate_limit_retries=1
+    )
+    router = _get_router()
+    num_calls = 0
+
+    async def _acompletion(**kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        raise litellm.RateLimitError(
+            message="rate limited", llm_provider="openai", model="gpt-4o-mini"
+        )
+
+    router.acompletion = _acompletion  # type: ignore
+    input_file = await engine.acreate_file(file=_get_input_file(1))
+    batch = await engine.acreate_batch(
+        router=router, input_file_id=input_file.id, endpoint="/v1/chat/completions"
+    )
+    batch = await _wait_for_batch(engine, batch.id)
+
+    assert num_calls == 2
+    assert batch.request_counts.failed == 1  # type: ignore
+    errors = _read_jsonl(engine.get_file_path(batch.error_file_id))  # type: ignore
+    assert errors[0]["custom_id"] == "request-0"
+    assert errors[0]["error"]["code"] == "429"
+    assert errors[0]["response"] is None
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+    for _ in range(8):
+        await limiter.acquire()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+
+    await limiter.release(rate_limited=True)
+    assert limiter.limit == 4
+    # 7 still in flight - new requests wait until fewer than 4 are
+    for _ in range(3):
+        await limiter.release()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+    await limiter.release()
+    await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_resume_claims_batch(tmp_path):
+    """
+    proxy workers share the storage dir - only one of them resumes a batch
+    """
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(file=_get_input_file(2))
+    batch = await engine.acreate_batch(
+        router=_get_router(),
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+    )
+    batch = await _wait_for_batch(engine, batch.id)
+    batch.status = "in_progress"
+    engine._write_batch(batch)
+
+    worker_1 = LocalBatchEngine(storage_dir=str(tmp_path))
+    worker_2 = LocalBatchEngine(storage_dir=str(tmp_path))
+    assert await worker_1.resume(router=_get_router()) == [batch.id]
+    assert await worker_2.resume(router=_get_router()) == []
+    batch = await _wait_for_batch(worker_1, batch.id)
+    assert batch.status == "completed"
+    assert batch.id not in worker_1.batch_locks
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_cancel_from_another_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "litellm.batches.local_batch_engine.BATCH_STATE_CHECKPOINT_INTERVAL", 0
+    )
+    worker_1 = LocalBatchEngine(storage_dir=str(tmp_path), max_concurrency=1)
+    worker_2 = LocalBatchEngine(storage_dir=str(tmp_path))
+    router = _get_router()
+    original_acompletion = router.acompletion
+
+    async def _acompletion(**kwargs):
+        await asyncio.sleep(0.05)
+        return await original_acompletion(**kwargs)
+
+    router.acompletion = _acompletion  # type: ignore
+    input_file = await worker_1.acreate_file(file=_get_input_file(20))
+    batch = await worker_1.acreate_batch(
+        router=router, input_file_id=input_file.id, endpoint="/v1/chat/completions"
+    )
+    await asyncio.sleep(0.2)
+
+    batch = await worker_2.acancel_batch(batch.id)
+    assert batch.status == "cancelling"
+    assert batch.id not in worker_2.batch_locks  # worker_1 still runs it
+
+    batch = await _wait_for_batch(worker_1, batch.id)
+    assert batch.status == "cancelled"
+    assert 0 < batch.request_counts.completed < 20  # type: ignore
+    results = _read_jsonl(worker_1.get_file_path(batch.output_file_id))  # type: ignore
+    assert len(results) == batch.request_counts.completed  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_local_batch_engine_cancel_batch_not_running(tmp_path):
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(file=_get_input_file(3))
+    batch = await engine.acreate_batch(
+        router=_get_router(),
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+    )
+    batch = await _wait_for_batch(engine, batch.id)
+    batch.status = "in_progress"  # process stopped before the batch finished
+    engine._write_batch(batch)
+
+    batch = await LocalBatchEngine(storage_dir=str(tmp_path)).acancel_batch(batch.id)
+    assert batch.status == "cancelled"
+    assert batch.request_counts.completed == 3  # type: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit, has_more", [(2, True), (3, False), (4, False)])
+async def test_local_batch_engine_list_batches(tmp_path, limit, has_more):
+    engine = LocalBatchEngine(storage_dir=str(tmp_path))
+    input_file = await engine.acreate_file(file=_get_input_file(1))
+    for _ in range(3):
+        batch = await engine.acreate_batch(
+            router=_get_router(),
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+        )
+        await _wait_for_batch(engine, batch.id)
+
+    response = await engine.alist_batches(limit=limit)
+    assert len(response["data"]) == min(limit, 3)
+    assert response["has_more"] is has_more
+    assert response["first_id"] == response["data"][0].id
+    assert response["last_id"] == response["data"][-1].id
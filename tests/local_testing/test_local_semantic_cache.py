@@ -0,0 +1,318 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import Cache
+from litellm.caching.local_semantic_cache import (
+    LocalSemanticCache,
+    get_prompt_from_messages,
+)
+from litellm.types.utils import Embedding, EmbeddingResponse
+
+
+def _embed(text: str) -> list:
+    # letter counts - similar texts get similar vectors
+    vector = [0.0] * 26
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1
+    return vector
+
+
+async def _mock_aembedding(model, input, **kwargs):
+    inputs = input if isinstance(input, list) else [input]
+    return EmbeddingResponse(
+        model=model,
+        data=[
+            Embedding(embedding=_embed(text), index=idx, object="embedding")
+            for idx, text in enumerate(inputs)
+        ],
+    )
+
+
+def _messages(content) -> list:
+    return [{"role": "user", "content": content}]
+
+
+def test_get_prompt_from_messages():
+    assert (
+        get_prompt_from_messages(
+            [
+                {"role": "system", "content": "be nice"},
+                {"role": "assistant", "content": None, "tool_calls": []},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "what is in this image?"},
+                        {"type": "image_url", "image_url": {"url": "https://"}},
+                    ],
+                },
+            ]
+        )
+        == "be nice\nwhat is in this image?"
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_batches_embedding_calls():
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    with patch.object(
+        litellm, "aembedding", side_effect=_mock_aembedding
+    ) as mock_aembedding:
+        await cache.async_set_cache(
+            "key", {"response": "cached"}, messages=_messages("hello world")
+        )
+        assert mock_aembedding.call_count == 1
+
+        results = await asyncio.gather(
+            cache.async_get_cache("key", messages=_messages("hello world!")),
+            cache.async_get_cache("key", messages=_messages("goodbye moon")),
+            cache.async_get_cache("key", messages=_messages("goodbye moon")),
+        )
+        # 2 unique prompts -> 1 embedding call
+        assert mock_aembedding.call_count == 2
+        assert mock_aembedding.call_args.kwargs["input"] == [
+            "hello world!",
+            "goodbye moon",
+        ]
+        assert results == [{"response": "cached"}, None, None]
+
+        # embedding from the get is reused by the set
+        await cache.async_set_cache(
+            "key", {"response": "moon"}, messages=_messages("goodbye moon")
+        )
+        assert mock_aembedding.call_count == 2
+        assert await cache.async_get_cache(
+            "key", messages=_messages("goodbye moon")
+        ) == {"response": "moon"}
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_persistence(tmp_path):
+    with patch.object(litellm, "aembedding", side_effect=_mock_aembedding):
+        cache = LocalSemanticCache(similarity_threshold=0.95, cache_dir=str(tmp_path))
+        for i, prompt in enumerate(["hello world", "goodbye moon"]):
+            await cache.async_set_cache(
+                "key", {"response": i}, messages=_messages(prompt)
+            )
+
+        # simulate a crash mid-write
+        with open(os.path.join(str(tmp_path), "vectors.f32"), "ab") as f:
+            f.write(b"\x00\x01")
+
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path)
+        )
+        assert reloaded_cache.persisted_vectors is not None
+        assert reloaded_cache.persisted_vectors.shape == (2, 26)
+        assert await reloaded_cache.async_get_cache(
+            "key", messages=_messages("goodbye moon")
+        ) == {"response": 1}
+
+        # new entries are searched together with the persisted ones
+        await reloaded_cache.async_set_cache(
+            "key", {"response": 2}, messages=_messages("quick brown fox")
+        )
+        for prompt, expected in [("hello world", 0), ("quick brown fox", 2)]:
+            assert await reloaded_cache.async_get_cache(
+                "key", messages=_messages(prompt)
+            ) == {"response": expected}
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path)
+        )
+        assert reloaded_cache.persisted_vectors.shape == (3, 26)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_batches_embedding_calls_per_api_key():
+    """
+    Prompts from different api keys are embedded in separate calls, so the embedding spend is logged against each key
+    """
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    with patch.object(
+        cache,
+        "_async_embed",
+        side_effect=lambda prompts, **kwargs: [_embed(p) for p in prompts],
+    ) as mock_async_embed:
+        await asyncio.gather(
+            cache.async_get_cache(
+                "key",
+                messages=_messages("hello world"),
+                metadata={"user_api_key": "key-1", "trace_id": "trace-1"},
+            ),
+            cache.async_get_cache(
+                "key",
+                messages=_messages("goodbye moon"),
+                metadata={"user_api_key": "key-2", "trace_id": "trace-2"},
+            ),
+            cache.async_get_cache(
+                "key",
+                messages=_messages("quick brown fox"),
+                metadata={"user_api_key": "key-1", "trace_id": "trace-3"},
+            ),
+        )
+
+    calls = sorted(
+        [call.kwargs for call in mock_async_embed.call_args_list],
+        key=lambda call_kwargs: call_kwargs["user_api_key"],
+    )
+    assert calls == [
+        {
+            "prompts": ["hello world", "quick brown fox"],
+            "user_api_key": "key-1",
+            "trace_id": None,
+        },
+        {"prompts": ["goodbye moon"], "user_api_key": "key-2", "trace_id": "trace-2"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_max_size_and_ttl(tmp_path):
+    with patch.object(litellm, "aembedding", side_effect=_mock_aembedding):
+        cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path), max_size=2
+        )
+        for i, prompt in enumerate(["hello world", "goodbye moon", "quick brown fox"]):
+            await cache.async_set_cache(
+                "key", {"response": i}, messages=_messages(prompt)
+            )
+
+        # oldest entry is evicted
+        assert cache.num_live_entries == 2
+        assert (
+            await cache.async_get_cache("key", messages=_messages("hello world"))
+            is None
+        )
+        assert await cache.async_get_cache(
+            "key", messages=_messages("quick brown fox")
+        ) == {"response": 2}
+
+        # expired entries are not returned
+        await cache.async_set_cache(
+            "key", {"response": 3}, messages=_messages("lazy dog"), ttl=0.1
+        )
+        assert await cache.async_get_cache("key", messages=_messages("lazy dog")) == {
+            "response": 3
+        }
+        await asyncio.sleep(0.2)
+        assert (
+            await cache.async_get_cache("key", messages=_messages("lazy dog")) is None
+        )
+
+        # evicted + expired rows are dropped from the files on load
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path), max_size=2
+        )
+        assert [prompt for prompt, _ in reloaded_cache.entries] == ["quick brown fox"]
+        assert reloaded_cache.persisted_vectors.shape == (1, 26)  # type: ignore
+        assert await reloaded_cache.async_get_cache(
+            "key", messages=_messages("quick brown fox")
+        ) == {"response": 2}
+
+
+def test_local_semantic_cache_compacts_evicted_rows():
+    import numpy as np
+
+    cache = LocalSemanticCache(similarity_threshold=0.95, max_size=100)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2000, 64)).astype(np.float32)
+    for i, vector in enumerate(vectors):
+        cache._add(prompt=str(i), embedding=vector, value=i, ttl=None)  # type: ignore
+
+    # evicted rows don't pile up in memory
+    assert cache.num_live_entries == 100
+    assert len(cache.entries) < 100 + 1024 + 2
+    for i in [0, 1899]:
+        assert cache._search(vectors[i])[1] != (str(i), i)  # type: ignore
+    for i in [1900, 1999]:
+        assert cache._search(vectors[i])[1] == (str(i), i)  # type: ignore
+
+
+def test_cache_forwards_local_semantic_cache_params():
+    litellm_cache = Cache(
+        type="local-semantic",  # type: ignore
+        similarity_threshold=0.95,
+        local_semantic_cache_max_size=5,
+        local_semantic_cache_max_embeddings_in_memory=7,
+    )
+    assert isinstance(litellm_cache.cache, LocalSemanticCache)
+    assert litellm_cache.cache.max_size == 5
+    assert litellm_cache.cache.prompt_embeddings.max_size == 7
+    assert litellm_cache.cache.index_type == "flat"
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_acompletion():
+    litellm.cache = Cache(type="local-semantic", similarity_threshold=0.95)  # type: ignore
+    try:
+        with patch.object(litellm, "aembedding", side_effect=_mock_aembedding):
+            response_1 = await litellm.acompletion(
+                model="gpt-4o",
+                messages=_messages("what is the capital of france"),
+                mock_response="paris",
+            )
+            await asyncio.sleep(0.5)  # cache writes are done in a background task
+            response_2 = await litellm.acompletion(
+                model="gpt-4o",
+                messages=_messages("what is the capital of france?"),
+                mock_response="not cached",
+            )
+        assert response_2.choices[0].message.content == "paris"  # type: ignore
+        assert response_2.id == response_1.id
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_hnsw_index(tmp_path):
+    pytest.importorskip("hnswlib")
+    with patch.object(litellm, "aembedding", side_effect=_mock_aembedding):
+        cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path), index_type="hnsw"
+        )
+        await cache.async_set_cache(
+            "key", {"response": "cached"}, messages=_messages("hello world")
+        )
+        reloaded_cache = LocalSemanticCache(
+            similarity_threshold=0.95, cache_dir=str(tmp_path), index_type="hnsw"
+        )
+        for semantic_cache in [cache, reloaded_cache]:
+            assert await semantic_cache.async_get_cache(
+                "key", messages=_messages("hello world!")
+            ) == {"response": "cached"}
+            assert (
+                await semantic_cache.async_get_cache(
+                    "key", messages=_messages("goodbye moon")
+                )
+                is None
+            )
+
+
+def test_local_semantic_cache_lookup_time():
+    """
+    Report lookup time over 10,000 cached 1536-d vectors
+    """
+    import numpy as np
+
+    cache = LocalSemanticCache(similarity_threshold=0.95)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((10000, 1536)).astype(np.float32)
+    for i, vector in enumerate(vectors):
+        cache._add(prompt=str(i), embedding=vector, value=i, ttl=None)  # type: ignore
+
+    num_lookups = 100
+    start_time = time.perf_counter()
+    for i in range(num_lookups):
+        similarity, entry = cache._search(vectors[i])  # type: ignore
+        assert entry is not None and entry[1] == i
+    lookup_time = (time.perf_counter() - start_time) / num_lookups
+    print(f"10,000 x 1536-d vectors: {lookup_time * 1000:.3f}ms per lookup")  # noqa
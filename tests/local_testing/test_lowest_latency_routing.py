@@ -72,7 +72,7 @@ async def test_latency_memory_leak(sync_mode):
                 start_time=start_time,
                 end_time=end_time,
             )
-    latency_key = f"{model_group}_map"
+    latency_key = f"{model_group}_latency:{deployment_id}:samples"
     cache_value = copy.deepcopy(
         test_cache.get_cache(key=latency_key)
     )  # MAKE SURE NO MEMORY LEAK IN CACHING OBJECT
@@ -145,11 +145,8 @@ def test_latency_updated():
         start_time=start_time,
         end_time=end_time,
     )
-    latency_key = f"{model_group}_map"
-    assert (
-        end_time - start_time
-        == test_cache.get_cache(key=latency_key)[deployment_id]["latency"][0]
-    )
+    latency_key = f"{model_group}_latency:{deployment_id}:samples"
+    assert end_time - start_time == test_cache.get_cache(key=latency_key)[0]["latency"]
 
 
 # test_tpm_rpm_updated()
@@ -188,9 +185,9 @@ def test_latency_updated_custom_ttl():
         start_time=start_time,
         end_time=end_time,
     )
-    latency_key = f"{model_group}_map"
+    latency_key = f"{model_group}_latency:{deployment_id}:samples"
     print(f"cache: {test_cache.get_cache(key=latency_key)}")
-    assert isinstance(test_cache.get_cache(key=latency_key), dict)
+    assert isinstance(test_cache.get_cache(key=latency_key), list)
     time.sleep(cache_time)
     assert test_cache.get_cache(key=latency_key) is None
 
@@ -966,3 +963,112 @@ async def test_lowest_latency_routing_time_to_first_token(sync_mode):
 
     assert len(selected_deployments.keys()) == 1
     assert "1" in list(selected_deployments.keys())
+
+
+def _log_latency(lowest_latency_logger, deployment_id, latency: float):
+    kwargs = {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-3.5-turbo"},
+            "model_info": {"id": deployment_id},
+        }
+    }
+    lowest_latency_logger.log_success_event(
+        response_obj={}, kwargs=kwargs, start_time=0.0, end_time=latency
+    )
+
+
+def test_latency_ring_buffer_keeps_latest_values():
+    """
+    - only the last `max_latency_list_size` latencies are kept
+    - each deployment has its own key, with the tpm / rpm counters in separate keys
+    """
+    test_cache = DualCache()
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=test_cache,
+        model_list=[],
+        routing_args={"max_latency_list_size": 3},
+    )
+    for latency in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        _log_latency(lowest_latency_logger, "1234", latency)
+    _log_latency(lowest_latency_logger, "5678", 9.0)
+
+    assert test_cache.get_cache(key="gpt-3.5-turbo_latency:1234:samples") == [
+        {"latency": 5.0},
+        {"latency": 4.0},
+        {"latency": 3.0},
+    ]
+    assert test_cache.get_cache(key="gpt-3.5-turbo_latency:5678:samples") == [
+        {"latency": 9.0}
+    ]
+    ids, latency_keys, usage_keys = lowest_latency_logger._get_deployment_keys(
+        model_group="gpt-3.5-turbo",
+        healthy_deployments=[{"model_info": {"id": "1234"}}],
+    )
+    request_count_dict = lowest_latency_logger._get_request_count_dict(
+        ids=ids,
+        latency_values=test_cache.batch_get_lists(keys=latency_keys),
+        usage_values=test_cache.batch_get_cache(keys=usage_keys),
+    )
+    assert request_count_dict["1234"]["latency"] == [5.0, 4.0, 3.0]
+    assert request_count_dict["1234"]["rpm"] == 5
+
+
+@pytest.mark.parametrize(
+    "latency_percentile, expected_id", [(None, "1234"), (50, "5678"), (90, "1234")]
+)
+def test_latency_percentile_routing(latency_percentile, expected_id):
+    """
+    1234 - mostly slow, 1 fast call -> lower mean + p90
+    5678 - mostly fast, 1 very slow call -> lower p50
+    """
+    model_list = [
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "azure/chatgpt-v-2"},
+            "model_info": {"id": "1234"},
+        },
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "azure/chatgpt-v-2"},
+            "model_info": {"id": "5678"},
+        },
+    ]
+    lowest_latency_logger = LowestLatencyLoggingHandler(
+        router_cache=DualCache(),
+        model_list=model_list,
+        routing_args={"latency_percentile": latency_percentile},
+    )
+    for latency in [0.1, 2.0, 2.0, 2.0, 2.0]:
+        _log_latency(lowest_latency_logger, "1234", latency)
+    for latency in [1.0, 1.0, 1.0, 1.0, 30.0]:
+        _log_latency(lowest_latency_logger, "5678", latency)
+
+    deployment = lowest_latency_logger.get_available_deployments(
+        model_group="gpt-3.5-turbo", healthy_deployments=model_list
+    )
+    assert deployment["model_info"]["id"] == expected_id
+
+
+def test_latency_writers_dont_overwrite_each_other():
+    """
+    2 router instances (e.g. proxy workers) sharing a cache - both push to the deployment's one latency list
+    """
+    test_cache = DualCache()
+    worker_1 = LowestLatencyLoggingHandler(router_cache=test_cache, model_list=[])
+    worker_2 = LowestLatencyLoggingHandler(router_cache=test_cache, model_list=[])
+    _log_latency(worker_1, "1234", 1.0)
+    _log_latency(worker_2, "1234", 2.0)
+    _log_latency(worker_1, "1234", 3.0)
+
+    ids, latency_keys, usage_keys = worker_1._get_deployment_keys(
+        model_group="gpt-3.5-turbo",
+        healthy_deployments=[{"model_info": {"id": "1234"}}],
+    )
+    assert latency_keys == ["gpt-3.5-turbo_latency:1234:samples"]
+    request_count_dict = worker_1._get_request_count_dict(
+        ids=ids,
+        latency_values=test_cache.batch_get_lists(keys=latency_keys),
+        usage_values=test_cache.batch_get_cache(keys=usage_keys),
+    )
+    assert sorted(request_count_dict["1234"]["latency"]) == [1.0, 2.0, 3.0]
+    assert request_count_dict["1234"]["rpm"] == 3
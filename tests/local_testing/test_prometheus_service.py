@@ -212,6 +212,99 @@ async def test_service_logger_db_monitoring_failure():
         assert actual_payload.error == "Database connection failed"
 
 
+@pytest.mark.asyncio
+async def test_log_service_success_aggregates_without_task_per_call():
+    """
+    Redis / router calls are aggregated in-process - no task is created per call, unless a span is logged
+    """
+    litellm.service_callback = ["prometheus_system", "otel"]
+    sl = ServiceLogging()
+    sl.prometheusServicesLogger.mock_testing = True
+    sl.service_metrics.flush()  # shared by every ServiceLogging in the process
+
+    with patch.object(
+        sl, "_async_log_service_span", new_callable=AsyncMock
+    ) as mock_span:
+        for duration in [0.001, 0.002, 0.003, 0.5]:
+            sl.log_service_success(
+                service=ServiceTypes.REDIS,
+                duration=duration,
+                call_type="async_get_cache",
+            )
+        sl.log_service_failure(
+            service=ServiceTypes.REDIS,
+            duration=0.01,
+            error=Exception("Redis is down"),
+            call_type="async_get_cache",
+        )
+        await asyncio.sleep(0)
+
+        # no parent otel span -> only the failure is logged as an individual event
+        assert mock_span.call_count == 1
+        assert mock_span.call_args.kwargs["payload"].is_error is True
+    assert sl.prometheusServicesLogger.mock_testing_success_calls == 4
+    assert sl.prometheusServicesLogger.mock_testing_failure_calls == 1
+
+    summaries = sl.service_metrics.flush()
+    assert len(summaries) == 1
+    assert summaries[0].service == "redis"
+    assert summaries[0].call_type == "async_get_cache"
+    assert summaries[0].count == 5
+    assert summaries[0].error_count == 1
+    assert summaries[0].max_duration == 0.5
+    assert summaries[0].p50_duration == 0.005
+    assert summaries[0].p99_duration == 0.5
+    assert sl.service_metrics.flush() == []
+
+    sl.periodic_flush_task.cancel()
+    litellm.service_callback = []
+
+
+@pytest.mark.asyncio
+async def test_log_service_success_span_sampling(monkeypatch):
+    """
+    Successful calls are only logged as otel spans if sampled, or over the latency threshold
+    """
+    litellm.service_callback = ["otel"]
+    monkeypatch.setattr(litellm, "service_span_sample_rate", 0.0)
+    monkeypatch.setattr(litellm, "service_span_latency_threshold", 1.0)
+    sl = ServiceLogging()
+    parent_otel_span = object()
+
+    with patch.object(
+        sl, "_async_log_service_span", new_callable=AsyncMock
+    ) as mock_span:
+        sl.log_service_success(
+            service=ServiceTypes.REDIS,
+            duration=0.01,
+            call_type="async_get_cache",
+            parent_otel_span=parent_otel_span,
+        )
+        sl.log_service_success(
+            service=ServiceTypes.REDIS,
+            duration=2.0,
+            call_type="async_get_cache",
+            parent_otel_span=parent_otel_span,
+        )
+        await asyncio.sleep(0)
+
+        assert mock_span.call_count == 1
+        assert mock_span.call_args.kwargs["payload"].duration == 2.0
+
+        monkeypatch.setattr(litellm, "service_span_sample_rate", 1.0)
+        sl.log_service_success(
+            service=ServiceTypes.REDIS,
+            duration=0.01,
+            call_type="async_get_cache",
+            parent_otel_span=parent_otel_span,
+        )
+        await asyncio.sleep(0)
+        assert mock_span.call_count == 2
+
+    sl.periodic_flush_task.cancel()
+    litellm.service_callback = []
+
+
 def test_get_metric_existing():
     """Test _get_metric when metric exists. _get_metric should return the metric object"""
     pl = PrometheusServicesLogger()
@@ -295,3 +388,38 @@ def test_create_counter_existing():
 
     assert counter2 is counter1
     assert pl._get_metric("litellm_test_service_test_type_of_request") is counter1
+
+
+@pytest.mark.asyncio
+async def test_service_logging_shares_aggregator_and_flush_task():
+    """
+    - every ServiceLogging instance records into the same aggregator, flushed by one task
+    - the sync entrypoint only counts as a sync call
+    """
+    litellm.service_callback = ["prometheus_system"]
+    sl_1 = ServiceLogging(mock_testing=True)
+    sl_2 = ServiceLogging(mock_testing=True)
+    sl_1.service_metrics.flush()
+
+    sl_1.service_success_hook(
+        service=ServiceTypes.REDIS, duration=0.01, call_type="get_cache"
+    )
+    sl_2.log_service_success(
+        service=ServiceTypes.REDIS, duration=0.01, call_type="get_cache"
+    )
+
+    assert (
+        sl_1.mock_testing_sync_success_hook,
+        sl_1.mock_testing_async_success_hook,
+    ) == (1, 0)
+    assert (
+        sl_2.mock_testing_sync_success_hook,
+        sl_2.mock_testing_async_success_hook,
+    ) == (0, 1)
+    assert sl_1.service_metrics is sl_2.service_metrics
+    assert sl_1.service_metrics.flush()[0].count == 2
+    assert sl_1.periodic_flush_task is not None
+    assert sl_1.periodic_flush_task is sl_2.periodic_flush_task
+
+    sl_1.periodic_flush_task.cancel()
+    litellm.service_callback = []
@@ -230,6 +230,87 @@ def test_stream_chunk_builder_litellm_mixed_calls():
     }
 
 
+def test_streaming_response_accumulator_out_of_order_chunks():
+    """
+    Chunks arriving out of order (e.g. on the logging threads) are reordered by `created_at`, within the reorder window
+    """
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingResponseAccumulator,
+    )
+
+    chunks = []
+    for i, chunk in enumerate(stream_chunk_testdata.chunks):
+        chunk._hidden_params["created_at"] = 1700000000 + i
+        chunks.append(chunk)
+    expected_response = stream_chunk_builder(chunks)
+
+    accumulator = StreamingResponseAccumulator()
+    for i in range(0, len(chunks), 2):
+        for chunk in reversed(chunks[i : i + 2]):
+            accumulator.add_chunk(chunk)
+    assert len(accumulator) == len(chunks)
+
+    response = stream_chunk_builder(accumulator)
+    assert response.choices[0].message.content == (
+        expected_response.choices[0].message.content
+    )
+    assert response.choices[0].message.tool_calls[0].to_dict() == (
+        expected_response.choices[0].message.tool_calls[0].to_dict()
+    )
+    assert response.usage == expected_response.usage
+
+    # build again, after more chunks - e.g. the usage chunk sent after the finish reason
+    accumulator.add_chunk(
+        litellm.ModelResponse(
+            choices=[],
+            usage={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+            stream=True,
+        )
+    )
+    response = accumulator.build()
+    assert response.choices[0].message.content == (
+        expected_response.choices[0].message.content
+    )
+    assert response.usage.prompt_tokens == 10
+    assert response.usage.completion_tokens == 20
+
+
+def test_streaming_response_accumulator_reorder_window_overflow():
+    """
+    A chunk arriving further out of order than the reorder window is logged and added out of order - the released chunks are not kept to replay
+    """
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingResponseAccumulator,
+    )
+
+    chunks = []
+    for i, chunk in enumerate(stream_chunk_testdata.chunks):
+        chunk._hidden_params["created_at"] = 1700000000 + i
+        chunks.append(chunk)
+    expected_response = stream_chunk_builder(chunks)
+
+    accumulator = StreamingResponseAccumulator(reorder_window=2)
+    # chunk 3 arrives after chunk 8 - chunks 0-6 are already released
+    arrival_order = [0, 1, 2, 4, 5, 6, 7, 8, 3] + list(range(9, len(chunks)))
+    for i in arrival_order:
+        accumulator.add_chunk(chunks[i])
+    assert accumulator.reorder_window_overflowed is True
+    assert not hasattr(accumulator, "released_chunks")
+    assert len(accumulator.pending_chunks) <= 2
+
+    response = accumulator.build()
+    processed_order = [0, 1, 2, 4, 5, 6, 3] + list(range(7, len(chunks)))
+    assert response.choices[0].message.content == "".join(
+        chunks[i].choices[0].delta.content or ""
+        for i in processed_order
+        if chunks[i].choices
+    )
+    assert response.choices[0].message.tool_calls[0].to_dict() == (
+        expected_response.choices[0].message.tool_calls[0].to_dict()
+    )
+    assert response.usage == expected_response.usage
+
+
 def test_stream_chunk_builder_litellm_empty_chunks():
     with pytest.raises(litellm.APIError):
         response = stream_chunk_builder(chunks=None)
@@ -545,6 +545,59 @@ def test_redact_msgs_from_logs():
     print("Test passed")
 
 
+def test_logging_obj_messages_snapshot():
+    """
+    - logging obj messages aren't changed by later changes to the request messages
+    - message strings (e.g. base64 images) are shared, not copied
+    - redacting the streaming response doesn't modify the original response
+    """
+    from litellm.litellm_core_utils.litellm_logging import Logging
+    from litellm.litellm_core_utils.redact_messages import perform_redaction
+
+    image_url = "data:image/png;base64," + "a" * 10_000
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "what's in this image?"},
+                {"type": "image_url", "image_url": {"url": image_url}},
+            ],
+        }
+    ]
+    litellm_logging_obj = Logging(
+        model="gpt-4o",
+        messages=messages,
+        stream=True,
+        call_type="acompletion",
+        litellm_call_id="1234",
+        start_time=datetime.now(),
+        function_id="1234",
+    )
+    messages[0]["content"].pop(0)
+    messages.append({"role": "assistant", "content": "hi"})
+
+    assert len(litellm_logging_obj.messages) == 1
+    assert len(litellm_logging_obj.messages[0]["content"]) == 2
+    assert (
+        litellm_logging_obj.messages[0]["content"][1]["image_url"]["url"] is image_url
+    )
+
+    streaming_response = litellm.ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": "hello"}}]
+    )
+    model_call_details = {
+        "stream": True,
+        "complete_streaming_response": streaming_response,
+    }
+    redacted_result = perform_redaction(model_call_details, result=streaming_response)
+    assert streaming_response.choices[0].message.content == "hello"
+    assert (
+        model_call_details["complete_streaming_response"].choices[0].message.content
+        == "redacted-by-litellm"
+    )
+    assert redacted_result.choices[0].message.content == "redacted-by-litellm"
+
+
 @pytest.mark.parametrize(
     "duration, unit",
     [("7s", "s"), ("7m", "m"), ("7h", "h"), ("7d", "d"), ("7mo", "mo")],
@@ -838,13 +891,14 @@ def test_is_base64_encoded():
     assert is_base64_encoded(s=base64_image) is True
 
 
+@mock.patch("httpx.AsyncHTTPTransport")
 @mock.patch("httpx.AsyncClient")
 @mock.patch.dict(
     os.environ,
     {"SSL_VERIFY": "/certificate.pem", "SSL_CERTIFICATE": "/client.pem"},
     clear=True,
 )
-def test_async_http_handler(mock_async_client):
+def test_async_http_handler(mock_async_client, mock_async_transport):
     import httpx
 
     timeout = 120
@@ -863,8 +917,121 @@ def test_async_http_handler(mock_async_client):
         ),
         timeout=timeout,
         verify="/certificate.pem",
+        transport=mock.ANY,
+    )
+    mock_async_transport.assert_called_with(
+        verify="/certificate.pem",
+        cert="/client.pem",
+        limits=httpx.Limits(
+            max_connections=concurrent_limit,
+            max_keepalive_connections=concurrent_limit,
+        ),
+        http2=False,
+    )
+
+
+def test_async_httpx_client_registry_key_normalization():
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPClientRegistry
+
+    registry = AsyncHTTPClientRegistry()
+    client_1 = registry.get_client(
+        llm_provider=litellm.LlmProviders.ANTHROPIC,
+        params={"timeout": 600},
+        api_base="HTTPS://api.anthropic.com/v1/messages",
+    )
+    client_2 = registry.get_client(
+        llm_provider=litellm.LlmProviders.ANTHROPIC,
+        params={"timeout": 600.0},
+        api_base="https://api.anthropic.com",
+    )
+    assert client_1 is client_2
+
+    client_3 = registry.get_client(
+        llm_provider=litellm.LlmProviders.ANTHROPIC,
+        params={"timeout": 30},
+        api_base="https://api.anthropic.com",
+    )
+    assert client_3 is not client_1
+    assert len(registry.get_pool_stats()) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_httpx_client_per_api_base(monkeypatch):
+    """
+    Provider calls to different api bases should not share a client
+    """
+    from litellm.llms.custom_httpx import http_handler
+
+    registry = http_handler.AsyncHTTPClientRegistry()
+    monkeypatch.setattr(http_handler, "async_http_client_registry", registry)
+    used_clients = []
+
+    async def mock_post(self, *args, **kwargs):
+        used_clients.append(self)
+        raise Exception("mock post")
+
+    monkeypatch.setattr(http_handler.AsyncHTTPHandler, "post", mock_post)
+    for api_base in [
+        "https://anthropic-proxy-1.example.com/v1/messages",
+        "https://anthropic-proxy-2.example.com/v1/messages",
+        "https://anthropic-proxy-1.example.com/v1/messages",
+    ]:
+        with pytest.raises(Exception):
+            await litellm.acompletion(
+                model="anthropic/claude-3-5-sonnet-20240620",
+                messages=[{"role": "user", "content": "hi"}],
+                api_base=api_base,
+                api_key="fake-key",
+                num_retries=0,
+            )
+
+    assert len(used_clients) == 3
+    assert used_clients[0] is used_clients[2]
+    assert used_clients[0] is not used_clients[1]
+    assert len(registry.clients) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_httpx_client_registry_per_host_limit_and_eviction():
+    import asyncio
+
+    import httpx
+
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPClientRegistry
+
+    registry = AsyncHTTPClientRegistry(idle_client_ttl=0)
+    client = registry.get_client(
+        llm_provider="openai", params={"max_connections_per_host": 1}
     )
 
+    max_in_flight = 0
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    client.client._transport.transport = httpx.MockTransport(handler)  # type: ignore
+
+    responses = await asyncio.gather(
+        *[client.post(url="https://example.com/v1/test", json={}) for _ in range(3)],
+        client.post(url="https://other-host.com/v1/test", json={}),
+    )
+    assert all(response.status_code == 200 for response in responses)
+    assert max_in_flight == 2  # 1 per host
+
+    stats = registry.get_pool_stats()[0]
+    assert stats["active_requests"] == 0
+    assert stats["waiters"] == 0
+
+    registry.evict_idle_clients(force=True)
+    assert registry.get_pool_stats() == []
+    await client.close()
+
 
 @pytest.mark.parametrize(
     "model, expected_bool", [("gpt-3.5-turbo", False), ("gpt-4o-audio-preview", True)]
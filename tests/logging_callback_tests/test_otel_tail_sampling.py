@@ -0,0 +1,194 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system-path
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+import litellm
+from litellm.integrations.opentelemetry import OpenTelemetry, OpenTelemetryConfig
+from litellm.integrations.opentelemetry_helpers.tail_sampling import (
+    TailSamplingSpanProcessor,
+)
+
+
+def _get_tail_sampled_tracer(sample_rate: float, slow_request_threshold=None):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(
+            span_processor=SimpleSpanProcessor(exporter),
+            sample_rate=sample_rate,
+            slow_request_threshold=slow_request_threshold,
+        )
+    )
+    return provider.get_tracer("test"), exporter
+
+
+def test_tail_sampling_drops_unsampled_traces():
+    tracer, exporter = _get_tail_sampled_tracer(sample_rate=0.0)
+
+    with tracer.start_as_current_span("proxy_request"):
+        with tracer.start_as_current_span("redis"):
+            pass
+        with tracer.start_as_current_span("litellm_request"):
+            pass
+
+    assert exporter.get_finished_spans() == ()
+
+
+def test_tail_sampling_keeps_whole_trace_on_error():
+    tracer, exporter = _get_tail_sampled_tracer(sample_rate=0.0)
+
+    with tracer.start_as_current_span("proxy_request"):
+        with tracer.start_as_current_span("redis"):
+            pass
+        with tracer.start_as_current_span("litellm_request") as span:
+            span.set_status(Status(StatusCode.ERROR))
+
+    assert {span.name for span in exporter.get_finished_spans()} == {
+        "proxy_request",
+        "redis",
+        "litellm_request",
+    }
+
+
+def test_tail_sampling_keeps_slow_requests():
+    tracer, exporter = _get_tail_sampled_tracer(
+        sample_rate=0.0, slow_request_threshold=0.05
+    )
+
+    with tracer.start_as_current_span("fast_request"):
+        pass
+    with tracer.start_as_current_span("slow_request"):
+        time.sleep(0.1)
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["slow_request"]
+
+
+def test_tail_sampling_late_child_span_follows_decision():
+    """
+    Spans ending after their root (e.g. async service hooks) follow the decision made for the trace
+    """
+    tracer, exporter = _get_tail_sampled_tracer(sample_rate=0.0)
+
+    root_span = tracer.start_span("proxy_request")
+    root_span.set_status(Status(StatusCode.ERROR))
+    from opentelemetry import trace
+
+    child_span = tracer.start_span(
+        "redis", context=trace.set_span_in_context(root_span)
+    )
+    root_span.end()
+    child_span.end()
+
+    assert [span.name for span in exporter.get_finished_spans()] == [
+        "proxy_request",
+        "redis",
+    ]
+
+
+def test_tail_sampling_sample_rate():
+    tracer, exporter = _get_tail_sampled_tracer(sample_rate=0.25)
+
+    for _ in range(2000):
+        with tracer.start_as_current_span("litellm_request"):
+            pass
+
+    assert 300 < len(exporter.get_finished_spans()) < 700
+
+
+class _StandInOTLPCollector(BaseHTTPRequestHandler):
+    """
+    Local stand-in for an OTLP/HTTP collector - counts the exported spans + bytes
+    """
+
+    received_spans = 0
+    received_bytes = 0
+
+    def do_POST(self):
+        from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+            ExportTraceServiceRequest,
+        )
+
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        request = ExportTraceServiceRequest()
+        request.ParseFromString(body)
+        _StandInOTLPCollector.received_bytes += len(body)
+        _StandInOTLPCollector.received_spans += sum(
+            len(scope_spans.spans)
+            for resource_spans in request.resource_spans
+            for scope_spans in resource_spans.scope_spans
+        )
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sample_rate", [None, 0.0])
+async def test_otel_export_overhead_with_local_collector(sample_rate):
+    """
+    Export mock requests to a local OTLP collector - tail sampling should drop successful requests, but keep failed ones
+    """
+    pytest.importorskip("opentelemetry.exporter.otlp.proto.http")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInOTLPCollector)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _StandInOTLPCollector.received_spans = 0
+    _StandInOTLPCollector.received_bytes = 0
+
+    otel_logger = OpenTelemetry(
+        config=OpenTelemetryConfig(
+            exporter="otlp_http",
+            endpoint="http://127.0.0.1:{}/v1/traces".format(server.server_port),
+            sample_rate=sample_rate,
+            max_attribute_length=256,
+        )
+    )
+    # the global tracer provider can only be set once per process - use this logger's provider
+    otel_logger.tracer = otel_logger.tracer_provider.get_tracer("litellm")
+    litellm.callbacks = [otel_logger]
+    num_requests = 50
+    try:
+        for _ in range(num_requests):
+            await litellm.acompletion(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "hi" * 1000}],
+                mock_response="hello",
+            )
+        with pytest.raises(Exception):
+            await litellm.acompletion(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "hi"}],
+                mock_response=Exception("bad request"),
+            )
+        await asyncio.sleep(1)
+        otel_logger.tracer_provider.force_flush()
+    finally:
+        litellm.callbacks = []
+        otel_logger.tracer_provider.shutdown()
+        server.shutdown()
+
+    exported = "{} spans, {} bytes exported".format(
+        _StandInOTLPCollector.received_spans, _StandInOTLPCollector.received_bytes
+    )
+    if sample_rate == 0.0:
+        # only the failed request is exported
+        assert _StandInOTLPCollector.received_spans == 1, exported
+    else:
+        assert _StandInOTLPCollector.received_spans > num_requests, exported
+        # long message bodies are truncated
+        assert _StandInOTLPCollector.received_bytes < num_requests * 2 * 2000, exported
@@ -774,3 +774,75 @@ def test_increment_deployment_cooled_down(prometheus_logger):
         "gpt-3.5-turbo", "model-123", "https://api.openai.com", "openai", "429"
     )
     prometheus_logger.litellm_deployment_cooled_down.labels().inc.assert_called_once()
+
+
+def test_prometheus_label_cardinality_limits():
+    """
+    end users past the limit are tracked in 1 overflow series
+    """
+    from litellm.types.integrations.prometheus import PROMETHEUS_OVERFLOW_LABEL_VALUE
+
+    collectors = list(REGISTRY._collector_to_names.keys())
+    for collector in collectors:
+        REGISTRY.unregister(collector)
+    litellm.prometheus_label_cardinality_limits = {"end_user": 2}
+    try:
+        prometheus_logger = PrometheusLogger()
+    finally:
+        litellm.prometheus_label_cardinality_limits = None
+
+    for end_user_id in ["user1", "user2", "user3", "user4", "user1"]:
+        prometheus_logger._increment_top_level_request_and_spend_metrics(
+            end_user_id=end_user_id,
+            user_api_key="key1",
+            user_api_key_alias="alias1",
+            model="gpt-3.5-turbo",
+            user_api_team="team1",
+            user_api_team_alias="team_alias1",
+            user_id="user1",
+            response_cost=0.1,
+        )
+
+    requests_by_end_user = {
+        sample.labels["end_user"]: sample.value
+        for metric in REGISTRY.collect()
+        if metric.name == "litellm_requests_metric"
+        for sample in metric.samples
+        if sample.name == "litellm_requests_metric_total"
+    }
+    assert requests_by_end_user == {
+        "user1": 2.0,
+        "user2": 1.0,
+        PROMETHEUS_OVERFLOW_LABEL_VALUE: 2.0,
+    }
+
+
+def test_prometheus_multiprocess_metrics_app(tmp_path, monkeypatch):
+    """
+    /metrics aggregates the metrics of all workers, when PROMETHEUS_MULTIPROC_DIR is set
+    """
+    import subprocess
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from litellm.integrations.prometheus_helpers.multiprocess import (
+        get_metrics_asgi_app,
+    )
+
+    worker_script = (
+        "from prometheus_client import Counter;"
+        "Counter('litellm_test_worker_requests', 'test').inc()"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", worker_script],
+            env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+            check=True,
+        )
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    app = FastAPI()
+    app.mount("/metrics", get_metrics_asgi_app())
+    response = TestClient(app).get("/metrics/")
+    assert "litellm_test_worker_requests_total 2.0" in response.text
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 import sys
 from unittest.mock import Mock
@@ -12,6 +13,7 @@ sys.path.insert(
 import litellm
 from unittest.mock import MagicMock, patch, AsyncMock
 
+from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
 from litellm.proxy.auth.auth_utils import is_request_body_safe
 from litellm.proxy.litellm_pre_call_utils import (
@@ -510,3 +512,325 @@ async def test_proxy_config_update_from_db():
                 "success_callback": "langfuse",
             }
         }
+
+
+class _SlowReadOnlyGuardrail(CustomGuardrail):
+    read_only = True
+
+    def __init__(self, delay: float, reject: bool = False, **kwargs):
+        self.delay = delay
+        self.reject = reject
+        self.completed = False
+        self.cancelled = False
+        super().__init__(**kwargs)
+
+    async def async_pre_call_hook(self, user_api_key_dict, cache, data, call_type):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.reject:
+            raise ValueError("Rejected by guardrail")
+        self.completed = True
+        return None
+
+    async def async_moderation_hook(self, data, user_api_key_dict, call_type):
+        return await self.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict,
+            cache=None,
+            data=data,
+            call_type=call_type,
+        )
+
+
+class _MutatingGuardrail(CustomGuardrail):
+    def __init__(self, **kwargs):
+        self.seen_messages = None
+        super().__init__(**kwargs)
+
+    async def async_pre_call_hook(self, user_api_key_dict, cache, data, call_type):
+        self.seen_messages = list(data["messages"])
+        data["messages"].append({"role": "user", "content": "added by guardrail"})
+        return data
+
+
+@pytest.fixture
+def proxy_logging_obj(monkeypatch):
+    from litellm.caching.caching import DualCache
+    from litellm.proxy.utils import ProxyLogging
+
+    monkeypatch.setattr(litellm, "callbacks", [])
+    return ProxyLogging(user_api_key_cache=DualCache())
+
+
+@pytest.mark.asyncio
+async def test_pre_call_hook_runs_read_only_guardrails_concurrently(
+    proxy_logging_obj, monkeypatch
+):
+    guardrails = [_SlowReadOnlyGuardrail(delay=0.5) for _ in range(3)]
+    monkeypatch.setattr(litellm, "callbacks", guardrails)
+
+    start = asyncio.get_event_loop().time()
+    data = await proxy_logging_obj.pre_call_hook(
+        user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+        data={"messages": [{"role": "user", "content": "hi"}]},
+        call_type="completion",
+    )
+    elapsed = asyncio.get_event_loop().time() - start
+
+    assert all(guardrail.completed for guardrail in guardrails)
+    assert elapsed < 1.0
+    assert data["messages"] == [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.asyncio
+async def test_pre_call_hook_first_rejection_cancels_other_guardrails(
+    proxy_logging_obj, monkeypatch
+):
+    rejecting_guardrail = _SlowReadOnlyGuardrail(delay=0.01, reject=True)
+    slow_guardrail = _SlowReadOnlyGuardrail(delay=5)
+    monkeypatch.setattr(litellm, "callbacks", [slow_guardrail, rejecting_guardrail])
+
+    with pytest.raises(ValueError, match="Rejected by guardrail"):
+        await proxy_logging_obj.pre_call_hook(
+            user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+            data={"messages": [{"role": "user", "content": "hi"}]},
+            call_type="completion",
+        )
+
+    assert slow_guardrail.cancelled is True
+    assert slow_guardrail.completed is False
+
+
+@pytest.mark.asyncio
+async def test_pre_call_hook_mutating_guardrails_stay_ordered(
+    proxy_logging_obj, monkeypatch
+):
+    first = _MutatingGuardrail()
+    second = _MutatingGuardrail()
+    read_only = _SlowReadOnlyGuardrail(delay=0.01)
+    monkeypatch.setattr(litellm, "callbacks", [first, read_only, second])
+
+    data = await proxy_logging_obj.pre_call_hook(
+        user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+        data={"messages": [{"role": "user", "content": "hi"}]},
+        call_type="completion",
+    )
+
+    assert read_only.completed is True
+    assert len(first.seen_messages) == 1
+    assert len(second.seen_messages) == 2
+    assert len(data["messages"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_pre_call_hook_callbacks_cached_until_callbacks_change(
+    proxy_logging_obj, monkeypatch
+):
+    guardrail = _SlowReadOnlyGuardrail(delay=0)
+    monkeypatch.setattr(litellm, "callbacks", [guardrail])
+
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class"
+    ) as mock_resolve:
+        litellm.callbacks.append("langsmith")
+        mock_resolve.return_value = None
+        first = proxy_logging_obj._get_pre_call_hook_callbacks()
+        second = proxy_logging_obj._get_pre_call_hook_callbacks()
+        assert first is second
+        assert mock_resolve.call_count == 1
+
+        new_guardrail = _MutatingGuardrail()
+        litellm.callbacks.append(new_guardrail)
+        third = proxy_logging_obj._get_pre_call_hook_callbacks()
+        assert third == [guardrail, new_guardrail]
+        assert mock_resolve.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_during_call_hook_runs_read_only_guardrails_concurrently(
+    proxy_logging_obj, monkeypatch
+):
+    rejecting_guardrail = _SlowReadOnlyGuardrail(delay=0.01, reject=True)
+    slow_guardrail = _SlowReadOnlyGuardrail(delay=5)
+    monkeypatch.setattr(litellm, "callbacks", [slow_guardrail, rejecting_guardrail])
+
+    with pytest.raises(ValueError, match="Rejected by guardrail"):
+        await proxy_logging_obj.during_call_hook(
+            data={"messages": [{"role": "user", "content": "hi"}]},
+            user_api_key_dict=UserAPIKeyAuth(api_key="sk-1234"),
+            call_type="completion",
+        )
+
+    assert slow_guardrail.cancelled is True
+
+
+def _get_spend_log(request_id, start_time, request_tags="[]", spend=0.1):
+    return {
+        "request_id": request_id,
+        "api_key": "hashed-key",
+        "user": "user-1",
+        "team_id": None,
+        "end_user": "",
+        "model": "gpt-4o",
+        "model_group": "gpt-4o",
+        "model_id": "model-1",
+        "spend": spend,
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+        "total_tokens": 15,
+        "startTime": start_time,
+        "request_tags": request_tags,
+    }
+
+
+def test_aggregate_spend_logs_for_rollups():
+    from datetime import datetime
+
+    from litellm.proxy.spend_tracking.spend_rollups import aggregate_spend_logs
+
+    spend_logs = [
+        _get_spend_log("1", datetime(2024, 5, 1, 10, 5), '["prod", "prod"]'),
+        _get_spend_log("2", datetime(2024, 5, 1, 10, 55), '["prod", "batch"]'),
+        _get_spend_log("3", "2024-05-01T11:30:00+00:00", spend=1.0),
+    ]
+
+    hourly_rows, daily_rows = aggregate_spend_logs(spend_logs=spend_logs)
+
+    dimensions = ("hashed-key", "user-1", "", "", "gpt-4o", "gpt-4o", "model-1")
+    ten_am = datetime(2024, 5, 1, 10)
+    assert hourly_rows[(ten_am,) + dimensions + ("",)] == [0.2, 20, 10, 30, 2]
+    # each request is counted once per unique tag
+    assert hourly_rows[(ten_am,) + dimensions + ("prod",)] == [0.2, 20, 10, 30, 2]
+    assert hourly_rows[(ten_am,) + dimensions + ("batch",)] == [0.1, 10, 5, 15, 1]
+    assert hourly_rows[(datetime(2024, 5, 1, 11),) + dimensions + ("",)] == [
+        1.0,
+        10,
+        5,
+        15,
+        1,
+    ]
+    assert len(hourly_rows) == 4
+
+    day = datetime(2024, 5, 1)
+    assert daily_rows[(day,) + dimensions + ("",)] == pytest.approx(
+        [1.2, 30, 15, 45, 3]
+    )
+    assert len(daily_rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_spend_writes_spend_logs_and_rollups_in_transaction():
+    from datetime import datetime
+
+    from litellm.proxy.utils import update_spend
+
+    transaction = MagicMock()
+    # request "3" is already in the db - it is not inserted again
+    transaction.query_raw = AsyncMock(
+        return_value=[{"request_id": "1"}, {"request_id": "2"}]
+    )
+    transaction.execute_raw = AsyncMock()
+    prisma_client = MagicMock()
+    prisma_client.db.tx.return_value.__aenter__ = AsyncMock(return_value=transaction)
+    prisma_client.db.tx.return_value.__aexit__ = AsyncMock(return_value=None)
+    prisma_client.jsonify_object = lambda data: data
+    prisma_client.user_list_transactons = {}
+    prisma_client.end_user_list_transactons = {}
+    prisma_client.key_list_transactons = {}
+    prisma_client.team_list_transactons = {}
+    prisma_client.team_member_list_transactons = {}
+    prisma_client.org_list_transactons = {}
+    prisma_client.spend_log_transactions = [
+        _get_spend_log("1", datetime(2024, 5, 1, 10, 5), '["prod"]'),
+        _get_spend_log("2", datetime(2024, 5, 1, 10, 55)),
+        _get_spend_log("3", datetime(2024, 5, 1, 10, 56), '["prod"]'),
+    ]
+
+    await update_spend(
+        prisma_client=prisma_client,
+        db_writer_client=None,
+        proxy_logging_obj=MagicMock(),
+    )
+
+    transaction.query_raw.assert_awaited_once()
+    insert_query, records = transaction.query_raw.await_args.args
+    assert "ON CONFLICT (request_id) DO NOTHING RETURNING request_id" in insert_query
+    records = json.loads(records)
+    assert [record["request_id"] for record in records] == ["1", "2", "3"]
+    assert records[0]["startTime"] == "2024-05-01T10:05:00"
+    assert records[0]["request_tags"] == ["prod"]
+    # hourly + daily rollup upserts - of the inserted spend logs only
+    assert transaction.execute_raw.await_count == 2
+    hourly_query, *hourly_params = transaction.execute_raw.await_args_list[0].args
+    assert 'INSERT INTO "LiteLLM_HourlySpendRollup"' in hourly_query
+    assert "ON CONFLICT" in hourly_query
+    # period_start, *dimensions, *counters - one entry per rollup row
+    assert len(hourly_params) == 14
+    assert hourly_params[0] == ["2024-05-01T10:00:00", "2024-05-01T10:00:00"]
+    assert hourly_params[8] == ["", "prod"]
+    assert hourly_params[-1] == ["2", "1"]
+    assert prisma_client.spend_log_transactions == []
+
+
+@pytest.mark.asyncio
+async def test_insert_spend_logs_counts_repeated_request_id_once():
+    from datetime import datetime
+
+    from litellm.proxy.spend_tracking.spend_rollups import insert_spend_logs
+
+    db = MagicMock()
+    db.query_raw = AsyncMock(return_value=[{"request_id": "1"}])
+    spend_logs = [
+        _get_spend_log("1", datetime(2024, 5, 1, 10, 5)),
+        _get_spend_log("1", datetime(2024, 5, 1, 10, 5)),
+    ]
+
+    inserted_spend_logs = await insert_spend_logs(db=db, spend_logs=spend_logs)
+
+    assert inserted_spend_logs == spend_logs[:1]
+
+
+@pytest.mark.asyncio
+async def test_backfill_spend_rollups_stops_at_current_hour():
+    from datetime import datetime, timedelta, timezone
+
+    from litellm.proxy.spend_tracking.spend_rollups import backfill_spend_rollups
+
+    current_hour = datetime.now(timezone.utc).replace(
+        tzinfo=None, minute=0, second=0, microsecond=0
+    )
+    today = current_hour.replace(hour=0)
+    transaction = MagicMock()
+    transaction.execute_raw = AsyncMock()
+    prisma_client = MagicMock()
+    prisma_client.db.execute_raw = AsyncMock()
+    prisma_client.db.tx.return_value.__aenter__ = AsyncMock(return_value=transaction)
+    prisma_client.db.tx.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    num_days = await backfill_spend_rollups(
+        prisma_client=prisma_client,
+        start_time=today - timedelta(days=1),
+        end_time=current_hour + timedelta(days=1),
+    )
+
+    if current_hour == today:  # the current day has no completed hour yet
+        assert num_days == 1
+        return
+    assert num_days == 2
+    # yesterday - no live writes, overwritten without locks
+    assert [call.args[1:] for call in prisma_client.db.execute_raw.await_args_list] == [
+        (today - timedelta(days=1), today),
+        (today - timedelta(days=1), today),
+    ]
+    # today - hourly rows till the current hour, the daily row summed from all of today's hourly rows
+    queries = [call.args for call in transaction.execute_raw.await_args_list]
+    assert queries[0] == (
+        'LOCK TABLE "LiteLLM_HourlySpendRollup" IN SHARE ROW EXCLUSIVE MODE',
+    )
+    assert queries[1][1:] == (today, current_hour)
+    assert queries[2] == (
+        'LOCK TABLE "LiteLLM_DailySpendRollup" IN SHARE ROW EXCLUSIVE MODE',
+    )
+    assert queries[3][1:] == (today, today + timedelta(days=1))
@@ -17,8 +17,10 @@ import json
 from io import BytesIO
 from typing import Dict, List
 from litellm.router_utils.batch_utils import (
+    SpooledJsonlFile,
     replace_model_in_jsonl,
     _get_router_metadata_variable_name,
+    _iter_lines,
 )
 
 
@@ -82,3 +84,127 @@ def test_router_metadata_variable_name():
     assert (
         _get_router_metadata_variable_name(function_name="batch") == "litellm_metadata"
     )
+
+
+def test_replace_model_in_jsonl_output(sample_jsonl_bytes):
+    """Test each line's body.model is replaced, and the filename is kept"""
+    result = replace_model_in_jsonl(
+        ("batch.jsonl", sample_jsonl_bytes + b"\n\n", "application/jsonl"), "claude-3"
+    )
+
+    assert result is not None
+    assert result.name == "batch.jsonl"
+    lines = result.read().decode("utf-8").splitlines()
+    assert len(lines) == 2
+    for line in lines:
+        assert json.loads(line)["body"]["model"] == "claude-3"
+
+
+def test_replace_model_in_jsonl_invalid_json():
+    assert (
+        replace_model_in_jsonl(b'{"body": {"model": "gpt-4"}}\nnot json', "x") is None
+    )
+
+
+def test_replace_model_in_jsonl_streams_large_files(tmp_path, sample_jsonl_data):
+    """
+    Large files are rewritten line by line, and spooled to disk instead of held in memory
+    """
+    import tracemalloc
+
+    from litellm.constants import BATCH_FILE_MAX_IN_MEMORY_SIZE
+
+    file_path = tmp_path / "batch.jsonl"
+    line = json.dumps(sample_jsonl_data[0]).encode("utf-8") + b"\n"
+    num_lines = (4 * BATCH_FILE_MAX_IN_MEMORY_SIZE) // len(line)
+    with open(file_path, "wb") as f:
+        for _ in range(num_lines):
+            f.write(line)
+
+    with open(file_path, "rb") as f:
+        tracemalloc.start()
+        result = replace_model_in_jsonl(f, "claude-3")
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert result is not None
+    assert result.name == "batch.jsonl"
+    assert result._rolled is True  # type: ignore - spooled to disk
+    assert peak_memory < BATCH_FILE_MAX_IN_MEMORY_SIZE * 1.5
+    num_result_lines = 0
+    for result_line in result:
+        assert json.loads(result_line)["body"]["model"] == "claude-3"
+        num_result_lines += 1
+    assert num_result_lines == num_lines
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [
+        b'{"a": 1}\n{"b": 2}\n',
+        '{"a": 1}\n{"b": 2}\n',
+        ("batch.jsonl", b'{"a": 1}\n{"b": 2}\n', "application/jsonl"),
+        BytesIO(b'{"a": 1}\n{"b": 2}\n'),
+    ],
+)
+def test_iter_lines(file_content):
+    """bytes / str / (name, content, type) tuples / file objects are all read as lines of bytes"""
+    assert list(_iter_lines(file_content)) == [b'{"a": 1}\n', b'{"b": 2}\n']
+
+
+def test_iter_lines_reads_file_objects_from_the_start():
+    file_like = BytesIO(b'{"a": 1}\n')
+    file_like.read()
+    assert list(_iter_lines(file_like)) == [b'{"a": 1}\n']
+
+    with pytest.raises(TypeError):
+        list(_iter_lines(123))  # type: ignore
+
+
+def test_spooled_jsonl_file_name():
+    """The name is kept after the file is rolled over to disk"""
+    spooled_file = SpooledJsonlFile(name="batch.jsonl", max_size=4)
+    assert spooled_file.name == "batch.jsonl"
+    spooled_file.write(b"more than 4 bytes")
+    assert spooled_file._rolled is True  # type: ignore
+    assert spooled_file.name == "batch.jsonl"
+    spooled_file.close()
+
+
+@pytest.mark.asyncio
+async def test_router_acreate_file_rewrites_file_off_the_event_loop(
+    sample_jsonl_bytes,
+):
+    """The file is rewritten in a worker thread - a large file should not block the event loop"""
+    import threading
+
+    from litellm.router_utils import batch_utils
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-batch-model",
+                "litellm_params": {"model": "openai/gpt-4o-mini", "api_key": "fake"},
+            }
+        ]
+    )
+    rewrite_threads = []
+
+    def _replace_model_in_jsonl(**kwargs):
+        rewrite_threads.append(threading.current_thread())
+        return batch_utils.replace_model_in_jsonl(**kwargs)
+
+    with patch(
+        "litellm.router.replace_model_in_jsonl", new=_replace_model_in_jsonl
+    ), patch.object(litellm, "acreate_file", new=AsyncMock()) as mock_acreate_file:
+        await router._acreate_file(
+            model="my-batch-model",
+            file=("batch.jsonl", sample_jsonl_bytes, "application/jsonl"),
+            purpose="batch",
+        )
+
+    assert rewrite_threads and rewrite_threads[0] is not threading.main_thread()
+    file_name, modified_file, _ = mock_acreate_file.call_args.kwargs["file"]
+    assert file_name == "batch.jsonl"
+    for line in modified_file.read().decode("utf-8").splitlines():
+        assert json.loads(line)["body"]["model"] == "gpt-4o-mini"
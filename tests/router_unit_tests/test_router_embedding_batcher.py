@@ -0,0 +1,274 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.router_utils.embedding_batcher import EmbeddingBatcher
+from litellm.types.utils import EmbeddingResponse, Usage
+
+
+def _get_router(embedding_batching: dict) -> Router:
+    return Router(
+        num_retries=0,
+        model_list=[
+            {
+                "model_name": "text-embedding-3-small",
+                "litellm_params": {
+                    "model": "text-embedding-3-small",
+                    "api_key": "fake-key",
+                },
+                "model_info": {"embedding_batching": embedding_batching},
+            }
+        ],
+    )
+
+
+async def _mock_aembedding(input, model, **kwargs):
+    response = EmbeddingResponse(
+        model=model,
+        data=[
+            {"object": "embedding", "index": idx, "embedding": [float(len(text))]}
+            for idx, text in enumerate(input)
+        ],
+        usage=Usage(prompt_tokens=30, completion_tokens=0, total_tokens=30),
+    )
+    response._hidden_params["response_cost"] = 0.3
+    return response
+
+
+@pytest.mark.asyncio
+async def test_router_embedding_batching():
+    """
+    - 3 concurrent calls -> 1 provider request
+    - each caller gets its own vectors, and a share of the usage + cost
+    """
+    router = _get_router({"max_wait_ms": 50, "max_batch_size": 100})
+    with patch.object(
+        litellm, "aembedding", side_effect=_mock_aembedding
+    ) as mock_aembedding:
+        responses = await asyncio.gather(
+            router.aembedding(model="text-embedding-3-small", input="a" * 40),
+            router.aembedding(
+                model="text-embedding-3-small", input=["b" * 40, "c" * 80]
+            ),
+            router.aembedding(model="text-embedding-3-small", input=["d" * 160]),
+        )
+
+    assert mock_aembedding.call_count == 1
+    assert mock_aembedding.call_args.kwargs["input"] == [
+        "a" * 40,
+        "b" * 40,
+        "c" * 80,
+        "d" * 160,
+    ]
+    assert [[item["embedding"] for item in r.data] for r in responses] == [
+        [[40.0]],
+        [[40.0], [80.0]],
+        [[160.0]],
+    ]
+    assert [item["index"] for item in responses[1].data] == [0, 1]
+    assert [r.usage.prompt_tokens for r in responses] == [4, 11, 15]
+    assert sum(r._hidden_params["response_cost"] for r in responses) == pytest.approx(
+        0.3
+    )
+
+
+@pytest.mark.asyncio
+async def test_router_embedding_batching_max_batch_size_and_groups():
+    router = _get_router({"max_wait_ms": 50, "max_batch_size": 2})
+    with patch.object(
+        litellm, "aembedding", side_effect=_mock_aembedding
+    ) as mock_aembedding:
+        await asyncio.gather(
+            router.aembedding(model="text-embedding-3-small", input="a"),
+            router.aembedding(model="text-embedding-3-small", input="b"),
+            router.aembedding(model="text-embedding-3-small", input="c"),
+            # different request params -> not batched with the others
+            router.aembedding(
+                model="text-embedding-3-small", input="d", dimensions=256
+            ),
+        )
+
+    assert sorted(call.kwargs["input"] for call in mock_aembedding.call_args_list) == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_router_embedding_batching_error_reaches_every_caller():
+    router = _get_router({"max_wait_ms": 50})
+    with patch.object(
+        litellm,
+        "aembedding",
+        side_effect=litellm.BadRequestError(
+            message="bad input", model="text-embedding-3-small", llm_provider="openai"
+        ),
+    ) as mock_aembedding:
+        results = await asyncio.gather(
+            router.aembedding(model="text-embedding-3-small", input="a"),
+            router.aembedding(model="text-embedding-3-small", input="b"),
+            return_exceptions=True,
+        )
+    assert mock_aembedding.call_count == 1
+    assert all(isinstance(result, litellm.BadRequestError) for result in results)
+
+
+def test_embedding_batcher_from_model_info():
+    assert EmbeddingBatcher.from_model_info(None) is None
+    assert EmbeddingBatcher.from_model_info({"id": "1"}) is None
+    batcher = EmbeddingBatcher.from_model_info(
+        {"embedding_batching": {"max_batch_size": 16, "max_batch_tokens": 1000}}
+    )
+    assert batcher is not None
+    assert batcher.max_batch_size == 16
+    assert batcher.max_batch_tokens == 1000
+    assert EmbeddingBatcher.can_batch(["a", "b"]) is True
+    assert EmbeddingBatcher.can_batch([1, 2, 3]) is False
+
+
+class _TrackingLogger(CustomLogger):
+    def __init__(self):
+        self.success_kwargs = []
+        self.success_responses = []
+        self.failure_kwargs = []
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.success_kwargs.append(kwargs)
+        self.success_responses.append(response_obj)
+
+    async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self.failure_kwargs.append(kwargs)
+
+
+@pytest.mark.asyncio
+async def test_router_embedding_batching_logs_each_caller():
+    """
+    1 provider request, but the callbacks run once per caller - with the caller's call id + share of the usage
+    """
+    tracking_logger = _TrackingLogger()
+    litellm.callbacks = [tracking_logger]
+    router = _get_router({"max_wait_ms": 50, "max_batch_size": 100})
+    try:
+        with patch.object(litellm, "aembedding", side_effect=_mock_aembedding):
+            await asyncio.gather(
+                router.aembedding(
+                    model="text-embedding-3-small",
+                    input="a" * 40,
+                    litellm_call_id="call-1",
+                    metadata={"user_api_key": "sk-1"},
+                ),
+                router.aembedding(
+                    model="text-embedding-3-small",
+                    input=["b" * 80],
+                    litellm_call_id="call-2",
+                    metadata={"user_api_key": "sk-1"},
+                ),
+            )
+        for _ in range(20):
+            if len(tracking_logger.success_kwargs) == 2:
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        litellm.callbacks = []
+
+    assert sorted(
+        kwargs["litellm_call_id"] for kwargs in tracking_logger.success_kwargs
+    ) == [
+        "call-1",
+        "call-2",
+    ]
+    usage_by_call_id = {
+        kwargs["litellm_call_id"]: response.usage.prompt_tokens
+        for kwargs, response in zip(
+            tracking_logger.success_kwargs, tracking_logger.success_responses
+        )
+    }
+    assert usage_by_call_id == {"call-1": 10, "call-2": 20}
+    assert all(
+        kwargs["litellm_params"]["metadata"]["user_api_key"] == "sk-1"
+        for kwargs in tracking_logger.success_kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_router_embedding_batching_logs_each_caller_failure():
+    tracking_logger = _TrackingLogger()
+    litellm.callbacks = [tracking_logger]
+    router = _get_router({"max_wait_ms": 50})
+    try:
+        with patch.object(
+            litellm,
+            "aembedding",
+            side_effect=litellm.BadRequestError(
+                message="bad input",
+                model="text-embedding-3-small",
+                llm_provider="openai",
+            ),
+        ):
+            await asyncio.gather(
+                router.aembedding(
+                    model="text-embedding-3-small", input="a", litellm_call_id="call-1"
+                ),
+                router.aembedding(
+                    model="text-embedding-3-small", input="b", litellm_call_id="call-2"
+                ),
+                return_exceptions=True,
+            )
+    finally:
+        litellm.callbacks = []
+    assert sorted(
+        kwargs["litellm_call_id"] for kwargs in tracking_logger.failure_kwargs
+    ) == [
+        "call-1",
+        "call-2",
+    ]
+
+
+def test_router_get_embedding_batcher():
+    router = _get_router({"max_batch_size": 16})
+    deployment = router.get_model_list()[0]
+    embedding_batcher = router._get_embedding_batcher(deployment=deployment)
+    assert embedding_batcher is not None
+    assert embedding_batcher.max_batch_size == 16
+    # one batcher per deployment
+    assert router._get_embedding_batcher(deployment=deployment) is embedding_batcher
+    assert (
+        router._get_embedding_batcher(
+            deployment={**deployment, "model_info": {"id": "no-batching"}}
+        )
+        is None
+    )
+    assert router._get_embedding_batcher(deployment={"model_info": {}}) is None
+
+
+@pytest.mark.asyncio
+async def test_router_abatched_embedding():
+    router = _get_router({"max_wait_ms": 1})
+    deployment = router.get_model_list()[0]
+    with patch.object(
+        litellm, "aembedding", side_effect=_mock_aembedding
+    ) as mock_aembedding:
+        response = await router._abatched_embedding(
+            embedding_batcher=router._get_embedding_batcher(deployment=deployment),  # type: ignore
+            input=["a", "b"],
+            call_kwargs={
+                **deployment["litellm_params"],
+                "model_info": deployment["model_info"],
+                "litellm_call_id": "call-1",
+            },
+        )
+    assert response._hidden_params["litellm_call_id"] == "call-1"
+    assert response._hidden_params["model_id"] == deployment["model_info"]["id"]
+    # the provider request gets its own (unlogged) logging object, not the caller's
+    assert "litellm_call_id" not in mock_aembedding.call_args.kwargs
+    assert mock_aembedding.call_args.kwargs["litellm_logging_obj"] is not None
@@ -721,6 +721,40 @@ def test_get_model_access_groups(model_list):
     assert len(access_groups) == 2
 
 
+def test_get_model_access_groups_index(model_list):
+    """Test if the access group index is cached, and rebuilt when deployments change"""
+    from litellm.types.router import Deployment, LiteLLM_Params
+
+    router = Router(model_list=model_list)
+    index = router.get_model_access_groups_index()
+    assert index == {
+        "group1": frozenset(["gpt-3.5-turbo"]),
+        "group2": frozenset(["gpt-3.5-turbo"]),
+    }
+    assert router.get_model_access_groups_index() is index
+
+    version = router.model_access_groups_index_version
+    router.add_deployment(
+        Deployment(
+            model_name="gpt-4o-mini",
+            litellm_params=LiteLLM_Params(model="gpt-4o-mini"),
+            model_info={"id": "new-deployment", "access_groups": ["group1"]},
+        )
+    )
+    assert router.model_access_groups_index_version > version
+    assert router.get_model_access_groups_index()["group1"] == frozenset(
+        ["gpt-3.5-turbo", "gpt-4o-mini"]
+    )
+
+    router.delete_deployment(id="new-deployment")
+    assert router.get_model_access_groups_index()["group1"] == frozenset(
+        ["gpt-3.5-turbo"]
+    )
+
+    router._invalidate_model_access_groups_index()
+    assert router.get_model_access_groups_index() is not index
+
+
 def test_update_settings(model_list):
     """Test if the 'update_settings' function is working correctly"""
     router = Router(model_list=model_list)